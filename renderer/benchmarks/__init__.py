@@ -0,0 +1,10 @@
+"""
+Benchmark scripts backing the performance figures quoted in the project.
+
+Each module runs on the bundled assets and prints its measurements:
+
+- slots_memory: Bytes per face of materialized Face3D and Face2D objects
+
+Example:
+    python -m benchmarks.slots_memory
+"""
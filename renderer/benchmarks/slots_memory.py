@@ -0,0 +1,81 @@
+"""Measures the memory held per face by Face3D and Face2D objects."""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List, Sequence, Tuple, TypeVar
+from geometry import Face2D, Face3D, Point
+from utility import FileImport
+
+T = TypeVar("T")
+
+
+def traced(build: Callable[[], T]) -> Tuple[T, int]:
+    """Runs a builder and measures the memory its result still holds.
+
+    Args:
+        build (Callable[[], T]): Function creating the objects to measure.
+
+    Returns:
+        Tuple[T, int]: The result and the bytes allocated while building
+            it that are still in use.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def measure(filepath: str) -> Tuple[int, float, float]:
+    """Measures bytes per face of an asset's Face3D and Face2D objects.
+
+    The Face3D figure covers each face with its vertex list and vertices;
+    the Face2D figure covers one projected face per Face3D with its points.
+
+    Args:
+        filepath (str): Path to the asset.
+
+    Returns:
+        Tuple[int, float, float]: Face count and bytes per Face3D and
+            per Face2D.
+    """
+    meshes = FileImport().read_file(filepath)
+    num_faces = sum(mesh.num_faces for mesh in meshes)
+    if not num_faces:
+        raise ValueError(f"{filepath} has no faces to measure.")
+    faces, face3d_bytes = traced(lambda: [mesh.faces for mesh in meshes])
+    flat: List[Face3D] = [face for mesh_faces in faces for face in mesh_faces]
+    _, face2d_bytes = traced(lambda: [Face2D([Point(p.x, p.y) for p in face.points],
+                                             1.0, face.color) for face in flat])
+    return num_faces, face3d_bytes / num_faces, face2d_bytes / num_faces
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Prints the bytes per face of an asset.
+
+    Args:
+        argv (Sequence[str] | None, optional): Command-line arguments;
+            defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("filepath", nargs="?", default="assets/bonsai.obj",
+                        help="asset to measure (default: %(default)s)")
+    args = parser.parse_args(argv)
+    num_faces, face3d, face2d = measure(args.filepath)
+    print(f"{args.filepath}: {num_faces} faces")
+    print(f"Face3D with vertices: {face3d:.1f} bytes per face")
+    print(f"Face2D with points: {face2d:.1f} bytes per face")
+
+
+if __name__ == "__main__":
+    main()
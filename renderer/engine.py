@@ -10,10 +10,11 @@ __license__ = "MIT"
 __version__ = "0.2.0"
 __maintainer__ = "Michael Nuttall"
 
-from typing import Any, List
-from scene import Screen, Scene, AspectRatio, Camera
-from geometry import Vertex, Shader, Face2D
-from utility import Interface, FileImport
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List
+from scene import Screen, Scene, AspectRatio, BVH, Camera, ExternalSort
+from geometry import Vertex, Shader, Face2D, Mesh3D
+from utility import AssetManifest, Interface, FileImport, MeshCache
 
 
 class Engine:
@@ -23,6 +24,8 @@ class Engine:
     """
 
     _instance: Engine | None = None
+    STREAM_FACE_THRESHOLD: int = 250_000
+    BVH_FACE_THRESHOLD: int = 50_000
 
     def __new__(cls) -> Engine:
         """Creates a new instance if one doesn't already exist.
@@ -38,24 +41,73 @@ class Engine:
         """Constructor"""
         self._scene: Scene | None = None
         self._screen: Screen | None = None
+        self._chunks: Callable[[], Iterator[Mesh3D]] | None = None
+        self._chunk_size: int = FileImport.DEFAULT_CHUNK_SIZE
+        self._sort_memory: int = ExternalSort.DEFAULT_MEMORY
+        self._variance: int = 0
 
     def load_scene(self, settings: dict[str, Any]) -> None:
         """Loads scene data and initializes the camera and screen
         based on user settings.
 
+        The asset manifest is consulted before the scene is loaded: scenes
+        whose indexed face count exceeds STREAM_FACE_THRESHOLD are streamed
+        unless settings say otherwise, and its suggested camera is used when
+        settings give none. Assets without an up-to-date entry are surveyed
+        chunk by chunk, so deciding to stream never loads a whole scene;
+        only scenes that are loaded have their new or changed assets
+        parsed into the manifest. Loaded scenes above BVH_FACE_THRESHOLD
+        faces get a BVH, saved in the mesh cache directory so later loads
+        reuse it.
+        Assets the Precompiler has baked are read from their binaries.
+        Streamed scenes are sorted in runs sized from the sort_memory
+        setting, a budget in bytes.
+
         Args:
             settings (dict[str, Any]): User input parameters
         """
+        filepaths = settings["filepath"]
+        paths = filepaths if isinstance(filepaths, list) else [filepaths]
+        manifest = AssetManifest(settings.get("asset_dir", "assets"))
         file_importer = FileImport()
-        meshes = file_importer.read_file(settings["filepath"])
+        cache = MeshCache(settings.get("cache_dir"), sidecars=[BVH.EXTENSION])
+        file_importer.cache = cache
+        file_importer.manifest = manifest
+        file_importer.workers = settings.get("workers", 1)
+        file_importer.precision = settings.get("precision", "float64")
+        size = settings.get("chunk_size", FileImport.DEFAULT_CHUNK_SIZE)
+        plan = manifest.combined(paths)
+        stream = settings.get("stream")
+        posed = "camera_origin" in settings and "look_at" in settings
+        if plan is None and (stream is None or stream and not posed):
+            plan = manifest.survey(chain.from_iterable(
+                file_importer.iter_chunks(path, size) for path in paths))
+        if stream is None:
+            stream = plan is not None and plan["faces"] > self.STREAM_FACE_THRESHOLD
+        if not stream and manifest.update([manifest.name_for(path) for path in paths],
+                                          importer=file_importer):
+            plan = manifest.combined(paths) or plan
+        meshes: List[Mesh3D] = []
+        self._chunks = None
+        if stream:
+            self._chunk_size = size
+            self._variance = settings["variance"]
+            self._sort_memory = settings.get("sort_memory",
+                                             ExternalSort.DEFAULT_MEMORY)
+            self._chunks = lambda: chain.from_iterable(
+                file_importer.iter_chunks(path, size) for path in paths)
+        elif isinstance(filepaths, list):
+            meshes = file_importer.read_files(filepaths, weld=True)
+        else:
+            meshes = file_importer.read_file(filepaths, weld=True)
 
         for mesh in meshes:
             mesh.set_color_variance(mesh.base_shader, settings["variance"])
 
-        camera = Camera(Vertex(*settings["camera_origin"]),
-                        Vertex(*settings["look_at"]))
-
-        self._scene = Scene(camera, meshes)
+        self._scene = Scene(self._make_camera(settings, plan), meshes)
+        if meshes and settings.get("bvh", plan is not None
+                                   and plan["faces"] > self.BVH_FACE_THRESHOLD):
+            self._scene.build_bvh(cache.directory_for(paths[0]))
         bg_r, bg_g, bg_b = settings.get("background_color", (30, 30, 30))
         self._screen = Screen(
             AspectRatio(*settings["aspect_ratio"]),
@@ -63,13 +115,42 @@ class Engine:
             Shader(bg_r, bg_g, bg_b)
         )
 
+    @staticmethod
+    def _make_camera(settings: dict[str, Any], plan: Dict[str, Any] | None) -> Camera:
+        """Creates the camera from settings, falling back to the manifest's pose.
+
+        The camera's viewport is the screen's aspect ratio, so faces that
+        would land outside the canvas are culled.
+
+        Args:
+            settings (dict[str, Any]): User input parameters
+            plan (Dict[str, Any] | None): Combined manifest entry of the scene.
+
+        Raises:
+            KeyError: If neither settings nor the manifest give a pose.
+
+        Returns:
+            Camera: Scene camera.
+        """
+        pose = plan["camera"] if plan is not None and plan["camera"] is not None else {}
+        origin = settings["camera_origin"] if "camera_origin" in settings \
+            else pose["origin"]
+        look_at = settings["look_at"] if "look_at" in settings else pose["look_at"]
+        return Camera(Vertex(*origin), Vertex(*look_at),
+                      viewport=AspectRatio(*settings["aspect_ratio"]))
+
     def render_scene(self) -> None:
         """Renders the currently loaded scene."""
         if not self._scene or not self._screen:
             raise RuntimeError("Scene or screen not properly initialized.")
 
-        faces: List[Face2D] = self._scene.make_render()
-        self._screen.render(faces)
+        if self._chunks is not None:
+            with ExternalSort.from_memory(self._sort_memory) as sorter:
+                self._scene.make_render_stream(self._chunks(), sorter, self._variance)
+                self._screen.render_stream(sorter)
+        else:
+            faces: List[Face2D] = self._scene.make_render()
+            self._screen.render(faces)
         self._screen.show()
 
     @staticmethod
@@ -8,11 +8,16 @@ The following classes are re-exported for convenient access:
 
 - Face2D: A triangle defined in 2D screen space
 - Face3D: A triangle defined by 3D vertices
+- IndexedMesh3D: A Mesh3D whose faces index into a shared vertex pool
+- LazyMesh3D: A Mesh3D whose vertices are loaded on first access
 - Mesh3D: A collection of connected Face3D objects
+- MeshBuffer: A Mesh3D stored as position, color and normal arrays
 - Point: A point in 2D Cartesian space
 - Shader: A color representation used for rendering faces
 - Vector: A 3D vector supporting arithmetic and geometric operations
+- VectorArray: N vectors in one array, with batched Vector operations
 - Vertex: A point in 3D space
+- VertexArray: N vertices in one array
 
 Example:
     from geometry import Vertex, Vector, Face3D
@@ -20,18 +25,28 @@ Example:
 
 from .face2d import Face2D
 from .face3d import Face3D
+from .indexedmesh3d import IndexedMesh3D
+from .lazymesh3d import LazyMesh3D
 from .mesh3d import Mesh3D
+from .meshbuffer import MeshBuffer
 from .point import Point
 from .shader import Shader
 from .vector import Vector
+from .vectorarray import VectorArray
 from .vertex import Vertex
+from .vertexarray import VertexArray
 
 __all__ = [
     "Face2D",
     "Face3D",
+    "IndexedMesh3D",
+    "LazyMesh3D",
     "Mesh3D",
+    "MeshBuffer",
     "Point",
     "Shader",
     "Vector",
-    "Vertex"
+    "VectorArray",
+    "Vertex",
+    "VertexArray"
 ]
@@ -13,7 +13,13 @@ __maintainer__ = "Michael Nuttall"
 
 
 class Coordinate3D(ABC):
-    """Abstract base class for 3D coordinate objects."""
+    """Abstract base class for 3D coordinate objects.
+
+    Coordinates live in __slots__, so subclasses that also declare
+    __slots__ carry no per-instance __dict__.
+    """
+
+    __slots__ = ("_x", "_y", "_z")
 
     def __init__(self, x: float, y: float, z: float) -> None:
         """Constructor
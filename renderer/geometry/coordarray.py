@@ -0,0 +1,129 @@
+"""CoordinateArray base class for batches of 3D coordinates."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from geometry.coord3d import Coordinate3D
+
+
+class CoordinateArray(ABC):
+    """Abstract base class for N coordinates stored as one (N, 3) array.
+
+    Operations work on every row in one numpy call. A single Coordinate3D
+    operand is broadcast against all rows; another array must have the
+    same length.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: ArrayLike) -> None:
+        """Constructor
+
+        Args:
+            data (ArrayLike): Coordinates of shape (N, 3).
+
+        Raises:
+            ValueError: If data does not have shape (N, 3).
+        """
+        array = np.asarray(data, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError(f"Expected coordinates of shape (N, 3), "
+                             f"got {array.shape}.")
+        self._data: NDArray[np.float64] = array
+
+    @property
+    def data(self) -> NDArray[np.float64]:
+        """Gets the coordinate array.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (N, 3).
+        """
+        return self._data
+
+    @property
+    def x(self) -> NDArray[np.float64]:
+        """Gets the x coordinates.
+
+        Returns:
+            NDArray[np.float64]: View of shape (N,).
+        """
+        return self._data[:, 0]
+
+    @property
+    def y(self) -> NDArray[np.float64]:
+        """Gets the y coordinates.
+
+        Returns:
+            NDArray[np.float64]: View of shape (N,).
+        """
+        return self._data[:, 1]
+
+    @property
+    def z(self) -> NDArray[np.float64]:
+        """Gets the z coordinates.
+
+        Returns:
+            NDArray[np.float64]: View of shape (N,).
+        """
+        return self._data[:, 2]
+
+    def _operand(self, other: CoordinateArray | Coordinate3D) -> NDArray[np.float64]:
+        """Gets the array of another operand, ready to broadcast.
+
+        Args:
+            other (CoordinateArray | Coordinate3D): Array of the same length
+                or a single coordinate.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (N, 3) or (3,).
+
+        Raises:
+            ValueError: If other is an array of a different length.
+        """
+        if isinstance(other, Coordinate3D):
+            return np.array((other.x, other.y, other.z), dtype=np.float64)
+        if len(other) != len(self):
+            raise ValueError(f"Cannot combine arrays of {len(self)} and "
+                             f"{len(other)} rows.")
+        return other.data
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> Any:
+        """Gets one row as a scalar coordinate object.
+
+        Args:
+            index (int): Row index.
+        """
+
+    def __len__(self) -> int:
+        """Gets the number of coordinates.
+
+        Returns:
+            int: N
+        """
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the rows as scalar coordinate objects.
+
+        Returns:
+            Iterator[Any]: One object per row.
+        """
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        """Formal string representation.
+
+        Returns:
+            str: Class name and row count.
+        """
+        return f"{type(self).__name__}(n={len(self)})"
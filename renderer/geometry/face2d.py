@@ -16,6 +16,8 @@ from geometry.shader import Shader
 class Face2D:
     """A triangular face made of 3 points in the 2D Cartesian plane."""
 
+    __slots__ = ("_points", "_distance", "_color")
+
     def __init__(self, points: List[Point], dist: float, color: Shader) -> None:
         """Constructor
 
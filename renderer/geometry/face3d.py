@@ -16,6 +16,8 @@ from geometry.shader import Shader
 class Face3D:
     """A triangular face made of 3 vertices in 3D space."""
 
+    __slots__ = ("_points", "_color")
+
     def __init__(self, points: List[Vertex], color: Shader = Shader(0, 0, 0)) -> None:
         """Constructor
 
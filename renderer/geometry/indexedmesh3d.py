@@ -0,0 +1,486 @@
+"""IndexedMesh3D class to represent a mesh over a shared vertex pool."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import random
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry.face3d import Face3D
+from geometry.mesh3d import Mesh3D, Quantization
+from geometry.meshbuffer import MeshBuffer
+from geometry.shader import Shader
+from geometry.vector import Vector
+from geometry.vertex import Vertex
+
+
+class IndexedMesh3D(Mesh3D):
+    """A mesh storing each unique vertex once and faces as index triples.
+
+    Materialized faces share the pooled Vertex objects, so a closed mesh
+    keeps one Vertex per corner position instead of one per face corner.
+    The pool, index triples and face colors are also cached as arrays for
+    batched projection, until add, faces, translate or a color setter
+    changes them. Meshes made from arrays (from_arrays, or welding a
+    buffer) keep only those arrays until vertices, indices or faces is
+    first read, and set_precision stores the pool like a vertex buffer.
+    Face normals given to from_arrays (as read from a compiled file) are
+    used for the face planes until the faces change.
+    """
+
+    def __init__(self, vertices: List[Vertex],
+                 indices: List[Tuple[int, int, int]],
+                 color: Shader | None = None) -> None:
+        """Constructor
+
+        Args:
+            vertices (List[Vertex]): Unique vertices of the mesh.
+            indices (List[Tuple[int, int, int]]): Vertex indices of each face.
+            color (Shader | None, optional): Base color of the mesh.
+
+        Raises:
+            ValueError: If an index is out of range.
+        """
+        super().__init__([])
+        for face in indices:
+            if len(face) != 3 or not all(0 <= i < len(vertices) for i in face):
+                raise ValueError(f"Invalid face indices: {face}")
+        self._faces = None
+        self._vertices: List[Vertex] | None = vertices
+        self._indices: List[Tuple[int, int, int]] | None = indices
+        self._lookup: Dict[Tuple[float, float, float], int] | None = None
+        self._pool: NDArray[Any] | None = None
+        self._index_array: NDArray[np.integer[Any]] | None = None
+        self._colors: NDArray[np.uint8] | None = None
+        self._normals: NDArray[np.floating[Any]] | None = None
+        self._base_shader = color
+
+    @classmethod
+    def from_buffer(cls, positions: NDArray[np.floating[Any]],
+                    shader: Shader | None = None) -> IndexedMesh3D:
+        """Creates an indexed mesh by welding an (F, 3, 3) position array.
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Array of shape (F, 3, 3).
+            shader (Shader | None, optional): Base color of the mesh.
+
+        Returns:
+            IndexedMesh3D: The welded mesh.
+        """
+        return cls.weld(Mesh3D.from_buffer(positions, shader))
+
+    @classmethod
+    def from_arrays(cls, vertices: NDArray[np.floating[Any]],
+                    indices: NDArray[np.integer[Any]],
+                    color: Shader | None = None,
+                    normals: NDArray[np.floating[Any]] | None = None
+                    ) -> IndexedMesh3D:
+        """Creates an indexed mesh over a vertex array and index triples.
+
+        The arrays are kept as-is (they may be read-only views over a
+        mapped file); Vertex objects are only built on first access.
+
+        Args:
+            vertices (NDArray[np.floating[Any]]): Vertex pool of shape (V, 3).
+            indices (NDArray[np.integer[Any]]): Index triples of shape (F, 3).
+            color (Shader | None, optional): Base color of the mesh.
+            normals (NDArray[np.floating[Any]] | None, optional): Unit normal
+                of each face, following its winding, of shape (F, 3).
+
+        Raises:
+            ValueError: If the arrays have the wrong shape or an index is
+                out of range.
+
+        Returns:
+            IndexedMesh3D: The indexed mesh.
+        """
+        if vertices.ndim != 2 or vertices.shape[1] != 3 or indices.ndim != 2 \
+                or indices.shape[1] != 3:
+            raise ValueError("Expected vertices of shape (V, 3) and indices of "
+                             "shape (F, 3).")
+        if indices.size and (indices.min() < 0 or indices.max() >= len(vertices)):
+            raise ValueError("Face indices reference a missing vertex.")
+        if normals is not None and normals.shape != indices.shape:
+            raise ValueError(f"Expected normals of shape {indices.shape}, "
+                             f"got {normals.shape}.")
+        mesh = cls([], [], color)
+        mesh._vertices, mesh._indices = None, None
+        mesh._pool, mesh._index_array = vertices, indices
+        mesh._normals = normals
+        return mesh
+
+    @classmethod
+    def weld(cls, mesh: Mesh3D) -> IndexedMesh3D:
+        """Creates an indexed copy of a mesh, merging identical vertices.
+
+        Array-backed meshes are welded in one vectorized pass, keeping a
+        MeshBuffer's per-face colors; meshes whose faces are built, and
+        may have been edited, are welded from those faces and keep their
+        per-face colors.
+
+        Args:
+            mesh (Mesh3D): Mesh to weld.
+
+        Returns:
+            IndexedMesh3D: The welded mesh.
+        """
+        if isinstance(mesh, IndexedMesh3D):
+            return mesh
+        positions = mesh.positions if mesh.is_array_backed else None
+        if positions is not None:
+            unique, inverse = np.unique(positions.reshape(-1, 3), axis=0,
+                                        return_inverse=True)
+            welded = cls.from_arrays(unique, inverse.reshape(-1, 3), mesh.base_shader)
+            if isinstance(mesh, MeshBuffer):
+                welded._colors = mesh.colors.copy()
+        else:
+            welded = cls([], [], mesh.base_shader)
+            welded.faces = [Face3D(list(face.points), face.color)
+                            for face in mesh.faces]
+        welded._variance = mesh.variance
+        return welded
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """Gets the unique vertices of the mesh.
+
+        Returns:
+            List[Vertex]: Shared vertex pool.
+        """
+        if self._vertices is None:
+            self._vertices = [Vertex(*row) for row in self.pool.tolist()]
+        return self._vertices
+
+    @property
+    def indices(self) -> List[Tuple[int, int, int]]:
+        """Gets the vertex indices of each face.
+
+        Returns:
+            List[Tuple[int, int, int]]: One index triple per face.
+        """
+        if self._indices is None:
+            self._indices = [(a, b, c) for a, b, c in self.index_array.tolist()]
+        return self._indices
+
+    @property
+    def pool(self) -> NDArray[np.floating[Any]]:
+        """Gets the vertex pool as an array.
+
+        A quantized pool is decoded into a new float64 array on each call.
+
+        Returns:
+            NDArray[np.floating[Any]]: Array of shape (V, 3).
+        """
+        stored = self.stored_pool
+        if self._quantization is None:
+            return stored
+        scale, origin = self._quantization
+        decoded: NDArray[np.float64] = stored * scale + origin
+        return decoded
+
+    @property
+    def stored_pool(self) -> NDArray[Any]:
+        """Gets the vertex pool as stored, without decoding quantization.
+
+        Returns:
+            NDArray[Any]: The (V, 3) pool in its stored dtype.
+        """
+        if self._pool is None:
+            self._pool = np.array([(v.x, v.y, v.z) for v in self.vertices],
+                                  dtype=np.float64).reshape(-1, 3)
+        return self._pool
+
+    @property
+    def quantization(self) -> Quantization | None:
+        """Gets the per-axis scale and origin of a quantized vertex pool.
+
+        Returns:
+            Quantization | None: (scale, origin), each of shape (3,), or
+                None unless the pool is quantized.
+        """
+        return self._quantization
+
+    @property
+    def precision(self) -> str:
+        """Gets the storage precision of the vertex pool.
+
+        Returns:
+            str: One of PRECISIONS; "float64" until a pool array is stored.
+        """
+        if self._quantization is not None:
+            return "quantized16"
+        if self._pool is not None and self._pool.dtype == np.float32:
+            return "float32"
+        return "float64"
+
+    def set_precision(self, precision: str) -> None:
+        """Converts the vertex pool to another storage precision.
+
+        The pooled Vertex objects are dropped and rebuilt from the
+        converted pool when next read. Meshes whose faces are built keep
+        them and are unchanged.
+
+        Args:
+            precision (str): "float64", "float32", or "quantized16" for
+                16-bit integers spanning the mesh's bounding box.
+
+        Raises:
+            ValueError: If precision is not one of PRECISIONS.
+        """
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}; "
+                             f"expected one of {', '.join(self.PRECISIONS)}.")
+        if self._faces is not None or precision == self.precision:
+            return
+        pool = self.pool
+        if precision == "quantized16":
+            self._pool, self._quantization = self.quantize(pool)
+        else:
+            self._pool = np.asarray(pool, dtype=precision)
+            self._quantization = None
+        self._vertices = None
+        self._lookup = None
+        self._reset_derived()
+
+    @property
+    def index_array(self) -> NDArray[np.integer[Any]]:
+        """Gets the vertex indices of each face as an array.
+
+        Returns:
+            NDArray[np.integer[Any]]: Array of shape (F, 3).
+        """
+        if self._index_array is None:
+            self._index_array = np.array(self.indices, dtype=np.intp).reshape(-1, 3)
+        return self._index_array
+
+    @property
+    def face_colors(self) -> NDArray[np.uint8]:
+        """Gets the RGB color of each face as an array.
+
+        Colors come from the built faces if there are any, otherwise
+        from the last color setter or the base shader. Editing a face's
+        color in place does not refresh them.
+
+        Returns:
+            NDArray[np.uint8]: Array of shape (F, 3).
+        """
+        if self._colors is None:
+            if self._faces is not None:
+                rgbs = [face.color.rgb for face in self._faces]
+                self._colors = np.array(rgbs, dtype=np.uint8).reshape(-1, 3)
+            else:
+                rgb = self._base_shader.rgb if self._base_shader is not None \
+                    else (0, 0, 0)
+                base = np.array(rgb, dtype=np.uint8)
+                self._colors = np.tile(base, (self.num_faces, 1))
+        return self._colors
+
+    @property
+    def normals(self) -> NDArray[np.floating[Any]] | None:
+        """Gets the per-face normals given to from_arrays, if any.
+
+        Returns:
+            NDArray[np.floating[Any]] | None: Array of shape (F, 3), or None
+                once the faces change.
+        """
+        return self._normals
+
+    @property
+    def faces(self) -> List[Face3D]:
+        """Gets the faces of the mesh, built over the shared vertex pool.
+
+        Returns:
+            List[Face3D]: List of faces.
+        """
+        return super().faces
+
+    @faces.setter
+    def faces(self, value: List[Face3D]) -> None:
+        """Sets the faces of the mesh and rebuilds the vertex pool.
+
+        Args:
+            value (List[Face3D]): New list of faces.
+        """
+        self._vertices = []
+        self._indices = []
+        self._lookup = {}
+        self._pool = self._index_array = self._colors = self._normals = None
+        self._quantization = None
+        self._faces = []
+        self._reset_derived()
+        for face in value:
+            self.add(face)
+
+    @property
+    def num_faces(self) -> int:
+        """Gets the number of faces.
+
+        Returns:
+            int: Face count.
+        """
+        if self._indices is not None:
+            return len(self._indices)
+        return len(self.index_array)
+
+    def _index_of(self, vertex: Vertex) -> int:
+        """Finds or adds a vertex in the pool.
+
+        Args:
+            vertex (Vertex): Vertex to look up.
+
+        Returns:
+            int: Index of the pooled vertex.
+        """
+        vertices = self.vertices
+        if self._lookup is None:
+            self._lookup = {(v.x, v.y, v.z): i for i, v in enumerate(vertices)}
+        key = (vertex.x, vertex.y, vertex.z)
+        if key not in self._lookup:
+            self._lookup[key] = len(vertices)
+            vertices.append(vertex)
+        return self._lookup[key]
+
+    def _corners(self) -> NDArray[np.floating[Any]]:
+        """Gets the corner positions by indexing the vertex pool.
+
+        Returns:
+            NDArray[np.floating[Any]]: Array of shape (F, 3, 3).
+        """
+        corners: NDArray[np.floating[Any]] = self.pool[self.index_array]
+        return corners
+
+    def _winding_normals(self, corners: NDArray[np.floating[Any]]
+                         ) -> NDArray[np.float64]:
+        """Gets the face normals given to from_arrays, or computes them.
+
+        Args:
+            corners (NDArray[np.floating[Any]]): Corners from _corners.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (F, 3).
+        """
+        if self.normals is not None:
+            return np.asarray(self.normals, dtype=np.float64)
+        return super()._winding_normals(corners)
+
+    def translate(self, offset: Vector) -> None:
+        """Moves the mesh by replacing its vertex pool with moved vertices.
+
+        Built faces are rebound to the new pool, so they keep sharing
+        vertices and the original Vertex objects (and arrays) are left
+        untouched.
+
+        Args:
+            offset (Vector): Displacement to apply.
+        """
+        shift = np.array([offset.x, offset.y, offset.z])
+        if self._pool is not None and self._quantization is not None:
+            scale, origin = self._quantization
+            self._quantization = (scale, origin + shift)
+        elif self._pool is not None:
+            self._pool = (self._pool + shift).astype(self._pool.dtype)
+        if self._vertices is not None:
+            self._vertices = [Vertex(v.x + offset.x, v.y + offset.y, v.z + offset.z)
+                              for v in self._vertices]
+            self._lookup = None
+        if self._faces is not None:
+            pool = self.vertices
+            for face, (a, b, c) in zip(self._faces, self.indices):
+                face.points = [pool[a], pool[b], pool[c]]
+        self._shift_derived(shift)
+
+    def _materialize(self) -> List[Face3D]:
+        """Builds Face3D objects that share the pooled vertices.
+
+        Returns:
+            List[Face3D]: Faces colored by the last color setter, else
+                with the base shader, if any.
+        """
+        pool = self.vertices
+        if self._colors is None:
+            color = self._base_shader if self._base_shader is not None \
+                else Shader(0, 0, 0)
+            return [Face3D([pool[a], pool[b], pool[c]], color)
+                    for a, b, c in self.indices]
+        rgbs = [(r, g, b) for r, g, b in self._colors.tolist()]
+        shaders = {rgb: Shader(*rgb) for rgb in set(rgbs)}
+        return [Face3D([pool[a], pool[b], pool[c]], shaders[rgb])
+                for (a, b, c), rgb in zip(self.indices, rgbs)]
+
+    def add(self, new_face: Face3D) -> None:
+        """Adds a Face3D to the mesh, welding its vertices into the pool.
+
+        The face is rebound to the pooled Vertex objects.
+
+        Args:
+            new_face (Face3D): New face to add.
+        """
+        a, b, c = (self._index_of(vertex) for vertex in new_face.points)
+        faces = self.faces
+        self.indices.append((a, b, c))
+        pool = self.vertices
+        new_face.points = [pool[a], pool[b], pool[c]]
+        faces.append(new_face)
+        self._pool = self._index_array = self._colors = self._normals = None
+        self._quantization = None
+        self._reset_derived()
+
+    def set_color(self, value: Shader) -> None:
+        """Sets all faces in the mesh to a uniform shader.
+
+        Faces that are not built yet are not built by this.
+
+        Args:
+            value (Shader): Shader color to apply to all faces.
+        """
+        if self._faces is not None:
+            super().set_color(value)
+        else:
+            self._base_shader = value
+            self._variance = 0
+        self._colors = None
+
+    def set_color_variance(self, value: Shader | None = None,
+                           variance: int = 25) -> None:
+        """Applies random color variance around a base Shader.
+
+        Until faces are built the colors are drawn straight into the
+        face color array, seeded from the random module.
+
+        Args:
+            value (Shader | None, optional): Base shader to vary from.
+                If None, uses the stored base_shader.
+            variance (int, optional): Color variation range. Defaults to 25.
+
+        Raises:
+            ValueError: If no faces exist and no base shader is available.
+        """
+        if value is None:
+            value = self._base_shader
+        if self._faces is not None or value is None:
+            super().set_color_variance(value, variance)
+            self._colors = None
+            return
+        self._base_shader = value
+        self._variance = abs(variance)
+        rng = np.random.default_rng(random.getrandbits(64))
+        offsets = rng.integers(-self._variance, self._variance, (self.num_faces, 3),
+                               endpoint=True)
+        self._colors = np.clip(np.array(value.rgb) + offsets, 0, 255).astype(np.uint8)
+
+    def __repr__(self) -> str:
+        """Returns a detailed string representation for debugging.
+
+        Returns:
+            str: Detailed IndexedMesh3D description.
+        """
+        num_vertices = len(self.pool) if self._vertices is None else len(self._vertices)
+        return (f"IndexedMesh3D(num_faces={self.num_faces}, "
+                f"num_vertices={num_vertices}, "
+                f"base_shader={self._base_shader}, variance={self._variance})")
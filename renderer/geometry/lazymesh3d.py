@@ -0,0 +1,175 @@
+"""LazyMesh3D class to represent a mesh whose vertices load on first use."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+from typing import Any, Callable, List, Sequence, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry.face3d import Face3D
+from geometry.mesh3d import Mesh3D
+from geometry.shader import Shader
+
+PositionLoader = Callable[[], NDArray[np.floating[Any]]]
+
+
+class LazyMesh3D(Mesh3D):
+    """A mesh proxy that knows its color and face count but defers its vertices.
+
+    The loader is called once, on first access to positions or faces, and
+    must return an (F, 3, 3) array. Until then the proxy costs only its
+    header information. Bounds known ahead of time, such as those in the
+    asset manifest, let whole-mesh culling reject the proxy unloaded.
+    """
+
+    def __init__(self, loader: PositionLoader, num_faces: int,
+                 shader: Shader | None = None,
+                 bounds: Sequence[Sequence[float]] | None = None) -> None:
+        """Constructor
+
+        Args:
+            loader (PositionLoader): Callable returning the (F, 3, 3)
+                position array.
+            num_faces (int): Face count the loader will produce.
+            shader (Shader | None, optional): Base color of the mesh.
+            bounds (Sequence[Sequence[float]] | None, optional): Minimum and
+                maximum corners of the mesh, if known without loading it.
+        """
+        super().__init__([])
+        self._faces = None
+        self._loader: PositionLoader | None = loader
+        self._num_faces: int = num_faces
+        self._base_shader = shader
+        if bounds is not None:
+            lower, upper = bounds
+            self._bounds = (np.array(lower, dtype=np.float64),
+                            np.array(upper, dtype=np.float64))
+
+    @property
+    def is_loaded(self) -> bool:
+        """Checks whether the vertices have been loaded.
+
+        Returns:
+            bool: True once the loader has run or faces were set directly.
+        """
+        return self._loader is None
+
+    def load(self) -> None:
+        """Runs the loader if it has not run yet.
+
+        Raises:
+            ValueError: If the loaded array does not have shape
+                (num_faces, 3, 3).
+        """
+        if self._loader is None:
+            return
+        positions = self._loader()
+        if positions.shape != (self._num_faces, 3, 3):
+            raise ValueError(f"Expected positions of shape ({self._num_faces}, 3, 3), "
+                             f"got {positions.shape}.")
+        self._positions = positions
+        self._loader = None
+
+    @property
+    def positions(self) -> NDArray[np.floating[Any]] | None:
+        """Gets the (F, 3, 3) vertex buffer, loading it if needed.
+
+        Returns:
+            NDArray[np.floating[Any]] | None: The buffer, or None if faces
+                were set directly.
+        """
+        self.load()
+        return super().positions
+
+    @property
+    def is_array_backed(self) -> bool:
+        """Checks whether the mesh is still defined by its (pending) buffer.
+
+        Returns:
+            bool: True until faces are built or set directly.
+        """
+        return self._faces is None \
+            and (self._loader is not None or self._positions is not None)
+
+    @property
+    def bounding_sphere(self) -> Tuple[NDArray[np.float64], float]:
+        """Gets a sphere enclosing the mesh, loading it only without known bounds.
+
+        Before loading, the sphere circumscribes the known bounding box.
+
+        Returns:
+            Tuple[NDArray[np.float64], float]: Center of shape (3,) and radius.
+        """
+        if self._sphere is None and self._loader is not None \
+                and self._bounds is not None:
+            lower, upper = self._bounds
+            radius = float(np.linalg.norm(upper - lower)) / 2
+            self._sphere = ((lower + upper) / 2, radius)
+        return super().bounding_sphere
+
+    @property
+    def stored_positions(self) -> NDArray[Any] | None:
+        """Gets the vertex buffer as stored, loading it if needed.
+
+        Returns:
+            NDArray[Any] | None: The buffer, or None if faces were set
+                directly.
+        """
+        self.load()
+        return super().stored_positions
+
+    @property
+    def faces(self) -> List[Face3D]:
+        """Gets the faces of the mesh, loading the vertices if needed.
+
+        Returns:
+            List[Face3D]: List of faces.
+        """
+        return super().faces
+
+    @faces.setter
+    def faces(self, value: List[Face3D]) -> None:
+        """Sets the faces of the mesh and drops the pending loader.
+
+        Args:
+            value (List[Face3D]): New list of faces.
+        """
+        self._loader = None
+        self._faces = value
+        self._positions = None
+        self._quantization = None
+        self._reset_derived()
+
+    @property
+    def num_faces(self) -> int:
+        """Gets the number of faces without loading the vertices.
+
+        Returns:
+            int: Face count.
+        """
+        if self._loader is not None:
+            return self._num_faces
+        return super().num_faces
+
+    def _materialize(self) -> List[Face3D]:
+        """Loads the vertices, then builds Face3D objects from them.
+
+        Returns:
+            List[Face3D]: Faces colored with the base shader, if any.
+        """
+        self.load()
+        return super()._materialize()
+
+    def __repr__(self) -> str:
+        """Returns a detailed string representation for debugging.
+
+        Returns:
+            str: Detailed LazyMesh3D description.
+        """
+        return (f"LazyMesh3D(num_faces={self.num_faces}, loaded={self.is_loaded}, "
+                f"base_shader={self._base_shader}, variance={self._variance})")
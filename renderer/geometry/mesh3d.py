@@ -5,17 +5,36 @@ from __future__ import annotations
 __author__ = "Arin Hartung"
 __date__ = "2025/04/16"
 __license__ = "MIT"
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 __maintainer__ = "Arin Hartung"
 
-from typing import List
+from typing import Any, List, Tuple
 import random
+import numpy as np
+from numpy.typing import NDArray
 from geometry.face3d import Face3D
 from geometry.shader import Shader
+from geometry.vector import Vector
+from geometry.vertex import Vertex
+
+
+Quantization = Tuple[NDArray[np.float64], NDArray[np.float64]]
 
 
 class Mesh3D:
-    """Mesh3D class to store a list of faces with a base shader and variance."""
+    """Mesh3D class to store a list of faces with a base shader and variance.
+
+    Buffer-backed meshes can store their positions as float64, float32, or
+    16-bit integers quantized over the mesh's bounding box.
+
+    Each face's plane (outward normal and offset) is cached for back-face
+    culling, and the mesh's bounding box and sphere for whole-mesh culling,
+    until the geometry is replaced through faces, add or set_precision;
+    translate moves them along with the mesh. Editing Face3D objects in
+    place does not refresh them.
+    """
+
+    PRECISIONS: Tuple[str, ...] = ("float64", "float32", "quantized16")
 
     def __init__(self, faces: List[Face3D]) -> None:
         """Constructor
@@ -23,9 +42,156 @@ class Mesh3D:
         Args:
             faces (List[Face3D]): List of Face3D objects in the mesh.
         """
-        self._faces: List[Face3D] = faces
+        self._faces: List[Face3D] | None = faces
+        self._positions: NDArray[Any] | None = None
+        self._quantization: Quantization | None = None
         self._base_shader: Shader | None = None
         self._variance: int = 0
+        self._two_sided: bool | None = None
+        self._planes: NDArray[np.float64] | None = None
+        self._closed: bool | None = None
+        self._bounds: Tuple[NDArray[np.float64], NDArray[np.float64]] | None = None
+        self._sphere: Tuple[NDArray[np.float64], float] | None = None
+
+    @classmethod
+    def from_buffer(cls, positions: NDArray[np.floating[Any]],
+                    shader: Shader | None = None) -> Mesh3D:
+        """Creates a mesh backed by an array of face vertex positions.
+
+        The array is kept as-is (it may be a read-only view over a mapped
+        file), and Face3D objects are only built on first access to faces.
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Array of shape (F, 3, 3).
+            shader (Shader | None, optional): Base color of the mesh.
+
+        Raises:
+            ValueError: If positions does not have shape (F, 3, 3).
+
+        Returns:
+            Mesh3D: The buffer-backed mesh.
+        """
+        if positions.ndim != 3 or positions.shape[1:] != (3, 3):
+            raise ValueError(f"Expected positions of shape (F, 3, 3), "
+                             f"got {positions.shape}.")
+        mesh = cls([])
+        mesh._faces = None
+        mesh._positions = positions
+        mesh._base_shader = shader
+        return mesh
+
+    @property
+    def positions(self) -> NDArray[np.floating[Any]] | None:
+        """Gets the (F, 3, 3) vertex buffer backing the mesh.
+
+        Quantized buffers are decoded into a new float64 array on each call;
+        projection kernels should read stored_positions and quantization.
+
+        Returns:
+            NDArray[np.floating[Any]] | None: The buffer, or None if the
+                mesh is built from Face3D objects.
+        """
+        if self._positions is None or self._quantization is None:
+            return self._positions
+        scale, origin = self._quantization
+        decoded: NDArray[np.float64] = self._positions * scale + origin
+        return decoded
+
+    @property
+    def stored_positions(self) -> NDArray[Any] | None:
+        """Gets the vertex buffer as stored, without decoding quantization.
+
+        Returns:
+            NDArray[Any] | None: The (F, 3, 3) buffer in its stored dtype,
+                or None if the mesh is built from Face3D objects.
+        """
+        return self._positions
+
+    @property
+    def is_array_backed(self) -> bool:
+        """Checks whether the position buffer is the mesh's only geometry.
+
+        Once Face3D objects are built they may carry their own colors, so
+        renderers must read the faces instead of the buffer.
+
+        Returns:
+            bool: True while the mesh has a buffer and no built faces.
+        """
+        return self._positions is not None and self._faces is None
+
+    @property
+    def quantization(self) -> Quantization | None:
+        """Gets the per-axis scale and origin of quantized positions.
+
+        A stored value q decodes to q * scale + origin.
+
+        Returns:
+            Quantization | None: (scale, origin), each of shape (3,), or
+                None unless the positions are quantized.
+        """
+        return self._quantization if self._positions is not None else None
+
+    @property
+    def precision(self) -> str:
+        """Gets the storage precision of the vertex buffer.
+
+        Returns:
+            str: One of PRECISIONS; "float64" for Face3D-backed meshes.
+        """
+        if self.quantization is not None:
+            return "quantized16"
+        if self._positions is not None and self._positions.dtype == np.float32:
+            return "float32"
+        return "float64"
+
+    def set_precision(self, precision: str) -> None:
+        """Converts the vertex buffer to another storage precision.
+
+        Meshes built from Face3D objects have no buffer and are unchanged.
+
+        Args:
+            precision (str): "float64", "float32", or "quantized16" for
+                16-bit integers spanning the mesh's bounding box.
+
+        Raises:
+            ValueError: If precision is not one of PRECISIONS.
+        """
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}; "
+                             f"expected one of {', '.join(self.PRECISIONS)}.")
+        positions = self.positions
+        if positions is None or precision == self.precision:
+            return
+        if precision == "quantized16":
+            self._positions, self._quantization = self.quantize(positions)
+        else:
+            self._positions = np.asarray(positions, dtype=precision)
+            self._quantization = None
+        self._reset_derived()
+
+    @staticmethod
+    def quantize(positions: NDArray[np.floating[Any]]
+                 ) -> Tuple[NDArray[np.uint16], Quantization]:
+        """Quantizes positions to 16 bits per axis over their bounding box.
+
+        The rounding error is at most half a step, i.e. 1/131070 of the
+        box's extent along each axis.
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Array of shape (F, 3, 3).
+
+        Returns:
+            Tuple[NDArray[np.uint16], Quantization]: Quantized array and
+                its (scale, origin).
+        """
+        corners = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        if not len(corners):
+            return np.zeros(positions.shape, dtype=np.uint16), (np.ones(3), np.zeros(3))
+        origin = corners.min(axis=0)
+        extent = corners.max(axis=0) - origin
+        scale = np.where(extent > 0, extent / 65535, 1.0)
+        quantized = np.rint((positions - origin) / scale).astype(np.uint16)
+        return quantized, (scale, origin)
 
     @property
     def faces(self) -> List[Face3D]:
@@ -34,6 +200,8 @@ class Mesh3D:
         Returns:
             List[Face3D]: List of faces.
         """
+        if self._faces is None:
+            self._faces = self._materialize()
         return self._faces
 
     @faces.setter
@@ -44,6 +212,295 @@ class Mesh3D:
             value (List[Face3D]): New list of faces.
         """
         self._faces = value
+        self._positions = None
+        self._quantization = None
+        self._reset_derived()
+
+    @property
+    def num_faces(self) -> int:
+        """Gets the number of faces without materializing a vertex buffer.
+
+        Returns:
+            int: Face count.
+        """
+        if self._faces is None and self._positions is not None:
+            return len(self._positions)
+        return len(self.faces)
+
+    def _materialize(self) -> List[Face3D]:
+        """Builds Face3D objects from the vertex buffer.
+
+        Returns:
+            List[Face3D]: Faces colored with the base shader, if any.
+        """
+        positions = self.positions
+        if positions is None:
+            return []
+        color = self._base_shader if self._base_shader is not None else Shader(0, 0, 0)
+        return [Face3D([Vertex(*corner) for corner in face], color)
+                for face in positions.tolist()]
+
+    @property
+    def two_sided(self) -> bool:
+        """Gets whether both sides of every face are drawn.
+
+        Unless set, closed and consistently wound meshes are one-sided, so
+        their back faces are culled, and any other mesh is two-sided.
+
+        Returns:
+            bool: True if back faces must not be culled.
+        """
+        if self._two_sided is None:
+            return not self.is_closed
+        return self._two_sided
+
+    @two_sided.setter
+    def two_sided(self, value: bool | None) -> None:
+        """Sets whether both sides of every face are drawn.
+
+        Args:
+            value (bool | None): True to never cull, False to always cull
+                faces facing away, None to decide from is_closed.
+        """
+        self._two_sided = value
+
+    @property
+    def corners(self) -> NDArray[np.floating[Any]]:
+        """Gets the corner positions of every face, decoded to floats.
+
+        Returns:
+            NDArray[np.floating[Any]]: Array of shape (F, 3, 3), in face order.
+        """
+        return self._corners()
+
+    @property
+    def is_closed(self) -> bool:
+        """Checks whether the faces form a closed, consistently wound surface.
+
+        Every edge must be shared by exactly two faces that traverse it in
+        opposite directions. Computed once and cached with the planes.
+
+        Returns:
+            bool: True for a closed, oriented surface.
+        """
+        if self._closed is None:
+            self._closed = self.is_closed_surface(self._corners())
+        return self._closed
+
+    @property
+    def planes(self) -> NDArray[np.float64]:
+        """Gets the plane of each face, computed once and cached.
+
+        Normals follow the winding (v1 - v0) x (v2 - v0) and are flipped
+        for closed meshes whose winding encloses a negative volume, so
+        they point outward either way.
+
+        Returns:
+            NDArray[np.float64]: Rows (nx, ny, nz, d) of shape (F, 4), with
+                unit normal n and d = n . v0; zero for degenerate faces.
+        """
+        if self._planes is None:
+            corners = self._corners()
+            normals = self._winding_normals(corners)
+            if self.is_closed and self.signed_volume(corners) < 0:
+                normals = -normals
+            offsets = np.einsum("ij,ij->i", normals, corners[:, 0])
+            self._planes = np.column_stack([normals, offsets])
+        return self._planes
+
+    @staticmethod
+    def face_normals(positions: NDArray[np.floating[Any]]) -> NDArray[np.float64]:
+        """Computes unit normals of (F, 3, 3) positions.
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Face corner positions.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (F, 3); zero for degenerate
+                faces.
+        """
+        corners = np.asarray(positions, dtype=np.float64)
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        unit: NDArray[np.float64] = np.divide(normals, lengths,
+                                              out=np.zeros_like(normals),
+                                              where=lengths > 0)
+        return unit
+
+    @staticmethod
+    def signed_volume(positions: NDArray[np.floating[Any]]) -> float:
+        """Computes the volume enclosed by faces, signed by their winding.
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Face corner positions of
+                shape (F, 3, 3).
+
+        Returns:
+            float: Positive when the winding is counter-clockwise seen from
+                outside a closed surface.
+        """
+        corners = np.asarray(positions, dtype=np.float64)
+        triple = np.einsum("ij,ij->i", corners[:, 0],
+                           np.cross(corners[:, 1], corners[:, 2]))
+        return float(triple.sum() / 6)
+
+    @staticmethod
+    def is_closed_surface(positions: NDArray[np.floating[Any]]) -> bool:
+        """Checks whether faces form a closed, consistently wound surface.
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Face corner positions of
+                shape (F, 3, 3); corners at identical positions are joined.
+
+        Returns:
+            bool: True if every directed edge appears once and its reverse
+                appears once.
+        """
+        if not len(positions):
+            return False
+        _, inverse = np.unique(np.asarray(positions).reshape(-1, 3), axis=0,
+                               return_inverse=True)
+        corners = inverse.reshape(-1, 3)
+        edges = np.concatenate([corners[:, [0, 1]], corners[:, [1, 2]],
+                                corners[:, [2, 0]]])
+        directed, counts = np.unique(edges, axis=0, return_counts=True)
+        if (counts != 1).any():
+            return False
+        reverse = np.unique(edges[:, ::-1], axis=0)
+        return bool(np.array_equal(directed, reverse))
+
+    def _corners(self) -> NDArray[np.floating[Any]]:
+        """Gets the corner positions the faces are drawn from.
+
+        Returns:
+            NDArray[np.floating[Any]]: Array of shape (F, 3, 3).
+        """
+        positions = self.positions
+        if positions is not None and self._faces is None:
+            return positions
+        return np.array([[(v.x, v.y, v.z) for v in face.points] for face in self.faces],
+                        dtype=np.float64).reshape(-1, 3, 3)
+
+    def _winding_normals(self, corners: NDArray[np.floating[Any]]
+                         ) -> NDArray[np.float64]:
+        """Gets the unit normal of each face, following its winding.
+
+        Args:
+            corners (NDArray[np.floating[Any]]): Corners from _corners.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (F, 3).
+        """
+        return self.face_normals(corners)
+
+    def _reset_derived(self) -> None:
+        """Drops the cached planes, closedness and bounds after the geometry changes."""
+        self._planes = None
+        self._closed = None
+        self._bounds = None
+        self._sphere = None
+
+    @property
+    def bounds(self) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Gets the axis-aligned bounding box, computed once and cached.
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.float64]]: Minimum and
+                maximum corners, shape (3,) each.
+        """
+        if self._bounds is None:
+            stored = self.stored_positions if self.is_array_backed else None
+            self._bounds = self.bounding_box(stored, self._quantization) \
+                if stored is not None else self.bounding_box(self._corners())
+        return self._bounds
+
+    @property
+    def bounding_sphere(self) -> Tuple[NDArray[np.float64], float]:
+        """Gets a sphere enclosing the mesh, computed once and cached.
+
+        The sphere is centered on the bounding box and reaches the farthest
+        vertex, which is tighter than the box's circumscribed sphere.
+
+        Returns:
+            Tuple[NDArray[np.float64], float]: Center of shape (3,) and radius.
+        """
+        if self._sphere is None:
+            lower, upper = self.bounds
+            center = (lower + upper) / 2
+            corners = np.asarray(self._corners(), dtype=np.float64).reshape(-1, 3)
+            radius = float(np.sqrt(np.max(np.sum((corners - center) ** 2, axis=1),
+                                          initial=0.0)))
+            self._sphere = (center, radius)
+        return self._sphere
+
+    @staticmethod
+    def bounding_box(positions: NDArray[Any], quantization: Quantization | None = None
+                     ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Computes the axis-aligned bounding box of a position array.
+
+        Quantized positions are reduced before decoding, so the array is
+        never widened.
+
+        Args:
+            positions (NDArray[Any]): Positions of shape (..., 3), as floats
+                or as quantized integers.
+            quantization (Quantization | None, optional): (scale, origin) of
+                quantized positions.
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.float64]]: Minimum and
+                maximum corners, shape (3,) each; both zero if positions is
+                empty.
+        """
+        if not positions.size:
+            return np.zeros(3), np.zeros(3)
+        # Reducing along contiguous rows is several times faster than down columns.
+        axes = np.ascontiguousarray(positions.reshape(-1, 3).T)
+        lower = axes.min(axis=1).astype(np.float64)
+        upper = axes.max(axis=1).astype(np.float64)
+        if quantization is not None:
+            scale, origin = quantization
+            lower, upper = lower * scale + origin, upper * scale + origin
+        return lower, upper
+
+    def translate(self, offset: Vector) -> None:
+        """Moves every face of the mesh by an offset.
+
+        Stored positions are shifted in their own precision (quantized ones
+        by moving the quantization origin), built faces get new vertices,
+        and the cached planes and bounds are shifted instead of recomputed.
+
+        Args:
+            offset (Vector): Displacement to apply.
+        """
+        shift = np.array([offset.x, offset.y, offset.z])
+        stored = self.stored_positions
+        if stored is not None and self._quantization is not None:
+            scale, origin = self._quantization
+            self._quantization = (scale, origin + shift)
+        elif stored is not None:
+            self._positions = (stored + shift).astype(stored.dtype)
+        if self._faces is not None:
+            for face in self._faces:
+                face.points = [Vertex(v.x + offset.x, v.y + offset.y, v.z + offset.z)
+                               for v in face.points]
+        self._shift_derived(shift)
+
+    def _shift_derived(self, shift: NDArray[np.float64]) -> None:
+        """Moves the cached planes and bounds along with a translated mesh.
+
+        Args:
+            shift (NDArray[np.float64]): Displacement of shape (3,).
+        """
+        if self._planes is not None:
+            self._planes = self._planes.copy()
+            self._planes[:, 3] += self._planes[:, :3] @ shift
+        if self._bounds is not None:
+            lower, upper = self._bounds
+            self._bounds = (lower + shift, upper + shift)
+        if self._sphere is not None:
+            center, radius = self._sphere
+            self._sphere = (center + shift, radius)
 
     @property
     def base_shader(self) -> Shader | None:
@@ -69,7 +526,7 @@ class Mesh3D:
         Args:
             value (Shader): Shader color to apply to all faces.
         """
-        for face in self._faces:
+        for face in self.faces:
             face.color = value
         self._base_shader = value
         self._variance = 0
@@ -89,15 +546,15 @@ class Mesh3D:
         if value is None:
             if self._base_shader is not None:
                 value = self._base_shader
-            elif self._faces:
-                value = self._faces[0].color
+            elif self.faces:
+                value = self.faces[0].color
             else:
                 raise ValueError("Cannot set color variance without a base color.")
 
         self._base_shader = value
         self._variance = abs(variance)
 
-        for face in self._faces:
+        for face in self.faces:
             r = max(0,
                     min(value.r + random.randint(-self._variance, self._variance), 255))
             g = max(0,
@@ -112,7 +569,10 @@ class Mesh3D:
         Args:
             new_face (Face3D): New face to add.
         """
-        self._faces.append(new_face)
+        self.faces.append(new_face)
+        self._positions = None
+        self._quantization = None
+        self._reset_derived()
 
     def __str__(self) -> str:
         """Returns a simple string representation for testing.
@@ -121,8 +581,8 @@ class Mesh3D:
             str: String showing number of faces and their RGB colors.
         """
         facestr = ' '.join(f"{face.color.r},{face.color.g},{face.color.b}"
-                           for face in self._faces)
-        return f"{len(self._faces)} faces: {facestr}"
+                           for face in self.faces)
+        return f"{len(self.faces)} faces: {facestr}"
 
     def __repr__(self) -> str:
         """Returns a detailed string representation for debugging.
@@ -130,5 +590,5 @@ class Mesh3D:
         Returns:
             str: Detailed Mesh3D description.
         """
-        return (f"Mesh3D(num_faces={len(self._faces)}, "
+        return (f"Mesh3D(num_faces={self.num_faces}, "
                 f"base_shader={self._base_shader}, variance={self._variance})")
@@ -0,0 +1,331 @@
+"""MeshBuffer class to store a mesh as contiguous structure-of-arrays buffers."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+from typing import Any, List, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry.face3d import Face3D
+from geometry.mesh3d import Mesh3D
+from geometry.shader import Shader
+from geometry.vertex import Vertex
+
+
+class MeshBuffer(Mesh3D):
+    """A mesh held as arrays: (F, 3, 3) positions, (F, 3) uint8 colors and
+    optional (F, 3) unit normals.
+
+    Colors are per face, so set_color and set_color_variance update the
+    array in one numpy call. Face3D objects are only built when faces is
+    read. From then on, as in Mesh3D, the built faces are the geometry:
+    the mesh is no longer array-backed, setters edit the faces in place,
+    and the arrays are repacked from the faces, edits included, whenever
+    they are read.
+    """
+
+    def __init__(self, positions: NDArray[np.floating[Any]],
+                 colors: NDArray[np.integer[Any]] | None = None,
+                 normals: NDArray[np.floating[Any]] | None = None,
+                 shader: Shader | None = None) -> None:
+        """Constructor
+
+        Args:
+            positions (NDArray[np.floating[Any]]): Array of shape (F, 3, 3).
+            colors (NDArray[np.integer[Any]] | None, optional): RGB of each
+                face, shape (F, 3). Defaults to the shader's color, or black.
+            normals (NDArray[np.floating[Any]] | None, optional): Normal of
+                each face, shape (F, 3).
+            shader (Shader | None, optional): Base color of the mesh.
+
+        Raises:
+            ValueError: If an array has the wrong shape or a color is
+                outside 0-255.
+        """
+        super().__init__([])
+        if positions.ndim != 3 or positions.shape[1:] != (3, 3):
+            raise ValueError(f"Expected positions of shape (F, 3, 3), "
+                             f"got {positions.shape}.")
+        num_faces = len(positions)
+        if colors is None:
+            rgb = shader.rgb if shader is not None else (0, 0, 0)
+            colors = np.tile(np.array(rgb, dtype=np.uint8), (num_faces, 1))
+        if colors.shape != (num_faces, 3):
+            raise ValueError(f"Expected colors of shape ({num_faces}, 3), "
+                             f"got {colors.shape}.")
+        if colors.size and (colors.min() < 0 or colors.max() > 255):
+            raise ValueError("Colors must be between 0 and 255.")
+        if normals is not None and normals.shape != (num_faces, 3):
+            raise ValueError(f"Expected normals of shape ({num_faces}, 3), "
+                             f"got {normals.shape}.")
+        self._faces = None
+        self._positions = positions
+        self._colors: NDArray[np.uint8] = np.array(colors, dtype=np.uint8)
+        self._normals: NDArray[np.float64] | None = \
+            None if normals is None else np.array(normals, dtype=np.float64)
+        self._base_shader = shader
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh3D) -> MeshBuffer:
+        """Creates a buffer copy of any mesh.
+
+        Buffer-backed meshes keep their position array; meshes made of
+        Face3D objects are packed face by face with their own colors.
+
+        Args:
+            mesh (Mesh3D): Mesh to convert.
+
+        Returns:
+            MeshBuffer: The array-backed mesh.
+        """
+        if isinstance(mesh, MeshBuffer):
+            return mesh
+        positions = mesh.positions
+        if positions is not None:
+            buffer = cls(positions, shader=mesh.base_shader)
+        else:
+            buffer = cls.from_faces(mesh.faces, mesh.base_shader)
+        buffer._variance = mesh.variance
+        return buffer
+
+    @classmethod
+    def from_faces(cls, faces: List[Face3D],
+                   shader: Shader | None = None) -> MeshBuffer:
+        """Packs Face3D objects into arrays.
+
+        Args:
+            faces (List[Face3D]): Faces to pack.
+            shader (Shader | None, optional): Base color of the mesh.
+
+        Returns:
+            MeshBuffer: The array-backed mesh.
+        """
+        positions, colors = cls._pack(faces)
+        return cls(positions, colors, shader=shader)
+
+    @staticmethod
+    def _pack(faces: List[Face3D]) -> Tuple[NDArray[np.float64], NDArray[np.uint8]]:
+        """Packs the corners and colors of Face3D objects into arrays.
+
+        Args:
+            faces (List[Face3D]): Faces to pack.
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.uint8]]: Positions of
+                shape (F, 3, 3) and RGB colors of shape (F, 3).
+        """
+        positions = np.array([[(v.x, v.y, v.z) for v in face.points] for face in faces],
+                             dtype=np.float64).reshape(-1, 3, 3)
+        colors = np.array([face.color.rgb for face in faces],
+                          dtype=np.uint8).reshape(-1, 3)
+        return positions, colors
+
+    @property
+    def positions(self) -> NDArray[np.floating[Any]] | None:
+        """Gets the (F, 3, 3) vertex buffer, repacked from built faces.
+
+        Returns:
+            NDArray[np.floating[Any]] | None: The buffer, decoded to
+                float64 if quantized.
+        """
+        self._write_back()
+        return super().positions
+
+    @property
+    def stored_positions(self) -> NDArray[Any] | None:
+        """Gets the vertex buffer as stored, repacked from built faces.
+
+        Returns:
+            NDArray[Any] | None: The (F, 3, 3) buffer in its stored dtype.
+        """
+        self._write_back()
+        return self._positions
+
+    @property
+    def colors(self) -> NDArray[np.uint8]:
+        """Gets the per-face colors, repacked from built faces.
+
+        Returns:
+            NDArray[np.uint8]: RGB array of shape (F, 3).
+        """
+        self._write_back()
+        return self._colors
+
+    @property
+    def normals(self) -> NDArray[np.float64] | None:
+        """Gets the per-face normals, if they were given or computed.
+
+        Returns:
+            NDArray[np.float64] | None: Array of shape (F, 3), or None.
+        """
+        self._write_back()
+        return self._normals
+
+    @property
+    def faces(self) -> List[Face3D]:
+        """Gets the faces of the buffer, built on first access.
+
+        Edits to the returned faces are written back to the arrays.
+
+        Returns:
+            List[Face3D]: List of faces.
+        """
+        return super().faces
+
+    @faces.setter
+    def faces(self, value: List[Face3D]) -> None:
+        """Replaces the contents of the buffer with new faces.
+
+        Args:
+            value (List[Face3D]): New list of faces.
+        """
+        self._positions, self._colors = self._pack(value)
+        self._quantization = None
+        self._normals = None
+        self._faces = None
+        self._reset_derived()
+
+    @property
+    def num_faces(self) -> int:
+        """Gets the number of faces.
+
+        Returns:
+            int: Face count.
+        """
+        return len(self._faces) if self._faces is not None else len(self._colors)
+
+    def _write_back(self) -> None:
+        """Repacks the built faces, which may have been edited, into the arrays.
+
+        The buffer keeps its precision, and computed normals are recomputed.
+        """
+        if self._faces is None:
+            return
+        precision = self.precision
+        positions, self._colors = self._pack(self._faces)
+        if precision == "quantized16":
+            self._positions, self._quantization = self.quantize(positions)
+        else:
+            self._positions = np.asarray(positions, dtype=precision)
+            self._quantization = None
+        if self._normals is not None:
+            self._normals = self.face_normals(positions)
+
+    def _corners(self) -> NDArray[np.floating[Any]]:
+        """Gets the corner positions; the arrays are authoritative.
+
+        Returns:
+            NDArray[np.floating[Any]]: Array of shape (F, 3, 3).
+        """
+        return self._decoded()
+
+    def _decoded(self) -> NDArray[np.floating[Any]]:
+        """Gets the positions as floats; a MeshBuffer always has them.
+
+        Returns:
+            NDArray[np.floating[Any]]: Array of shape (F, 3, 3).
+        """
+        positions = self.positions
+        return positions if positions is not None else np.zeros((0, 3, 3))
+
+    def compute_normals(self) -> NDArray[np.float64]:
+        """Computes and stores the unit normal of every face.
+
+        Returns:
+            NDArray[np.float64]: Normals of shape (F, 3).
+        """
+        self._normals = self.face_normals(self._decoded())
+        return self._normals
+
+    def _materialize(self) -> List[Face3D]:
+        """Builds Face3D objects from the position and color arrays.
+
+        Returns:
+            List[Face3D]: One face per row, each with its own color.
+        """
+        positions = self._decoded()
+        shaders = {rgb: Shader(*rgb) for rgb in set(map(tuple, self._colors.tolist()))}
+        return [Face3D([Vertex(*corner) for corner in face], shaders[tuple(rgb)])
+                for face, rgb in zip(positions.tolist(), self._colors.tolist())]
+
+    def set_color(self, value: Shader) -> None:
+        """Sets every face to one color.
+
+        Args:
+            value (Shader): Shader color to apply to all faces.
+        """
+        if self._faces is not None:
+            super().set_color(value)
+            return
+        self._colors[:] = value.rgb
+        self._base_shader = value
+        self._variance = 0
+
+    def set_color_variance(self, value: Shader | None = None,
+                           variance: int = 25) -> None:
+        """Applies random color variance around a base Shader.
+
+        Args:
+            value (Shader | None, optional): Base shader to vary from.
+                If None, uses the stored base_shader or the first face color.
+            variance (int, optional): Color variation range. Defaults to 25.
+
+        Raises:
+            ValueError: If no faces exist and no base shader is available.
+        """
+        if self._faces is not None:
+            super().set_color_variance(value, variance)
+            return
+        if value is None:
+            if self._base_shader is not None:
+                value = self._base_shader
+            elif self.num_faces:
+                value = Shader(*self._colors[0].tolist())
+            else:
+                raise ValueError("Cannot set color variance without a base color.")
+
+        self._base_shader = value
+        self._variance = abs(variance)
+        jitter = np.random.default_rng().integers(-self._variance, self._variance + 1,
+                                                  self._colors.shape)
+        self._colors[:] = np.clip(np.array(value.rgb) + jitter, 0, 255)
+
+    def add(self, new_face: Face3D) -> None:
+        """Appends a face to the buffer.
+
+        Each call copies the arrays, so build large meshes from arrays or
+        from_faces instead.
+
+        Args:
+            new_face (Face3D): New face to add.
+        """
+        if self._faces is not None:
+            self._faces.append(new_face)
+            self._reset_derived()
+            return
+        precision = self.precision
+        corners = np.array([[(v.x, v.y, v.z) for v in new_face.points]])
+        self._positions = np.concatenate([np.asarray(self._decoded(), dtype=np.float64),
+                                          corners])
+        self._quantization = None
+        self._colors = np.concatenate([self._colors,
+                                       np.array([new_face.color.rgb], dtype=np.uint8)])
+        if self._normals is not None:
+            self._normals = np.concatenate([self._normals, self.face_normals(corners)])
+        self.set_precision(precision)
+        self._reset_derived()
+
+    def __repr__(self) -> str:
+        """Returns a detailed string representation for debugging.
+
+        Returns:
+            str: Detailed MeshBuffer description.
+        """
+        return (f"MeshBuffer(num_faces={self.num_faces}, precision={self.precision}, "
+                f"normals={self._normals is not None}, "
+                f"base_shader={self._base_shader}, variance={self._variance})")
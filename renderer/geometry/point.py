@@ -12,6 +12,8 @@ __maintainer__ = "Michael Nuttall"
 class Point:
     """A point of the form (x, y) in the Cartesian plane."""
 
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: float, y: float) -> None:
         """Constructor
 
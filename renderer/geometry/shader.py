@@ -15,6 +15,8 @@ from typing import Tuple
 class Shader:
     """Shader class for storing and converting RGB color values."""
 
+    __slots__ = ("_r", "_g", "_b")
+
     def __init__(self, *args: int | str) -> None:
         """Constructor
 
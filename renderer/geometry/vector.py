@@ -5,7 +5,6 @@ Vector class for vector operations in 3D space.
 from __future__ import annotations
 
 import math
-from functools import cached_property
 from geometry.coord3d import Coordinate3D
 from geometry.vertex import Vertex
 
@@ -18,12 +17,30 @@ __maintainer__ = "Michael Nuttall"
 
 
 class Vector(Coordinate3D):
-    """A vector in 3D space represented by its components (x, y, z)."""
+    """A vector in 3D space represented by its components (x, y, z).
+
+    The magnitude and unit vector are cached in slots until a component
+    changes.
+    """
+
+    __slots__ = ("_magnitude", "_unit")
+
+    def __init__(self, x: float, y: float, z: float) -> None:
+        """Constructor
+
+        Args:
+            x (float): component along the x-axis
+            y (float): component along the y-axis
+            z (float): component along the z-axis
+        """
+        super().__init__(x, y, z)
+        self._magnitude: float | None = None
+        self._unit: Vector | None = None
 
     def _invalidate_cache(self) -> None:
         """Invalidates cached properties if vector values are changed."""
-        self.__dict__.pop("magnitude", None)
-        self.__dict__.pop("normalize", None)
+        self._magnitude = None
+        self._unit = None
 
     @property
     def x(self) -> float:
@@ -82,16 +99,18 @@ class Vector(Coordinate3D):
         self._invalidate_cache()
         self._z = value
 
-    @cached_property
+    @property
     def magnitude(self) -> float:
         """Calculates the magnitude (length) of the vector.
 
         Returns:
             float: magnitude
         """
-        return math.sqrt(self._x ** 2 + self._y ** 2 + self._z ** 2)
+        if self._magnitude is None:
+            self._magnitude = math.sqrt(self._x ** 2 + self._y ** 2 + self._z ** 2)
+        return self._magnitude
 
-    @cached_property
+    @property
     def normalize(self) -> Vector:
         """Returns the normalized (unit) vector.
 
@@ -101,10 +120,12 @@ class Vector(Coordinate3D):
         Raises:
             ValueError: if the vector is zero and cannot be normalized
         """
-        mag = self.magnitude
-        if mag == 0:
-            raise ValueError("Cannot normalize a zero vector.")
-        return Vector(self._x / mag, self._y / mag, self._z / mag)
+        if self._unit is None:
+            mag = self.magnitude
+            if mag == 0:
+                raise ValueError("Cannot normalize a zero vector.")
+            self._unit = Vector(self._x / mag, self._y / mag, self._z / mag)
+        return self._unit
 
     def dot(self, other: Vector) -> float:
         """Computes the dot product with another vector.
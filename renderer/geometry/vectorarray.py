@@ -0,0 +1,204 @@
+"""VectorArray class for vector operations on many 3D vectors at once."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+from typing import Any, List
+import numpy as np
+from numpy.typing import NDArray
+from geometry.coordarray import CoordinateArray
+from geometry.vector import Vector
+from geometry.vertex import Vertex
+from geometry.vertexarray import VertexArray
+
+
+class VectorArray(CoordinateArray):
+    """N vectors stored as an (N, 3) array; the batched form of Vector.
+
+    Results match calling the Vector method on each row, but the type
+    checks run once per call instead of once per vector.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector]) -> VectorArray:
+        """Packs Vector objects into an array.
+
+        Args:
+            vectors (List[Vector]): Vectors to pack.
+
+        Returns:
+            VectorArray: One row per vector.
+        """
+        return cls(np.array([(v.x, v.y, v.z) for v in vectors],
+                            dtype=np.float64).reshape(-1, 3))
+
+    def __getitem__(self, index: int) -> Vector:
+        """Gets one vector.
+
+        Args:
+            index (int): Row index.
+
+        Returns:
+            Vector: The vector at that row.
+        """
+        return Vector(*self._data[index].tolist())
+
+    def _vector_operand(self, other: VectorArray | Vector,
+                        operation: str) -> NDArray[np.float64]:
+        """Gets the array of a vector operand.
+
+        Args:
+            other (VectorArray | Vector): Matching vectors or a single vector.
+            operation (str): Name of the operation, for the error message.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (N, 3) or (3,).
+
+        Raises:
+            TypeError: If other is not a Vector or VectorArray.
+        """
+        if not isinstance(other, (Vector, VectorArray)):
+            raise TypeError(f"{operation} requires a Vector or VectorArray.")
+        return self._operand(other)
+
+    @property
+    def magnitude(self) -> NDArray[np.float64]:
+        """Calculates the magnitude (length) of every vector.
+
+        Returns:
+            NDArray[np.float64]: Magnitudes of shape (N,).
+        """
+        magnitudes: NDArray[np.float64] = np.sqrt(np.einsum("ij,ij->i", self._data,
+                                                            self._data))
+        return magnitudes
+
+    @property
+    def normalize(self) -> VectorArray:
+        """Returns the normalized (unit) vectors.
+
+        Returns:
+            VectorArray: Unit vectors.
+
+        Raises:
+            ValueError: If any vector is zero and cannot be normalized.
+        """
+        magnitudes = self.magnitude
+        if np.any(magnitudes == 0):
+            raise ValueError("Cannot normalize a zero vector.")
+        return VectorArray(self._data / magnitudes[:, np.newaxis])
+
+    def dot(self, other: VectorArray | Vector) -> NDArray[np.float64]:
+        """Computes the dot product of each vector with other.
+
+        Args:
+            other (VectorArray | Vector): Matching vectors or a single vector.
+
+        Returns:
+            NDArray[np.float64]: Dot products of shape (N,).
+
+        Raises:
+            TypeError: If other is not a Vector or VectorArray.
+        """
+        operand = self._vector_operand(other, "Dot product")
+        products: NDArray[np.float64] = self._data @ operand if operand.ndim == 1 \
+            else np.einsum("ij,ij->i", self._data, operand)
+        return products
+
+    def cross(self, other: VectorArray | Vector) -> VectorArray:
+        """Computes the cross product of each vector with other.
+
+        Args:
+            other (VectorArray | Vector): Matching vectors or a single vector.
+
+        Returns:
+            VectorArray: Cross products.
+
+        Raises:
+            TypeError: If other is not a Vector or VectorArray.
+        """
+        operand = self._vector_operand(other, "Cross product")
+        return VectorArray(np.cross(self._data, operand))
+
+    def __add__(self, other: object) -> VectorArray | VertexArray:
+        """Adds vectors to vectors, or moves vertices by these vectors.
+
+        Args:
+            other (object): A Vector or VectorArray, giving a VectorArray;
+                or a Vertex or VertexArray, giving a VertexArray.
+
+        Returns:
+            VectorArray | VertexArray: Result of the addition.
+
+        Raises:
+            TypeError: If other is not one of those types.
+        """
+        if isinstance(other, (Vector, VectorArray)):
+            return VectorArray(self._data + self._operand(other))
+        if isinstance(other, (Vertex, VertexArray)):
+            return VertexArray(self._data + self._operand(other))
+        raise TypeError("Unsupported operand type for +")
+
+    def __sub__(self, other: VectorArray | Vector) -> VectorArray:
+        """Subtracts vectors from these vectors.
+
+        Args:
+            other (VectorArray | Vector): Matching vectors or a single vector.
+
+        Returns:
+            VectorArray: Differences.
+
+        Raises:
+            TypeError: If other is not a Vector or VectorArray.
+        """
+        return VectorArray(self._data - self._vector_operand(other, "Subtraction"))
+
+    def __mul__(self, scalar: float | NDArray[np.floating[Any]]) -> VectorArray:
+        """Multiplies the vectors by one scalar or by one scalar per vector.
+
+        Args:
+            scalar (float | NDArray[np.floating[Any]]): Multiplier, or multipliers
+                of shape (N,).
+
+        Returns:
+            VectorArray: Scaled vectors.
+
+        Raises:
+            TypeError: If scalar is not a number or an array of N numbers.
+        """
+        if isinstance(scalar, (int, float)):
+            return VectorArray(self._data * scalar)
+        if isinstance(scalar, np.ndarray) and scalar.shape == (len(self),) \
+                and np.issubdtype(scalar.dtype, np.number):
+            return VectorArray(self._data * scalar[:, np.newaxis])
+        raise TypeError("Can only multiply by a number or one number per vector.")
+
+    def __rmul__(self, scalar: float) -> VectorArray:
+        """Right-hand scalar multiplication.
+
+        Args:
+            scalar (float): multiplier
+
+        Returns:
+            VectorArray: Scaled vectors.
+        """
+        return self.__mul__(scalar)
+
+    def __eq__(self, other: object) -> bool:
+        """Equality checker, tolerant like Vector's.
+
+        Args:
+            other (object): other operand
+
+        Returns:
+            bool: True if every component is close.
+        """
+        if not isinstance(other, VectorArray) or self._data.shape != other.data.shape:
+            return False
+        return bool(np.allclose(self._data, other.data, rtol=1e-9, atol=0.0))
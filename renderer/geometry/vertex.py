@@ -23,6 +23,8 @@ __maintainer__ = "Michael Nuttall"
 class Vertex(Coordinate3D):
     """A vertex of the form (x, y, z) in 3D space."""
 
+    __slots__ = ()
+
     def __sub__(self, other: Vertex) -> "Vector":
         """Subtract another Vertex to get the displacement Vector.
 
@@ -0,0 +1,121 @@
+"""VertexArray class to represent many vertices in 3D space at once."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+from typing import TYPE_CHECKING, List
+import numpy as np
+from numpy.typing import NDArray
+from geometry.coordarray import CoordinateArray
+from geometry.vertex import Vertex
+
+if TYPE_CHECKING:
+    from geometry.vector import Vector  # pragma: no cover
+    from geometry.vectorarray import VectorArray  # pragma: no cover
+
+
+class VertexArray(CoordinateArray):
+    """N vertices stored as an (N, 3) array; the batched form of Vertex."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_vertices(cls, vertices: List[Vertex]) -> VertexArray:
+        """Packs Vertex objects into an array.
+
+        Args:
+            vertices (List[Vertex]): Vertices to pack.
+
+        Returns:
+            VertexArray: One row per vertex.
+        """
+        return cls(np.array([(v.x, v.y, v.z) for v in vertices],
+                            dtype=np.float64).reshape(-1, 3))
+
+    def __getitem__(self, index: int) -> Vertex:
+        """Gets one vertex.
+
+        Args:
+            index (int): Row index.
+
+        Returns:
+            Vertex: The vertex at that row.
+        """
+        return Vertex(*self._data[index].tolist())
+
+    def __add__(self, other: VectorArray | Vector) -> VertexArray:
+        """Moves every vertex by a vector or by matching vectors.
+
+        Args:
+            other (VectorArray | Vector): Displacement(s).
+
+        Returns:
+            VertexArray: Moved vertices.
+
+        Raises:
+            TypeError: If other is not a Vector or VectorArray.
+        """
+        from geometry.vector import Vector
+        from geometry.vectorarray import VectorArray
+        if not isinstance(other, (Vector, VectorArray)):
+            raise TypeError("Unsupported operand type for +")
+        return VertexArray(self._data + self._operand(other))
+
+    def __sub__(self, other: object) -> VertexArray | VectorArray:
+        """Subtracts vertices to get displacements, or vectors to move vertices.
+
+        Args:
+            other (object): A Vertex or VertexArray, giving the VectorArray
+                from other to self; or a Vector or VectorArray, giving the
+                moved VertexArray.
+
+        Returns:
+            VertexArray | VectorArray: Result of the subtraction.
+
+        Raises:
+            TypeError: If other is not one of those types.
+        """
+        from geometry.vector import Vector
+        from geometry.vectorarray import VectorArray
+        if isinstance(other, (Vertex, VertexArray)):
+            return VectorArray(self._data - self._operand(other))
+        if isinstance(other, (Vector, VectorArray)):
+            return VertexArray(self._data - self._operand(other))
+        raise TypeError("Unsupported operand type for -")
+
+    def distance(self, other: VertexArray | Vertex) -> NDArray[np.float64]:
+        """Calculates the distance from each vertex to other.
+
+        Args:
+            other (VertexArray | Vertex): A vertex or matching vertices.
+
+        Returns:
+            NDArray[np.float64]: Euclidean distances of shape (N,).
+
+        Raises:
+            TypeError: If other is not a Vertex or VertexArray.
+        """
+        if not isinstance(other, (Vertex, VertexArray)):
+            raise TypeError("The argument must be a Vertex or VertexArray.")
+        offsets = self._data - self._operand(other)
+        distances: NDArray[np.float64] = np.linalg.norm(offsets, axis=1)
+        return distances
+
+    def __eq__(self, other: object) -> bool:
+        """Equality checker.
+
+        Args:
+            other (object): another object to compare.
+
+        Returns:
+            bool: True if every coordinate matches exactly.
+        """
+        if not isinstance(other, VertexArray):
+            return False
+        return self._data.shape == other.data.shape \
+            and bool(np.all(self._data == other.data))
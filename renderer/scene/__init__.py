@@ -7,7 +7,9 @@ file imports, and scene organization.
 The following classes are re-exported for convenient access:
 
 - AspectRatio: Represents the screen's aspect ratio
+- BVH: Bounding volume hierarchy over a scene's faces for culling and picking
 - Camera: Defines the viewpoint and projection system in 3D space
+- ExternalSort: Orders projected faces far-to-near in bounded memory
 - Scene: Holds a collection of Mesh3D objects and the active Camera
 - Screen: Manages the Tkinter window and draws the 2D projections
 
@@ -16,13 +18,17 @@ Example:
 """
 
 from .aspect_ratio import AspectRatio
+from .bvh import BVH
 from .camera import Camera
+from .external_sort import ExternalSort
 from .scene import Scene
 from .screen import Screen
 
 __all__ = [
     "AspectRatio",
+    "BVH",
     "Camera",
+    "ExternalSort",
     "Scene",
     "Screen"
 ]
@@ -0,0 +1,641 @@
+"""BVH class to index a scene's faces for culling, picking and nearest-face queries."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import hashlib
+import heapq
+import os
+import struct
+from typing import Any, Iterable, List, NamedTuple, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry import Mesh3D, Vector, Vertex
+from scene.camera import Camera
+
+
+class FaceHit(NamedTuple):
+    """A face found by a BVH query and its distance from the query."""
+
+    mesh: int
+    face: int
+    distance: float
+
+
+class BVH:
+    """A bounding volume hierarchy over every face of a list of meshes.
+
+    Faces are numbered mesh by mesh and their world positions gathered
+    into one (F, 3, 3) array. Nodes live in flat arrays in depth-first
+    order: each has a bounding box, the range of the face order it
+    covers and the index of its right child, while its left child is the
+    next node. Nodes are split at the median centroid along their
+    longest axis until they hold at most leaf_size faces.
+
+    Queries walk the tree one level at a time, testing every node of a
+    level in one numpy call. After a mesh moves, refit recomputes the
+    boxes bottom-up, and the tree is rebuilt once refitting has grown the
+    total box area past REBUILD_RATIO times its area when built.
+
+    Saved files hold a fixed header, with the SHA-256 key of the faces
+    the tree was built over, then the node arrays and the face order as
+    little-endian 8-byte values.
+    """
+
+    MAGIC: bytes = b"RBVH"
+    FORMAT_VERSION: int = 1
+    EXTENSION: str = ".rbvh"
+    HEADER: struct.Struct = struct.Struct("<4sIQQ32s")
+    COORD_DTYPE: np.dtype[np.float64] = np.dtype("<f8")
+    INDEX_DTYPE: np.dtype[np.int64] = np.dtype("<i8")
+    DEFAULT_LEAF_SIZE: int = 16
+    REBUILD_RATIO: float = 2.0
+    PARALLEL_EPSILON: float = 1e-12
+
+    def __init__(self, meshes: List[Mesh3D],
+                 leaf_size: int = DEFAULT_LEAF_SIZE) -> None:
+        """Constructor
+
+        Gathers the faces of the meshes; call build or load before querying.
+
+        Args:
+            meshes (List[Mesh3D]): Meshes to index, in scene order.
+            leaf_size (int, optional): Most faces a leaf may hold.
+
+        Raises:
+            ValueError: If leaf_size is less than 1.
+        """
+        if leaf_size < 1:
+            raise ValueError("Leaf size must be at least 1.")
+        self._meshes: List[Mesh3D] = meshes
+        self._leaf_size: int = leaf_size
+        self._offsets: NDArray[np.int64] = np.zeros(1, dtype=np.int64)
+        self._triangles: NDArray[np.float64] = np.zeros((0, 3, 3))
+        self._key: str | None = None
+        self._lower: NDArray[np.float64] = np.zeros((0, 3))
+        self._upper: NDArray[np.float64] = np.zeros((0, 3))
+        self._start: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._count: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._right: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._order: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._built_area: float = 0.0
+        self._gather()
+
+    @property
+    def meshes(self) -> List[Mesh3D]:
+        """Gets the indexed meshes.
+
+        Returns:
+            List[Mesh3D]: Meshes in scene order.
+        """
+        return self._meshes
+
+    @property
+    def leaf_size(self) -> int:
+        """Gets the most faces a leaf may hold.
+
+        Returns:
+            int: Leaf size.
+        """
+        return self._leaf_size
+
+    @property
+    def num_faces(self) -> int:
+        """Gets the number of indexed faces.
+
+        Returns:
+            int: Face count over all meshes.
+        """
+        return len(self._triangles)
+
+    @property
+    def num_nodes(self) -> int:
+        """Gets the number of nodes in the tree.
+
+        Returns:
+            int: Node count; 0 before the tree is built.
+        """
+        return len(self._right)
+
+    @property
+    def is_built(self) -> bool:
+        """Checks whether the tree has been built or loaded.
+
+        Returns:
+            bool: True if queries can run.
+        """
+        return self.num_nodes > 0
+
+    @property
+    def key(self) -> str:
+        """Gets the content key of the indexed faces, computed once and cached.
+
+        Returns:
+            str: Hex SHA-256 digest of the face counts and positions.
+        """
+        if self._key is None:
+            hasher = hashlib.sha256()
+            hasher.update(self._offsets.astype(self.INDEX_DTYPE).tobytes())
+            hasher.update(self._triangles.astype(self.COORD_DTYPE).tobytes())
+            self._key = hasher.hexdigest()
+        return self._key
+
+    @property
+    def bounds(self) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Gets the box of the root node.
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.float64]]: Minimum and
+                maximum corners, shape (3,) each.
+
+        Raises:
+            RuntimeError: If the tree has not been built.
+        """
+        self._require_built()
+        return self._lower[0], self._upper[0]
+
+    def build(self) -> None:
+        """Builds the tree over the gathered faces by median splits."""
+        face_lower = self._triangles.min(axis=1)
+        face_upper = self._triangles.max(axis=1)
+        centroids = (face_lower + face_upper) / 2
+        order = np.arange(self.num_faces, dtype=np.int64)
+        lower: List[NDArray[np.float64]] = []
+        upper: List[NDArray[np.float64]] = []
+        start: List[int] = []
+        count: List[int] = []
+        right: List[int] = []
+        stack = [(0, self.num_faces, -1)]
+        while stack:
+            first, last, parent = stack.pop()
+            if parent >= 0:
+                right[parent] = len(start)
+            faces = order[first:last]
+            lower.append(face_lower[faces].min(axis=0) if faces.size else np.zeros(3))
+            upper.append(face_upper[faces].max(axis=0) if faces.size else np.zeros(3))
+            start.append(first)
+            count.append(last - first)
+            right.append(-1)
+            if last - first <= self._leaf_size:
+                continue
+            spread = centroids[faces]
+            axis = int(np.argmax(spread.max(axis=0) - spread.min(axis=0)))
+            middle = (first + last) // 2
+            order[first:last] = faces[np.argpartition(spread[:, axis], middle - first)]
+            stack.append((middle, last, len(start) - 1))
+            stack.append((first, middle, -1))
+
+        self._lower, self._upper = np.array(lower), np.array(upper)
+        self._start = np.array(start, dtype=np.int64)
+        self._count = np.array(count, dtype=np.int64)
+        self._right = np.array(right, dtype=np.int64)
+        self._order = order
+        self._built_area = self._area()
+
+    def cull(self, camera: Camera) -> List[Tuple[int, NDArray[np.int64]]]:
+        """Finds the faces in leaves that may overlap the camera's view frustum.
+
+        Subtrees wholly inside the frustum are taken without visiting
+        their children and ones wholly outside are skipped, so only the
+        nodes crossing a frustum plane are opened. Faces in a crossing
+        leaf are all kept, so callers still test them one by one.
+
+        Args:
+            camera (Camera): Camera whose frustum planes to test against.
+
+        Returns:
+            List[Tuple[int, NDArray[np.int64]]]: For each mesh with
+                candidate faces, its index and its face indices in
+                ascending order, in mesh order.
+
+        Raises:
+            RuntimeError: If the tree has not been built.
+        """
+        self._require_built()
+        planes = camera.frustum_planes
+        normals, offsets = planes[:, :3], planes[:, 3]
+        nodes = np.zeros(1, dtype=np.int64)
+        taken: List[NDArray[np.int64]] = []
+        while nodes.size:
+            to_lower = self._lower[nodes, np.newaxis, :] * normals
+            to_upper = self._upper[nodes, np.newaxis, :] * normals
+            deepest = np.maximum(to_lower, to_upper).sum(axis=2)
+            shallowest = np.minimum(to_lower, to_upper).sum(axis=2)
+            overlaps = np.all(deepest >= offsets, axis=1)
+            contained = np.all(shallowest >= offsets, axis=1)
+            nodes, contained = nodes[overlaps], contained[overlaps]
+            whole = contained | (self._right[nodes] < 0)
+            taken.append(nodes[whole])
+            nodes = self._children(nodes[~whole])
+        return self._group(self._faces_under(np.concatenate(taken)))
+
+    def pick(self, origin: Vertex, direction: Vector) -> FaceHit | None:
+        """Finds the first face hit by a ray.
+
+        Both sides of a face can be hit. Nodes whose box the ray misses,
+        or enters beyond the nearest hit so far, are skipped.
+
+        Args:
+            origin (Vertex): Start of the ray.
+            direction (Vector): Direction of the ray.
+
+        Returns:
+            FaceHit | None: The nearest face hit and the distance along the
+                ray, or None if the ray hits nothing.
+
+        Raises:
+            RuntimeError: If the tree has not been built.
+            ValueError: If direction is the zero vector.
+        """
+        self._require_built()
+        unit = direction.normalize
+        start = np.array([origin.x, origin.y, origin.z])
+        heading = np.array([unit.x, unit.y, unit.z])
+        with np.errstate(divide="ignore"):
+            inverse = 1.0 / heading
+        best, hit = np.inf, -1
+        nodes = np.zeros(1, dtype=np.int64)
+        while nodes.size:
+            nodes = nodes[self._ray_entries(nodes, start, inverse) < best]
+            faces = self._faces_under(nodes[self._right[nodes] < 0])
+            if faces.size:
+                distances = self._ray_distances(start, heading, self._triangles[faces])
+                nearest = int(np.argmin(distances))
+                if distances[nearest] < best:
+                    best, hit = float(distances[nearest]), int(faces[nearest])
+            nodes = self._children(nodes[self._right[nodes] >= 0])
+        return None if hit < 0 else FaceHit(*self._locate(hit), best)
+
+    def nearest(self, point: Vertex) -> FaceHit | None:
+        """Finds the face closest to a point.
+
+        Nodes are opened nearest box first and the search stops once the
+        nearest unopened box is farther than the best face found.
+
+        Args:
+            point (Vertex): Query point.
+
+        Returns:
+            FaceHit | None: The closest face and its distance, or None if
+                there are no faces.
+
+        Raises:
+            RuntimeError: If the tree has not been built.
+        """
+        self._require_built()
+        if not self.num_faces:
+            return None
+        target = np.array([point.x, point.y, point.z])
+        best, hit = np.inf, -1
+        queue = [(self._box_distance(target, 0), 0)]
+        while queue:
+            distance, node = heapq.heappop(queue)
+            if distance >= best:
+                break
+            if self._right[node] >= 0:
+                for child in (node + 1, int(self._right[node])):
+                    heapq.heappush(queue, (self._box_distance(target, child), child))
+                continue
+            faces = self._order[self._start[node]:self._start[node] + self._count[node]]
+            distances = self._point_distances(target, self._triangles[faces])
+            closest = int(np.argmin(distances))
+            if distances[closest] < best:
+                best, hit = float(distances[closest]), int(faces[closest])
+        return FaceHit(*self._locate(hit), best)
+
+    def refit(self, mesh_indices: Iterable[int]) -> None:
+        """Updates the tree after meshes have moved.
+
+        The moved meshes' faces are gathered again and every box is
+        recomputed bottom-up, keeping the tree's shape. The tree is rebuilt
+        instead if a mesh's face count changed, or if refitting has left
+        the boxes too loose.
+
+        Args:
+            mesh_indices (Iterable[int]): Indices of the meshes that moved.
+
+        Raises:
+            RuntimeError: If the tree has not been built.
+        """
+        self._require_built()
+        for index in mesh_indices:
+            first, last = self._offsets[index], self._offsets[index + 1]
+            if self._meshes[index].num_faces != last - first:
+                self._gather()
+                self.build()
+                return
+            self._triangles[first:last] = self._meshes[index].corners
+        self._key = None
+        self._refit_boxes()
+        if self._area() > self.REBUILD_RATIO * self._built_area:
+            self.build()
+
+    def save(self, path: str) -> None:
+        """Writes the tree to a file, replacing it atomically.
+
+        Args:
+            path (str): Destination path.
+
+        Raises:
+            RuntimeError: If the tree has not been built.
+        """
+        self._require_built()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, 'wb') as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, self.num_nodes,
+                                        self.num_faces, bytes.fromhex(self.key)))
+            for array, dtype in self._stored_arrays():
+                file.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        os.replace(partial, path)
+
+    def load(self, path: str) -> bool:
+        """Reads a saved tree if it was built over the same faces.
+
+        A file whose key does not match the gathered faces is ignored, so
+        a stale file is never used.
+
+        Args:
+            path (str): Saved tree path.
+
+        Raises:
+            ValueError: If the file is not a saved tree or is truncated.
+
+        Returns:
+            bool: True if the tree was loaded; False if the file is
+                missing or was built over other faces.
+        """
+        if not os.path.isfile(path):
+            return False
+        with open(path, 'rb') as file:
+            header = file.read(self.HEADER.size)
+            if len(header) != self.HEADER.size:
+                raise ValueError("Not a saved BVH file.")
+            magic, version, num_nodes, num_faces, digest = self.HEADER.unpack(header)
+            if magic != self.MAGIC or version != self.FORMAT_VERSION:
+                raise ValueError("Not a saved BVH file.")
+            if num_faces != self.num_faces or digest.hex() != self.key:
+                return False
+            arrays: List[NDArray[Any]] = []
+            for rows, columns, dtype in ((num_nodes, 3, self.COORD_DTYPE),
+                                         (num_nodes, 3, self.COORD_DTYPE),
+                                         (num_nodes, 1, self.INDEX_DTYPE),
+                                         (num_nodes, 1, self.INDEX_DTYPE),
+                                         (num_nodes, 1, self.INDEX_DTYPE),
+                                         (num_faces, 1, self.INDEX_DTYPE)):
+                array = np.fromfile(file, dtype=dtype, count=rows * columns)
+                if array.size != rows * columns:
+                    raise ValueError("Saved BVH file is truncated.")
+                arrays.append(array.reshape(rows, 3) if columns == 3 else array)
+        os.utime(path)  # mark as recently used
+        self._lower, self._upper, self._start, self._count, self._right, \
+            self._order = arrays
+        self._built_area = self._area()
+        return True
+
+    def _gather(self) -> None:
+        """Gathers the world positions of every face of every mesh."""
+        counts = [mesh.num_faces for mesh in self._meshes]
+        self._offsets = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)]) \
+            .astype(np.int64)
+        self._triangles = np.zeros((int(self._offsets[-1]), 3, 3))
+        for index, mesh in enumerate(self._meshes):
+            start, stop = self._offsets[index], self._offsets[index + 1]
+            self._triangles[start:stop] = mesh.corners
+        self._key = None
+
+    def _stored_arrays(self) -> List[Tuple[NDArray[Any], np.dtype[Any]]]:
+        """Gets the arrays a saved file holds, in file order.
+
+        Returns:
+            List[Tuple[NDArray[Any], np.dtype[Any]]]: Each array and the
+                dtype it is written as.
+        """
+        return [(self._lower, self.COORD_DTYPE), (self._upper, self.COORD_DTYPE),
+                (self._start, self.INDEX_DTYPE), (self._count, self.INDEX_DTYPE),
+                (self._right, self.INDEX_DTYPE), (self._order, self.INDEX_DTYPE)]
+
+    def _require_built(self) -> None:
+        """Checks that the tree can be queried.
+
+        Raises:
+            RuntimeError: If the tree has not been built or loaded.
+        """
+        if not self.is_built:
+            raise RuntimeError("BVH has not been built.")
+
+    def _levels(self) -> List[NDArray[np.int64]]:
+        """Gets the nodes of each level of the tree, root first.
+
+        Returns:
+            List[NDArray[np.int64]]: Node indices per level.
+        """
+        levels = []
+        nodes = np.zeros(1, dtype=np.int64)
+        while nodes.size:
+            levels.append(nodes)
+            nodes = self._children(nodes[self._right[nodes] >= 0])
+        return levels
+
+    def _children(self, inner: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Gets the children of internal nodes.
+
+        Args:
+            inner (NDArray[np.int64]): Internal node indices.
+
+        Returns:
+            NDArray[np.int64]: Left children, then right children.
+        """
+        return np.concatenate([inner + 1, self._right[inner]])
+
+    def _faces_under(self, nodes: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Gets the faces in the subtrees of some nodes.
+
+        Args:
+            nodes (NDArray[np.int64]): Node indices with disjoint subtrees.
+
+        Returns:
+            NDArray[np.int64]: Face indices, in tree order.
+        """
+        counts = self._count[nodes]
+        ends = np.cumsum(counts)
+        positions = np.arange(ends[-1] if ends.size else 0) \
+            + np.repeat(self._start[nodes] - (ends - counts), counts)
+        faces: NDArray[np.int64] = self._order[positions]
+        return faces
+
+    def _locate(self, face: int) -> Tuple[int, int]:
+        """Finds the mesh a face belongs to.
+
+        Args:
+            face (int): Face index over all meshes.
+
+        Returns:
+            Tuple[int, int]: Mesh index and face index within the mesh.
+        """
+        mesh = int(np.searchsorted(self._offsets, face, side="right")) - 1
+        return mesh, face - int(self._offsets[mesh])
+
+    def _group(self, faces: NDArray[np.int64]) -> List[Tuple[int, NDArray[np.int64]]]:
+        """Splits face indices over all meshes into per-mesh indices.
+
+        Args:
+            faces (NDArray[np.int64]): Face indices over all meshes.
+
+        Returns:
+            List[Tuple[int, NDArray[np.int64]]]: Mesh index and ascending
+                face indices within it, for each mesh with faces.
+        """
+        faces = np.sort(faces)
+        owners = np.searchsorted(self._offsets, faces, side="right") - 1
+        meshes, firsts = np.unique(owners, return_index=True)
+        lasts = [*firsts[1:].tolist(), len(faces)]
+        return [(mesh, faces[first:last] - self._offsets[mesh])
+                for mesh, first, last in zip(meshes.tolist(), firsts.tolist(), lasts)]
+
+    def _area(self) -> float:
+        """Sums the surface areas of every node's box.
+
+        Returns:
+            float: Total area, the cost a query pays for loose boxes.
+        """
+        x, y, z = (self._upper - self._lower).T
+        return float(2 * np.sum(x * y + y * z + z * x))
+
+    def _refit_boxes(self) -> None:
+        """Recomputes every box from the faces, leaves first."""
+        if not self.num_faces:
+            return
+        ordered = self._triangles[self._order]
+        leaves = np.flatnonzero(self._right < 0)
+        # Leaves cover consecutive ranges of the face order, in node order.
+        starts = self._start[leaves]
+        self._lower[leaves] = np.minimum.reduceat(ordered.min(axis=1), starts)
+        self._upper[leaves] = np.maximum.reduceat(ordered.max(axis=1), starts)
+        for level in reversed(self._levels()):
+            inner = level[self._right[level] >= 0]
+            self._lower[inner] = np.minimum(self._lower[inner + 1],
+                                            self._lower[self._right[inner]])
+            self._upper[inner] = np.maximum(self._upper[inner + 1],
+                                            self._upper[self._right[inner]])
+
+    def _ray_entries(self, nodes: NDArray[np.int64], start: NDArray[np.float64],
+                     inverse: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Measures where a ray enters each node's box, by the slab method.
+
+        Args:
+            nodes (NDArray[np.int64]): Node indices.
+            start (NDArray[np.float64]): Ray origin, shape (3,).
+            inverse (NDArray[np.float64]): Reciprocal of the unit ray
+                direction, inf where a component is zero.
+
+        Returns:
+            NDArray[np.float64]: Distance along the ray to each box, 0 if
+                the origin is inside it and inf if the ray misses it.
+        """
+        with np.errstate(invalid="ignore"):
+            to_lower = (self._lower[nodes] - start) * inverse
+            to_upper = (self._upper[nodes] - start) * inverse
+        # fmin and fmax skip the nan from a ray lying in a box face.
+        entry = np.maximum(np.fmax.reduce(np.fmin(to_lower, to_upper), axis=1), 0.0)
+        exit_ = np.fmin.reduce(np.fmax(to_lower, to_upper), axis=1)
+        entries: NDArray[np.float64] = np.where(entry <= exit_, entry, np.inf)
+        return entries
+
+    @classmethod
+    def _ray_distances(cls, start: NDArray[np.float64], heading: NDArray[np.float64],
+                       triangles: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Intersects a ray with many triangles (Moller-Trumbore).
+
+        Args:
+            start (NDArray[np.float64]): Ray origin, shape (3,).
+            heading (NDArray[np.float64]): Unit ray direction, shape (3,).
+            triangles (NDArray[np.float64]): Corners of shape (K, 3, 3).
+
+        Returns:
+            NDArray[np.float64]: Distance along the ray to each triangle,
+                inf where it is missed or parallel to the ray.
+        """
+        first = triangles[:, 0]
+        edge1, edge2 = triangles[:, 1] - first, triangles[:, 2] - first
+        across = np.cross(heading, edge2)
+        determinant = np.einsum("ij,ij->i", edge1, across)
+        offset = start - first
+        upward = np.cross(offset, edge1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = np.einsum("ij,ij->i", offset, across) / determinant
+            v = upward @ heading / determinant
+            distance = np.einsum("ij,ij->i", edge2, upward) / determinant
+        hit = (np.abs(determinant) > cls.PARALLEL_EPSILON) & (u >= 0) & (v >= 0) \
+            & (u + v <= 1) & (distance >= 0)
+        distances: NDArray[np.float64] = np.where(hit, distance, np.inf)
+        return distances
+
+    @staticmethod
+    def _segment_distances(point: NDArray[np.float64], first: NDArray[np.float64],
+                           second: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Measures the distance from a point to many line segments.
+
+        Args:
+            point (NDArray[np.float64]): Query point, shape (3,).
+            first (NDArray[np.float64]): Segment starts, shape (K, 3).
+            second (NDArray[np.float64]): Segment ends, shape (K, 3).
+
+        Returns:
+            NDArray[np.float64]: Distances of shape (K,).
+        """
+        along = second - first
+        lengths = np.einsum("ij,ij->i", along, along)
+        projected = np.einsum("ij,ij->i", point - first, along)
+        fraction = np.clip(np.divide(projected, lengths, out=np.zeros_like(projected),
+                                     where=lengths > 0), 0.0, 1.0)
+        distances: NDArray[np.float64] = np.linalg.norm(
+            point - (first + along * fraction[:, np.newaxis]), axis=1)
+        return distances
+
+    @classmethod
+    def _point_distances(cls, point: NDArray[np.float64],
+                         triangles: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Measures the distance from a point to many triangles.
+
+        A point whose projection falls inside a triangle is as far from
+        it as from its plane; otherwise the nearest edge is closest.
+
+        Args:
+            point (NDArray[np.float64]): Query point, shape (3,).
+            triangles (NDArray[np.float64]): Corners of shape (K, 3, 3).
+
+        Returns:
+            NDArray[np.float64]: Distances of shape (K,).
+        """
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        normals = np.cross(b - a, c - a)
+        areas = np.linalg.norm(normals, axis=1)
+        inside = areas > 0
+        for first, second in ((a, b), (b, c), (c, a)):
+            inside &= np.einsum("ij,ij->i", np.cross(second - first, point - first),
+                                normals) >= 0
+        heights = np.abs(np.einsum("ij,ij->i", point - a, normals)) \
+            / np.where(inside, areas, 1.0)
+        edges = np.minimum.reduce([cls._segment_distances(point, first, second)
+                                   for first, second in ((a, b), (b, c), (c, a))])
+        distances: NDArray[np.float64] = np.where(inside, heights, edges)
+        return distances
+
+    def _box_distance(self, point: NDArray[np.float64], node: int) -> float:
+        """Measures the distance from a point to a node's box.
+
+        Args:
+            point (NDArray[np.float64]): Query point, shape (3,).
+            node (int): Node index.
+
+        Returns:
+            float: Distance; 0 inside the box.
+        """
+        gaps = np.maximum(self._lower[node] - point, point - self._upper[node])
+        return float(np.linalg.norm(np.maximum(gaps, 0.0)))
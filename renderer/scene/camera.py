@@ -1,32 +1,128 @@
 """Camera class for defining a viewpoint in 3D space."""
 
 from __future__ import annotations
-from typing import List
-from geometry import Face3D, Face2D, Vector, Vertex, Point, Shader
+import math
+from typing import Any, List, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry import Face3D, Face2D, IndexedMesh3D, Mesh3D, MeshBuffer, Vector, \
+    Vertex, VertexArray, Point, Shader
+from geometry.mesh3d import Quantization
+from scene.aspect_ratio import AspectRatio
 
 __author__ = "Michael Nuttall"
 __date__ = "2025/04/16"
 __license__ = "MIT"
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 __maintainer__ = "Michael Nuttall"
 
 
 class Camera(Vertex):
-    """A camera defined by its position and orientation in 3D space."""
+    """A camera defined by its position and orientation in 3D space.
 
-    def __init__(self, origin: Vertex, look_at: Vertex) -> None:
+    Camera space has x along right, y along up and z along forward, so
+    depth is positive in front of the camera. The view, projection and
+    combined matrices and the frustum planes are built on first use and
+    kept until the origin, the look-at point or a lens setting changes.
+
+    The view frustum is bounded by the near and far planes and, once a
+    viewport is set, by the edges of the visible image plane.
+    """
+
+    def __init__(self, origin: Vertex, look_at: Vertex, focal_length: float = 1.0,
+                 near: float = 0.1, far: float = math.inf,
+                 viewport: AspectRatio | None = None) -> None:
         """Constructor
 
         Args:
             origin (Vertex): Camera's position in 3D space.
             look_at (Vertex): Point the camera looks at.
+            focal_length (float, optional): Distance from the camera to the
+                image plane. Defaults to 1.
+            near (float, optional): Depth of the near clipping plane.
+            far (float, optional): Depth of the far clipping plane;
+                unbounded by default.
+            viewport (AspectRatio | None, optional): Width and height of the
+                visible image plane, as shown by the Screen. Defaults to
+                None, leaving the sides of the frustum open.
+
+        Raises:
+            ValueError: If focal_length is not positive or the planes do
+                not satisfy 0 < near < far.
         """
         super().__init__(origin.x, origin.y, origin.z)
         self._look_at: Vertex = look_at
         self._forward: Vector = Vector(0.0, 0.0, -1.0)
         self._up: Vector = Vector(0.0, 1.0, 0.0)
         self._right: Vector = Vector(1.0, 0.0, 0.0)
+        self._focal_length: float = 1.0
+        self._near: float = 0.1
+        self._far: float = math.inf
+        self._view: NDArray[np.float64] | None = None
+        self._projection: NDArray[np.float64] | None = None
+        self._view_projection: NDArray[np.float64] | None = None
+        self._viewport: AspectRatio | None = viewport
+        self._frustum: NDArray[np.float64] | None = None
+
+        self.focal_length = focal_length
+        self.set_clip_planes(near, far)
+        self._recalculate_axes()
+
+    @property
+    def x(self) -> float:
+        """Property to get x.
+
+        Returns:
+            float: x
+        """
+        return self._x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        """Moves the camera along x, keeping it aimed at the look-at point.
+
+        Args:
+            value (float): x
+        """
+        self._x = value
+        self._recalculate_axes()
+
+    @property
+    def y(self) -> float:
+        """Property to get y.
+
+        Returns:
+            float: y
+        """
+        return self._y
 
+    @y.setter
+    def y(self, value: float) -> None:
+        """Moves the camera along y, keeping it aimed at the look-at point.
+
+        Args:
+            value (float): y
+        """
+        self._y = value
+        self._recalculate_axes()
+
+    @property
+    def z(self) -> float:
+        """Property to get z.
+
+        Returns:
+            float: z
+        """
+        return self._z
+
+    @z.setter
+    def z(self, value: float) -> None:
+        """Moves the camera along z, keeping it aimed at the look-at point.
+
+        Args:
+            value (float): z
+        """
+        self._z = value
         self._recalculate_axes()
 
     def _recalculate_axes(self) -> None:
@@ -45,6 +141,9 @@ class Camera(Vertex):
         self._forward = forward
         self._right = right
         self._up = up
+        self._view = None
+        self._view_projection = None
+        self._frustum = None
 
     def set_look_at(self, new_look_at: Vertex) -> None:
         """Sets a new look-at point for the camera and recalculates axes.
@@ -64,6 +163,367 @@ class Camera(Vertex):
         """
         return self._forward
 
+    @property
+    def basis(self) -> NDArray[np.float64]:
+        """Returns the view basis as a matrix, rebuilt only when the axes change.
+
+        Returns:
+            NDArray[np.float64]: Rows right, up and forward, shape (3, 3).
+        """
+        return self.view_matrix[:3, :3]
+
+    @property
+    def focal_length(self) -> float:
+        """Returns the distance from the camera to the image plane.
+
+        Returns:
+            float: Focal length.
+        """
+        return self._focal_length
+
+    @focal_length.setter
+    def focal_length(self, value: float) -> None:
+        """Sets the focal length.
+
+        Args:
+            value (float): Distance to the image plane.
+
+        Raises:
+            ValueError: If value is not positive.
+        """
+        if not value > 0:
+            raise ValueError("Focal length must be positive.")
+        self._focal_length = value
+        self._projection = None
+        self._view_projection = None
+        self._frustum = None
+
+    @property
+    def near(self) -> float:
+        """Returns the depth of the near clipping plane.
+
+        Returns:
+            float: Near plane depth.
+        """
+        return self._near
+
+    @property
+    def far(self) -> float:
+        """Returns the depth of the far clipping plane.
+
+        Returns:
+            float: Far plane depth, possibly infinite.
+        """
+        return self._far
+
+    def set_clip_planes(self, near: float, far: float = math.inf) -> None:
+        """Sets the near and far clipping planes.
+
+        Args:
+            near (float): Depth of the near plane.
+            far (float, optional): Depth of the far plane; unbounded by default.
+
+        Raises:
+            ValueError: If the planes do not satisfy 0 < near < far.
+        """
+        if not 0 < near < far:
+            raise ValueError(f"Clip planes must satisfy 0 < near < far, "
+                             f"got {near} and {far}.")
+        self._near = near
+        self._far = far
+        self._projection = None
+        self._view_projection = None
+        self._frustum = None
+
+    @property
+    def viewport(self) -> AspectRatio | None:
+        """Returns the visible extent of the image plane.
+
+        Returns:
+            AspectRatio | None: Width and height of the image plane, or None
+                if the sides of the frustum are open.
+        """
+        return self._viewport
+
+    @viewport.setter
+    def viewport(self, value: AspectRatio | None) -> None:
+        """Sets the visible extent of the image plane.
+
+        Args:
+            value (AspectRatio | None): Width and height of the image plane,
+                e.g. the Screen's aspect ratio, or None to open the sides.
+        """
+        self._viewport = value
+        self._frustum = None
+
+    def field_of_view(self, extent: float) -> float:
+        """Gets the angle of view across an image-plane extent.
+
+        Args:
+            extent (float): Width or height of the visible image plane,
+                e.g. an AspectRatio component.
+
+        Returns:
+            float: Angle in radians.
+        """
+        return 2 * math.atan(extent / (2 * self._focal_length))
+
+    def set_field_of_view(self, angle: float, extent: float) -> None:
+        """Sets the focal length that gives an angle of view across an extent.
+
+        Args:
+            angle (float): Angle in radians, between 0 and pi.
+            extent (float): Width or height of the visible image plane.
+
+        Raises:
+            ValueError: If angle is not between 0 and pi.
+        """
+        if not 0 < angle < math.pi:
+            raise ValueError("Field of view must be between 0 and pi radians.")
+        self.focal_length = extent / (2 * math.tan(angle / 2))
+
+    @property
+    def view_matrix(self) -> NDArray[np.float64]:
+        """Returns the 4x4 matrix from world to camera space.
+
+        Built on first use after the origin or look-at point changes.
+
+        Returns:
+            NDArray[np.float64]: Homogeneous matrix whose top rows are the
+                right, up and forward axes, translated by the origin.
+        """
+        if self._view is None:
+            rotation = np.array([[axis.x, axis.y, axis.z]
+                                 for axis in (self._right, self._up, self._forward)])
+            view = np.eye(4)
+            view[:3, :3] = rotation
+            view[:3, 3] = -(rotation @ np.array([self._x, self._y, self._z]))
+            self._view = view
+        return self._view
+
+    @property
+    def projection_matrix(self) -> NDArray[np.float64]:
+        """Returns the 4x4 matrix from camera space to clip space.
+
+        After dividing by w (the depth), x and y are the image-plane
+        coordinates that project_vertex returns, scaled by the focal length,
+        and z runs from 0 at the near plane to 1 at the far plane.
+
+        Returns:
+            NDArray[np.float64]: Homogeneous projection matrix.
+        """
+        if self._projection is None:
+            depth = 1.0 if math.isinf(self._far) \
+                else self._far / (self._far - self._near)
+            focal = self._focal_length
+            self._projection = np.array([[focal, 0.0, 0.0, 0.0],
+                                         [0.0, focal, 0.0, 0.0],
+                                         [0.0, 0.0, depth, -self._near * depth],
+                                         [0.0, 0.0, 1.0, 0.0]])
+        return self._projection
+
+    @property
+    def view_projection_matrix(self) -> NDArray[np.float64]:
+        """Returns the combined 4x4 matrix from world to clip space.
+
+        Returns:
+            NDArray[np.float64]: projection_matrix @ view_matrix.
+        """
+        if self._view_projection is None:
+            self._view_projection = self.projection_matrix @ self.view_matrix
+        return self._view_projection
+
+    @property
+    def frustum_planes(self) -> NDArray[np.float64]:
+        """Returns the planes bounding the view frustum in world space.
+
+        Built on first use after the camera moves or a lens setting changes.
+        Rows are the near plane, the far plane if it is finite, then the
+        right, left, top and bottom planes if a viewport is set.
+
+        Returns:
+            NDArray[np.float64]: Planes (nx, ny, nz, d) of shape (P, 4) with
+                unit normals pointing inwards; a point p is inside a plane
+                when n . p >= d.
+        """
+        if self._frustum is None:
+            right, up, forward = self.basis
+            normals = [forward]
+            if not math.isinf(self._far):
+                normals.append(-forward)
+            if self._viewport is not None:
+                half_width, half_height = self._half_extents(self._viewport)
+                sides = np.array([half_width * forward - right,
+                                  half_width * forward + right,
+                                  half_height * forward - up,
+                                  half_height * forward + up])
+                normals.extend(sides / np.linalg.norm(sides, axis=1)[:, np.newaxis])
+            rows = np.array(normals)
+            offsets = rows @ np.array([self._x, self._y, self._z])
+            offsets[0] += self._near
+            if not math.isinf(self._far):
+                offsets[1] -= self._far
+            self._frustum = np.column_stack([rows, offsets])
+        return self._frustum
+
+    def _half_extents(self, viewport: AspectRatio) -> Tuple[float, float]:
+        """Gets the slopes of the frustum's sides.
+
+        Args:
+            viewport (AspectRatio): Visible extent of the image plane.
+
+        Returns:
+            Tuple[float, float]: Half width and half height of the visible
+                region at unit depth.
+        """
+        return (viewport.horizontal / (2 * self._focal_length),
+                viewport.vertical / (2 * self._focal_length))
+
+    def is_box_in_frustum(self, lower: NDArray[np.float64],
+                          upper: NDArray[np.float64]) -> bool:
+        """Checks whether an axis-aligned box may be inside the view frustum.
+
+        The test is conservative: a box near a corner of the frustum can
+        pass while being outside it, but a box that overlaps it never fails.
+
+        Args:
+            lower (NDArray[np.float64]): Minimum corner of the box, shape (3,).
+            upper (NDArray[np.float64]): Maximum corner of the box, shape (3,).
+
+        Returns:
+            bool: False if the box lies entirely outside one frustum plane.
+        """
+        return self._box_test(lower, upper)[0]
+
+    def _box_test(self, lower: NDArray[np.float64], upper: NDArray[np.float64]
+                  ) -> Tuple[bool, bool]:
+        """Classifies an axis-aligned box against the view frustum.
+
+        Args:
+            lower (NDArray[np.float64]): Minimum corner of the box, shape (3,).
+            upper (NDArray[np.float64]): Maximum corner of the box, shape (3,).
+
+        Returns:
+            Tuple[bool, bool]: Whether the box may overlap the frustum, and
+                whether it lies entirely inside it.
+        """
+        planes = self.frustum_planes
+        to_upper, to_lower = planes[:, :3] * upper, planes[:, :3] * lower
+        deepest = np.maximum(to_upper, to_lower).sum(axis=1)
+        shallowest = np.minimum(to_upper, to_lower).sum(axis=1)
+        return bool(np.all(deepest >= planes[:, 3])), \
+            bool(np.all(shallowest >= planes[:, 3]))
+
+    def is_sphere_in_frustum(self, center: NDArray[np.float64], radius: float) -> bool:
+        """Checks whether a sphere may be inside the view frustum.
+
+        Args:
+            center (NDArray[np.float64]): Center of the sphere, shape (3,).
+            radius (float): Radius of the sphere.
+
+        Returns:
+            bool: False if the sphere lies entirely outside one frustum plane.
+        """
+        planes = self.frustum_planes
+        return bool(np.all(planes[:, :3] @ center - planes[:, 3] >= -radius))
+
+    def is_mesh_in_frustum(self, mesh: Mesh3D) -> bool:
+        """Checks whether a mesh may be inside the view frustum with one test.
+
+        Uses the mesh's cached bounding sphere and box, so no face is read.
+
+        Args:
+            mesh (Mesh3D): Mesh to test.
+
+        Returns:
+            bool: False if the mesh cannot be visible.
+        """
+        return self._mesh_test(mesh)[0]
+
+    def _mesh_test(self, mesh: Mesh3D) -> Tuple[bool, bool]:
+        """Classifies a mesh against the view frustum by its cached bounds.
+
+        The bounding sphere settles most meshes with one small product; the
+        bounding box decides the ones the sphere leaves undecided.
+
+        Args:
+            mesh (Mesh3D): Mesh to test.
+
+        Returns:
+            Tuple[bool, bool]: Whether the mesh may overlap the frustum, and
+                whether it lies entirely inside it.
+        """
+        center, radius = mesh.bounding_sphere
+        planes = self.frustum_planes
+        distances = planes[:, :3] @ center - planes[:, 3]
+        if np.any(distances < -radius):
+            return False, False
+        if np.all(distances >= radius):
+            return True, True
+        return self._box_test(*mesh.bounds)
+
+    def is_face_in_frustum(self, face: Face3D) -> bool:
+        """Checks whether a face may be visible inside the view frustum.
+
+        Args:
+            face (Face3D): Face composed of 3 vertices.
+
+        Returns:
+            bool: False if all its vertices are outside the same plane.
+        """
+        corners = np.array([[(vertex.x, vertex.y, vertex.z) for vertex in face.points]])
+        return bool(self._in_frustum(self._to_view(corners))[0])
+
+    def _in_frustum(self, view: NDArray[np.float64]) -> NDArray[np.bool_]:
+        """Checks which faces may be visible inside the view frustum.
+
+        A face is culled only when all its corners are outside the same
+        plane, so faces crossing an edge of the frustum are kept.
+
+        Args:
+            view (NDArray[np.float64]): Camera-space corners of shape (F, 3, 3).
+
+        Returns:
+            NDArray[np.bool_]: Mask of shape (F,).
+        """
+        x, y, z = view[..., 0], view[..., 1], view[..., 2]
+        outside = [z < self._near, z > self._far]
+        if self._viewport is not None:
+            half_width, half_height = self._half_extents(self._viewport)
+            outside += [x > half_width * z, x < -half_width * z,
+                        y > half_height * z, y < -half_height * z]
+        inside: NDArray[np.bool_] = ~np.any([side.all(axis=1) for side in outside],
+                                            axis=0)
+        return inside
+
+    def _to_view(self, positions: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Transforms world positions to camera space.
+
+        Args:
+            positions (NDArray[np.float64]): Positions of shape (..., 3).
+
+        Returns:
+            NDArray[np.float64]: Camera-space positions of the same shape.
+        """
+        matrix = self.view_matrix
+        view: NDArray[np.float64] = positions @ matrix[:3, :3].T + matrix[:3, 3]
+        return view
+
+    def _perspective(self, view: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Projects camera-space positions onto the image plane.
+
+        Args:
+            view (NDArray[np.float64]): Camera-space positions of shape (..., 3).
+
+        Returns:
+            NDArray[np.float64]: Image-plane coordinates of shape (..., 2);
+                inf or nan for positions in the camera plane.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            points: NDArray[np.float64] = \
+                self._focal_length * view[..., :2] / view[..., 2:]
+        return points
+
     @property
     def up(self) -> Vector:
         """Returns the up vector.
@@ -105,6 +565,21 @@ class Camera(Vertex):
         """
         return any(self.is_vertex_in_front(vertex) for vertex in face.points)
 
+    def facing(self, planes: NDArray[np.float64]) -> NDArray[np.bool_]:
+        """Checks which faces turn their front side towards the camera.
+
+        Args:
+            planes (NDArray[np.float64]): Face planes (nx, ny, nz, d) of
+                shape (F, 4), as given by Mesh3D.planes.
+
+        Returns:
+            NDArray[np.bool_]: True where the camera is strictly in front
+                of the face's plane; edge-on and degenerate faces are False.
+        """
+        facing: NDArray[np.bool_] = planes[:, :3] @ np.array([self.x, self.y, self.z]) \
+            > planes[:, 3]
+        return facing
+
     def project_vertex(self, vertex: Vertex) -> Point:
         """Projects a 3D vertex onto the camera's 2D space.
 
@@ -113,20 +588,28 @@ class Camera(Vertex):
 
         Returns:
             Point: 2D projected point.
+
+        Raises:
+            ValueError: If the vertex is in the camera plane.
         """
         to_vertex: Vector = vertex - self
         x_cam: float = to_vertex.dot(self._right)
         y_cam: float = to_vertex.dot(self._up)
         z_cam: float = to_vertex.dot(self._forward)
+        if z_cam == 0:
+            raise ValueError("Cannot project a vertex in the camera plane.")
 
-        x_proj = x_cam / z_cam
-        y_proj = y_cam / z_cam
+        x_proj = self._focal_length * x_cam / z_cam
+        y_proj = self._focal_length * y_cam / z_cam
 
         return Point(x_proj, y_proj)
 
     def project_face(self, face: Face3D) -> Face2D:
         """Projects a 3D face onto 2D space.
 
+        The face is projected as it is; use project_clipped for faces that
+        may cross the near plane.
+
         Args:
             face (Face3D): 3D face.
 
@@ -139,3 +622,291 @@ class Camera(Vertex):
         dist: float = face.distance(self)
         color: Shader = face.color
         return Face2D(projected_points, dist, color)
+
+    def project_clipped(self, face: Face3D) -> List[Face2D]:
+        """Projects a 3D face after clipping it against the near plane.
+
+        A face beyond the near plane projects as with project_face. A face
+        crossing it is cut at the plane, leaving one or two triangles that
+        keep the face's distance and color, so corners behind the camera
+        never reach the perspective divide.
+
+        Args:
+            face (Face3D): 3D face.
+
+        Returns:
+            List[Face2D]: Zero to two 2D triangles.
+        """
+        corners = np.array([[(vertex.x, vertex.y, vertex.z) for vertex in face.points]])
+        view = self._to_view(corners)
+        if np.all(view[..., 2] >= self._near):
+            return [self.project_face(face)]
+        pieces, _ = self._clip_near(view)
+        dist: float = face.distance(self)
+        return [Face2D([Point(x, y) for x, y in corners], dist, face.color)
+                for corners in self._perspective(pieces).tolist()]
+
+    def _clip_near(self, view: NDArray[np.float64]
+                   ) -> Tuple[NDArray[np.float64], NDArray[np.intp]]:
+        """Clips camera-space triangles against the near plane.
+
+        This is Sutherland-Hodgman against a single plane: a triangle with
+        one corner beyond the plane becomes the triangle between that corner
+        and the two edge crossings, and one with two corners beyond becomes
+        a quad, split into two triangles. Winding is preserved, and pieces
+        that collapse because a corner lies on the plane are dropped.
+
+        Args:
+            view (NDArray[np.float64]): Camera-space corners of shape (V, 3, 3).
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.intp]]: Clipped triangles
+                of shape (P, 3, 3) and the index of the triangle each came
+                from, in ascending order.
+        """
+        beyond = view[..., 2] >= self._near
+        count = beyond.sum(axis=1)
+        if np.all(count == 3):
+            return view, np.arange(len(view))
+        split = np.flatnonzero((count == 1) | (count == 2))
+        # Rotate each split triangle so the corner alone on its side comes first.
+        lone = np.where(count[split] == 1, beyond[split].argmax(axis=1),
+                        beyond[split].argmin(axis=1))
+        order = (lone[:, np.newaxis] + np.arange(3)) % 3
+        a, b, c = np.take_along_axis(view[split], order[..., np.newaxis], axis=1) \
+            .transpose(1, 0, 2)
+        ab = a + (b - a) * ((self._near - a[:, 2]) / (b[:, 2] - a[:, 2]))[:, np.newaxis]
+        ca = c + (a - c) * ((self._near - c[:, 2]) / (a[:, 2] - c[:, 2]))[:, np.newaxis]
+        ab[:, 2] = ca[:, 2] = self._near
+        one = (count[split] == 1) & (a[:, 2] > self._near)
+        first = (count[split] == 2) & (c[:, 2] > self._near)
+        second = (count[split] == 2) & (b[:, 2] > self._near)
+        whole = np.flatnonzero(count == 3)
+        pieces = np.concatenate([view[whole], np.stack([a, ab, ca], axis=1)[one],
+                                 np.stack([b, c, ca], axis=1)[first],
+                                 np.stack([b, ca, ab], axis=1)[second]])
+        sources = np.concatenate([whole, split[one], split[first], split[second]])
+        ascending = np.argsort(sources, kind="stable")
+        return pieces[ascending], sources[ascending]
+
+    def project_batch(self, vertices: NDArray[Any] | VertexArray
+                      ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Projects N vertices with one matrix multiply against the cached view matrix.
+
+        Matches project_vertex row by row, except that a vertex in the
+        camera plane gives inf or nan instead of raising.
+
+        Args:
+            vertices (NDArray[Any] | VertexArray): Positions of shape (N, 3).
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.float64]]: Projected
+                coordinates of shape (N, 2) and camera-space depth (N,),
+                positive in front of the camera.
+
+        Raises:
+            ValueError: If vertices does not have shape (N, 3).
+        """
+        data = vertices.data if isinstance(vertices, VertexArray) \
+            else np.asarray(vertices, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError(f"Expected vertices of shape (N, 3), got {data.shape}.")
+        view = self._to_view(data)
+        return self._perspective(view), view[:, 2]
+
+    def project_indexed(self, mesh: IndexedMesh3D,
+                        faces: NDArray[np.integer[Any]] | None = None) -> List[Face2D]:
+        """Projects the faces of an indexed mesh that are inside the view frustum.
+
+        The mesh's cached pool, index and face color arrays are projected
+        and measured in one batch, so neither Vertex nor Face3D objects
+        are built; faces sharing a vertex share its projected Point, and
+        faces share one Shader per distinct color. A mesh whose
+        cached bounds are outside the frustum is rejected before its pool
+        is read, and one wholly inside it skips the per-face frustum test.
+        Back faces are culled unless the mesh is two-sided. Faces crossing
+        the near plane are clipped and their pieces come last.
+
+        Args:
+            mesh (IndexedMesh3D): Mesh over a shared vertex pool.
+            faces (NDArray[np.integer[Any]] | None, optional): Indices of
+                the only faces to consider, already culled as a group (by
+                a BVH); the whole-mesh test is then skipped, and only those
+                faces and the pool vertices they use are transformed.
+
+        Returns:
+            List[Face2D]: 2D projections of the visible faces.
+        """
+        if not mesh.num_faces:
+            return []
+        overlaps, contained = self._mesh_test(mesh) if faces is None else (True, False)
+        if not overlaps:
+            return []
+        stored, corners = mesh.stored_pool, mesh.index_array
+        colors = mesh.face_colors
+        planes = None if mesh.two_sided else mesh.planes
+        if faces is not None:
+            subset = np.asarray(faces, dtype=np.intp)
+            rows, inverse = np.unique(corners[subset], return_inverse=True)
+            stored, corners = stored[rows], inverse.reshape(-1, 3)
+            colors = colors[subset]
+            planes = None if planes is None else planes[subset]
+        quantization = mesh.quantization
+        pool = VertexArray(np.asarray(stored, dtype=np.float64) if quantization is None
+                           else stored * quantization[0] + quantization[1])
+        view = self._to_view(pool.data)
+        visible = np.ones(len(corners), dtype=bool) if contained \
+            else self._in_frustum(view[corners])
+        if planes is not None:
+            visible &= self.facing(planes)
+        distances = np.sort(pool.distance(self)[corners], axis=1)
+        face_depths = ((distances[:, 2] + distances[:, 1]) / 2).tolist()
+
+        crossing = np.zeros(len(corners), dtype=bool) if contained \
+            else visible & (view[corners, 2] < self._near).any(axis=1)
+        visible &= ~crossing
+
+        projected: List[Point] = [Point(x, y)
+                                  for x, y in self._perspective(view).tolist()]
+        rgbs = [(r, g, b) for r, g, b in colors.tolist()]
+        shaders = {rgb: Shader(*rgb) for rgb in set(rgbs)}
+        render_list = [Face2D([projected[a], projected[b], projected[c]],
+                              face_depths[i], shaders[rgbs[i]])
+                       for i, (a, b, c) in zip(np.flatnonzero(visible).tolist(),
+                                               corners[visible].tolist())]
+        pieces, sources = self._clip_near(view[corners[crossing]])
+        owners = np.flatnonzero(crossing)[sources].tolist()
+        render_list.extend(Face2D([Point(x, y) for x, y in piece], face_depths[i],
+                                  shaders[rgbs[i]])
+                           for piece, i in zip(self._perspective(pieces).tolist(),
+                                               owners))
+        return render_list
+
+    def project_mesh(self, mesh: Mesh3D,
+                     faces: NDArray[np.integer[Any]] | None = None) -> List[Face2D]:
+        """Projects the visible faces of an array-backed mesh.
+
+        Culling, depth and projection run on the position buffer as in
+        project_chunk; Face3D objects are never built. The mesh's cached
+        bounds accept or reject it as a whole first. Back faces are
+        culled unless the mesh is two-sided, and faces crossing the near
+        plane are clipped. Faces share one Shader per distinct color.
+
+        Args:
+            mesh (Mesh3D): Mesh whose is_array_backed is True.
+            faces (NDArray[np.integer[Any]] | None, optional): Indices of
+                the only faces to consider, already culled as a group (by
+                a BVH); the whole-mesh test is then skipped.
+
+        Returns:
+            List[Face2D]: 2D projections of the visible faces, in mesh order.
+
+        Raises:
+            ValueError: If the mesh is not array-backed.
+        """
+        if not mesh.is_array_backed:
+            raise ValueError("Mesh has no position buffer to project.")
+        overlaps, contained = self._mesh_test(mesh) if faces is None else (True, False)
+        if not overlaps:
+            return []  # rejected before reading the buffer, so proxies stay unloaded
+        stored = mesh.stored_positions
+        if stored is None:
+            raise ValueError("Mesh has no position buffer to project.")
+        planes = None if mesh.two_sided else mesh.planes
+        if faces is not None:
+            stored, planes = stored[faces], None if planes is None else planes[faces]
+        sources, depths, points = self._project_positions(stored, mesh.quantization,
+                                                          planes, contained)
+        if faces is not None:
+            sources = np.asarray(faces, dtype=np.intp)[sources]
+        if isinstance(mesh, MeshBuffer):
+            rgbs = [tuple(rgb) for rgb in mesh.colors[sources].tolist()]
+            shaders = {rgb: Shader(*rgb) for rgb in set(rgbs)}
+            colors = [shaders[rgb] for rgb in rgbs]
+        else:
+            shader = mesh.base_shader if mesh.base_shader is not None \
+                else Shader(0, 0, 0)
+            colors = [shader] * len(depths)
+        return [Face2D([Point(x, y) for x, y in corners], depth, color)
+                for corners, depth, color in zip(points.tolist(), depths.tolist(),
+                                                 colors)]
+
+    def project_chunk(self, positions: NDArray[Any],
+                      quantization: Quantization | None = None,
+                      planes: NDArray[np.float64] | None = None
+                      ) -> Tuple[NDArray[np.intp], NDArray[np.float64],
+                                 NDArray[np.float64]]:
+        """Culls, clips and projects an (F, 3, 3) position array in one vectorized pass.
+
+        Matches is_face_in_frustum, project_vertex and Face3D.distance for
+        every face, without creating Face3D or Point objects. A chunk whose
+        bounding box is outside the frustum is rejected without being
+        transformed, and one wholly inside it skips the per-face frustum
+        test. Faces crossing the near plane are clipped into one or two
+        triangles, as with project_clipped. Float32 and quantized positions
+        are widened to float64 here, chunk by chunk, so meshes can stay
+        resident at the smaller precision.
+
+        Args:
+            positions (NDArray[Any]): Face corner positions, as floats or
+                as quantized integers.
+            quantization (Quantization | None, optional): (scale, origin)
+                decoding quantized positions as q * scale + origin.
+            planes (NDArray[np.float64] | None, optional): Face planes of
+                shape (F, 4); if given, faces turned away from the camera
+                are culled before they are transformed.
+
+        Returns:
+            Tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+                For each of the T output triangles, the index of the face it
+                came from (T,) in ascending order, the face's depth (T,) and
+                the projected corners (T, 3, 2).
+        """
+        lower, upper = Mesh3D.bounding_box(positions, quantization)
+        overlaps, contained = self._box_test(lower, upper)
+        if not overlaps:
+            return np.zeros(0, dtype=np.intp), np.zeros(0), np.zeros((0, 3, 2))
+        return self._project_positions(positions, quantization, planes, contained)
+
+    def _project_positions(self, positions: NDArray[Any],
+                           quantization: Quantization | None,
+                           planes: NDArray[np.float64] | None, contained: bool
+                           ) -> Tuple[NDArray[np.intp], NDArray[np.float64],
+                                      NDArray[np.float64]]:
+        """Culls, clips and projects positions already tested as a whole.
+
+        Args:
+            positions (NDArray[Any]): Face corner positions of shape (F, 3, 3).
+            quantization (Quantization | None): (scale, origin) of quantized
+                positions, or None for floats.
+            planes (NDArray[np.float64] | None): Face planes for back-face
+                culling, or None to keep both sides.
+            contained (bool): True if all positions are known to be inside
+                the frustum, so per-face frustum tests and clipping are skipped.
+
+        Returns:
+            Tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+                Source face, depth and projected corners of each output
+                triangle, as returned by project_chunk.
+        """
+        visible = np.ones(len(positions), dtype=bool) if planes is None \
+            else self.facing(planes)
+        if planes is not None:
+            positions = positions[visible]
+        camera = np.array([self.x, self.y, self.z])
+        if quantization is None:
+            offsets = np.asarray(positions, dtype=np.float64) - camera
+        else:
+            scale, origin = quantization
+            offsets = positions * scale + (origin - camera)
+        view = offsets @ self.basis.T
+        inside = np.ones(len(view), dtype=bool) if contained else self._in_frustum(view)
+        visible[visible] = inside
+        view, offsets = view[inside], offsets[inside]
+
+        distances = np.sort(np.linalg.norm(offsets, axis=-1), axis=1)
+        depths = (distances[:, 2] + distances[:, 1]) / 2
+        pieces, sources = (view, np.arange(len(view))) if contained \
+            else self._clip_near(view)
+        return np.flatnonzero(visible)[sources], depths[sources], \
+            self._perspective(pieces)
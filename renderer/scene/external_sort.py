@@ -0,0 +1,281 @@
+"""ExternalSort class to order projected faces far-to-near in bounded memory."""
+
+from __future__ import annotations
+
+__author__ = "Michael Nuttall"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Michael Nuttall"
+
+import heapq
+import tempfile
+from itertools import islice
+from operator import itemgetter
+from types import TracebackType
+from typing import Any, BinaryIO, Iterator, List, Tuple, Type
+import numpy as np
+from numpy.typing import NDArray
+from geometry import Face2D, Point, Shader
+
+
+class ExternalSort:
+    """Sorts projected faces for the painter's algorithm using bounded memory.
+
+    Faces are buffered as fixed-size records. Each time run_size records
+    are buffered they are sorted and appended to one temporary file as a
+    run. Iterating merges the runs, reading each in blocks. When there are
+    more than fan_in runs, groups of fan_in runs are first merged into
+    longer runs in a new file, pass after pass, so at most two files are
+    open and each block read holds at least run_size // fan_in records.
+    """
+
+    RECORD_DTYPE: np.dtype[Any] = np.dtype([
+        ("key", "<f8"),
+        ("points", "<f8", (3, 2)),
+        ("color", "u1", (3,)),
+    ])
+    DEFAULT_RUN_SIZE: int = 65536
+    DEFAULT_MEMORY: int = 64 * 2**20
+    MAX_FAN_IN: int = 64
+
+    def __init__(self, run_size: int = DEFAULT_RUN_SIZE,
+                 directory: str | None = None, fan_in: int = MAX_FAN_IN) -> None:
+        """Constructor
+
+        Args:
+            run_size (int, optional): Records held in memory before a run
+                is spilled to disk.
+            directory (str | None, optional): Directory for the run file.
+                Defaults to the system temporary directory.
+            fan_in (int, optional): Most runs merged at once.
+
+        Raises:
+            ValueError: If run_size is not positive or fan_in is below 2.
+        """
+        if run_size < 1:
+            raise ValueError("Run size must be at least 1.")
+        if fan_in < 2:
+            raise ValueError("Fan-in must be at least 2.")
+        self._run_size: int = run_size
+        self._directory: str | None = directory
+        self._fan_in: int = fan_in
+        self._buffer: List[NDArray[Any]] = []
+        self._buffered: int = 0
+        self._file: BinaryIO | None = None
+        self._runs: List[Tuple[int, int]] = []
+        self._stored: int = 0
+
+    @classmethod
+    def from_memory(cls, memory: int, directory: str | None = None) -> ExternalSort:
+        """Creates a sort whose run size fits a memory budget.
+
+        Merging holds a block of every run plus the merged output, about
+        twice run_size records, so runs take half the budget.
+
+        Args:
+            memory (int): Bytes of records to hold in memory.
+            directory (str | None, optional): Directory for the run file.
+
+        Returns:
+            ExternalSort: Sort with run_size sized from memory.
+        """
+        return cls(max(1, memory // (2 * cls.RECORD_DTYPE.itemsize)), directory)
+
+    @property
+    def run_size(self) -> int:
+        """Gets the number of records held in memory per run.
+
+        Returns:
+            int: Run size.
+        """
+        return self._run_size
+
+    @property
+    def fan_in(self) -> int:
+        """Gets the most runs merged at once.
+
+        Returns:
+            int: Fan-in.
+        """
+        return self._fan_in
+
+    @property
+    def num_runs(self) -> int:
+        """Gets the number of runs spilled to disk so far.
+
+        Returns:
+            int: Run count.
+        """
+        return len(self._runs)
+
+    def __len__(self) -> int:
+        """Gets the number of faces added.
+
+        Returns:
+            int: Face count.
+        """
+        return self._buffered + self._stored
+
+    def add(self, depths: NDArray[np.floating[Any]], points: NDArray[np.floating[Any]],
+            colors: NDArray[np.integer[Any]] | Tuple[int, int, int]) -> None:
+        """Adds a batch of projected faces.
+
+        Args:
+            depths (NDArray[np.floating[Any]]): Depth of each face, shape (V,).
+            points (NDArray[np.floating[Any]]): Projected corners, shape (V, 3, 2).
+            colors (NDArray[np.integer[Any]] | Tuple[int, int, int]): RGB of
+                each face, shape (V, 3), or one RGB for the whole batch.
+        """
+        records = np.empty(len(depths), dtype=self.RECORD_DTYPE)
+        records["key"] = -np.asarray(depths)  # ascending keys draw farthest first
+        records["points"] = points
+        records["color"] = colors
+        while len(records):
+            room = self._run_size - self._buffered
+            self._buffer.append(records[:room])
+            self._buffered += len(records[:room])
+            records = records[room:]
+            if self._buffered == self._run_size:
+                self._spill()
+
+    def _sorted_buffer(self) -> NDArray[Any]:
+        """Sorts the in-memory buffer in place of its batches.
+
+        Returns:
+            NDArray[Any]: Buffered records ordered far-to-near.
+        """
+        run = np.concatenate(self._buffer) if self._buffer else \
+            np.empty(0, dtype=self.RECORD_DTYPE)
+        run = run[np.argsort(run["key"], kind="stable")]
+        self._buffer = [run]
+        return run
+
+    def _spill(self) -> None:
+        """Appends the buffered records to the run file as one sorted run."""
+        run = self._sorted_buffer()
+        self._buffer = []
+        self._buffered = 0
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)
+        self._file.seek(self._stored * self.RECORD_DTYPE.itemsize)
+        self._file.write(run.tobytes())
+        self._runs.append((self._stored, len(run)))
+        self._stored += len(run)
+
+    @staticmethod
+    def _rows(records: NDArray[Any]) -> Iterator[Tuple[Any, ...]]:
+        """Converts records to plain Python rows.
+
+        Args:
+            records (NDArray[Any]): Records to convert.
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: (key, points, color) rows.
+        """
+        return zip(records["key"].tolist(), records["points"].tolist(),
+                   records["color"].tolist())
+
+    def _read_run(self, file: BinaryIO, run: Tuple[int, int],
+                  block: int) -> Iterator[Tuple[Any, ...]]:
+        """Reads one run back in blocks of records.
+
+        Runs share a file, so each block seeks to its own position.
+
+        Args:
+            file (BinaryIO): Run file.
+            run (Tuple[int, int]): First record and record count of the run.
+            block (int): Records read per block.
+
+        Yields:
+            Tuple[Any, ...]: The next (key, points, color) record.
+        """
+        first, count = run
+        size = self.RECORD_DTYPE.itemsize
+        for start in range(first, first + count, block):
+            file.seek(start * size)
+            data = file.read(min(block, first + count - start) * size)
+            yield from self._rows(np.frombuffer(data, dtype=self.RECORD_DTYPE))
+
+    def _merge(self, file: BinaryIO,
+               runs: List[Tuple[int, int]]) -> Iterator[Tuple[Any, ...]]:
+        """Merges runs of one file into a single ordered stream.
+
+        Args:
+            file (BinaryIO): Run file.
+            runs (List[Tuple[int, int]]): Runs to merge, at most fan_in.
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: (key, points, color) rows in key order.
+        """
+        block = max(1, self._run_size // len(runs))
+        return heapq.merge(*(self._read_run(file, run, block) for run in runs),
+                           key=itemgetter(0))
+
+    def _merge_pass(self, file: BinaryIO) -> BinaryIO:
+        """Merges each group of fan_in runs into one run of a new file.
+
+        Args:
+            file (BinaryIO): Current run file.
+
+        Returns:
+            BinaryIO: New run file holding the merged runs.
+        """
+        merged = tempfile.TemporaryFile(dir=self._directory)
+        runs: List[Tuple[int, int]] = []
+        for first in range(0, len(self._runs), self._fan_in):
+            group = self._runs[first:first + self._fan_in]
+            rows = self._merge(file, group)
+            while block := list(islice(rows, self._run_size)):
+                merged.write(np.array(block, dtype=self.RECORD_DTYPE).tobytes())
+            runs.append((group[0][0], sum(count for _, count in group)))
+        file.close()
+        self._runs = runs
+        return merged
+
+    def __iter__(self) -> Iterator[Face2D]:
+        """Yields every added face from farthest to nearest.
+
+        Returns:
+            Iterator[Face2D]: Faces in drawing order.
+        """
+        if self._file is None:
+            records: Iterator[Tuple[Any, ...]] = self._rows(self._sorted_buffer())
+        else:
+            if self._buffered:
+                self._spill()
+            while len(self._runs) > self._fan_in:
+                self._file = self._merge_pass(self._file)
+            records = self._merge(self._file, self._runs)
+        for key, points, color in records:
+            yield Face2D([Point(x, y) for x, y in points], -key, Shader(*color))
+
+    def close(self) -> None:
+        """Deletes the run file and drops any buffered records."""
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._runs = []
+        self._stored = 0
+        self._buffer = []
+        self._buffered = 0
+
+    def __enter__(self) -> ExternalSort:
+        """Enters a context that closes the sort on exit.
+
+        Returns:
+            ExternalSort: This sort.
+        """
+        return self
+
+    def __exit__(self, exc_type: Type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        """Closes the sort.
+
+        Args:
+            exc_type (Type[BaseException] | None): Exception type, if any.
+            exc_value (BaseException | None): Exception, if any.
+            traceback (TracebackType | None): Traceback, if any.
+        """
+        self.close()
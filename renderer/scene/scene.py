@@ -8,13 +8,23 @@ __license__ = "MIT"
 __version__ = "0.1.0"
 __maintainer__ = "Arin Hartung"
 
-from typing import List
-from geometry import Mesh3D, Face2D
+import os
+from typing import Any, Iterable, List, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry import Mesh3D, IndexedMesh3D, MeshBuffer, Face2D, Vector
+from scene.bvh import BVH
 from scene.camera import Camera
+from scene.external_sort import ExternalSort
 
 
 class Scene:
-    """Scene class to represent a collection of 3D meshes."""
+    """Scene class to represent a collection of 3D meshes.
+
+    A static scene can build a BVH over all its faces once; renders then
+    cull through it instead of testing every mesh. Changing the mesh list
+    drops the BVH, and moving a mesh with translate refits it.
+    """
 
     def __init__(self, active_cam: Camera, meshes: List[Mesh3D]) -> None:
         """Constructor
@@ -25,6 +35,7 @@ class Scene:
         """
         self._active_cam: Camera = active_cam
         self._meshes: List[Mesh3D] = meshes
+        self._bvh: BVH | None = None
 
     @property
     def meshes(self) -> List[Mesh3D]:
@@ -43,6 +54,7 @@ class Scene:
             value (List[Mesh3D]): New list of meshes.
         """
         self._meshes = value
+        self._bvh = None
 
     @property
     def active_cam(self) -> Camera:
@@ -69,19 +81,172 @@ class Scene:
             new_mesh (Mesh3D): New mesh to add.
         """
         self._meshes.append(new_mesh)
+        self._bvh = None
+
+    @property
+    def bvh(self) -> BVH | None:
+        """Property to get the scene's BVH.
+
+        Returns:
+            BVH | None: The BVH renders cull through, or None if it has not
+                been built since the meshes last changed.
+        """
+        return self._bvh
+
+    def build_bvh(self, cache_dir: str | None = None,
+                  leaf_size: int = BVH.DEFAULT_LEAF_SIZE) -> BVH:
+        """Builds a BVH over every face in the scene, or loads a saved one.
+
+        Saved trees are keyed by the faces' content, so a tree is reused
+        only while every mesh is unchanged.
+
+        Args:
+            cache_dir (str | None, optional): Directory to load the tree
+                from and save it to. If None, it is always built.
+            leaf_size (int, optional): Most faces a leaf may hold.
+
+        Returns:
+            BVH: The scene's BVH.
+        """
+        bvh = BVH(self._meshes, leaf_size)
+        path = None if cache_dir is None \
+            else os.path.join(cache_dir, bvh.key + BVH.EXTENSION)
+        if path is None or not bvh.load(path):
+            bvh.build()
+            if path is not None:
+                bvh.save(path)
+        self._bvh = bvh
+        return bvh
+
+    def translate(self, mesh: Mesh3D, offset: Vector) -> None:
+        """Moves a mesh of the scene, refitting the BVH if there is one.
+
+        Args:
+            mesh (Mesh3D): Mesh in the scene to move.
+            offset (Vector): Displacement to apply.
+
+        Raises:
+            ValueError: If the mesh is not in the scene.
+        """
+        indices = [index for index, other in enumerate(self._meshes) if other is mesh]
+        if not indices:
+            raise ValueError("Mesh is not in the scene.")
+        mesh.translate(offset)
+        if self._bvh is not None:
+            self._bvh.refit(indices)
 
     def make_render(self) -> List[Face2D]:
         """Creates a render list of 2D faces from visible 3D meshes.
 
         Projects visible faces onto 2D space based on camera view.
+        Array-backed meshes are projected from their position buffer in
+        one batch, and indexed meshes project their vertex pool in one
+        batch; other meshes are projected face by face. Faces outside the
+        camera's view frustum are culled, and so are faces turned away
+        from the camera unless their mesh is two-sided. Faces crossing the
+        near plane are clipped to it. With a BVH, only the faces it finds
+        in the frustum are projected.
 
         Returns:
             List[Face2D]: List of 2D projected faces.
         """
+        candidates: Iterable[Tuple[int, NDArray[np.int64] | None]] = \
+            self._bvh.cull(self._active_cam) if self._bvh is not None \
+            else ((index, None) for index in range(len(self._meshes)))
+        render_list: List[Face2D] = []
+        for index, faces in candidates:
+            mesh = self._meshes[index]
+            if faces is not None and len(faces) == mesh.num_faces:
+                faces = None  # whole mesh kept; its own bounds test is cheaper
+            if mesh.is_array_backed:
+                render_list.extend(self._active_cam.project_mesh(mesh, faces))
+                continue
+            if isinstance(mesh, IndexedMesh3D):
+                render_list.extend(self._active_cam.project_indexed(mesh, faces))
+                continue
+            render_list.extend(self._project_faces(mesh, faces))
+        return render_list
+
+    def _project_faces(self, mesh: Mesh3D,
+                       faces: NDArray[np.int64] | None = None) -> List[Face2D]:
+        """Projects the visible faces of a mesh one Face3D at a time.
+
+        Meshes outside the view frustum are rejected as a whole by their
+        cached bounds.
+
+        Args:
+            mesh (Mesh3D): Mesh made of Face3D objects.
+            faces (NDArray[np.int64] | None, optional): Indices of the only
+                faces to consider, already culled by the BVH.
+
+        Returns:
+            List[Face2D]: 2D projections of the visible faces.
+        """
+        if faces is None and not self._active_cam.is_mesh_in_frustum(mesh):
+            return []
+        all_faces = mesh.faces
+        facing = [True] * len(all_faces) if mesh.two_sided \
+            else self._active_cam.facing(mesh.planes).tolist()
+        chosen = range(len(all_faces)) if faces is None else faces.tolist()
         render_list: List[Face2D] = []
-        for mesh in self._meshes:
-            for face in mesh.faces:
-                if self._active_cam.is_face_in_front(face):
-                    render_mesh: Face2D = self._active_cam.project_face(face)
-                    render_list.append(render_mesh)
+        for index in chosen:
+            if facing[index] and self._active_cam.is_face_in_frustum(all_faces[index]):
+                render_list.extend(self._active_cam.project_clipped(all_faces[index]))
         return render_list
+
+    def make_render_stream(self, chunks: Iterable[Mesh3D], sorter: ExternalSort,
+                           variance: int = 0) -> ExternalSort:
+        """Projects a stream of mesh chunks into an external sort.
+
+        Each chunk is culled and projected in one vectorized pass and only
+        its visible faces are handed to the sort, so memory stays bounded
+        by the chunk and run sizes rather than the scene's face count.
+        Back faces are culled unless the chunk is two-sided; importers set
+        two_sided from the whole source mesh, since a chunk of a closed
+        mesh is not closed itself.
+
+        Args:
+            chunks (Iterable[Mesh3D]): Meshes or mesh chunks to render.
+            sorter (ExternalSort): Sort receiving the projected faces.
+            variance (int, optional): Random color variation per face.
+
+        Returns:
+            ExternalSort: The sorter, ready to iterate far-to-near.
+        """
+        rng = np.random.default_rng()
+        for chunk in chunks:
+            positions, colors = self._chunk_arrays(chunk)
+            planes = None if chunk.two_sided else chunk.planes
+            sources, depths, points = self._active_cam.project_chunk(
+                positions, chunk.quantization, planes)
+            colors = colors[sources]
+            if variance:
+                jitter = rng.integers(-abs(variance), abs(variance) + 1, colors.shape)
+                colors = np.clip(colors + jitter, 0, 255)
+            sorter.add(depths, points, colors)
+        return sorter
+
+    @staticmethod
+    def _chunk_arrays(chunk: Mesh3D) -> Tuple[NDArray[Any], NDArray[np.int64]]:
+        """Gets the positions and per-face colors of a mesh as arrays.
+
+        Args:
+            chunk (Mesh3D): Mesh to convert.
+
+        Returns:
+            Tuple[NDArray[Any], NDArray[np.int64]]: Positions of shape
+                (F, 3, 3) in their stored dtype and RGB colors of shape (F, 3).
+        """
+        stored = chunk.stored_positions
+        if stored is not None:
+            if isinstance(chunk, MeshBuffer):
+                return stored, chunk.colors.astype(np.int64)
+            shader = chunk.base_shader
+            rgb = shader.rgb if shader is not None else (0, 0, 0)
+            return stored, np.tile(np.array(rgb, dtype=np.int64), (len(stored), 1))
+        positions = np.array([[(v.x, v.y, v.z) for v in face.points]
+                              for face in chunk.faces],
+                             dtype=np.float64).reshape(-1, 3, 3)
+        colors = np.array([face.color.rgb for face in chunk.faces],
+                          dtype=np.int64).reshape(-1, 3)
+        return positions, colors
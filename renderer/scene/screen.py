@@ -9,7 +9,7 @@ __version__ = "0.1.0"
 __maintainer__ = "Michael Nuttall"
 
 import tkinter as tk
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from geometry import Point, Face2D, Shader
 from scene.aspect_ratio import AspectRatio
 
@@ -107,3 +107,16 @@ class Screen:
         """
         self._create_canvas()
         self._draw_faces(faces)
+
+    def render_stream(self, faces: Iterable[Face2D]) -> None:
+        """Renders faces that already arrive in drawing order, farthest first.
+
+        Faces are drawn as they are produced, so the caller never needs to
+        hold the whole render list.
+
+        Args:
+            faces (Iterable[Face2D]): The 2D faces to render, far-to-near.
+        """
+        self._create_canvas()
+        for face2d in faces:
+            self._draw_face(face2d)
@@ -0,0 +1,125 @@
+"""
+Unit tests for the BinaryImport class.
+"""
+
+__author__ = "Michael Nuttall"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Michael Nuttall"
+
+import os
+import struct
+import tempfile
+import unittest
+import numpy as np
+from utility import BinaryImport, FileImport
+from geometry import Mesh3D, Vertex, Shader
+
+TRIANGLES = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+                      [[0, 0, 1], [1, 0, 1], [0, 1, 1]]], dtype=np.float32)
+
+
+class TestBinaryImport(unittest.TestCase):
+    """Unit tests for binary STL and PLY loading."""
+
+    def setUp(self) -> None:
+        """Create a temporary folder for generated scans."""
+        self._tmp = tempfile.TemporaryDirectory()
+        FileImport._instance = None  # pylint: disable=protected-access
+
+    def tearDown(self) -> None:
+        """Remove generated scans."""
+        self._tmp.cleanup()
+
+    def _write(self, name: str, data: bytes) -> str:
+        """Writes a file into the temporary folder and returns its path."""
+        path = os.path.join(self._tmp.name, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def _stl(self, triangles: np.ndarray) -> bytes:
+        """Encodes triangles as binary STL."""
+        data = b"\0" * 80 + struct.pack("<I", len(triangles))
+        for tri in triangles:
+            data += struct.pack("<12fH", 0, 0, 1, *tri.ravel(), 0)
+        return data
+
+    def _ply(self, body_faces: bytes, num_faces: int, colors: bool = False) -> bytes:
+        """Encodes the four corners of a unit square plus given faces as PLY."""
+        header = ("ply\nformat binary_little_endian 1.0\nelement vertex 4\n"
+                  "property float x\nproperty float y\nproperty float z\n")
+        if colors:
+            header += "property uchar red\nproperty uchar green\nproperty uchar blue\n"
+        header += (f"element face {num_faces}\n"
+                   "property list uchar int vertex_indices\nend_header\n")
+        body = b""
+        for x, y in ((0, 0), (1, 0), (1, 1), (0, 1)):
+            body += struct.pack("<3f", x, y, 0)
+            if colors:
+                body += struct.pack("<3B", 200, 100, 0)
+        return header.encode("ascii") + body + body_faces
+
+    def test_read_stl_is_zero_copy(self) -> None:
+        """Test STL positions are a view over the mapped file."""
+        path = self._write("scan.stl", self._stl(TRIANGLES))
+        (mesh,) = BinaryImport.read_stl(path)
+        positions = mesh.positions
+        assert positions is not None
+        self.assertEqual(positions.shape, (2, 3, 3))
+        self.assertFalse(positions.flags.owndata)
+        np.testing.assert_array_equal(positions, TRIANGLES)
+        self.assertEqual(mesh.faces[1].points[2], Vertex(0, 1, 1))
+        self.assertEqual(mesh.base_shader, Shader(127, 127, 127))
+
+    def test_read_stl_rejects_bad_size(self) -> None:
+        """Test an STL whose size disagrees with its count raises ValueError."""
+        path = self._write("bad.stl", self._stl(TRIANGLES)[:-10])
+        with self.assertRaises(ValueError):
+            BinaryImport.read_stl(path)
+        with self.assertRaises(ValueError):
+            BinaryImport.read_stl(self._write("empty.stl", b""))
+
+    def test_read_ply_triangles(self) -> None:
+        """Test all-triangle PLY faces gather into an (F, 3, 3) array."""
+        faces = struct.pack("<B3i", 3, 0, 1, 2) + struct.pack("<B3i", 3, 0, 2, 3)
+        path = self._write("scan.ply", self._ply(faces, 2, colors=True))
+        (mesh,) = BinaryImport.read_ply(path)
+        positions = mesh.positions
+        assert positions is not None
+        self.assertEqual(positions.shape, (2, 3, 3))
+        np.testing.assert_array_equal(positions[1, 2], [0, 1, 0])
+        self.assertEqual(mesh.base_shader, Shader(200, 100, 0))
+
+    def test_read_ply_fan_triangulates_polygons(self) -> None:
+        """Test PLY polygons fall back to fan triangulation."""
+        faces = struct.pack("<B4i", 4, 0, 1, 2, 3)
+        path = self._write("quad.ply", self._ply(faces, 1))
+        (mesh,) = BinaryImport.read_ply(path, Shader(1, 2, 3))
+        self.assertEqual(mesh.num_faces, 2)
+        self.assertEqual(mesh.faces[1].points,
+                         [Vertex(0, 0, 0), Vertex(1, 1, 0), Vertex(0, 1, 0)])
+        self.assertEqual(mesh.base_shader, Shader(1, 2, 3))
+
+    def test_read_ply_rejects_bad_input(self) -> None:
+        """Test malformed PLY files raise ValueError."""
+        bad_index = struct.pack("<B3i", 3, 0, 1, 9)
+        with self.assertRaises(ValueError):
+            BinaryImport.read_ply(self._write("bad.ply", self._ply(bad_index, 1)))
+        with self.assertRaises(ValueError):
+            BinaryImport.read_ply(self._write("text.ply",
+                                              b"ply\nformat ascii 1.0\nend_header\n"))
+        with self.assertRaises(ValueError):
+            BinaryImport.read_ply(self._write("cut.ply", self._ply(b"\x04\0", 1)))
+        with self.assertRaises(ValueError):
+            BinaryImport.read_ply(self._write("not.ply", b"solid nothing\n"))
+
+    def test_file_import_routes_by_extension(self) -> None:
+        """Test read_file hands .stl and .ply files to BinaryImport."""
+        stl = self._write("scan.stl", self._stl(TRIANGLES))
+        meshes = FileImport().read_file(stl)
+        self.assertIsInstance(meshes[0], Mesh3D)
+        self.assertEqual(meshes[0].num_faces, 2)
+        welded = FileImport().read_file(stl, weld=True)
+        self.assertEqual(len(welded[0].vertices), 6)
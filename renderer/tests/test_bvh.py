@@ -0,0 +1,231 @@
+"""
+Unit tests for the BVH class using unittest and Hypothesis.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import os
+import tempfile
+import unittest
+from typing import List, Set, Tuple
+import numpy as np
+from hypothesis import given, settings, strategies as st
+from geometry import Face3D, IndexedMesh3D, Mesh3D, MeshBuffer, Shader, Vector, Vertex
+from scene import AspectRatio, BVH, Camera
+
+
+def make_meshes(seed: int) -> List[Mesh3D]:
+    """Creates small clusters of random triangles spread over a wide area."""
+    rng = np.random.default_rng(seed)
+    meshes: List[Mesh3D] = []
+    for count in rng.integers(0, 60, 12).tolist():
+        positions = rng.uniform(-1, 1, (count, 3, 3)) + rng.uniform(-20, 20, 3)
+        meshes.append(MeshBuffer(positions, np.full((count, 3), 9)))
+    return meshes
+
+
+def all_triangles(meshes: List[Mesh3D]) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """Gets every face's corners and its (mesh, face) pair, by brute force."""
+    labels = [(index, face) for index, mesh in enumerate(meshes)
+              for face in range(mesh.num_faces)]
+    return np.concatenate([mesh.corners for mesh in meshes]).reshape(-1, 3, 3), labels
+
+
+class TestBVH(unittest.TestCase):
+    """Unit tests for building, querying, refitting and saving a BVH."""
+
+    def setUp(self) -> None:
+        """Build a BVH over a few scattered meshes."""
+        self.meshes = make_meshes(0)
+        self.bvh = BVH(self.meshes, leaf_size=4)
+        self.bvh.build()
+        self.camera = Camera(Vertex(0, -40, 5), Vertex(3, 0, 0), focal_length=2.0,
+                             viewport=AspectRatio(4, 3))
+
+    def culled(self) -> Set[Tuple[int, int]]:
+        """Gets the (mesh, face) pairs the BVH keeps for the camera."""
+        return {(mesh, face) for mesh, faces in self.bvh.cull(self.camera)
+                for face in faces.tolist()}
+
+    def test_invalid_leaf_size_raises(self) -> None:
+        """Test that leaves must hold at least one face."""
+        with self.assertRaises(ValueError):
+            BVH(self.meshes, leaf_size=0)
+
+    def test_queries_require_a_built_tree(self) -> None:
+        """Test that an unbuilt tree cannot be queried."""
+        bvh = BVH(self.meshes)
+        self.assertFalse(bvh.is_built)
+        with self.assertRaises(RuntimeError):
+            bvh.cull(self.camera)
+        with self.assertRaises(RuntimeError):
+            bvh.nearest(Vertex(0, 0, 0))
+
+    def test_tree_covers_every_face_once(self) -> None:
+        """Test that leaves partition the faces and boxes enclose them."""
+        triangles, _ = all_triangles(self.meshes)
+        self.assertEqual(self.bvh.num_faces, len(triangles))
+        order = self.bvh._order  # pylint: disable=protected-access
+        self.assertEqual(sorted(order.tolist()), list(range(len(triangles))))
+        lower, upper = self.bvh.bounds
+        np.testing.assert_allclose(lower, triangles.reshape(-1, 3).min(axis=0))
+        np.testing.assert_allclose(upper, triangles.reshape(-1, 3).max(axis=0))
+
+    def test_cull_keeps_every_face_in_the_frustum(self) -> None:
+        """Test that culling drops no face the per-face test would keep."""
+        triangles, labels = all_triangles(self.meshes)
+        inside = self.camera._in_frustum(  # pylint: disable=protected-access
+            self.camera._to_view(triangles))  # pylint: disable=protected-access
+        kept = self.culled()
+        self.assertTrue({labels[i] for i in np.flatnonzero(inside)} <= kept)
+        self.assertLess(len(kept), len(labels))
+
+    def test_cull_groups_faces_by_mesh(self) -> None:
+        """Test that culled faces come grouped per mesh, in order."""
+        groups = self.bvh.cull(self.camera)
+        indices = [mesh for mesh, _ in groups]
+        self.assertEqual(indices, sorted(set(indices)))
+        for mesh, faces in groups:
+            self.assertTrue(np.all(np.diff(faces) > 0))
+            self.assertTrue(np.all(faces < self.meshes[mesh].num_faces))
+
+    def test_pick_finds_the_first_face_on_the_ray(self) -> None:
+        """Test picking through two stacked faces and missing everything."""
+        near = Face3D([Vertex(-1, -1, 2), Vertex(1, -1, 2), Vertex(0, 1, 2)])
+        far = Face3D([Vertex(-1, -1, 5), Vertex(1, -1, 5), Vertex(0, 1, 5)])
+        bvh = BVH([Mesh3D([far]), Mesh3D([far, near])], leaf_size=1)
+        bvh.build()
+        self.assertEqual(bvh.pick(Vertex(0, 0, 0), Vector(0, 0, 2)), (1, 1, 2.0))
+        self.assertEqual(bvh.pick(Vertex(0, 0, 9), Vector(0, 0, -1)), (0, 0, 4.0))
+        self.assertIsNone(bvh.pick(Vertex(0, 0, 0), Vector(0, 0, -1)))
+        with self.assertRaises(ValueError):
+            bvh.pick(Vertex(0, 0, 0), Vector(0, 0, 0))
+
+    def test_nearest_measures_to_faces_edges_and_corners(self) -> None:
+        """Test nearest-face distances above a face, beside an edge, past a corner."""
+        face = Face3D([Vertex(0, 0, 0), Vertex(2, 0, 0), Vertex(0, 2, 0)])
+        bvh = BVH([Mesh3D([face])])
+        bvh.build()
+        self.assertEqual(bvh.nearest(Vertex(0.5, 0.5, 3)), (0, 0, 3.0))
+        self.assertAlmostEqual(bvh.nearest(Vertex(1, -4, 0)).distance, 4.0)
+        self.assertAlmostEqual(bvh.nearest(Vertex(-3, -4, 0)).distance, 5.0)
+        self.assertAlmostEqual(bvh.nearest(Vertex(2, 2, 0)).distance, np.sqrt(2))
+
+    def test_empty_scene(self) -> None:
+        """Test that a tree without faces answers every query with nothing."""
+        bvh = BVH([Mesh3D([])])
+        bvh.build()
+        self.assertEqual(bvh.cull(self.camera), [])
+        self.assertIsNone(bvh.pick(Vertex(0, 0, 0), Vector(0, 0, 1)))
+        self.assertIsNone(bvh.nearest(Vertex(0, 0, 0)))
+
+    def test_mixed_mesh_kinds_are_indexed(self) -> None:
+        """Test that Face3D, indexed and buffer meshes are all gathered."""
+        face = Face3D([Vertex(0, 0, 3), Vertex(1, 0, 3), Vertex(0, 1, 3)],
+                      Shader(1, 2, 3))
+        positions = np.array([[[0, 0, 3], [1, 0, 3], [0, 1, 3]]], dtype=float)
+        meshes = [Mesh3D([face]), IndexedMesh3D.weld(Mesh3D([face])),
+                  Mesh3D.from_buffer(positions)]
+        bvh = BVH(meshes)
+        bvh.build()
+        self.assertEqual(bvh.num_faces, 3)
+        self.assertEqual(bvh.nearest(Vertex(0.2, 0.2, 0)).distance, 3.0)
+
+    def test_refit_follows_a_moved_mesh(self) -> None:
+        """Test that refitting keeps the tree's shape but moves its boxes."""
+        order = self.bvh._order.copy()  # pylint: disable=protected-access
+        key = self.bvh.key
+        self.meshes[2].translate(Vector(0.5, 0, 0))
+        self.bvh.refit([2])
+        self.assertNotEqual(self.bvh.key, key)
+        refitted = self.bvh._order  # pylint: disable=protected-access
+        np.testing.assert_array_equal(refitted, order)
+        triangles, _ = all_triangles(self.meshes)
+        np.testing.assert_allclose(self.bvh.bounds[1],
+                                   triangles.reshape(-1, 3).max(axis=0))
+        hit = self.bvh.nearest(Vertex(*self.meshes[2].corners[0, 0].tolist()))
+        self.assertEqual(hit.distance, 0.0)
+
+    def test_refit_rebuilds_loose_trees(self) -> None:
+        """Test that a far move rebuilds the tree instead of leaving loose boxes."""
+        order = self.bvh._order.copy()  # pylint: disable=protected-access
+        self.meshes[1].translate(Vector(1000, 1000, 1000))
+        self.bvh.refit([1])
+        rebuilt = self.bvh._order  # pylint: disable=protected-access
+        self.assertFalse(np.array_equal(rebuilt, order))
+        self.assertEqual(self.bvh.nearest(Vertex(1000, 1000, 1000)).mesh, 1)
+
+    def test_refit_rebuilds_when_face_counts_change(self) -> None:
+        """Test that a mesh gaining faces is picked up by a rebuild."""
+        mesh = Mesh3D([Face3D([Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)])])
+        bvh = BVH([mesh])
+        bvh.build()
+        mesh.add(Face3D([Vertex(0, 0, 9), Vertex(1, 0, 9), Vertex(0, 1, 9)]))
+        bvh.refit([0])
+        self.assertEqual(bvh.num_faces, 2)
+        self.assertEqual(bvh.nearest(Vertex(0.1, 0.1, 10)), (0, 1, 1.0))
+
+    def test_save_and_load_round_trip(self) -> None:
+        """Test that a saved tree loads only over the same faces."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "nested", "scene" + BVH.EXTENSION)
+            self.assertFalse(BVH(self.meshes).load(path))
+            self.bvh.save(path)
+            loaded = BVH(self.meshes)
+            self.assertTrue(loaded.load(path))
+            self.assertEqual(loaded.num_nodes, self.bvh.num_nodes)
+            self.assertEqual(self.culled(), {(mesh, face) for mesh, faces
+                                             in loaded.cull(self.camera)
+                                             for face in faces.tolist()})
+            self.assertFalse(BVH(make_meshes(1)).load(path))
+
+    def test_load_rejects_foreign_and_truncated_files(self) -> None:
+        """Test that unreadable files raise ValueError."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scene" + BVH.EXTENSION)
+            with open(path, "wb") as file:
+                file.write(b"not a tree")
+            with self.assertRaises(ValueError):
+                BVH(self.meshes).load(path)
+            self.bvh.save(path)
+            with open(path, "r+b") as file:
+                file.truncate(os.path.getsize(path) - 8)
+            with self.assertRaises(ValueError):
+                BVH(self.meshes).load(path)
+
+    @settings(deadline=None, max_examples=25)
+    @given(st.integers(min_value=0, max_value=2**16),
+           st.integers(min_value=1, max_value=9),
+           st.tuples(*[st.floats(min_value=-25, max_value=25)] * 3),
+           st.tuples(*[st.floats(min_value=-1, max_value=1)] * 3))
+    def test_queries_match_brute_force(self, seed: int, leaf_size: int,
+                                       origin: Tuple[float, float, float],
+                                       heading: Tuple[float, float, float]) -> None:
+        """Test pick and nearest against testing every face."""
+        meshes = make_meshes(seed)
+        bvh = BVH(meshes, leaf_size)
+        bvh.build()
+        triangles, labels = all_triangles(meshes)
+        start = np.array(origin)
+        distances = BVH._point_distances(  # pylint: disable=protected-access
+            start, triangles)
+        nearest = bvh.nearest(Vertex(*origin))
+        if not labels:
+            self.assertIsNone(nearest)
+            return
+        self.assertAlmostEqual(nearest.distance, float(distances.min()))
+        if np.linalg.norm(heading) < 1e-3:
+            return
+        unit = np.array(heading) / np.linalg.norm(heading)
+        ray = BVH._ray_distances(  # pylint: disable=protected-access
+            start, unit, triangles)
+        hit = bvh.pick(Vertex(*origin), Vector(*heading))
+        if hit is None:
+            self.assertTrue(np.all(np.isinf(ray)))
+        else:
+            self.assertAlmostEqual(hit.distance, float(ray.min()))
+            self.assertEqual(ray[labels.index((hit.mesh, hit.face))], ray.min())
@@ -8,9 +8,14 @@ __license__ = "MIT"
 __version__ = "0.1.0"
 __maintainer__ = "Arin Hartung"
 
+import math
 import unittest
-from scene import Camera
-from geometry import Vector, Vertex, Point, Face3D, Face2D, Shader
+from unittest.mock import PropertyMock, patch
+from typing import List, Tuple
+import numpy as np
+from scene import AspectRatio, Camera
+from geometry import Vector, Vertex, Point, Face3D, Face2D, Shader, Mesh3D, \
+    IndexedMesh3D, MeshBuffer, VertexArray
 from hypothesis import given, strategies as st
 
 
@@ -81,6 +86,13 @@ class TestCamera(unittest.TestCase):
         self.assertAlmostEqual(projected.x, 0.0)
         self.assertAlmostEqual(projected.y, 0.0)
 
+    def test_project_vertex_in_camera_plane_raises(self) -> None:
+        """
+        Test projecting a vertex level with the camera is a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.camera.project_vertex(Vertex(1.0, 0.0, 0.0))
+
     def test_project_face(self) -> None:
         """
         Test projecting a face to 2D.
@@ -94,6 +106,44 @@ class TestCamera(unittest.TestCase):
         self.assertIsInstance(projected_face, Face2D)
         self.assertEqual(len(projected_face.points), 3)
 
+    def test_project_indexed_matches_project_face(self) -> None:
+        """
+        Test indexed projection matches per-face projection and culling.
+        """
+        faces = [
+            Face3D([Vertex(0.0, 0.0, -5.0), Vertex(1.0, 0.0, -5.0),
+                    Vertex(0.0, 1.0, -6.0)], Shader(10, 10, 10)),
+            Face3D([Vertex(0.0, 0.0, -5.0), Vertex(0.0, 1.0, -6.0),
+                    Vertex(-1.0, 0.0, -4.0)], Shader(20, 20, 20)),
+            Face3D([Vertex(0.0, 0.0, 5.0), Vertex(1.0, 0.0, 5.0),
+                    Vertex(0.0, 1.0, 5.0)], Shader(30, 30, 30)),
+        ]
+        expected = [self.camera.project_face(f) for f in faces
+                    if self.camera.is_face_in_front(f)]
+        mesh = IndexedMesh3D.weld(Mesh3D(faces))
+        projected = self.camera.project_indexed(mesh)
+        self.assertEqual(len(projected), 2)
+        for got, want in zip(projected, expected):
+            self.assertEqual(got.points, want.points)
+            self.assertAlmostEqual(got.distance, want.distance)
+            self.assertEqual(got.color, want.color)
+        self.assertIs(projected[0].points[0], projected[1].points[0])
+
+    def test_project_indexed_reads_the_cached_arrays(self) -> None:
+        """Test indexed projection builds neither vertices nor faces."""
+        pool = np.array([[0.0, 0.0, -5.0], [1.0, 0.0, -5.0], [0.0, 1.0, -6.0],
+                         [-1.0, 0.0, -4.0]])
+        mesh = IndexedMesh3D.from_arrays(pool, np.array([[0, 1, 2], [0, 2, 3]]),
+                                         Shader(100, 100, 100))
+        mesh.set_color_variance(variance=10)
+        colors = mesh.face_colors.copy()
+        projected = self.camera.project_indexed(mesh)
+        self.assertEqual([f.color.rgb for f in projected],
+                         [tuple(rgb) for rgb in colors.tolist()])
+        self.assertIsNone(mesh._vertices)  # pylint: disable=protected-access
+        self.assertIsNone(mesh._faces)  # pylint: disable=protected-access
+        self.assertEqual([f.color for f in mesh.faces], [f.color for f in projected])
+
     @given(
         st.floats(-1000, 1000, allow_nan=False, allow_infinity=False),
         st.floats(-1000, 1000, allow_nan=False, allow_infinity=False),
@@ -108,3 +158,418 @@ class TestCamera(unittest.TestCase):
         self.assertIsInstance(self.camera.forward, Vector)
         self.assertIsInstance(self.camera.up, Vector)
         self.assertIsInstance(self.camera.right, Vector)
+
+    def test_project_chunk_decodes_quantized_positions(self) -> None:
+        """Test quantized chunks project like their decoded float positions."""
+        camera = Camera(Vertex(1.0, 2.0, 3.0), Vertex(0.0, 0.0, 0.0))
+        positions = np.random.default_rng(3).uniform(-1, 1, (20, 3, 3))
+        quantized, quantization = Mesh3D.quantize(positions)
+        scale, origin = quantization
+        decoded = quantized * scale + origin
+        expected = camera.project_chunk(decoded)
+        actuals = camera.project_chunk(quantized, quantization)
+        for actual, wanted in zip(actuals, expected):
+            np.testing.assert_allclose(actual, wanted, atol=1e-12)
+
+    def test_project_chunk_matches_project_face(self) -> None:
+        """Test the vectorized chunk projection matches per-face projection."""
+        camera = Camera(Vertex(1.0, 2.0, 3.0), Vertex(0.0, 0.0, 0.0))
+        positions = np.array([
+            [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+            [[5, 5, 5], [6, 5, 5], [5, 6, 5]],
+            [[0, 0, 1], [1, 1, 0], [-1, 0, 0]],
+        ], dtype=np.float64)
+        faces = [Face3D([Vertex(*c) for c in face]) for face in positions.tolist()]
+        sources, depths, points = camera.project_chunk(positions)
+        expected = [camera.project_face(f) for f in faces
+                    if camera.is_face_in_frustum(f)]
+        self.assertEqual(sources.tolist(),
+                         [i for i, f in enumerate(faces)
+                          if camera.is_face_in_frustum(f)])
+        self.assertEqual(sources.tolist(), [0, 2])
+        np.testing.assert_allclose(depths, [f.distance for f in expected])
+        np.testing.assert_allclose(points,
+                                   [[(p.x, p.y) for p in f.points] for f in expected],
+                                   atol=1e-12)
+
+    @given(st.lists(st.tuples(*[st.floats(-100, 100, allow_nan=False)] * 3)
+                    .filter(lambda v: abs(v[2] + 5.0) > 0.01
+                            or abs(v[0]) + abs(v[1]) > 0.01),
+                    min_size=1, max_size=10))
+    def test_project_batch_matches_project_vertex(
+            self, rows: List[Tuple[float, ...]]) -> None:
+        """Test batch projection matches project_vertex for each row."""
+        camera = Camera(Vertex(0.5, -1.0, 2.0), Vertex(0.0, 0.0, 0.0))
+        vertices = [Vertex(*row) for row in rows]
+        depths = [(v - camera).dot(camera.forward) for v in vertices]
+        points, depth = camera.project_batch(VertexArray.from_vertices(vertices))
+        np.testing.assert_allclose(depth, depths, atol=1e-9)
+        for vertex, point, z in zip(vertices, points.tolist(), depths):
+            if abs(z) > 1e-3:
+                expected = camera.project_vertex(vertex)
+                np.testing.assert_allclose(point, [expected.x, expected.y],
+                                           rtol=1e-6, atol=1e-6)
+
+    def test_project_batch_rejects_bad_shape(self) -> None:
+        """Test project_batch requires an (N, 3) array."""
+        with self.assertRaises(ValueError):
+            self.camera.project_batch(np.zeros((2, 2)))
+
+    def test_basis_follows_look_at(self) -> None:
+        """Test the cached basis is rebuilt when the look-at point changes."""
+        np.testing.assert_allclose(self.camera.basis[2], [0.0, 0.0, -1.0])
+        self.camera.set_look_at(Vertex(1.0, 0.0, 0.0))
+        np.testing.assert_allclose(self.camera.basis[2], [1.0, 0.0, 0.0])
+        forward = self.camera.forward
+        np.testing.assert_allclose(self.camera.basis[2],
+                                   [forward.x, forward.y, forward.z])
+
+    def test_project_mesh_matches_project_face(self) -> None:
+        """Test array-backed projection matches per-face projection and colors."""
+        camera = Camera(Vertex(1.0, 2.0, 3.0), Vertex(0.0, 0.0, 0.0))
+        positions = np.array([
+            [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+            [[5, 5, 5], [6, 5, 5], [5, 6, 5]],
+            [[0, 0, 1], [1, 1, 0], [-1, 0, 0]],
+        ], dtype=np.float64)
+        colors = np.array([[1, 2, 3], [4, 5, 6], [1, 2, 3]], dtype=np.uint8)
+        buffer = MeshBuffer(positions, colors)
+        expected = [camera.project_face(f) for f in MeshBuffer(positions, colors).faces
+                    if camera.is_face_in_front(f)]
+        projected = camera.project_mesh(buffer)
+        self.assertEqual([f.color for f in projected], [f.color for f in expected])
+        self.assertIs(projected[0].color, projected[1].color)
+        np.testing.assert_allclose([f.distance for f in projected],
+                                   [f.distance for f in expected])
+        np.testing.assert_allclose([[(p.x, p.y) for p in f.points] for f in projected],
+                                   [[(p.x, p.y) for p in f.points] for f in expected],
+                                   atol=1e-12)
+        plain = camera.project_mesh(Mesh3D.from_buffer(positions, Shader(7, 8, 9)))
+        self.assertEqual([f.color for f in plain], [Shader(7, 8, 9)] * 2)
+
+    def test_projecting_a_face_subset_matches_filtering_the_full_projection(
+            self) -> None:
+        """Test the faces argument of project_mesh and project_indexed."""
+        camera = Camera(Vertex(0.5, 0.5, 6.0), Vertex(0.5, 0.5, 0.0))
+        buffer = MeshBuffer(np.random.default_rng(4).uniform(-1, 2, (12, 3, 3)),
+                            np.arange(36).reshape(12, 3))
+        buffer.two_sided = True
+        indexed = IndexedMesh3D.weld(buffer)
+        indexed.two_sided = True
+        subset = np.array([1, 4, 5, 9])
+        wanted = {tuple(rgb) for rgb in buffer.colors[subset].tolist()}
+        part = camera.project_mesh(buffer, subset)
+        self.assertEqual([(f.distance, f.color.rgb) for f in part],
+                         [(f.distance, f.color.rgb) for f in camera.project_mesh(buffer)
+                          if f.color.rgb in wanted])
+        self.assertEqual(len(part), len(subset))
+        indexed_part = camera.project_indexed(indexed, subset)
+        np.testing.assert_allclose([f.distance for f in indexed_part],
+                                   [f.distance for f in part])
+
+    def test_project_indexed_transforms_only_the_face_subset(self) -> None:
+        """Test a face subset reads just its faces and the pool rows they use."""
+        camera = Camera(Vertex(0.5, 0.5, 6.0), Vertex(0.5, 0.5, 0.0))
+        buffer = MeshBuffer(np.random.default_rng(4).uniform(-1, 2, (12, 3, 3)),
+                            np.arange(36).reshape(12, 3))
+        indexed = IndexedMesh3D.weld(buffer)
+        indexed.set_precision("quantized16")
+        self.assertTrue(indexed.two_sided)  # decided once per mesh, then cached
+        subset = np.array([1, 4, 5, 9])
+        rows = np.unique(indexed.index_array[subset])
+        expected = camera.project_mesh(buffer, subset)
+        with patch.object(Camera, "_to_view", autospec=True,
+                          side_effect=Camera._to_view) as to_view, \
+                patch.object(Camera, "_in_frustum", autospec=True,
+                             side_effect=Camera._in_frustum) as in_frustum, \
+                patch.object(IndexedMesh3D, "pool",
+                             new_callable=PropertyMock) as pool:
+            part = camera.project_indexed(indexed, subset)
+        self.assertEqual(to_view.call_args.args[1].shape, (len(rows), 3))
+        self.assertEqual(in_frustum.call_args.args[1].shape, (len(subset), 3, 3))
+        pool.assert_not_called()
+        self.assertEqual(len(part), len(subset))
+        np.testing.assert_allclose([f.distance for f in part],
+                                   [f.distance for f in expected], atol=1e-3)
+
+    def test_project_mesh_requires_array_backed_mesh(self) -> None:
+        """Test meshes made of Face3D objects are rejected."""
+        face = Face3D([Vertex(0.0, 0.0, -5.0), Vertex(1.0, 0.0, -5.0),
+                       Vertex(0.0, 1.0, -5.0)])
+        with self.assertRaises(ValueError):
+            self.camera.project_mesh(Mesh3D([face]))
+
+    def test_view_matrix_maps_world_to_camera_space(self) -> None:
+        """Test the view matrix puts the origin at zero and look_at straight ahead."""
+        camera = Camera(Vertex(1.0, 2.0, 3.0), Vertex(4.0, 6.0, 3.0))
+        view = camera.view_matrix
+        np.testing.assert_allclose(view @ [1.0, 2.0, 3.0, 1.0], [0.0, 0.0, 0.0, 1.0],
+                                   atol=1e-12)
+        np.testing.assert_allclose(view @ [4.0, 6.0, 3.0, 1.0], [0.0, 0.0, 5.0, 1.0],
+                                   atol=1e-12)
+        vertex = Vertex(2.0, 7.0, -1.0)
+        offset = vertex - camera
+        np.testing.assert_allclose(view @ [2.0, 7.0, -1.0, 1.0],
+                                   [offset.dot(camera.right), offset.dot(camera.up),
+                                    offset.dot(camera.forward), 1.0], atol=1e-12)
+
+    def test_matrices_are_cached_until_camera_changes(self) -> None:
+        """Test matrices are reused while the camera is static and rebuilt on moves."""
+        view = self.camera.view_matrix
+        combined = self.camera.view_projection_matrix
+        self.assertIs(self.camera.view_matrix, view)
+        self.assertIs(self.camera.view_projection_matrix, combined)
+        self.camera.project_batch(np.zeros((1, 3)) - [0.0, 0.0, 1.0])
+        self.assertIs(self.camera.view_matrix, view)
+
+        self.camera.x = 2.0
+        moved = self.camera.view_matrix
+        self.assertIsNot(moved, view)
+        self.assertIsNot(self.camera.view_projection_matrix, combined)
+        np.testing.assert_allclose(moved @ [0.0, 0.0, -1.0, 1.0],
+                                   [0.0, 0.0, math.sqrt(5.0), 1.0], atol=1e-12)
+        self.camera.set_look_at(Vertex(2.0, 0.0, -1.0))
+        self.assertIsNot(self.camera.view_matrix, moved)
+
+    def test_projection_matrix_depth_range(self) -> None:
+        """Test clip depth runs from 0 at the near plane to 1 at the far plane."""
+        camera = Camera(self.origin, self.look_at, focal_length=2.0, near=0.5, far=10.0)
+        projection = camera.projection_matrix
+        for depth, expected in ((0.5, 0.0), (10.0, 1.0)):
+            clip = projection @ [1.0, -1.0, depth, 1.0]
+            self.assertAlmostEqual(clip[2] / clip[3], expected)
+            np.testing.assert_allclose(clip[:2] / clip[3], [2.0 / depth, -2.0 / depth])
+        unbounded = Camera(self.origin, self.look_at, near=0.5).projection_matrix
+        clip = unbounded @ [0.0, 0.0, 1e12, 1.0]
+        self.assertAlmostEqual(clip[2] / clip[3], 1.0)
+
+    def test_lens_changes_rebuild_projection(self) -> None:
+        """Test focal length and clip plane changes invalidate the projection."""
+        projection = self.camera.projection_matrix
+        view = self.camera.view_matrix
+        self.camera.focal_length = 2.0
+        self.assertIsNot(self.camera.projection_matrix, projection)
+        self.assertIs(self.camera.view_matrix, view)
+        projection = self.camera.projection_matrix
+        self.camera.set_clip_planes(1.0, 100.0)
+        self.assertIsNot(self.camera.projection_matrix, projection)
+        self.assertEqual((self.camera.near, self.camera.far), (1.0, 100.0))
+
+    def test_focal_length_scales_projection(self) -> None:
+        """Test the scalar and batch projections scale with the focal length."""
+        vertex = Vertex(1.0, 0.5, -4.0)
+        self.camera.focal_length = 3.0
+        point = self.camera.project_vertex(vertex)
+        self.assertAlmostEqual(point.x, 0.75)
+        points, _ = self.camera.project_batch(np.array([[1.0, 0.5, -4.0]]))
+        np.testing.assert_allclose(points[0], [point.x, point.y])
+
+    def test_field_of_view_round_trip(self) -> None:
+        """Test setting a field of view sets the matching focal length."""
+        self.assertAlmostEqual(self.camera.field_of_view(2.0), math.pi / 2)
+        self.camera.set_field_of_view(math.pi / 3, 4.0)
+        self.assertAlmostEqual(self.camera.field_of_view(4.0), math.pi / 3)
+        with self.assertRaises(ValueError):
+            self.camera.set_field_of_view(math.pi, 4.0)
+
+    def test_invalid_lens_settings_raise(self) -> None:
+        """Test focal lengths and clip planes are validated."""
+        with self.assertRaises(ValueError):
+            Camera(self.origin, self.look_at, focal_length=0.0)
+        with self.assertRaises(ValueError):
+            Camera(self.origin, self.look_at, near=0.0)
+        with self.assertRaises(ValueError):
+            self.camera.set_clip_planes(5.0, 1.0)
+
+    def test_facing_uses_face_planes(self) -> None:
+        """Test facing is true only with the camera strictly in front of a plane."""
+        planes = np.array([[0.0, 0.0, 1.0, -5.0], [0.0, 0.0, -1.0, 5.0],
+                           [1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]])
+        self.assertEqual(self.camera.facing(planes).tolist(),
+                         [True, False, False, False])
+
+    def test_back_faces_of_closed_meshes_are_culled(self) -> None:
+        """Test batch paths drop faces turned away unless the mesh is two-sided."""
+        camera = Camera(Vertex(3.0, 2.0, 1.5), Vertex(0.25, 0.25, 0.25))
+        positions = np.array([[[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+                              [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+                              [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+                              [[1, 0, 0], [0, 1, 0], [0, 0, 1]]], dtype=np.float64)
+        for winding in (positions, positions[:, ::-1].copy()):
+            mesh = Mesh3D.from_buffer(winding, Shader(1, 2, 3))
+            self.assertEqual(len(camera.project_mesh(mesh)), 1)
+            indexed = IndexedMesh3D.from_buffer(winding)
+            self.assertEqual(len(camera.project_indexed(indexed)), 1)
+            sources, depths, _ = camera.project_chunk(winding, planes=mesh.planes)
+            self.assertEqual(sources.tolist(), [3])
+            self.assertEqual(len(depths), 1)
+            mesh.two_sided = True
+            self.assertEqual(len(camera.project_mesh(mesh)), 4)
+
+    def test_frustum_planes_bound_the_view(self) -> None:
+        """Test the frustum planes follow the near and far planes and the viewport."""
+        self.assertEqual(self.camera.frustum_planes.shape, (1, 4))
+        camera = Camera(self.origin, self.look_at, far=10.0, viewport=AspectRatio(2, 2))
+        planes = camera.frustum_planes
+        self.assertEqual(planes.shape, (6, 4))
+        np.testing.assert_allclose(np.linalg.norm(planes[:, :3], axis=1), 1.0)
+        for point, inside in (((0, 0, -5), True), ((4.9, 4.9, -5), True),
+                              ((5.1, 0, -5), False), ((0, -5.1, -5), False),
+                              ((0, 0, -0.05), False), ((0, 0, -11), False)):
+            self.assertEqual(bool(np.all(planes[:, :3] @ point >= planes[:, 3])),
+                             inside, point)
+
+    def test_frustum_is_cached_until_lens_changes(self) -> None:
+        """Test the frustum is rebuilt only after the camera or lens changes."""
+        camera = Camera(self.origin, self.look_at, viewport=AspectRatio(2, 2))
+        planes = camera.frustum_planes
+        self.assertIs(camera.frustum_planes, planes)
+        camera.focal_length = 2.0
+        self.assertIsNot(camera.frustum_planes, planes)
+        planes = camera.frustum_planes
+        camera.viewport = None
+        self.assertEqual(camera.frustum_planes.shape, (1, 4))
+        camera.x = 1.0
+        self.assertIsNot(camera.frustum_planes, planes)
+
+    def test_is_box_in_frustum(self) -> None:
+        """Test whole boxes are rejected only when outside one plane."""
+        camera = Camera(self.origin, self.look_at, viewport=AspectRatio(2, 2))
+        for lower, upper, inside in (([-1.0, -1, -6], [1.0, 1, -4], True),
+                                     ([4.0, -1, -6], [8.0, 1, -4], True),
+                                     ([7.0, -1, -6], [8.0, 1, -4], False),
+                                     ([-1.0, -1, 1], [1.0, 1, 2], False)):
+            self.assertEqual(camera.is_box_in_frustum(np.array(lower), np.array(upper)),
+                             inside)
+
+    def test_is_face_in_frustum(self) -> None:
+        """Test faces are culled when every corner is outside the same plane."""
+        camera = Camera(self.origin, self.look_at, far=10.0, viewport=AspectRatio(2, 2))
+        cases = (([(0, 0, -5), (1, 0, -5), (0, 1, -5)], True),
+                 ([(-20, 0, -5), (20, 0, -5), (0, 1, -5)], True),
+                 ([(6, 0, -5), (7, 0, -5), (6, 1, -5)], False),
+                 ([(0, 6, -5), (1, 6, -5), (0, 7, -5)], False),
+                 ([(0, 0, -0.05), (0.01, 0, -0.05), (0, 0.01, -0.05)], False),
+                 ([(0, 0, -11), (1, 0, -11), (0, 1, -11)], False))
+        for corners, inside in cases:
+            face = Face3D([Vertex(*corner) for corner in corners])
+            self.assertEqual(camera.is_face_in_frustum(face), inside, corners)
+
+    def test_project_chunk_rejects_chunks_outside_the_frustum(self) -> None:
+        """Test off-screen faces and whole off-screen chunks are culled."""
+        camera = Camera(self.origin, self.look_at, viewport=AspectRatio(2, 2))
+        positions = np.array([[[0, 0, -5], [1, 0, -5], [0, 1, -5]],
+                              [[6, 0, -5], [7, 0, -5], [6, 1, -5]]], dtype=np.float64)
+        sources, depths, points = camera.project_chunk(positions)
+        self.assertEqual(sources.tolist(), [0])
+        self.assertEqual(points.shape, (1, 3, 2))
+        sources, depths, points = camera.project_chunk(positions[1:] + 10)
+        self.assertEqual(sources.tolist(), [])
+        self.assertEqual((depths.shape, points.shape), ((0,), (0, 3, 2)))
+        quantized, quantization = Mesh3D.quantize(positions[1:] + 10)
+        self.assertEqual(len(camera.project_chunk(quantized, quantization)[0]), 0)
+
+    @given(st.lists(st.tuples(*[st.floats(-20, 20, allow_nan=False)] * 9),
+                    min_size=1, max_size=10))
+    def test_project_chunk_matches_is_face_in_frustum(
+            self, rows: List[Tuple[float, ...]]) -> None:
+        """Test the batch frustum test and clipping match the per-face ones."""
+        camera = Camera(Vertex(1.0, 2.0, 3.0), Vertex(0.0, 0.0, 0.0), far=25.0,
+                        viewport=AspectRatio(4, 3))
+        positions = np.array(rows).reshape(-1, 3, 3)
+        faces = [Face3D([Vertex(*corner) for corner in face])
+                 for face in positions.tolist()]
+        expected = [(i, piece) for i, face in enumerate(faces)
+                    if camera.is_face_in_frustum(face)
+                    for piece in camera.project_clipped(face)]
+        sources, _, points = camera.project_chunk(positions)
+        self.assertEqual(sources.tolist(), [i for i, _ in expected])
+        wanted = np.array([[(p.x, p.y) for p in piece.points] for _, piece in expected])
+        np.testing.assert_allclose(points, wanted.reshape(-1, 3, 2),
+                                   rtol=1e-6, atol=1e-9)
+        mesh = IndexedMesh3D.from_buffer(positions)
+        mesh.two_sided = True
+        self.assertEqual(len(camera.project_indexed(mesh)), len(expected))
+
+    def test_project_clipped_splits_faces_crossing_the_near_plane(self) -> None:
+        """Test faces crossing the near plane give one or two clipped triangles."""
+        color = Shader(1, 2, 3)
+        beyond = Face3D([Vertex(0, 0, -5), Vertex(1, 0, -5), Vertex(0, 1, -5)], color)
+        self.assertEqual([f.points for f in self.camera.project_clipped(beyond)],
+                         [self.camera.project_face(beyond).points])
+        one = Face3D([Vertex(0, 0, -2), Vertex(1, 0, 0), Vertex(0, 1, 0)], color)
+        two = Face3D([Vertex(0, 0, -2), Vertex(1, 0, -2), Vertex(0, 1, 1)], color)
+        for face, count in ((one, 1), (two, 2)):
+            pieces = self.camera.project_clipped(face)
+            self.assertEqual(len(pieces), count)
+            for piece in pieces:
+                self.assertEqual((piece.distance, piece.color),
+                                 (face.distance(self.camera), color))
+                self.assertTrue(all(abs(p.x) <= 10 and abs(p.y) <= 10
+                                    for p in piece.points))
+        on_plane = Face3D([Vertex(0, 0, 1), Vertex(0, 0, -0.1), Vertex(0, 1, -1)],
+                          color)
+        self.assertEqual(len(self.camera.project_clipped(on_plane)), 1)
+        points = self.camera.project_clipped(one)[0].points
+        self.assertAlmostEqual(points[1].x, 0.95 / 0.1)
+        self.assertAlmostEqual(points[2].y, 0.95 / 0.1)
+
+    @given(st.lists(st.tuples(*[st.floats(-5, 5, allow_nan=False)] * 9), min_size=1,
+                    max_size=10))
+    def test_clipped_pieces_keep_winding_beyond_the_near_plane(
+            self, rows: List[Tuple[float, ...]]) -> None:
+        """Test clipped pieces lie beyond the near plane and keep their winding."""
+        view = np.array(rows).reshape(-1, 3, 3)
+        pieces, sources = self.camera._clip_near(view)
+        self.assertTrue(np.all(pieces[..., 2] >= self.camera.near - 1e-9))
+        self.assertTrue(np.all(np.diff(sources) >= 0))
+        original = Mesh3D.face_normals(view)[sources]
+        clipped = Mesh3D.face_normals(pieces)
+        self.assertTrue(np.all(np.einsum("ij,ij->i", original, clipped) >= -1e-9))
+
+    def test_batch_paths_clip_like_project_clipped(self) -> None:
+        """Test the mesh and indexed paths clip a face through the camera plane."""
+        positions = np.array([[[0, 0, -2], [1, 0, -2], [0, 1, 0]],
+                              [[0, 0, -2], [1, 0, -2], [0, 1, -2]]], dtype=np.float64)
+        faces = [Face3D([Vertex(*corner) for corner in face])
+                 for face in positions.tolist()]
+        expected = [sorted((p.x, p.y) for p in piece.points)
+                    for face in faces for piece in self.camera.project_clipped(face)]
+        self.assertEqual(len(expected), 3)
+        for mesh in (Mesh3D.from_buffer(positions),
+                     IndexedMesh3D.from_buffer(positions)):
+            mesh.two_sided = True
+            projected = self.camera.project_mesh(mesh) if mesh.is_array_backed \
+                else self.camera.project_indexed(mesh)
+            actual = [sorted((p.x, p.y) for p in face.points) for face in projected]
+            np.testing.assert_allclose(sorted(actual), sorted(expected), atol=1e-12)
+
+    def test_sphere_and_mesh_frustum_tests(self) -> None:
+        """Test whole meshes are accepted or rejected by their bounds."""
+        camera = Camera(self.origin, self.look_at, viewport=AspectRatio(2, 2))
+        self.assertTrue(camera.is_sphere_in_frustum(np.array([0.0, 0, -5]), 0.5))
+        self.assertTrue(camera.is_sphere_in_frustum(np.array([5.5, 0, -5]), 1.0))
+        self.assertFalse(camera.is_sphere_in_frustum(np.array([9.0, 0, -5]), 1.0))
+        self.assertFalse(camera.is_sphere_in_frustum(np.array([0.0, 0, 2]), 1.0))
+        positions = np.array([[[0, 0, -5], [1, 0, -5], [0, 1, -5]]], dtype=np.float64)
+        for mesh in (Mesh3D.from_buffer(positions),
+                     IndexedMesh3D.from_buffer(positions),
+                     Mesh3D([Face3D([Vertex(*c) for c in positions[0].tolist()])])):
+            self.assertTrue(camera.is_mesh_in_frustum(mesh))
+            mesh.translate(Vector(20, 0, 0))
+            self.assertFalse(camera.is_mesh_in_frustum(mesh))
+
+    def test_meshes_outside_the_frustum_are_not_read(self) -> None:
+        """Test rejected meshes are never transformed or materialized."""
+        camera = Camera(self.origin, self.look_at, viewport=AspectRatio(2, 2))
+        positions = np.array([[[20, 0, -5], [21, 0, -5], [20, 1, -5]]],
+                             dtype=np.float64)
+        buffered = Mesh3D.from_buffer(positions)
+        indexed = IndexedMesh3D.from_buffer(positions)
+        _ = buffered.bounding_sphere, indexed.bounding_sphere
+        with patch.object(Camera, "_to_view") as to_view, \
+                patch.object(Camera, "_project_positions") as project:
+            self.assertEqual(camera.project_mesh(buffered), [])
+            self.assertEqual(camera.project_indexed(indexed), [])
+            to_view.assert_not_called()
+            project.assert_not_called()
@@ -8,9 +8,16 @@ __license__ = "MIT"
 __version__ = "0.1.0"
 __maintainer__ = "Arin Hartung"
 
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from engine import Engine
+from utility import AssetManifest, FileImport, MeshCache, Precompiler
+
+ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      "assets")
 
 
 class TestEngine(unittest.TestCase):
@@ -30,11 +37,15 @@ class TestEngine(unittest.TestCase):
     def test_load_scene_initializes_scene_and_screen(self) -> None:
         """Test loading scene correctly sets up scene and screen."""
         with patch("engine.FileImport") as mock_file_import, \
+                patch("engine.AssetManifest") as mock_manifest, \
                 patch("engine.Camera") as mock_camera, \
                 patch("engine.Scene") as mock_scene, \
                 patch("engine.Screen") as mock_screen, \
                 patch("engine.Shader") as mock_shader:
 
+            mock_manifest.return_value.combined.return_value = None
+            mock_manifest.return_value.survey.return_value = {
+                "faces": 1, "camera": None}
             mock_file_import.return_value.read_file.return_value = [MagicMock()]
             settings = {
                 "filepath": "assets/demo.obj",
@@ -51,8 +62,9 @@ class TestEngine(unittest.TestCase):
             self.assertIsNotNone(self.engine._scene)
             self.assertIsNotNone(self.engine._screen)
             mock_file_import.return_value.read_file.assert_called_once_with(
-                settings["filepath"])
+                settings["filepath"], weld=True)
             mock_camera.assert_called_once()
+            self.assertIn("viewport", mock_camera.call_args.kwargs)
             mock_scene.assert_called_once()
             mock_screen.assert_called_once()
             mock_shader.assert_called_once()
@@ -73,6 +85,231 @@ class TestEngine(unittest.TestCase):
         mock_screen.render.assert_called_once_with([mock_face])
         mock_screen.show.assert_called_once()
 
+    def test_load_scene_stream_defers_loading(self) -> None:
+        """Test stream mode reads nothing until render and then streams chunks."""
+        with patch("engine.FileImport") as mock_file_import, \
+                patch("engine.AssetManifest") as mock_manifest, \
+                patch("engine.Camera"), patch("engine.Scene") as mock_scene, \
+                patch("engine.Screen") as mock_screen, patch("engine.Shader"), \
+                patch("engine.ExternalSort") as mock_sort:
+            mock_manifest.return_value.combined.return_value = None
+            settings = {
+                "filepath": "assets/demo.obj",
+                "camera_origin": (0.0, 0.0, 0.0),
+                "look_at": (0.0, 0.0, -1.0),
+                "aspect_ratio": (16, 9),
+                "resolution": 1080,
+                "variance": 3,
+                "stream": True,
+                "chunk_size": 128,
+                "sort_memory": 1 << 20,
+            }
+            self.engine.load_scene(settings)
+            importer = mock_file_import.return_value
+            importer.read_file.assert_not_called()
+            importer.iter_chunks.assert_not_called()
+
+            self.engine.render_scene()
+            mock_sort.from_memory.assert_called_once_with(1 << 20)
+            sorter = mock_sort.from_memory.return_value.__enter__.return_value
+            make_stream = mock_scene.return_value.make_render_stream
+            chunks, used_sorter, variance = make_stream.call_args.args
+            self.assertEqual((used_sorter, variance), (sorter, 3))
+            importer.iter_chunks.return_value = iter(["chunk"])
+            self.assertEqual(list(chunks), ["chunk"])
+            importer.iter_chunks.assert_called_once_with(settings["filepath"], 128)
+            mock_screen.return_value.render_stream.assert_called_once_with(sorter)
+            mock_screen.return_value.show.assert_called_once()
+
+    def test_load_scene_merges_file_list(self) -> None:
+        """Test a list of paths is loaded with read_files into one scene."""
+        with patch("engine.FileImport") as mock_file_import, \
+                patch("engine.AssetManifest") as mock_manifest, \
+                patch("engine.Camera"), patch("engine.Scene") as mock_scene, \
+                patch("engine.Screen"), patch("engine.Shader"):
+            mock_manifest.return_value.combined.return_value = None
+            mock_manifest.return_value.survey.return_value = {
+                "faces": 2, "camera": None}
+            importer = mock_file_import.return_value
+            importer.read_files.return_value = [MagicMock(), MagicMock()]
+            settings = {
+                "filepath": ["assets/demo.obj", "assets/bonsai.obj"],
+                "camera_origin": (0.0, 0.0, 0.0),
+                "look_at": (0.0, 0.0, -1.0),
+                "aspect_ratio": (16, 9),
+                "resolution": 1080,
+                "variance": 1,
+            }
+            self.engine.load_scene(settings)
+            importer.read_files.assert_called_once_with(settings["filepath"], weld=True)
+            importer.read_file.assert_not_called()
+            self.assertEqual(mock_scene.call_args.args[1],
+                             importer.read_files.return_value)
+
+    def test_load_scene_streams_large_indexed_scenes(self) -> None:
+        """Test the manifest's face count picks stream mode and its camera pose."""
+        with patch("engine.FileImport") as mock_file_import, \
+                patch("engine.AssetManifest") as mock_manifest, \
+                patch("engine.Camera") as mock_camera, \
+                patch("engine.Vertex") as mock_vertex, \
+                patch("engine.Scene"), patch("engine.Screen"), patch("engine.Shader"):
+            mock_manifest.return_value.combined.return_value = {
+                "faces": Engine.STREAM_FACE_THRESHOLD + 1,
+                "camera": {"origin": [1.0, 2.0, 3.0], "look_at": [0.0, 0.0, 0.0]},
+            }
+            settings = {
+                "filepath": "assets/big.obj",
+                "aspect_ratio": (16, 9),
+                "resolution": 1080,
+                "variance": 0,
+            }
+            self.engine.load_scene(settings)
+            mock_manifest.assert_called_once_with("assets")
+            combined = mock_manifest.return_value.combined
+            combined.assert_called_once_with(["assets/big.obj"])
+            mock_file_import.return_value.read_file.assert_not_called()
+            self.assertIsNotNone(self.engine._chunks)
+            mock_vertex.assert_any_call(1.0, 2.0, 3.0)
+            mock_camera.assert_called_once()
+
+            settings["stream"] = False
+            settings["camera_origin"] = (5.0, 5.0, 5.0)
+            self.engine.load_scene(settings)
+            self.assertIsNone(self.engine._chunks)
+            mock_file_import.return_value.read_file.assert_called_once()
+            mock_vertex.assert_any_call(5.0, 5.0, 5.0)
+
+    def test_load_scene_builds_a_bvh_for_large_scenes(self) -> None:
+        """Test large loaded scenes get a BVH saved in the cache directory."""
+        with patch("engine.FileImport") as mock_file_import, \
+                patch("engine.AssetManifest") as mock_manifest, \
+                patch("engine.Camera"), patch("engine.Scene") as mock_scene, \
+                patch("engine.Screen"), patch("engine.Shader"):
+            mock_file_import.return_value.read_file.return_value = [MagicMock()]
+            mock_manifest.return_value.combined.return_value = {
+                "faces": Engine.BVH_FACE_THRESHOLD + 1, "camera": None}
+            settings = {
+                "filepath": "assets/big.obj",
+                "camera_origin": (0.0, 0.0, 0.0),
+                "look_at": (0.0, 0.0, -1.0),
+                "aspect_ratio": (16, 9),
+                "resolution": 1080,
+                "variance": 0,
+                "stream": False,
+                "cache_dir": "cache",
+            }
+            self.engine.load_scene(settings)
+            build_bvh = mock_scene.return_value.build_bvh
+            build_bvh.assert_called_once_with("cache")
+
+            build_bvh.reset_mock()
+            settings["bvh"] = False
+            self.engine.load_scene(settings)
+            build_bvh.assert_not_called()
+
+    def test_load_scene_reads_precompiled_assets(self) -> None:
+        """Test a precompiled source is loaded from its binary, not parsed."""
+        with tempfile.TemporaryDirectory() as folder:
+            source = os.path.join(folder, "tetrahedron.obj")
+            shutil.copy(os.path.join(ASSETS, "tetrahedron.obj"), source)
+            FileImport._instance = None  # pylint: disable=protected-access
+            Precompiler(folder).run()
+            settings = {
+                "filepath": source,
+                "asset_dir": folder,
+                "cache_dir": os.path.join(folder, "cache"),
+                "aspect_ratio": (4, 3),
+                "resolution": 64,
+                "variance": 0,
+            }
+            with patch.object(FileImport, "_read_source") as read_source, \
+                    patch.object(MeshCache, "lookup") as lookup, patch("engine.Screen"):
+                self.engine.load_scene(settings)
+            read_source.assert_not_called()
+            lookup.assert_not_called()
+            scene = self.engine._scene  # pylint: disable=protected-access
+            assert scene is not None
+            self.assertEqual(sum(mesh.num_faces for mesh in scene.meshes), 4)
+
+    def test_load_scene_indexes_new_and_changed_assets(self) -> None:
+        """Test loading adds an unindexed asset to the manifest and reuses its parse."""
+        with tempfile.TemporaryDirectory() as folder:
+            source = os.path.join(folder, "tetrahedron.obj")
+            shutil.copy(os.path.join(ASSETS, "tetrahedron.obj"), source)
+            FileImport._instance = None  # pylint: disable=protected-access
+            settings = {
+                "filepath": source,
+                "asset_dir": folder,
+                "cache_dir": os.path.join(folder, "cache"),
+                "aspect_ratio": (4, 3),
+                "resolution": 64,
+                "variance": 0,
+            }
+            with patch.object(FileImport, "_read_source",
+                              wraps=FileImport()._read_source) as read_source, \
+                    patch("engine.Screen"):
+                self.engine.load_scene(settings)
+                self.assertEqual(read_source.call_count, 1)
+                self.engine.load_scene(settings)
+                self.assertEqual(read_source.call_count, 1)
+            entry = AssetManifest(folder).get(source)
+            assert entry is not None
+            self.assertEqual(entry["faces"], 4)
+
+    def test_load_scene_streams_new_assets_without_indexing_them(self) -> None:
+        """Test a new asset over the stream threshold is surveyed, not indexed."""
+        with tempfile.TemporaryDirectory() as folder:
+            source = os.path.join(folder, "tetrahedron.obj")
+            shutil.copy(os.path.join(ASSETS, "tetrahedron.obj"), source)
+            FileImport._instance = None  # pylint: disable=protected-access
+            settings = {
+                "filepath": source,
+                "asset_dir": folder,
+                "aspect_ratio": (4, 3),
+                "resolution": 64,
+                "variance": 0,
+            }
+            with patch.object(Engine, "STREAM_FACE_THRESHOLD", 3), \
+                    patch.object(FileImport, "read_file") as read_file, \
+                    patch.object(AssetManifest, "refresh") as refresh, \
+                    patch("engine.Screen"):
+                self.engine.load_scene(settings)
+            read_file.assert_not_called()
+            refresh.assert_not_called()
+            chunks = self.engine._chunks  # pylint: disable=protected-access
+            self.assertIsNotNone(chunks)
+            self.assertIsNone(AssetManifest(folder).get(source))
+
+    def test_load_scene_stores_welded_meshes_at_precision(self) -> None:
+        """Test the precision setting reaches the welded meshes of a scene."""
+        with tempfile.TemporaryDirectory() as folder:
+            source = os.path.join(folder, "tetrahedron.obj")
+            shutil.copy(os.path.join(ASSETS, "tetrahedron.obj"), source)
+            FileImport._instance = None  # pylint: disable=protected-access
+            settings = {
+                "filepath": source,
+                "asset_dir": folder,
+                "aspect_ratio": (4, 3),
+                "resolution": 64,
+                "variance": 0,
+                "precision": "quantized16",
+            }
+            with patch("engine.Screen"):
+                self.engine.load_scene(settings)
+            scene = self.engine._scene  # pylint: disable=protected-access
+            assert scene is not None
+            self.assertEqual([mesh.precision for mesh in scene.meshes], ["quantized16"])
+            self.assertEqual(scene.meshes[0].num_faces, 4)
+
+    def test_load_scene_without_pose_raises(self) -> None:
+        """Test a missing camera pose is an error when the manifest has none."""
+        with patch("engine.FileImport"), patch("engine.AssetManifest") as mock_manifest:
+            mock_manifest.return_value.combined.return_value = None
+            mock_manifest.return_value.survey.return_value = {
+                "faces": 0, "camera": None}
+            with self.assertRaises(KeyError):
+                self.engine.load_scene({"filepath": "assets/demo.obj", "variance": 0})
+
     def test_render_scene_without_init_raises(self) -> None:
         """Test that render_scene raises if scene or screen is uninitialized."""
         with self.assertRaises(RuntimeError):
@@ -0,0 +1,92 @@
+"""
+Unit tests for the ExternalSort class using unittest and Hypothesis.
+"""
+
+__author__ = "Michael Nuttall"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Michael Nuttall"
+
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from hypothesis import given, settings, strategies as st
+from scene import ExternalSort
+from geometry import Shader
+
+
+class TestExternalSort(unittest.TestCase):
+    """Unit tests for the ExternalSort class."""
+
+    @staticmethod
+    def _points(count: int) -> np.ndarray:
+        """Builds distinct projected corners for count faces."""
+        return np.arange(count * 6, dtype=np.float64).reshape(count, 3, 2)
+
+    def test_in_memory_sort_is_far_to_near(self) -> None:
+        """Test faces come back farthest first without spilling."""
+        with ExternalSort(run_size=10) as sorter:
+            sorter.add(np.array([1.0, 3.0, 2.0]), self._points(3), (10, 20, 30))
+            faces = list(sorter)
+            self.assertEqual(sorter.num_runs, 0)
+        self.assertEqual([f.distance for f in faces], [3.0, 2.0, 1.0])
+        self.assertEqual(faces[0].points[2].x, 10.0)
+        self.assertEqual(faces[0].color, Shader(10, 20, 30))
+
+    def test_spilled_runs_merge_in_order(self) -> None:
+        """Test batches larger than a run are spilled and merged."""
+        with ExternalSort(run_size=4) as sorter:
+            sorter.add(np.array([5.0, 1.0, 9.0, 3.0, 7.0]), self._points(5),
+                       np.array([[i, i, i] for i in range(5)]))
+            sorter.add(np.array([8.0, 2.0]), self._points(2), (0, 0, 0))
+            self.assertEqual(sorter.num_runs, 1)
+            self.assertEqual(len(sorter), 7)
+            faces = list(sorter)
+            self.assertEqual(sorter.num_runs, 2)
+        self.assertEqual([f.distance for f in faces],
+                         [9.0, 8.0, 7.0, 5.0, 3.0, 2.0, 1.0])
+        self.assertEqual(faces[0].color, Shader(2, 2, 2))
+
+    def test_sort_can_be_iterated_twice(self) -> None:
+        """Test iteration does not consume the sorted faces."""
+        with ExternalSort(run_size=2) as sorter:
+            sorter.add(np.array([1.0, 2.0, 3.0]), self._points(3), (0, 0, 0))
+            self.assertEqual([f.distance for f in sorter], [f.distance for f in sorter])
+
+    def test_runs_beyond_fan_in_merge_in_passes(self) -> None:
+        """Test more runs than the fan-in share one file and merge in passes."""
+        depths = np.random.default_rng(0).permutation(25).astype(float)
+        with patch("scene.external_sort.tempfile.TemporaryFile",
+                   wraps=tempfile.TemporaryFile) as opened:
+            with ExternalSort(run_size=2, fan_in=3) as sorter:
+                sorter.add(depths, self._points(25), (0, 0, 0))
+                self.assertEqual((sorter.num_runs, opened.call_count), (12, 1))
+                faces = list(sorter)
+                self.assertLessEqual(sorter.num_runs, 3)
+                self.assertEqual([f.distance for f in sorter], list(range(24, -1, -1)))
+        self.assertEqual([f.distance for f in faces], list(range(24, -1, -1)))
+        self.assertEqual(faces[0].points[0].x, 6.0 * int(np.argmax(depths)))
+
+    def test_from_memory_sizes_runs_from_the_budget(self) -> None:
+        """Test the run size is half the budget in records."""
+        size = ExternalSort.RECORD_DTYPE.itemsize
+        self.assertEqual(ExternalSort.from_memory(size * 200).run_size, 100)
+        self.assertEqual(ExternalSort.from_memory(0).run_size, 1)
+
+    def test_invalid_run_size_raises(self) -> None:
+        """Test a run size below 1 or a fan-in below 2 raises ValueError."""
+        with self.assertRaises(ValueError):
+            ExternalSort(run_size=0)
+        with self.assertRaises(ValueError):
+            ExternalSort(fan_in=1)
+
+    @given(st.lists(st.floats(0, 1e6), max_size=60), st.integers(1, 8),
+           st.integers(2, 5))
+    @settings(max_examples=30, deadline=None)
+    def test_matches_sorted(self, depths: list, run_size: int, fan_in: int) -> None:
+        """Test the merged order matches an in-memory descending sort."""
+        with ExternalSort(run_size=run_size, fan_in=fan_in) as sorter:
+            sorter.add(np.array(depths), self._points(len(depths)), (0, 0, 0))
+            self.assertEqual([f.distance for f in sorter], sorted(depths, reverse=True))
@@ -8,10 +8,16 @@ __license__ = "MIT"
 __version__ = "0.1.0"
 __maintainer__ = "Michael Nuttall"
 
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
 import unittest
-from unittest.mock import patch, mock_open
+from unittest.mock import MagicMock, patch, mock_open
+import numpy as np
 from utility import FileImport
-from geometry import Mesh3D
+from geometry import Mesh3D, IndexedMesh3D, LazyMesh3D
 
 SAMPLE_DATA = """# This is a comment
 2
@@ -115,3 +121,299 @@ class TestFileImport(unittest.TestCase):
         """Test ValueError is raised if a face has fewer than 3 vertices."""
         with self.assertRaises(ValueError):
             self.importer.read_file("mock.obj")
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_read_file_stream_returns_iterator(self, _mock_file) -> None:
+        """Test read_file with stream=True lazily yields Mesh3D objects."""
+        meshes = self.importer.read_file("mock.obj", stream=True)
+        self.assertNotIsInstance(meshes, list)
+        first = next(meshes)
+        self.assertIsInstance(first, Mesh3D)
+        self.assertEqual(first.base_shader.rgb, (10, 20, 30))
+        self.assertEqual(len(list(meshes)), 1)
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_read_file_stream_does_not_buffer_lines(self, _mock_file) -> None:
+        """Test streaming never stores the raw lines in the singleton."""
+        meshes = list(self.importer.iter_file("mock.obj"))
+        self.assertEqual(len(meshes), 2)
+        self.assertEqual(self.importer.get_data(), [])
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_read_file_releases_lines(self, _mock_file) -> None:
+        """Test read_file drops the raw line buffer after building meshes."""
+        self.importer.read_file("mock.obj")
+        self.assertEqual(self.importer.get_data(), [])
+
+    @patch("builtins.open", new_callable=mock_open, read_data="2\n10 20 30\n0\n")
+    def test_read_file_stream_raises_on_truncated_data(self, _mock_file) -> None:
+        """Test ValueError is raised if the stream ends before all meshes."""
+        with self.assertRaises(ValueError):
+            list(self.importer.read_file("mock.obj", stream=True))
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_read_file_weld_returns_indexed_meshes(self, _mock_file) -> None:
+        """Test weld=True returns IndexedMesh3D objects with the same faces."""
+        plain = self.importer.read_file("mock.obj")
+        welded = self.importer.read_file("mock.obj", weld=True)
+        self.assertTrue(all(isinstance(m, IndexedMesh3D) for m in welded))
+        self.assertEqual([m.faces for m in welded], [m.faces for m in plain])
+        self.assertEqual(welded[1].base_shader.rgb, (255, 255, 255))
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_read_file_stream_weld(self, _mock_file) -> None:
+        """Test streaming and welding can be combined."""
+        meshes = self.importer.read_file("mock.obj", stream=True, weld=True)
+        self.assertIsInstance(next(meshes), IndexedMesh3D)
+
+    def test_index_file_finds_mesh_blocks(self) -> None:
+        """Test the index holds each mesh's color, face count and vertex lines."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sample.obj")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(SAMPLE_DATA)
+            blocks = self.importer.index_file(path)
+            with open(path, "rb") as file:
+                data = file.read()
+        self.assertEqual([b.color.rgb for b in blocks], [(10, 20, 30), (255, 255, 255)])
+        self.assertEqual([b.num_faces for b in blocks], [1, 1])
+        self.assertEqual(data[blocks[1].start:blocks[1].end],
+                         b"v 0 0 1\nv 1 0 1\nv 0 1 1\n")
+
+    def test_read_parallel_matches_sequential(self) -> None:
+        """Test parallel parsing returns the same meshes in file order."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sample.obj")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(SAMPLE_DATA)
+            plain = self.importer.read_file(path)
+            self.importer.workers = 2
+            parallel = self.importer.read_file(path)
+        self.assertEqual([m.faces for m in parallel], [m.faces for m in plain])
+        self.assertEqual([m.base_shader.rgb for m in parallel],
+                         [(10, 20, 30), (255, 255, 255)])
+
+    def test_read_parallel_raises_on_invalid_vertex(self) -> None:
+        """Test worker errors keep the sequential parser's message."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "bad.obj")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(MALFORMED_VERTEX)
+            with self.assertRaisesRegex(ValueError, "Expected line starting with 'v'"):
+                self.importer.read_parallel(path, 2)
+
+    def test_workers_rejects_zero(self) -> None:
+        """Test the worker count must be positive."""
+        with self.assertRaises(ValueError):
+            self.importer.workers = 0
+
+    def test_parse_vertices_fast_path_matches_line_parser(self) -> None:
+        """Test canonical and irregular vertex blocks parse to the same array."""
+        canonical = ["v 0 0 1", "v 1.5 -2 3e-1", "v 0 1 1"]
+        irregular = ["v\t0 0 1", "v  1.5 -2 3e-1", "v 0 1 1 1"]
+        parse = FileImport._parse_vertices  # pylint: disable=protected-access
+        fast, slow = parse(canonical, 1), parse(irregular, 1)
+        self.assertEqual(fast.shape, (1, 3, 3))
+        self.assertEqual(fast.tolist(), slow.tolist())
+        self.assertEqual(fast[0, 1].tolist(), [1.5, -2.0, 0.3])
+
+    def test_parse_vertices_keeps_line_parser_errors(self) -> None:
+        """Test malformed blocks raise the per-line parser's messages."""
+        with self.assertRaisesRegex(ValueError, "Expected line starting with 'v'"):
+            FileImport._parse_vertices(  # pylint: disable=protected-access
+                ["v 0 0 0", "p 1 0 0", "v 0 1 0"], 1)
+        with self.assertRaisesRegex(ValueError, "Expected 3 vertices, got: 2"):
+            FileImport._parse_vertices(  # pylint: disable=protected-access
+                ["v 0 0 0", "v 1 0 0"], 1)
+        with self.assertRaises(ValueError):
+            FileImport._parse_vertices(  # pylint: disable=protected-access
+                ["v 0 0 0", "v 1 x 0", "v 0 1 0"], 1)
+
+    def test_parse_vertices_checks_each_line_of_the_fast_path(self) -> None:
+        """Test a long line cannot make up for a short one in the same block."""
+        parse = FileImport._parse_vertices  # pylint: disable=protected-access
+        with self.assertRaises(IndexError):
+            parse(["v 0 0 0 5", "v 1 0", "v 0 1 0"], 1)
+        with self.assertRaises(IndexError):
+            parse(["v 0 0", "v 1 0 0", "v 0 1 0", "v 0 0 1 0", "v 1 0 0", "v 0 1 0"], 2)
+
+    def test_read_lazy_parses_on_access(self) -> None:
+        """Test lazy proxies carry header info and parse their own block."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sample.obj")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(SAMPLE_DATA)
+            plain = self.importer.read_file(path)
+            lazy = self.importer.read_lazy(path)
+            self.assertTrue(all(isinstance(m, LazyMesh3D) for m in lazy))
+            self.assertEqual([m.num_faces for m in lazy], [1, 1])
+            self.assertFalse(any(m.is_loaded for m in lazy))
+            self.assertEqual(lazy[1].faces, plain[1].faces)
+            self.assertFalse(lazy[0].is_loaded)
+
+    def test_index_file_skips_blank_and_comment_lines(self) -> None:
+        """Test blank, indented and comment lines inside a block are skipped."""
+        data = "1\n\n  10 20 30\n#faces\n2\nv 0 0 0\n\nv 1 0 0\n  # note\nv 0 1 0\n" \
+               "\r\n  v 0 0 1\nv 1 0 1\nv 0 1 1\n"
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "spaced.obj")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(data)
+            blocks = self.importer.index_file(path)
+            lazy = self.importer.read_lazy(path)
+            self.assertEqual(blocks[0].num_faces, 2)
+            self.assertEqual(blocks[0].end, len(data))
+            self.assertEqual(lazy[0].positions[1].tolist(),
+                             [[0, 0, 1], [1, 0, 1], [0, 1, 1]])
+
+    def test_index_file_reads_in_bounded_chunks(self) -> None:
+        """Test indexing never reads the whole file, even across chunk edges."""
+        sizes = []
+        read = gzip.GzipFile.read
+
+        def bounded_read(file: gzip.GzipFile, size: int = -1) -> bytes:
+            sizes.append(size)
+            return read(file, size)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sample.obj.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as file:
+                file.write(SAMPLE_DATA)
+            with patch.object(gzip.GzipFile, "read", bounded_read), \
+                    patch("utility.fileimport._LineReader.CHUNK_SIZE", 5):
+                blocks = self.importer.index_file(path)
+            lazy = self.importer.read_lazy(path)
+            self.assertEqual(lazy[1].positions[0].tolist(),
+                             [[0, 0, 1], [1, 0, 1], [0, 1, 1]])
+        start = SAMPLE_DATA.index("v 0 0 1")
+        self.assertEqual((blocks[1].start, blocks[1].end), (start, len(SAMPLE_DATA)))
+        self.assertEqual([b.color.rgb for b in blocks], [(10, 20, 30), (255, 255, 255)])
+        self.assertTrue(sizes and all(0 < size <= 5 for size in sizes))
+
+    def test_index_file_raises_on_missing_header(self) -> None:
+        """Test a file that ends before a mesh's count line is rejected."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "short.obj")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("2\n10 20 30\n1\nv 0 0 0\nv 1 0 0\nv 0 1 0\n1 2 3\n")
+            with self.assertRaisesRegex(ValueError, "Unexpected end of data"):
+                self.importer.index_file(path)
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_iter_chunks_splits_meshes(self, _mock_file) -> None:
+        """Test chunks never exceed chunk_size faces and keep mesh colors."""
+        with patch.object(FileImport, "is_wavefront", return_value=False), \
+                patch("utility.fileimport.MeshCache.is_compiled", return_value=False):
+            chunks = list(self.importer.iter_chunks("mock.obj", chunk_size=1))
+        self.assertEqual([c.num_faces for c in chunks], [1, 1])
+        self.assertEqual([c.base_shader.rgb for c in chunks],
+                         [(10, 20, 30), (255, 255, 255)])
+        self.assertEqual(chunks[1].positions[0, 2].tolist(), [0.0, 1.0, 1.0])
+
+    def test_iter_chunks_slices_binary_meshes(self) -> None:
+        """Test buffer-backed sources are sliced into chunk views."""
+        big = Mesh3D.from_buffer(np.zeros((5, 3, 3)))
+        with patch.object(FileImport, "_read_source", return_value=[big]):
+            chunks = list(self.importer.iter_chunks("scan.stl", chunk_size=2))
+        self.assertEqual([c.num_faces for c in chunks], [2, 2, 1])
+
+    @patch("builtins.open", new_callable=mock_open, read_data=SAMPLE_DATA)
+    def test_iter_chunks_decides_sides_per_source_mesh(self, _mock_file) -> None:
+        """Test chunks take two_sided from the manifest or their whole source mesh."""
+        closed = Mesh3D.from_buffer(np.array([[[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+                                              [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+                                              [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+                                              [[1, 0, 0], [0, 1, 0], [0, 0, 1]]],
+                                             dtype=np.float64))
+        with patch.object(FileImport, "_read_source", return_value=[closed]):
+            chunks = list(self.importer.iter_chunks("scan.stl", chunk_size=3))
+        self.assertEqual([c.two_sided for c in chunks], [False, False])
+
+        with patch.object(FileImport, "is_wavefront", return_value=False), \
+                patch("utility.fileimport.MeshCache.is_compiled", return_value=False):
+            chunks = list(self.importer.iter_chunks("mock.obj", chunk_size=1))
+            self.assertEqual([c.two_sided for c in chunks], [True, True])
+            manifest = MagicMock()
+            manifest.part_sides.return_value = [False, True]
+            self.importer.manifest = manifest
+            chunks = list(self.importer.iter_chunks("mock.obj", chunk_size=1))
+        manifest.part_sides.assert_called_once_with("mock.obj")
+        self.assertEqual([c.two_sided for c in chunks], [False, True])
+
+    def test_precision_applies_to_chunks_and_unwelded_meshes(self) -> None:
+        """Test the precision setting converts streamed, unwelded and welded meshes."""
+        big = Mesh3D.from_buffer(np.random.default_rng(4).uniform(-1, 1, (5, 3, 3)))
+        self.importer.precision = "quantized16"
+        with patch.object(FileImport, "_read_source", return_value=[big]):
+            chunks = list(self.importer.iter_chunks("scan.stl", chunk_size=2))
+        self.assertEqual([c.precision for c in chunks], ["quantized16"] * 3)
+
+        self.importer.precision = "float32"
+        with patch.object(FileImport, "_read_source",
+                          return_value=[Mesh3D.from_buffer(np.zeros((2, 3, 3)))]):
+            meshes = [self.importer.read_file("scan.stl")[0],
+                      self.importer.read_files(["scan.stl"])[0]]
+            welded = self.importer.read_file("scan.stl", weld=True)[0]
+            merged = self.importer.read_files(["scan.stl"], weld=True)[0]
+        self.assertEqual([mesh.precision for mesh in meshes], ["float32"] * 2)
+        self.assertEqual(merged.precision, "float32")
+        self.assertIsInstance(welded, IndexedMesh3D)
+        self.assertEqual(welded.precision, "float32")
+        with self.assertRaises(ValueError):
+            self.importer.precision = "half"
+
+    def test_iter_chunks_rejects_zero(self) -> None:
+        """Test a chunk size below 1 raises ValueError."""
+        with self.assertRaises(ValueError):
+            next(self.importer.iter_chunks("mock.obj", chunk_size=0))
+
+    def test_read_files_merges_in_path_order(self) -> None:
+        """Test several files load concurrently into one list in path order."""
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            single = "1\n1 2 3\n1\nv 0 0 0\nv 1 0 0\nv 0 1 0\n"
+            for name, data in (("a.obj", SAMPLE_DATA), ("b.obj", single)):
+                paths.append(os.path.join(folder, name))
+                with open(paths[-1], "w", encoding="utf-8") as file:
+                    file.write(data)
+            meshes = self.importer.read_files(paths)
+            self.importer.workers = 2
+            parallel = self.importer.read_files(paths, weld=True)
+        self.assertEqual([m.base_shader.rgb for m in meshes],
+                         [(10, 20, 30), (255, 255, 255), (1, 2, 3)])
+        self.assertTrue(all(isinstance(m, IndexedMesh3D) for m in parallel))
+        self.assertEqual([m.faces for m in parallel], [m.faces for m in meshes])
+        self.assertEqual(self.importer.read_files([]), [])
+
+    def test_compressed_assets_read_like_plain_ones(self) -> None:
+        """Test gzip, bz2 and xz assets are detected by content and decoded."""
+        with tempfile.TemporaryDirectory() as folder:
+            plain = os.path.join(folder, "plain.obj")
+            with open(plain, "w", encoding="utf-8") as file:
+                file.write(SAMPLE_DATA)
+            expected = self.importer.read_file(plain)
+            self.assertIsNone(FileImport.compression(plain))
+            for kind, module in (("gzip", gzip), ("bz2", bz2), ("xz", lzma)):
+                path = os.path.join(folder, f"packed_{kind}.dat")
+                with module.open(path, "wt", encoding="utf-8") as file:
+                    file.write(SAMPLE_DATA)
+                self.assertEqual(FileImport.compression(path), kind)
+                self.assertEqual([m.faces for m in self.importer.read_file(path)],
+                                 [m.faces for m in expected])
+                streamed = self.importer.read_file(path, stream=True)
+                self.assertEqual([m.faces for m in streamed],
+                                 [m.faces for m in expected])
+                self.assertEqual(self.importer.read_lazy(path)[1].faces,
+                                 expected[1].faces)
+
+    def test_compressed_assets_skip_block_offsets_when_parallel(self) -> None:
+        """Test compressed text falls back to the streaming parser with workers."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "packed.obj.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as file:
+                file.write(SAMPLE_DATA)
+            self.importer.workers = 2
+            with patch.object(FileImport, "read_parallel") as mock_parallel:
+                meshes = self.importer.read_file(path)
+            mock_parallel.assert_not_called()
+        self.assertEqual([m.num_faces for m in meshes], [1, 1])
@@ -0,0 +1,228 @@
+"""
+Unit tests for the IndexedMesh3D class using unittest and Hypothesis.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import unittest
+import numpy as np
+from hypothesis import given, strategies as st
+from geometry import IndexedMesh3D, Mesh3D, MeshBuffer, Face3D, Vertex, Vector, Shader
+
+
+class TestIndexedMesh3D(unittest.TestCase):
+    """Unit tests for the IndexedMesh3D class."""
+
+    def setUp(self) -> None:
+        """Set up a two-face quad sharing an edge."""
+        self.a, self.b = Vertex(0, 0, 0), Vertex(1, 0, 0)
+        self.c, self.d = Vertex(1, 1, 0), Vertex(0, 1, 0)
+        self.quad = Mesh3D([
+            Face3D([self.a, self.b, self.c], Shader(10, 20, 30)),
+            Face3D([Vertex(0, 0, 0), Vertex(1, 1, 0), self.d], Shader(40, 50, 60)),
+        ])
+
+    def test_weld_merges_shared_vertices(self) -> None:
+        """Test welding keeps one vertex per unique position."""
+        mesh = IndexedMesh3D.weld(self.quad)
+        self.assertEqual(len(mesh.vertices), 4)
+        self.assertEqual(mesh.num_faces, 2)
+        self.assertEqual(mesh.faces[0].points[0], mesh.faces[1].points[0])
+        self.assertIs(mesh.faces[0].points[0], mesh.faces[1].points[0])
+
+    def test_weld_keeps_face_colors(self) -> None:
+        """Test welding a Face3D mesh preserves per-face colors."""
+        mesh = IndexedMesh3D.weld(self.quad)
+        self.assertEqual([f.color for f in mesh.faces],
+                         [Shader(10, 20, 30), Shader(40, 50, 60)])
+
+    def test_weld_buffer_mesh(self) -> None:
+        """Test welding a buffer-backed mesh is equivalent to its faces."""
+        positions = np.array([[[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                              [[0, 0, 0], [1, 1, 0], [0, 1, 0]]], dtype=np.float64)
+        mesh = IndexedMesh3D.from_buffer(positions, Shader(1, 1, 1))
+        self.assertEqual(len(mesh.vertices), 4)
+        self.assertEqual(mesh.faces, Mesh3D.from_buffer(positions).faces)
+        self.assertEqual(mesh.faces[1].color, Shader(1, 1, 1))
+
+    def test_weld_keeps_colors_edited_on_built_faces(self) -> None:
+        """Test a buffer mesh recolored through its faces welds with those colors."""
+        positions = np.array([[[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                              [[0, 0, 0], [1, 1, 0], [0, 1, 0]]], dtype=np.float64)
+        mesh = Mesh3D.from_buffer(positions, Shader(1, 1, 1))
+        mesh.set_color(Shader(2, 2, 2))
+        mesh.faces[1].color = Shader(9, 8, 7)
+        welded = IndexedMesh3D.weld(mesh)
+        self.assertEqual(welded.face_colors.tolist(), [[2, 2, 2], [9, 8, 7]])
+        buffer = MeshBuffer(positions, np.array([[3, 4, 5], [6, 7, 8]]))
+        self.assertEqual(IndexedMesh3D.weld(buffer).face_colors.tolist(),
+                         [[3, 4, 5], [6, 7, 8]])
+
+    def test_weld_returns_indexed_mesh_unchanged(self) -> None:
+        """Test welding an already indexed mesh is a no-op."""
+        mesh = IndexedMesh3D.weld(self.quad)
+        self.assertIs(IndexedMesh3D.weld(mesh), mesh)
+
+    def test_invalid_indices_raise(self) -> None:
+        """Test out-of-range indices raise ValueError."""
+        with self.assertRaises(ValueError):
+            IndexedMesh3D([self.a, self.b, self.c], [(0, 1, 3)])
+
+    def test_from_arrays_builds_pool(self) -> None:
+        """Test from_arrays keeps the given vertex pool and index triples."""
+        vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        indices = np.array([[0, 1, 2]], dtype=np.uint32)
+        mesh = IndexedMesh3D.from_arrays(vertices, indices, Shader(1, 2, 3))
+        self.assertEqual(mesh.vertices, [self.a, self.b, self.d])
+        self.assertEqual(mesh.indices, [(0, 1, 2)])
+        self.assertEqual(mesh.faces[0].color, Shader(1, 2, 3))
+
+    def test_from_arrays_keeps_the_arrays(self) -> None:
+        """Test from_arrays defers Vertex objects until they are read."""
+        vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        indices = np.array([[0, 1, 2]], dtype=np.uint32)
+        mesh = IndexedMesh3D.from_arrays(vertices, indices)
+        self.assertIs(mesh.pool, vertices)
+        self.assertIs(mesh.index_array, indices)
+        self.assertEqual(mesh.num_faces, 1)
+        np.testing.assert_array_equal(mesh.corners[0], vertices)
+        self.assertIsNone(mesh._vertices)  # pylint: disable=protected-access
+        self.assertIn("num_vertices=3", repr(mesh))
+
+    def test_arrays_follow_mutation(self) -> None:
+        """Test translate, add and color setters refresh the cached arrays."""
+        mesh = IndexedMesh3D.weld(self.quad)
+        np.testing.assert_array_equal(mesh.face_colors, [[10, 20, 30], [40, 50, 60]])
+        mesh.translate(Vector(0, 0, 1))
+        np.testing.assert_array_equal(mesh.pool[:, 2], [1, 1, 1, 1])
+        mesh.add(Face3D([Vertex(0, 0, 1), Vertex(5, 0, 1), Vertex(0, 5, 1)],
+                        Shader(1, 2, 3)))
+        self.assertEqual(mesh.pool.shape, (6, 3))
+        np.testing.assert_array_equal(mesh.index_array[-1], [0, 4, 5])
+        np.testing.assert_array_equal(mesh.face_colors[-1], [1, 2, 3])
+        mesh.set_color_variance(Shader(100, 100, 100), 0)
+        np.testing.assert_array_equal(mesh.face_colors, np.full((3, 3), 100))
+
+    def test_color_setters_leave_array_meshes_unbuilt(self) -> None:
+        """Test colors set before faces are built carry over to the faces."""
+        positions = np.array([[[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                              [[0, 0, 0], [1, 1, 0], [0, 1, 0]]], dtype=np.float64)
+        mesh = IndexedMesh3D.from_buffer(positions, Shader(100, 100, 100))
+        mesh.set_color_variance(variance=20)
+        colors = mesh.face_colors
+        self.assertTrue(np.all(np.abs(colors.astype(int) - 100) <= 20))
+        self.assertIsNone(mesh._faces)  # pylint: disable=protected-access
+        self.assertEqual([f.color.rgb for f in mesh.faces],
+                         [tuple(rgb) for rgb in colors.tolist()])
+        mesh.set_color(Shader(7, 8, 9))
+        np.testing.assert_array_equal(mesh.face_colors, [[7, 8, 9], [7, 8, 9]])
+        array_mesh = IndexedMesh3D.from_buffer(positions, Shader(1, 1, 1))
+        array_mesh.set_color(Shader(7, 8, 9))
+        self.assertEqual(array_mesh.faces[1].color, Shader(7, 8, 9))
+
+    def test_set_precision_stores_the_pool(self) -> None:
+        """Test the pool is stored at lower precision and decoded on read."""
+        vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 2.0]])
+        mesh = IndexedMesh3D([Vertex(*row) for row in vertices.tolist()], [(0, 1, 2)])
+        mesh.set_precision("quantized16")
+        self.assertEqual(mesh.precision, "quantized16")
+        np.testing.assert_allclose(mesh.pool, vertices, atol=1e-4)
+        mesh.translate(Vector(0, 0, 1))
+        np.testing.assert_allclose(mesh.vertices[2].z, 3.0, atol=1e-4)
+        mesh.set_precision("float32")
+        self.assertEqual(mesh.precision, "float32")
+        mesh.add(Face3D([Vertex(0, 0, 1), Vertex(5, 0, 1), Vertex(0, 5, 1)]))
+        self.assertEqual(mesh.precision, "float64")
+        with self.assertRaises(ValueError):
+            mesh.set_precision("half")
+
+    def test_from_arrays_rejects_bad_input(self) -> None:
+        """Test from_arrays checks array shapes and index range."""
+        vertices = np.zeros((3, 3))
+        with self.assertRaises(ValueError):
+            IndexedMesh3D.from_arrays(vertices, np.array([[0, 1, 3]]))
+        with self.assertRaises(ValueError):
+            IndexedMesh3D.from_arrays(vertices, np.array([0, 1, 2]))
+        with self.assertRaises(ValueError):
+            IndexedMesh3D.from_arrays(vertices, np.array([[0, 1, 2]]), None,
+                                      np.zeros((2, 3)))
+
+    def test_from_arrays_normals_last_until_faces_change(self) -> None:
+        """Test given normals set the face planes until a face is added."""
+        vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        normals = np.array([[0.0, 0.0, -1.0]])
+        mesh = IndexedMesh3D.from_arrays(vertices, np.array([[0, 1, 2]]), None,
+                                         normals)
+        self.assertIs(mesh.normals, normals)
+        np.testing.assert_array_equal(mesh.planes, [[0.0, 0.0, -1.0, 0.0]])
+        mesh.add(Face3D([Vertex(0, 0, 1), Vertex(1, 0, 1), Vertex(0, 1, 1)]))
+        self.assertIsNone(mesh.normals)
+        np.testing.assert_array_equal(mesh.planes[:, 2], [1.0, 1.0])
+
+    def test_add_reuses_pooled_vertices(self) -> None:
+        """Test add() welds new faces into the existing pool."""
+        mesh = IndexedMesh3D([self.a, self.b, self.c], [(0, 1, 2)])
+        face = Face3D([Vertex(1, 1, 0), Vertex(0, 1, 0), Vertex(0, 0, 0)])
+        mesh.add(face)
+        self.assertEqual(len(mesh.vertices), 4)
+        self.assertEqual(mesh.indices[-1], (2, 3, 0))
+        self.assertIs(face.points[0], mesh.vertices[2])
+        self.assertIn(face, mesh.faces)
+
+    def test_set_color_applies_to_all_faces(self) -> None:
+        """Test the inherited color API works on indexed meshes."""
+        mesh = IndexedMesh3D.weld(self.quad)
+        mesh.set_color(Shader(7, 8, 9))
+        self.assertTrue(all(f.color == Shader(7, 8, 9) for f in mesh.faces))
+
+    def test_repr_contains_vertex_count(self) -> None:
+        """Test __repr__ reports faces and pooled vertices."""
+        r = repr(IndexedMesh3D.weld(self.quad))
+        self.assertIn("IndexedMesh3D", r)
+        self.assertIn("num_vertices=4", r)
+
+    def test_planes_match_unwelded_mesh(self) -> None:
+        """Test planes read from the pool match the source mesh and reset on add."""
+        positions = np.array([[[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+                              [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+                              [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+                              [[1, 0, 0], [0, 1, 0], [0, 0, 1]]], dtype=np.float64)
+        source = Mesh3D.from_buffer(positions)
+        mesh = IndexedMesh3D.from_buffer(positions)
+        self.assertTrue(mesh.is_closed)
+        np.testing.assert_allclose(mesh.planes, source.planes)
+        mesh.add(Face3D([Vertex(5, 0, 0), Vertex(6, 0, 0), Vertex(5, 1, 0)]))
+        self.assertFalse(mesh.is_closed)
+        self.assertEqual(len(mesh.planes), 5)
+
+    def test_translate_replaces_the_pool(self) -> None:
+        """Test translate moves shared vertices without touching the originals."""
+        original = Vertex(0, 0, 0)
+        mesh = IndexedMesh3D([original, Vertex(1, 0, 0), Vertex(0, 1, 0),
+                              Vertex(0, 0, 1)],
+                             [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)])
+        faces = mesh.faces
+        _ = mesh.bounds
+        mesh.translate(Vector(0, 0, 5))
+        self.assertEqual(original, Vertex(0, 0, 0))
+        self.assertEqual(mesh.vertices[0], Vertex(0, 0, 5))
+        self.assertIs(faces[0].points[0], faces[1].points[0])
+        self.assertIs(faces[0].points[0], mesh.vertices[0])
+        self.assertEqual(mesh.bounds[0].tolist(), [0, 0, 5])
+        mesh.add(Face3D([Vertex(0, 0, 5), Vertex(2, 0, 5), Vertex(0, 2, 5)]))
+        self.assertEqual(len(mesh.vertices), 6)
+
+    @given(st.lists(st.tuples(st.integers(0, 3), st.integers(0, 3), st.integers(0, 3)),
+                    min_size=1, max_size=20))
+    def test_weld_preserves_geometry(self, corners) -> None:
+        """Test welded faces always match the source faces."""
+        grid = [Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0), Vertex(0, 0, 1)]
+        faces = [Face3D([Vertex(grid[i].x, grid[i].y, grid[i].z) for i in face])
+                 for face in corners]
+        mesh = IndexedMesh3D.weld(Mesh3D(list(faces)))
+        self.assertEqual(mesh.faces, faces)
+        self.assertLessEqual(len(mesh.vertices), 4)
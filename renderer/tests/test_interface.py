@@ -8,6 +8,7 @@ __license__ = "MIT"
 __version__ = "0.1.0"
 __maintainer__ = "Arin Hartung"
 
+import os
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -41,6 +42,27 @@ class TestInterface(unittest.TestCase):
         mock_tk.assert_called_once()
         self.assertTrue(isinstance(self.interface._root, MagicMock))
 
+    @patch("utility.interface.tk.Listbox")
+    @patch("utility.interface.AssetManifest")
+    def test_asset_list_comes_from_manifest(self, mock_manifest: MagicMock,
+                                            mock_listbox: MagicMock) -> None:
+        """Test assets are listed from the manifest and fill the path field."""
+        mock_manifest.return_value.listing.return_value = [
+            ("pot.obj", "112 faces, 2 meshes"), ("big.obj", "not indexed")]
+        interface = Interface()
+        mock_manifest.assert_called_once_with("assets")
+        mock_listbox.return_value.insert.assert_any_call("end", "big.obj (not indexed)")
+
+        interface._entry_filepath = MagicMock()
+        event = MagicMock()
+        event.widget.curselection.return_value = (1,)
+        interface._on_asset_select(event)
+        interface._entry_filepath.insert.assert_called_once_with(0, "big.obj")
+
+        event.widget.curselection.return_value = ()
+        interface._on_asset_select(event)
+        interface._entry_filepath.insert.assert_called_once()
+
     @patch("os.path.isfile", return_value=True)
     def test_collect_input_valid(self, _mock_isfile: MagicMock) -> None:
         """Test valid input collection."""
@@ -59,6 +81,23 @@ class TestInterface(unittest.TestCase):
 
         self.interface._collect_input()
         self.assertEqual(self.interface._result["resolution"], 300)
+        self.assertEqual(self.interface._result["filepath"], "assets/demo.obj")
+
+    @patch("os.path.isfile", return_value=True)
+    def test_collect_input_multiple_files(self, _mock_isfile: MagicMock) -> None:
+        """Test several ';'-separated paths are resolved into a list."""
+        mock_entry = MagicMock()
+        mock_entry.get.side_effect = [
+            "tree.obj; assets/rock.obj", "-0.7 -1 1", "0 0 0.65",
+            "4 3", "300", "10", "30 30 30"
+        ]
+        for name in ("filepath", "cam_origin", "look_at", "aspect",
+                     "resolution", "variance", "bgcolor"):
+            setattr(self.interface, f"_entry_{name}", mock_entry)
+
+        self.interface._collect_input()
+        self.assertEqual(self.interface._result["filepath"],
+                         [os.path.join("assets", "tree.obj"), "assets/rock.obj"])
 
     @patch("tkinter.messagebox.showerror")
     def test_collect_input_invalid(self, mock_msg: MagicMock) -> None:
@@ -0,0 +1,82 @@
+"""
+Unit tests for the LazyMesh3D class using unittest.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import unittest
+from unittest.mock import MagicMock
+import numpy as np
+from geometry import LazyMesh3D, Face3D, Vertex, Shader
+
+
+class TestLazyMesh3D(unittest.TestCase):
+    """Unit tests for the LazyMesh3D class."""
+
+    def setUp(self) -> None:
+        """Set up a proxy over a two-face position array."""
+        self.positions = np.arange(18, dtype=np.float64).reshape(2, 3, 3)
+        self.loader = MagicMock(return_value=self.positions)
+        self.mesh = LazyMesh3D(self.loader, 2, Shader(10, 20, 30))
+
+    def test_header_info_does_not_load(self) -> None:
+        """Test face count and color are available before loading."""
+        self.assertEqual(self.mesh.num_faces, 2)
+        self.assertEqual(self.mesh.base_shader, Shader(10, 20, 30))
+        self.assertFalse(self.mesh.is_loaded)
+        self.loader.assert_not_called()
+
+    def test_faces_load_once(self) -> None:
+        """Test the loader runs once, on first access to faces."""
+        faces = self.mesh.faces
+        self.assertIs(self.mesh.faces, faces)
+        self.loader.assert_called_once_with()
+        self.assertTrue(self.mesh.is_loaded)
+        self.assertEqual(faces[1].points[2], Vertex(15, 16, 17))
+        self.assertEqual(faces[0].color, Shader(10, 20, 30))
+
+    def test_positions_load(self) -> None:
+        """Test positions access loads the array without building faces."""
+        self.assertIs(self.mesh.positions, self.positions)
+        self.assertIsNone(self.mesh._faces)  # pylint: disable=protected-access
+
+    def test_is_array_backed_without_loading(self) -> None:
+        """Test a pending proxy is array-backed until faces are built or set."""
+        self.assertTrue(self.mesh.is_array_backed)
+        self.loader.assert_not_called()
+        _ = self.mesh.faces
+        self.assertFalse(self.mesh.is_array_backed)
+
+    def test_known_bounds_do_not_load(self) -> None:
+        """Test bounds given up front answer bounds and sphere queries unloaded."""
+        mesh = LazyMesh3D(self.loader, 2, bounds=[[0, 1, 2], [15, 16, 17]])
+        lower, upper = mesh.bounds
+        center, radius = mesh.bounding_sphere
+        self.assertEqual((lower.tolist(), upper.tolist()), ([0, 1, 2], [15, 16, 17]))
+        self.assertEqual(center.tolist(), [7.5, 8.5, 9.5])
+        self.assertAlmostEqual(radius, np.sqrt(3) * 7.5)
+        self.loader.assert_not_called()
+
+    def test_setting_faces_drops_loader(self) -> None:
+        """Test faces set directly replace the pending load."""
+        self.mesh.faces = [Face3D([Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)])]
+        self.assertEqual(self.mesh.num_faces, 1)
+        self.assertIsNone(self.mesh.positions)
+        self.loader.assert_not_called()
+
+    def test_load_rejects_wrong_shape(self) -> None:
+        """Test a loader returning the wrong face count raises ValueError."""
+        mesh = LazyMesh3D(lambda: np.zeros((1, 3, 3)), 2)
+        with self.assertRaises(ValueError):
+            mesh.load()
+
+    def test_bounds_load_once_and_match_the_buffer(self) -> None:
+        """Test the bounding box of a pending mesh comes from its loaded buffer."""
+        lower, upper = self.mesh.bounds
+        self.assertEqual((lower.tolist(), upper.tolist()), ([0, 1, 2], [15, 16, 17]))
+        _ = self.mesh.bounding_sphere
+        self.loader.assert_called_once()
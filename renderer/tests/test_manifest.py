@@ -0,0 +1,202 @@
+"""
+Unit tests for the AssetManifest class.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import math
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from utility import AssetManifest, FileImport
+
+ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      "assets")
+
+
+class TestAssetManifest(unittest.TestCase):
+    """Unit tests for indexing an asset directory."""
+
+    def setUp(self) -> None:
+        """Copy two assets into a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.assets = self._tmp.name
+        for name in ("tetrahedron.obj", "pot.obj"):
+            shutil.copy(os.path.join(ASSETS, name), self.assets)
+        os.makedirs(os.path.join(self.assets, ".hidden"))
+        shutil.copy(os.path.join(ASSETS, "tree.obj"),
+                    os.path.join(self.assets, ".hidden"))
+        self.pot = os.path.join(self.assets, "pot.obj")
+        self.tetrahedron = os.path.join(self.assets, "tetrahedron.obj")
+        FileImport._instance = None  # pylint: disable=protected-access
+
+    def tearDown(self) -> None:
+        """Remove temporary files."""
+        self._tmp.cleanup()
+
+    def test_missing_manifest_starts_empty(self) -> None:
+        """Test a directory without a manifest has no entries."""
+        manifest = AssetManifest(self.assets)
+        self.assertEqual(manifest.entries, {})
+        self.assertEqual(manifest.path,
+                         os.path.join(self.assets, ".compiled", "manifest.json"))
+        self.assertIsNone(manifest.get(self.pot))
+
+    def test_is_source_accepts_compressed_assets(self) -> None:
+        """Test mesh extensions are recognized with or without compression."""
+        self.assertTrue(AssetManifest.is_source("scan.PLY"))
+        self.assertTrue(AssetManifest.is_source("scene.obj.xz"))
+        self.assertFalse(AssetManifest.is_source("notes.txt.gz"))
+        self.assertFalse(AssetManifest.is_source("scene.rmc"))
+
+    def test_update_indexes_and_persists(self) -> None:
+        """Test update parses new assets and a new instance reads them back."""
+        manifest = AssetManifest(self.assets)
+        self.assertEqual(manifest.update(), ["pot.obj", "tetrahedron.obj"])
+        reloaded = AssetManifest(self.assets)
+        entry = reloaded.get(self.pot)
+        assert entry is not None
+        meshes = FileImport().read_file(self.pot)
+        self.assertEqual(entry["meshes"], len(meshes))
+        self.assertEqual(entry["faces"], sum(mesh.num_faces for mesh in meshes))
+        self.assertEqual(entry["fingerprint"], AssetManifest.fingerprint(self.pot))
+
+    def test_update_is_incremental(self) -> None:
+        """Test only changed files are parsed again and deleted ones dropped."""
+        manifest = AssetManifest(self.assets)
+        manifest.update()
+        with open(self.tetrahedron, "a", encoding="utf-8") as file:
+            file.write("\n")
+        self.assertIsNone(manifest.get(self.tetrahedron))
+        with patch.object(AssetManifest, "describe",
+                          wraps=AssetManifest.describe) as describe:
+            self.assertEqual(manifest.update(), ["tetrahedron.obj"])
+            describe.assert_called_once()
+        os.remove(self.pot)
+        self.assertEqual(manifest.update(), [])
+        self.assertEqual(list(AssetManifest(self.assets).entries), ["tetrahedron.obj"])
+
+    def test_update_checks_only_named_assets(self) -> None:
+        """Test named updates skip other and unknown assets and forget nothing."""
+        manifest = AssetManifest(self.assets)
+        manifest.update()
+        os.remove(self.pot)
+        with open(self.tetrahedron, "a", encoding="utf-8") as file:
+            file.write("\n")
+        names = ["tetrahedron.obj", "missing.obj", "../x.obj"]
+        self.assertEqual(manifest.update(names), ["tetrahedron.obj"])
+        self.assertIn("pot.obj", manifest.entries)
+        self.assertEqual(manifest.update(["tetrahedron.obj"]), [])
+        self.assertEqual(manifest.update(names, force=True), ["tetrahedron.obj"])
+
+    def test_named_updates_do_not_walk_the_directory(self) -> None:
+        """Test named updates look only at the named files, hidden ones excluded."""
+        manifest = AssetManifest(self.assets)
+        with patch.object(AssetManifest, "find_sources") as find_sources:
+            self.assertEqual(manifest.update(["tetrahedron.obj", ".hidden/tree.obj"]),
+                             ["tetrahedron.obj"])
+            self.assertEqual(manifest.update(["tetrahedron.obj"]), [])
+            find_sources.assert_not_called()
+
+    def test_survey_matches_the_indexed_entry(self) -> None:
+        """Test surveying chunks counts and bounds an asset without storing it."""
+        manifest = AssetManifest(self.assets)
+        survey = manifest.survey(FileImport().iter_chunks(self.pot, 7))
+        self.assertEqual(manifest.entries, {})
+        manifest.update()
+        plan = manifest.combined([self.pot])
+        assert plan is not None
+        self.assertEqual(survey["faces"], plan["faces"])
+        for expected, actual in zip(plan["bounds"], survey["bounds"]):
+            for low, high in zip(expected, actual):
+                self.assertAlmostEqual(low, high)
+        self.assertEqual(AssetManifest.survey([]),
+                         {"faces": 0, "bounds": None, "camera": None})
+
+    def test_outdated_manifest_version_is_ignored(self) -> None:
+        """Test a manifest with another version is treated as empty."""
+        manifest = AssetManifest(self.assets)
+        manifest.update()
+        manifest.MANIFEST_VERSION = 0
+        manifest.save()
+        self.assertEqual(AssetManifest(self.assets).entries, {})
+
+    def test_bounds_and_camera_frame_the_asset(self) -> None:
+        """Test the suggested camera looks at the box center from outside it."""
+        manifest = AssetManifest(self.assets)
+        manifest.update()
+        entry = manifest.get(self.tetrahedron)
+        assert entry is not None
+        low, high = entry["bounds"]
+        camera = entry["camera"]
+        center = [(a + b) / 2 for a, b in zip(low, high)]
+        for expected, actual in zip(center, camera["look_at"]):
+            self.assertAlmostEqual(expected, actual, places=5)
+        self.assertGreater(math.dist(camera["origin"], center),
+                           math.dist(low, high) / 2)
+
+    def test_suggest_camera_without_bounds(self) -> None:
+        """Test empty assets get no camera and a point gets a unit offset."""
+        self.assertIsNone(AssetManifest.suggest_camera(None))
+        camera = AssetManifest.suggest_camera([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
+        assert camera is not None
+        self.assertAlmostEqual(math.dist(camera["origin"], [1.0, 2.0, 3.0]), 1.0,
+                               places=5)
+
+    def test_combined_merges_entries(self) -> None:
+        """Test several assets combine counts and bounds, or give None if unindexed."""
+        manifest = AssetManifest(self.assets)
+        self.assertIsNone(manifest.combined([self.pot]))
+        manifest.update()
+        plan = manifest.combined([self.pot, self.tetrahedron])
+        assert plan is not None
+        pot, tetrahedron = manifest.get(self.pot), manifest.get(self.tetrahedron)
+        assert pot is not None and tetrahedron is not None
+        self.assertEqual(plan["faces"], pot["faces"] + tetrahedron["faces"])
+        self.assertEqual(plan["bounds"], AssetManifest.union([pot["bounds"],
+                                                              tetrahedron["bounds"]]))
+        self.assertIsNone(manifest.combined([os.path.join(ASSETS, "pot.obj")]))
+
+    def test_part_sides_follow_closed_meshes(self) -> None:
+        """Test the manifest records which meshes can be back-face culled."""
+        manifest = AssetManifest(self.assets)
+        self.assertIsNone(manifest.part_sides(self.tetrahedron))
+        manifest.update()
+        self.assertEqual(manifest.part_sides(self.tetrahedron), [False])
+        self.assertEqual(manifest.part_sides(self.pot), [True, True])
+
+    def test_part_bounds_seed_lazy_meshes(self) -> None:
+        """Test per-mesh bounds from the manifest match each lazily read mesh."""
+        manifest = AssetManifest(self.assets)
+        self.assertIsNone(manifest.part_bounds(self.pot))
+        manifest.update()
+        bounds = manifest.part_bounds(self.pot)
+        assert bounds is not None
+        lazy = FileImport().read_lazy(self.pot, bounds)
+        self.assertEqual([[low.tolist(), high.tolist()] for low, high
+                          in (mesh.bounds for mesh in lazy)], bounds)
+        self.assertFalse(any(mesh.is_loaded for mesh in lazy))
+        for mesh, box in zip(lazy, bounds):
+            mesh.load()
+            corners = mesh.bounding_box(mesh.positions)
+            self.assertEqual([corner.tolist() for corner in corners], box)
+        with self.assertRaises(ValueError):
+            FileImport().read_lazy(self.pot, bounds[1:])
+
+    def test_listing_reads_no_meshes(self) -> None:
+        """Test the listing uses stored entries and skips hidden folders."""
+        manifest = AssetManifest(self.assets)
+        manifest.update()
+        with open(self.tetrahedron, "a", encoding="utf-8") as file:
+            file.write("\n")
+        with patch.object(FileImport, "read_file") as read_file:
+            rows = AssetManifest(self.assets).listing()
+            read_file.assert_not_called()
+        self.assertEqual(rows[1], ("tetrahedron.obj", "not indexed"))
+        self.assertRegex(rows[0][1], r"^\d+ faces, \d+ meshes$")
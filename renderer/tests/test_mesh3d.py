@@ -10,8 +10,15 @@ __maintainer__ = "Michael Nuttall"
 
 import unittest
 from unittest.mock import patch
+import numpy as np
 from hypothesis import given, strategies as st
-from geometry import Mesh3D, Face3D, Vertex, Shader
+from geometry import Mesh3D, Face3D, Vertex, Vector, Shader
+
+# Counter-clockwise seen from outside, so the enclosed volume is positive.
+TETRAHEDRON = np.array([[[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+                        [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+                        [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+                        [[1, 0, 0], [0, 1, 0], [0, 0, 1]]], dtype=np.float64)
 
 
 class TestMesh3D(unittest.TestCase):
@@ -124,6 +131,204 @@ class TestMesh3D(unittest.TestCase):
             self.assertTrue(95 <= face.color.g <= 105)
             self.assertTrue(95 <= face.color.b <= 105)
 
+    def test_from_buffer_materializes_faces_lazily(self) -> None:
+        """Test a buffer-backed mesh builds Face3D objects on first access."""
+        positions = np.arange(18, dtype=np.float64).reshape(2, 3, 3)
+        mesh = Mesh3D.from_buffer(positions, Shader(1, 2, 3))
+        self.assertIs(mesh.positions, positions)
+        self.assertEqual(mesh.num_faces, 2)
+        self.assertEqual(mesh.faces[1].points[0], Vertex(9, 10, 11))
+        self.assertEqual(mesh.faces[0].color, Shader(1, 2, 3))
+
+    def test_is_array_backed_until_faces_are_built(self) -> None:
+        """Test only an unbuilt buffer counts as array-backed."""
+        mesh = Mesh3D.from_buffer(np.zeros((1, 3, 3)))
+        self.assertTrue(mesh.is_array_backed)
+        _ = mesh.faces
+        self.assertFalse(mesh.is_array_backed)
+        self.assertFalse(self.mesh.is_array_backed)
+
+    def test_from_buffer_rejects_bad_shape(self) -> None:
+        """Test from_buffer raises ValueError for non (F, 3, 3) arrays."""
+        with self.assertRaises(ValueError):
+            Mesh3D.from_buffer(np.zeros((2, 9)))
+
+    def test_add_detaches_buffer(self) -> None:
+        """Test editing a buffer-backed mesh drops the stale buffer."""
+        mesh = Mesh3D.from_buffer(np.zeros((1, 3, 3)))
+        mesh.add(self.mesh.faces[0])
+        self.assertIsNone(mesh.positions)
+        self.assertEqual(mesh.num_faces, 2)
+
+    def test_set_precision_float32_halves_storage(self) -> None:
+        """Test float32 storage keeps the positions within float32 rounding."""
+        positions = np.random.default_rng(1).uniform(-5, 5, (4, 3, 3))
+        mesh = Mesh3D.from_buffer(positions, Shader(1, 2, 3))
+        mesh.set_precision("float32")
+        self.assertEqual(mesh.precision, "float32")
+        self.assertIsNone(mesh.quantization)
+        assert mesh.stored_positions is not None
+        self.assertEqual(mesh.stored_positions.nbytes, positions.nbytes // 2)
+        np.testing.assert_allclose(mesh.positions, positions, rtol=1e-6)
+
+    def test_set_precision_quantized16_decodes_within_half_step(self) -> None:
+        """Test quantized positions decode to within half a step per axis."""
+        positions = np.random.default_rng(2).uniform(-5, 5, (6, 3, 3))
+        positions[..., 2] = 7.0  # a flat axis must not divide by zero
+        mesh = Mesh3D.from_buffer(positions)
+        mesh.set_precision("quantized16")
+        self.assertEqual(mesh.precision, "quantized16")
+        assert mesh.stored_positions is not None and mesh.quantization is not None
+        self.assertEqual(mesh.stored_positions.dtype, np.uint16)
+        scale, origin = mesh.quantization
+        np.testing.assert_allclose(origin, positions.reshape(-1, 3).min(axis=0))
+        self.assertTrue(np.all(np.abs(mesh.positions - positions) <= scale / 2 + 1e-12))
+        self.assertEqual(mesh.faces[0].points[0].z, 7.0)
+
+        mesh.set_precision("float64")
+        self.assertIsNone(mesh.quantization)
+        self.assertEqual(mesh.precision, "float64")
+
+    def test_set_precision_rejects_unknown_names(self) -> None:
+        """Test an unknown precision raises ValueError."""
+        with self.assertRaises(ValueError):
+            Mesh3D.from_buffer(np.zeros((1, 3, 3))).set_precision("float16")
+
+    def test_closed_meshes_are_one_sided(self) -> None:
+        """Test only closed, consistently wound meshes default to one-sided."""
+        closed = Mesh3D.from_buffer(TETRAHEDRON.copy())
+        self.assertTrue(closed.is_closed)
+        self.assertFalse(closed.two_sided)
+        self.assertFalse(self.mesh.is_closed)
+        self.assertTrue(self.mesh.two_sided)
+        flipped_one = TETRAHEDRON.copy()
+        flipped_one[0] = flipped_one[0, ::-1]
+        self.assertFalse(Mesh3D.from_buffer(flipped_one).is_closed)
+        self.assertFalse(Mesh3D.from_buffer(TETRAHEDRON[:3].copy()).is_closed)
+
+    def test_two_sided_can_be_set(self) -> None:
+        """Test explicit settings override the closedness check."""
+        closed = Mesh3D.from_buffer(TETRAHEDRON.copy())
+        closed.two_sided = True
+        self.assertTrue(closed.two_sided)
+        self.mesh.two_sided = False
+        self.assertFalse(self.mesh.two_sided)
+        self.mesh.two_sided = None
+        self.assertTrue(self.mesh.two_sided)
+
+    def test_planes_point_outward_for_either_winding(self) -> None:
+        """Test closed meshes get outward normals whichever way they are wound."""
+        for positions in (TETRAHEDRON, TETRAHEDRON[:, ::-1]):
+            mesh = Mesh3D.from_buffer(positions.copy())
+            planes = mesh.planes
+            centroids = positions.mean(axis=1)
+            outward = np.einsum("ij,ij->i", planes[:, :3],
+                                centroids - [0.25, 0.25, 0.25])
+            self.assertTrue((outward > 0).all())
+            np.testing.assert_allclose(np.linalg.norm(planes[:, :3], axis=1), 1.0)
+            np.testing.assert_allclose(np.einsum("ij,ij->i", planes[:, :3], centroids),
+                                       planes[:, 3], atol=1e-12)
+        self.assertAlmostEqual(Mesh3D.signed_volume(TETRAHEDRON), 1 / 6)
+
+    def test_planes_are_cached_until_geometry_changes(self) -> None:
+        """Test planes are reused, then rebuilt after add, faces and set_precision."""
+        mesh = Mesh3D.from_buffer(TETRAHEDRON.copy())
+        planes = mesh.planes
+        self.assertIs(mesh.planes, planes)
+        mesh.set_precision("float32")
+        self.assertIsNot(mesh.planes, planes)
+        planes = mesh.planes
+        mesh.add(Face3D([Vertex(5, 0, 0), Vertex(6, 0, 0), Vertex(5, 1, 0)]))
+        self.assertEqual(len(mesh.planes), 5)
+        self.assertFalse(mesh.is_closed)
+        mesh.faces = mesh.faces[:1]
+        self.assertEqual(len(mesh.planes), 1)
+        np.testing.assert_allclose(self.mesh.planes, [[0, 0, 1, 0]])
+
+    def test_corners_decode_every_kind_of_mesh(self) -> None:
+        """Test corners gives float positions for face, buffer and quantized meshes."""
+        np.testing.assert_array_equal(self.mesh.corners,
+                                      [[[0, 0, 0], [1, 0, 0], [0, 1, 0]]])
+        mesh = Mesh3D.from_buffer(TETRAHEDRON.copy())
+        mesh.set_precision("quantized16")
+        np.testing.assert_allclose(mesh.corners, TETRAHEDRON, atol=1e-4)
+        self.assertEqual(Mesh3D([]).corners.shape, (0, 3, 3))
+
+    def test_bounds_and_sphere_enclose_the_mesh(self) -> None:
+        """Test the bounding box and sphere of face and buffer meshes."""
+        for precision in ("float64", "float32", "quantized16"):
+            mesh = Mesh3D.from_buffer(TETRAHEDRON * 2 - 1)
+            mesh.set_precision(precision)
+            lower, upper = mesh.bounds
+            np.testing.assert_allclose(lower, [-1, -1, -1], atol=1e-4)
+            np.testing.assert_allclose(upper, [1, 1, 1], atol=1e-4)
+            center, radius = mesh.bounding_sphere
+            np.testing.assert_allclose(center, [0, 0, 0], atol=1e-4)
+            self.assertAlmostEqual(radius, 3 ** 0.5, places=4)
+        lower, upper = self.mesh.bounds
+        self.assertEqual((lower.tolist(), upper.tolist()), ([0, 0, 0], [1, 1, 0]))
+        self.assertAlmostEqual(self.mesh.bounding_sphere[1], 0.5 ** 0.5)
+        empty = Mesh3D([])
+        self.assertEqual((empty.bounds[0].tolist(), empty.bounding_sphere[1]),
+                         ([0, 0, 0], 0.0))
+
+    def test_bounds_are_cached_until_geometry_changes(self) -> None:
+        """Test bounds are computed once and dropped by add and the faces setter."""
+        bounds, sphere = self.mesh.bounds, self.mesh.bounding_sphere
+        self.assertIs(self.mesh.bounds, bounds)
+        self.assertIs(self.mesh.bounding_sphere, sphere)
+        self.mesh.add(Face3D([Vertex(0, 0, 0), Vertex(4, 0, 0), Vertex(0, 0, 3)]))
+        self.assertEqual(self.mesh.bounds[1].tolist(), [4, 1, 3])
+        self.assertAlmostEqual(self.mesh.bounding_sphere[1],
+                               float(np.linalg.norm([2, 0.5, 1.5])))
+        self.mesh.faces = self.mesh.faces[:1]
+        self.assertEqual(self.mesh.bounds[1].tolist(), [1, 1, 0])
+
+    def test_translate_moves_geometry_and_caches(self) -> None:
+        """Test translate moves stored and built faces and shifts the caches."""
+        offset = Vector(1.5, -2.0, 3.0)
+        for precision in ("float64", "float32", "quantized16"):
+            mesh = Mesh3D.from_buffer(TETRAHEDRON.copy())
+            mesh.set_precision(precision)
+            _ = mesh.planes, mesh.bounding_sphere
+            mesh.translate(offset)
+            self.assertEqual(mesh.precision, precision)
+            moved = Mesh3D.from_buffer(TETRAHEDRON + [1.5, -2.0, 3.0])
+            assert mesh.positions is not None
+            np.testing.assert_allclose(mesh.positions, moved.stored_positions,
+                                       atol=1e-4)
+            np.testing.assert_allclose(mesh.planes, moved.planes, atol=1e-4)
+            np.testing.assert_allclose(mesh.bounds, moved.bounds, atol=1e-4)
+            np.testing.assert_allclose(mesh.bounding_sphere[0],
+                                       moved.bounding_sphere[0], atol=1e-4)
+        faces = [Face3D([Vertex(*corner) for corner in face])
+                 for face in TETRAHEDRON.tolist()]
+        mesh = Mesh3D(list(faces))
+        first = faces[0].points[0]
+        mesh.translate(offset)
+        self.assertEqual(mesh.faces[0].points[0], Vertex(1.5, -2.0, 3.0))
+        self.assertEqual(first, Vertex(0, 0, 0))
+        self.assertEqual(mesh.bounds[0].tolist(), [1.5, -2.0, 3.0])
+
+    @given(st.lists(st.tuples(*[st.floats(-100, 100, allow_nan=False)] * 9), min_size=1,
+                    max_size=10))
+    def test_bounding_sphere_contains_every_vertex(self, rows) -> None:
+        """Test no vertex lies outside the bounding sphere or box."""
+        positions = np.array(rows).reshape(-1, 3, 3)
+        mesh = Mesh3D.from_buffer(positions)
+        center, radius = mesh.bounding_sphere
+        lower, upper = mesh.bounds
+        corners = positions.reshape(-1, 3)
+        distances = np.linalg.norm(corners - center, axis=1)
+        self.assertTrue(np.all(distances <= radius + 1e-9))
+        self.assertTrue(np.all((corners >= lower) & (corners <= upper)))
+
+    def test_set_precision_ignores_face_meshes(self) -> None:
+        """Test meshes without a buffer keep their faces unchanged."""
+        self.mesh.set_precision("quantized16")
+        self.assertIsNone(self.mesh.stored_positions)
+        self.assertEqual(self.mesh.precision, "float64")
+
     @given(
         st.lists(
             st.tuples(
@@ -0,0 +1,155 @@
+"""
+Unit tests for the MeshBuffer class using unittest and Hypothesis.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import unittest
+import numpy as np
+from hypothesis import given, strategies as st
+from geometry import Mesh3D, MeshBuffer, Face3D, Vertex, Vector, Shader
+
+
+class TestMeshBuffer(unittest.TestCase):
+    """Unit tests for the MeshBuffer class."""
+
+    def setUp(self) -> None:
+        """Set up a two-face buffer with distinct colors."""
+        self.positions = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+                                   [[0, 0, 1], [0, 1, 1], [1, 0, 1]]], dtype=np.float64)
+        self.colors = np.array([[10, 20, 30], [40, 50, 60]], dtype=np.uint8)
+        self.buffer = MeshBuffer(self.positions, self.colors)
+
+    def test_faces_are_built_on_demand(self) -> None:
+        """Test faces are materialized from the arrays with per-face colors."""
+        self.assertIsNone(self.buffer._faces)  # pylint: disable=protected-access
+        faces = self.buffer.faces
+        self.assertEqual(faces[1],
+                         Face3D([Vertex(0, 0, 1), Vertex(0, 1, 1), Vertex(1, 0, 1)],
+                                Shader(40, 50, 60)))
+        self.assertEqual(faces[0].color, Shader(10, 20, 30))
+        self.assertIs(self.buffer.faces, faces)
+        self.assertEqual(self.buffer.num_faces, 2)
+        self.assertFalse(self.buffer.is_array_backed)
+
+    def test_face_edits_are_written_back(self) -> None:
+        """Test edits to built faces reach the arrays, as with a Mesh3D."""
+        self.buffer.set_precision("float32")
+        self.buffer.compute_normals()
+        faces = self.buffer.faces
+        faces[0].color = Shader(1, 2, 3)
+        faces[1].points = [Vertex(0, 0, 2), Vertex(1, 0, 2), Vertex(0, 1, 2)]
+        self.assertEqual(self.buffer.colors.tolist(), [[1, 2, 3], [40, 50, 60]])
+        assert self.buffer.positions is not None
+        np.testing.assert_array_equal(self.buffer.positions[1],
+                                      [[0, 0, 2], [1, 0, 2], [0, 1, 2]])
+        self.assertEqual(self.buffer.precision, "float32")
+        np.testing.assert_allclose(self.buffer.normals, [[0, 0, 1], [0, 0, 1]])
+        self.buffer.set_color(Shader(7, 7, 7))
+        self.assertEqual(faces[1].color, Shader(7, 7, 7))
+        self.buffer.add(Face3D([Vertex(5, 5, 5), Vertex(6, 5, 5), Vertex(5, 6, 5)]))
+        self.assertIs(self.buffer.faces, faces)
+        self.assertEqual(self.buffer.num_faces, 3)
+        self.assertEqual(len(self.buffer.colors), 3)
+
+    def test_default_colors_come_from_shader(self) -> None:
+        """Test missing colors are filled with the base shader."""
+        buffer = MeshBuffer(self.positions, shader=Shader(7, 8, 9))
+        self.assertEqual(buffer.colors.tolist(), [[7, 8, 9], [7, 8, 9]])
+        self.assertEqual(buffer.colors.dtype, np.uint8)
+        self.assertEqual(MeshBuffer(self.positions).colors.tolist(),
+                         [[0, 0, 0], [0, 0, 0]])
+
+    def test_rejects_bad_arrays(self) -> None:
+        """Test mismatched shapes and out-of-range colors raise ValueError."""
+        with self.assertRaises(ValueError):
+            MeshBuffer(np.zeros((2, 9)))
+        with self.assertRaises(ValueError):
+            MeshBuffer(self.positions, np.zeros((3, 3)))
+        with self.assertRaises(ValueError):
+            MeshBuffer(self.positions, np.array([[0, 0, 256], [0, 0, 0]]))
+        with self.assertRaises(ValueError):
+            MeshBuffer(self.positions, normals=np.zeros((2, 2)))
+
+    def test_set_color_updates_array(self) -> None:
+        """Test set_color fills the color array and refreshes faces."""
+        _ = self.buffer.faces
+        self.buffer.set_color(Shader(1, 2, 3))
+        self.assertEqual(self.buffer.colors.tolist(), [[1, 2, 3], [1, 2, 3]])
+        self.assertEqual(self.buffer.faces[1].color, Shader(1, 2, 3))
+        self.assertEqual(self.buffer.base_shader, Shader(1, 2, 3))
+
+    def test_set_color_variance_without_base_uses_first_face(self) -> None:
+        """Test variance falls back to the first face's color."""
+        self.buffer.set_color_variance(variance=0)
+        self.assertEqual(self.buffer.colors.tolist(), [[10, 20, 30], [10, 20, 30]])
+        with self.assertRaises(ValueError):
+            MeshBuffer(np.zeros((0, 3, 3))).set_color_variance()
+
+    @given(st.integers(0, 255), st.integers(0, 255), st.integers(0, 255),
+           st.integers(-300, 300))
+    def test_set_color_variance_stays_in_range(self, r, g, b, variance) -> None:
+        """Test every channel stays within variance of the base and in 0-255."""
+        buffer = MeshBuffer(np.zeros((40, 3, 3)))
+        buffer.set_color_variance(Shader(r, g, b), variance)
+        self.assertEqual(buffer.variance, abs(variance))
+        spread = np.abs(buffer.colors.astype(int) - (r, g, b))
+        self.assertTrue(np.all(spread <= abs(variance)))
+
+    def test_add_appends_face_and_normal(self) -> None:
+        """Test add grows every array, including computed normals."""
+        normals = self.buffer.compute_normals()
+        np.testing.assert_allclose(normals, [[0, 0, 1], [0, 0, -1]])
+        self.buffer.add(Face3D([Vertex(0, 0, 0), Vertex(0, 1, 0), Vertex(0, 0, 1)],
+                               Shader(9, 9, 9)))
+        self.assertEqual(self.buffer.num_faces, 3)
+        self.assertEqual(self.buffer.colors[2].tolist(), [9, 9, 9])
+        assert self.buffer.normals is not None
+        np.testing.assert_allclose(self.buffer.normals[2], [1, 0, 0])
+        self.assertEqual(self.buffer.faces[2].points[1], Vertex(0, 1, 0))
+
+    def test_add_keeps_precision(self) -> None:
+        """Test appending to a quantized buffer re-quantizes it."""
+        self.buffer.set_precision("quantized16")
+        self.buffer.add(Face3D([Vertex(2, 2, 2), Vertex(3, 2, 2), Vertex(2, 3, 2)]))
+        self.assertEqual(self.buffer.precision, "quantized16")
+        assert self.buffer.positions is not None
+        np.testing.assert_allclose(self.buffer.positions[2, 1], [3, 2, 2], atol=1e-4)
+
+    def test_faces_setter_repacks_arrays(self) -> None:
+        """Test assigning faces replaces the arrays and drops normals."""
+        self.buffer.compute_normals()
+        self.buffer.faces = [Face3D([Vertex(5, 5, 5), Vertex(6, 5, 5), Vertex(5, 6, 5)],
+                                    Shader(3, 3, 3))]
+        self.assertEqual(self.buffer.num_faces, 1)
+        self.assertIsNone(self.buffer.normals)
+        self.assertEqual(self.buffer.colors.tolist(), [[3, 3, 3]])
+
+    def test_translate_keeps_colors_and_normals(self) -> None:
+        """Test translate moves the positions but not the per-face arrays."""
+        normals = self.buffer.compute_normals().copy()
+        colors = self.buffer.colors.copy()
+        before = np.array(self.buffer.positions)
+        self.buffer.translate(Vector(1, 2, 3))
+        assert self.buffer.positions is not None
+        np.testing.assert_allclose(self.buffer.positions, before + [1, 2, 3])
+        np.testing.assert_array_equal(self.buffer.normals, normals)
+        np.testing.assert_array_equal(self.buffer.colors, colors)
+
+    def test_from_mesh_converts_face_and_buffer_meshes(self) -> None:
+        """Test any mesh converts to a buffer with the same faces."""
+        faces = Mesh3D([Face3D([Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)],
+                               Shader(4, 5, 6))])
+        converted = MeshBuffer.from_mesh(faces)
+        self.assertEqual(converted.faces, faces.faces)
+        backed = Mesh3D.from_buffer(self.positions, Shader(1, 1, 1))
+        self.assertIs(MeshBuffer.from_mesh(backed).positions, self.positions)
+        self.assertIs(MeshBuffer.from_mesh(self.buffer), self.buffer)
+
+    def test_repr_mentions_precision(self) -> None:
+        """Test the debug representation includes the storage precision."""
+        self.assertIn("precision=float64", repr(self.buffer))
@@ -0,0 +1,248 @@
+"""
+Unit tests for the MeshCache class.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from utility import FileImport, MeshCache
+from geometry import IndexedMesh3D, Mesh3D, Face3D, Vertex, Shader
+from scene import BVH
+
+SAMPLE_DATA = """2
+10 20 30
+1
+v 0 0 0
+v 1 0 0
+v 0 1 0
+255 255 255
+2
+v 0 0 1
+v 1 0 1
+v 0 1 1
+v 0.5 -2.25 1e3
+v 1 0 1
+v 0 1 1
+"""
+
+
+class TestMeshCache(unittest.TestCase):
+    """Unit tests for compiling, loading and evicting cached meshes."""
+
+    def setUp(self) -> None:
+        """Create a temporary asset file and cache directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self._tmp.name, "scene.obj")
+        with open(self.source, "w", encoding="utf-8") as file:
+            file.write(SAMPLE_DATA)
+        self.cache_dir = os.path.join(self._tmp.name, "cache")
+        self.cache = MeshCache(self.cache_dir)
+        FileImport._instance = None  # pylint: disable=protected-access
+        self.importer = FileImport()
+
+    def tearDown(self) -> None:
+        """Remove temporary files."""
+        self._tmp.cleanup()
+
+    def test_load_misses_before_store(self) -> None:
+        """Test load returns None when nothing has been compiled."""
+        self.assertIsNone(self.cache.load(self.source))
+
+    def test_round_trip_preserves_meshes(self) -> None:
+        """Test compiled meshes match the parsed originals."""
+        meshes = self.importer.read_file(self.source)
+        self.cache.store(self.source, meshes)
+        loaded = self.cache.load(self.source)
+        self.assertIsNotNone(loaded)
+        assert loaded is not None
+        self.assertEqual(len(loaded), 2)
+        for original, cached in zip(meshes, loaded):
+            self.assertEqual(original.faces, cached.faces)
+            self.assertEqual(original.base_shader, cached.base_shader)
+
+    def test_key_changes_with_content(self) -> None:
+        """Test editing the source file produces a different cache key."""
+        before = self.cache.path_for(self.source)
+        with open(self.source, "a", encoding="utf-8") as file:
+            file.write("# edited\n")
+        os.utime(self.source, ns=(1, 1))
+        self.assertNotEqual(before, self.cache.path_for(self.source))
+
+    def test_default_directory_is_next_to_source(self) -> None:
+        """Test a cache without a directory writes beside the asset."""
+        cache = MeshCache()
+        self.assertEqual(cache.directory_for(self.source),
+                         os.path.join(self._tmp.name, ".meshcache"))
+
+    def test_invalid_size_limit_raises(self) -> None:
+        """Test a non-positive size limit is rejected."""
+        with self.assertRaises(ValueError):
+            MeshCache(self.cache_dir, max_bytes=0)
+
+    def test_evict_removes_least_recently_used(self) -> None:
+        """Test eviction keeps the cache directory under its size limit."""
+        mesh = Mesh3D([Face3D([Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)])])
+        mesh.set_color(Shader(1, 2, 3))
+        os.makedirs(self.cache_dir)
+        old = os.path.join(self.cache_dir, "old.rmc")
+        new = os.path.join(self.cache_dir, "new.rmc")
+        MeshCache.write_compiled(old, [mesh])
+        MeshCache.write_compiled(new, [mesh])
+        os.utime(old, ns=(1, 1))
+        cache = MeshCache(self.cache_dir, max_bytes=os.path.getsize(new))
+        cache.evict(self.cache_dir)
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+
+    def test_evict_counts_saved_scene_trees(self) -> None:
+        """Test saved BVH files share the cache's size limit once named as sidecars."""
+        mesh = Mesh3D([Face3D([Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)])])
+        compiled = os.path.join(self.cache_dir, "mesh.rmc")
+        tree = os.path.join(self.cache_dir, "scene" + BVH.EXTENSION)
+        bvh = BVH([mesh])
+        bvh.build()
+        bvh.save(tree)
+        MeshCache.write_compiled(compiled, [mesh])
+        os.utime(tree, ns=(1, 1))
+        size = os.path.getsize(compiled)
+        MeshCache(self.cache_dir, max_bytes=size).evict(self.cache_dir)
+        self.assertTrue(os.path.exists(tree))
+        cache = MeshCache(self.cache_dir, max_bytes=size, sidecars=[BVH.EXTENSION])
+        self.assertEqual(cache.sidecars, (BVH.EXTENSION,))
+        cache.evict(self.cache_dir)
+        self.assertFalse(os.path.exists(tree))
+        self.assertTrue(os.path.exists(compiled))
+
+    def test_store_never_evicts_the_new_file(self) -> None:
+        """Test a compiled file larger than the whole cache limit is still mapped."""
+        mesh = Mesh3D([Face3D([Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)])])
+        os.makedirs(self.cache_dir)
+        old = os.path.join(self.cache_dir, "old.rmc")
+        MeshCache.write_compiled(old, [mesh])
+        self.importer.cache = MeshCache(self.cache_dir, max_bytes=64)
+        meshes = self.importer.map_file(self.source)
+        self.assertEqual([m.num_faces for m in meshes], [1, 2])
+        self.assertFalse(os.path.exists(old))
+        self.assertEqual(os.listdir(self.cache_dir),
+                         [os.path.basename(self.cache.path_for(self.source))])
+
+    def test_rejects_foreign_files(self) -> None:
+        """Test reading a file that is not a compiled mesh raises ValueError."""
+        with self.assertRaises(ValueError):
+            list(MeshCache.iter_compiled(self.source))
+
+    def test_rejects_truncated_files(self) -> None:
+        """Test reading a truncated compiled file raises ValueError."""
+        compiled = os.path.join(self._tmp.name, "cut.rmc")
+        MeshCache.write_compiled(compiled, self.importer.read_file(self.source))
+        with open(compiled, "r+b") as file:
+            file.truncate(os.path.getsize(compiled) - 8)
+        with self.assertRaises(ValueError):
+            list(MeshCache.iter_compiled(compiled))
+
+    def test_file_import_uses_cache_transparently(self) -> None:
+        """Test read_file compiles on a miss and reuses it on a hit."""
+        self.importer.cache = self.cache
+        first = self.importer.read_file(self.source)
+        compiled = self.cache.lookup(self.source)
+        self.assertIsNotNone(compiled)
+
+        self.importer.read_data = None  # type: ignore[method-assign]
+        second = self.importer.read_file(self.source)
+        streamed = list(self.importer.read_file(self.source, stream=True))
+        self.assertEqual([m.faces for m in first], [m.faces for m in second])
+        self.assertEqual(len(streamed), 2)
+
+    def test_map_compiled_returns_read_only_views(self) -> None:
+        """Test mapped meshes expose zero-copy views into the file."""
+        compiled = self.cache.store(self.source, self.importer.read_file(self.source))
+        meshes = MeshCache.map_compiled(compiled)
+        positions = meshes[1].positions
+        assert positions is not None
+        self.assertEqual(positions.shape, (2, 3, 3))
+        self.assertFalse(positions.flags.writeable)
+        self.assertFalse(positions.flags.owndata)
+        self.assertAlmostEqual(float(positions[1, 0, 2]), 1000.0)
+        self.assertEqual(meshes[0].base_shader, Shader(10, 20, 30))
+
+    def test_file_import_map_file_compiles_text_assets(self) -> None:
+        """Test map_file compiles a text asset once and then maps it."""
+        self.importer.cache = self.cache
+        meshes = self.importer.map_file(self.source)
+        self.assertEqual([m.num_faces for m in meshes], [1, 2])
+        compiled = self.cache.lookup(self.source)
+        assert compiled is not None
+        remapped = self.importer.map_file(compiled)
+        self.assertEqual(remapped[1].faces, meshes[1].faces)
+
+    def test_indexed_round_trip_keeps_welded_pool(self) -> None:
+        """Test indexed files restore the vertex pool, indices and colors."""
+        meshes = self.importer.read_file(self.source, weld=True)
+        path = os.path.join(self._tmp.name, "scene.rmc")
+        MeshCache.write_indexed(path, meshes)
+        self.assertTrue(MeshCache.is_indexed(path))
+        loaded = MeshCache.map_compiled(path)
+        self.assertTrue(all(isinstance(mesh, IndexedMesh3D) for mesh in loaded))
+        self.assertEqual([m.indices for m in loaded], [m.indices for m in meshes])
+        self.assertEqual([m.vertices for m in loaded], [m.vertices for m in meshes])
+        self.assertEqual(loaded[0].base_shader, Shader(10, 20, 30))
+        self.assertEqual(len(list(MeshCache.iter_compiled(path))), 2)
+        with open(path, "rb") as file:
+            with self.assertRaises(ValueError):
+                MeshCache.read_table(file)
+
+    def test_indexed_file_stores_unit_normals(self) -> None:
+        """Test each face's normal is stored after its indices."""
+        meshes = self.importer.read_file(self.source, weld=True)
+        path = os.path.join(self._tmp.name, "scene.rmc")
+        MeshCache.write_indexed(path, meshes[:1])
+        with open(path, "rb") as file:
+            data = file.read()
+        normals = np.frombuffer(data[-24:], dtype="<f8")
+        np.testing.assert_allclose(normals, [0.0, 0.0, 1.0])
+
+    def test_mapped_meshes_plane_from_stored_normals(self) -> None:
+        """Test mapped meshes carry the stored normals into their face planes."""
+        meshes = self.importer.read_file(self.source, weld=True)
+        path = os.path.join(self._tmp.name, "scene.rmc")
+        MeshCache.write_indexed(path, meshes)
+        loaded = MeshCache.map_indexed(path)
+        expected = [mesh.planes for mesh in meshes]
+        with patch.object(Mesh3D, "face_normals") as face_normals:
+            planes = [mesh.planes for mesh in loaded]
+        face_normals.assert_not_called()
+        for mesh, plane, want in zip(loaded, planes, expected):
+            assert isinstance(mesh, IndexedMesh3D)
+            self.assertIsNotNone(mesh.normals)
+            np.testing.assert_allclose(plane, want)
+
+    def test_face_normals_are_zero_for_degenerate_faces(self) -> None:
+        """Test collinear corners give a zero normal instead of NaN."""
+        vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+        normals = MeshCache.face_normals(vertices, np.array([[0, 1, 2]]))
+        np.testing.assert_array_equal(normals, [[0.0, 0.0, 0.0]])
+
+    def test_truncated_indexed_file_raises(self) -> None:
+        """Test an indexed file cut short is rejected."""
+        path = os.path.join(self._tmp.name, "scene.rmc")
+        MeshCache.write_indexed(path, self.importer.read_file(self.source, weld=True))
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 8)
+        with self.assertRaises(ValueError):
+            MeshCache.map_compiled(path)
+
+    def test_file_import_reads_compiled_files(self) -> None:
+        """Test read_file loads a .rmc file without parsing text."""
+        path = os.path.join(self._tmp.name, "scene.rmc")
+        MeshCache.write_indexed(path, self.importer.read_file(self.source, weld=True))
+        meshes = self.importer.read_file(path)
+        self.assertEqual([m.num_faces for m in meshes], [1, 2])
+        self.assertEqual(len(list(self.importer.read_file(path, stream=True))), 2)
@@ -0,0 +1,136 @@
+"""
+Unit tests for the Precompiler class.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import contextlib
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from utility import AssetManifest, FileImport, MeshCache, Precompiler
+from geometry import IndexedMesh3D
+
+ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      "assets")
+
+
+class TestPrecompiler(unittest.TestCase):
+    """Unit tests for baking asset directories into indexed binaries."""
+
+    def setUp(self) -> None:
+        """Copy a few assets into a temporary source tree."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self._tmp.name, "assets")
+        os.makedirs(os.path.join(self.source, "props"))
+        shutil.copy(os.path.join(ASSETS, "tetrahedron.obj"), self.source)
+        shutil.copy(os.path.join(ASSETS, "pot.obj"), os.path.join(self.source, "props"))
+        with open(os.path.join(ASSETS, "test_obj.obj"), "rb") as file:
+            with gzip.open(os.path.join(self.source, "small.obj.gz"), "wb") as packed:
+                packed.write(file.read())
+        notes = os.path.join(self.source, "notes.txt")
+        with open(notes, "w", encoding="utf-8") as file:
+            file.write("not an asset")
+        FileImport._instance = None  # pylint: disable=protected-access
+
+    def tearDown(self) -> None:
+        """Remove temporary files."""
+        self._tmp.cleanup()
+
+    def test_default_output_is_hidden_in_source(self) -> None:
+        """Test the output directory defaults to '.compiled' in the source."""
+        compiler = Precompiler(self.source)
+        self.assertEqual(compiler.output_dir, os.path.join(self.source, ".compiled"))
+        self.assertEqual(compiler.workers, 1)
+
+    def test_invalid_worker_count_raises(self) -> None:
+        """Test fewer than one worker is rejected."""
+        with self.assertRaises(ValueError):
+            Precompiler(self.source, workers=0)
+
+    def test_run_writes_loadable_files_and_manifest(self) -> None:
+        """Test compiled files load back as the welded source meshes."""
+        compiler = Precompiler(self.source)
+        compiled = compiler.run()
+        self.assertEqual(compiled, ["props/pot.obj", "small.obj.gz", "tetrahedron.obj"])
+        manifest = AssetManifest(self.source)
+        self.assertEqual(manifest.entries, compiler.manifest.entries)
+
+        entry = manifest.entries["props/pot.obj"]
+        target = os.path.join(compiler.output_dir, entry["compiled"])
+        self.assertEqual(target, compiler.target_for("props/pot.obj"))
+        self.assertTrue(MeshCache.is_indexed(target))
+        pot = os.path.join(self.source, "props", "pot.obj")
+        source = FileImport().read_file(pot, weld=True)
+        loaded = FileImport().read_file(target)
+        self.assertTrue(all(isinstance(mesh, IndexedMesh3D) for mesh in loaded))
+        self.assertEqual([m.faces for m in loaded], [m.faces for m in source])
+        self.assertEqual(entry["digest"], MeshCache().digest(pot))
+        self.assertEqual([part["faces"] for part in entry["parts"]],
+                         [m.num_faces for m in source])
+
+    def test_run_only_recompiles_changed_sources(self) -> None:
+        """Test a second run skips unchanged files and drops deleted ones."""
+        Precompiler(self.source).run()
+        tetrahedron = os.path.join(self.source, "tetrahedron.obj")
+        with open(tetrahedron, "a", encoding="utf-8") as file:
+            file.write("\n")
+        os.remove(os.path.join(self.source, "small.obj.gz"))
+
+        compiler = Precompiler(self.source)
+        self.assertEqual(compiler.run(), ["tetrahedron.obj"])
+        self.assertNotIn("small.obj.gz", compiler.manifest.entries)
+        self.assertFalse(os.path.exists(compiler.target_for("small.obj.gz")))
+        self.assertEqual(compiler.run(), [])
+        self.assertEqual(len(compiler.run(force=True)), 2)
+
+    def test_compiled_file_is_found_only_while_fresh(self) -> None:
+        """Test the manifest resolves a source to its compiled file until it changes."""
+        compiler = Precompiler(self.source)
+        tetrahedron = os.path.join(self.source, "tetrahedron.obj")
+        self.assertIsNone(compiler.manifest.compiled_file(tetrahedron))
+        compiler.run()
+        self.assertEqual(compiler.manifest.compiled_file(tetrahedron),
+                         compiler.target_for("tetrahedron.obj"))
+        with open(tetrahedron, "a", encoding="utf-8") as file:
+            file.write("\n")
+        self.assertIsNone(compiler.manifest.compiled_file(tetrahedron))
+
+    def test_missing_compiled_file_is_rebuilt(self) -> None:
+        """Test deleting a compiled file makes its asset stale."""
+        compiler = Precompiler(self.source)
+        compiler.run()
+        os.remove(compiler.target_for("tetrahedron.obj"))
+        self.assertFalse(compiler.manifest.is_fresh("tetrahedron.obj", compiled=True))
+        self.assertEqual(compiler.run(), ["tetrahedron.obj"])
+
+    def test_invalid_asset_is_reported(self) -> None:
+        """Test a malformed asset gets an error entry and a failing exit code."""
+        broken = os.path.join(self.source, "broken.obj")
+        with open(broken, "w", encoding="utf-8") as file:
+            file.write("1\n255 255 255\n1\nx 0 0 0\n")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = Precompiler.main([self.source, "-j", "1"])
+        self.assertEqual(status, 1)
+        self.assertIn("broken.obj:", output.getvalue())
+        manifest = AssetManifest(self.source)
+        self.assertIn("error", manifest.entries["broken.obj"])
+        self.assertIn("compiled", manifest.entries["tetrahedron.obj"])
+        self.assertIsNone(manifest.get(os.path.join(self.source, "broken.obj")))
+
+    def test_parallel_run_matches_serial(self) -> None:
+        """Test worker processes produce the same entries as one process."""
+        serial = Precompiler(self.source, os.path.join(self._tmp.name, "a"))
+        parallel = Precompiler(self.source, os.path.join(self._tmp.name, "b"),
+                               workers=2)
+        serial.run()
+        parallel.run()
+        self.assertEqual(serial.manifest.entries, parallel.manifest.entries)
@@ -8,10 +8,15 @@ __license__ = "MIT"
 __version__ = "0.1.0"
 __maintainer__ = "Michael Nuttall"
 
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock
-from geometry import Point, Mesh3D, Face3D, Vertex, Shader, Face2D
-from scene import Scene
+from typing import List
+from unittest.mock import Mock, patch
+import numpy as np
+from geometry import Point, Mesh3D, IndexedMesh3D, MeshBuffer, Face3D, Vertex, Vector, \
+    Shader, Face2D, LazyMesh3D
+from scene import AspectRatio, BVH, Scene, Camera, ExternalSort
 
 
 class TestScene(unittest.TestCase):
@@ -53,23 +58,23 @@ class TestScene(unittest.TestCase):
         """Test make_render adds projected faces for visible geometry."""
         points = [Point(0, 0), Point(1, 0), Point(0, 1)]
         mock_face2d = Face2D(points, 1.0, Shader(0, 0, 0))
-        self.mock_camera.is_face_in_front.return_value = True
-        self.mock_camera.project_face.return_value = mock_face2d
+        self.mock_camera.is_face_in_frustum.return_value = True
+        self.mock_camera.project_clipped.return_value = [mock_face2d]
 
         render_list = self.scene.make_render()
 
-        self.mock_camera.is_face_in_front.assert_called_once_with(self.face)
-        self.mock_camera.project_face.assert_called_once_with(self.face)
+        self.mock_camera.is_face_in_frustum.assert_called_once_with(self.face)
+        self.mock_camera.project_clipped.assert_called_once_with(self.face)
         self.assertEqual(render_list, [mock_face2d])
 
     def test_make_render_skips_invisible_faces(self) -> None:
         """Test make_render skips faces not in front of the camera."""
-        self.mock_camera.is_face_in_front.return_value = False
+        self.mock_camera.is_face_in_frustum.return_value = False
 
         render_list = self.scene.make_render()
 
-        self.mock_camera.is_face_in_front.assert_called_once_with(self.face)
-        self.mock_camera.project_face.assert_not_called()
+        self.mock_camera.is_face_in_frustum.assert_called_once_with(self.face)
+        self.mock_camera.project_clipped.assert_not_called()
         self.assertEqual(render_list, [])
 
     def test_make_render_mixed_visibility_faces(self) -> None:
@@ -85,42 +90,255 @@ class TestScene(unittest.TestCase):
         self.scene.meshes = [mesh1, mesh2]
 
         # Configure camera to see only first and third faces
-        self.mock_camera.is_face_in_front.side_effect = [True, False, True, False]
+        self.mock_camera.is_face_in_frustum.side_effect = [True, False, True, False]
 
         # Expected projected Face2D objects for visible faces
         points = [Point(0, 0), Point(1, 0), Point(0, 1)]
         f2d_1 = Face2D(points, 1.0, Shader(100, 100, 100))
         f2d_2 = Face2D(points, 2.0, Shader(150, 150, 150))
-        self.mock_camera.project_face.side_effect = [f2d_1, f2d_2]
+        self.mock_camera.project_clipped.side_effect = [[f2d_1], [f2d_2]]
 
         # Call and assert
         result = self.scene.make_render()
 
         self.assertEqual(result, [f2d_1, f2d_2])
-        self.assertEqual(self.mock_camera.project_face.call_count, 2)
-        self.assertEqual(self.mock_camera.is_face_in_front.call_count, 4)
+        self.assertEqual(self.mock_camera.project_clipped.call_count, 2)
+        self.assertEqual(self.mock_camera.is_face_in_frustum.call_count, 4)
+
+    def test_make_render_rejects_meshes_outside_the_frustum(self) -> None:
+        """Test a mesh the camera rejects as a whole is not tested face by face."""
+        self.mock_camera.is_mesh_in_frustum.return_value = False
+
+        self.assertEqual(self.scene.make_render(), [])
+        self.mock_camera.is_mesh_in_frustum.assert_called_once_with(self.mesh)
+        self.mock_camera.is_face_in_frustum.assert_not_called()
+
+    def test_make_render_leaves_off_screen_lazy_meshes_unloaded(self) -> None:
+        """Test a proxy with known bounds outside the view is culled unloaded."""
+        triangle = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]], dtype=np.float64)
+        ahead, behind = triangle + [0, 0, 5], triangle + [0, 0, -5]
+        meshes = [LazyMesh3D(lambda positions=positions: positions, 1, Shader(1, 2, 3),
+                             [positions.min(axis=(0, 1)), positions.max(axis=(0, 1))])
+                  for positions in (ahead, behind)]
+        camera = Camera(Vertex(0, 0, 0), Vertex(0, 0, 1), viewport=AspectRatio(4, 3))
+        faces = Scene(camera, meshes).make_render()
+        self.assertEqual(len(faces), 1)
+        self.assertTrue(meshes[0].is_loaded)
+        self.assertFalse(meshes[1].is_loaded)
 
     def test_make_render_on_empty_scene(self) -> None:
         """Test make_render returns empty list if no meshes exist."""
         self.scene.meshes = []
         result = self.scene.make_render()
         self.assertEqual(result, [])
-        self.mock_camera.is_face_in_front.assert_not_called()
-        self.mock_camera.project_face.assert_not_called()
+        self.mock_camera.is_face_in_frustum.assert_not_called()
+        self.mock_camera.project_clipped.assert_not_called()
 
     def test_make_render_uses_updated_camera(self) -> None:
         """Test that setting a new camera changes behavior of make_render."""
         # Create a second mock camera with different behavior
         alt_camera = Mock()
-        alt_camera.is_face_in_front.return_value = True
+        alt_camera.is_face_in_frustum.return_value = True
 
         points = [Point(0, 0), Point(1, 0), Point(0, 1)]
         alt_face2d = Face2D(points, 3.0, Shader(200, 200, 200))
-        alt_camera.project_face.return_value = alt_face2d
+        alt_camera.project_clipped.return_value = [alt_face2d]
 
         self.scene.active_cam = alt_camera
         result = self.scene.make_render()
 
-        alt_camera.is_face_in_front.assert_called_once_with(self.face)
-        alt_camera.project_face.assert_called_once_with(self.face)
+        alt_camera.is_face_in_frustum.assert_called_once_with(self.face)
+        alt_camera.project_clipped.assert_called_once_with(self.face)
         self.assertEqual(result, [alt_face2d])
+
+    def test_make_render_projects_indexed_meshes_once(self) -> None:
+        """Test indexed meshes go through the shared-vertex projection path."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1)]
+        face2d = Face2D(points, 1.0, Shader(0, 0, 0))
+        indexed = IndexedMesh3D.weld(Mesh3D([self.face]))
+        self.scene.meshes = [indexed]
+        self.mock_camera.project_indexed.return_value = [face2d]
+
+        result = self.scene.make_render()
+
+        self.mock_camera.project_indexed.assert_called_once_with(indexed, None)
+        self.mock_camera.is_face_in_frustum.assert_not_called()
+        self.assertEqual(result, [face2d])
+
+    def test_make_render_projects_array_backed_meshes_in_batch(self) -> None:
+        """Test array-backed meshes go through the batch projection path."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1)]
+        face2d = Face2D(points, 1.0, Shader(0, 0, 0))
+        buffered = Mesh3D.from_buffer(np.zeros((1, 3, 3)))
+        self.scene.meshes = [buffered, self.mesh]
+        self.mock_camera.project_mesh.return_value = [face2d]
+        self.mock_camera.is_face_in_frustum.return_value = False
+
+        result = self.scene.make_render()
+
+        self.mock_camera.project_mesh.assert_called_once_with(buffered, None)
+        self.mock_camera.is_face_in_frustum.assert_called_once_with(self.face)
+        self.assertEqual(result, [face2d])
+
+    def test_make_render_projects_built_faces_of_buffer_meshes(self) -> None:
+        """Test buffer meshes with built faces render their faces' colors."""
+        camera = Camera(Vertex(3, 2, 5), Vertex(0, 0, 0))
+        mesh = Mesh3D.from_buffer(np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]],
+                                           dtype=np.float64), Shader(10, 20, 30))
+        fresh = Scene(camera, [mesh]).make_render()
+        mesh.faces[0].color = Shader(1, 1, 1)
+        self.assertFalse(mesh.is_array_backed)
+        rebuilt = Scene(camera, [mesh]).make_render()
+        self.assertEqual(fresh[0].color, Shader(10, 20, 30))
+        self.assertEqual(rebuilt[0].color, Shader(1, 1, 1))
+        self.assertAlmostEqual(rebuilt[0].distance, fresh[0].distance)
+
+    def test_make_render_culls_back_faces_of_face_meshes(self) -> None:
+        """Test the per-face path culls faces turned away on closed meshes."""
+        camera = Camera(Vertex(3, 2, 1.5), Vertex(0.25, 0.25, 0.25))
+        corners = [[(0, 0, 0), (0, 1, 0), (1, 0, 0)], [(0, 0, 0), (1, 0, 0), (0, 0, 1)],
+                   [(0, 0, 0), (0, 0, 1), (0, 1, 0)], [(1, 0, 0), (0, 1, 0), (0, 0, 1)]]
+        mesh = Mesh3D([Face3D([Vertex(*c) for c in face], Shader(5, 5, 5))
+                       for face in corners])
+        self.assertEqual(len(Scene(camera, [mesh]).make_render()), 1)
+        mesh.two_sided = True
+        self.assertEqual(len(Scene(camera, [mesh]).make_render()), 4)
+
+    def test_make_render_stream_matches_make_render(self) -> None:
+        """Test streamed chunks produce the same faces as the list render."""
+        camera = Camera(Vertex(3, 2, 5), Vertex(0, 0, 0))
+        positions = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+                              [[0, 0, 1], [1, 0, 1], [0, 1, 1]],
+                              [[9, 9, 9], [9, 8, 9], [8, 9, 9]]], dtype=np.float64)
+        chunks = [Mesh3D.from_buffer(positions[:2], Shader(10, 20, 30)),
+                  Mesh3D.from_buffer(positions[2:], Shader(40, 50, 60)),
+                  Mesh3D([self.face])]
+        expected = sorted(Scene(camera, chunks).make_render(), reverse=True)
+        with ExternalSort(run_size=2) as sorter:
+            Scene(camera, []).make_render_stream(iter(chunks), sorter)
+            streamed = list(sorter)
+        self.assertEqual([f.color for f in streamed], [f.color for f in expected])
+        np.testing.assert_allclose([f.distance for f in streamed],
+                                   [f.distance for f in expected])
+
+    def test_make_render_stream_culls_back_faces_of_one_sided_chunks(self) -> None:
+        """Test chunks of a closed mesh are culled as the whole mesh would be."""
+        camera = Camera(Vertex(3, 2, 1.5), Vertex(0.25, 0.25, 0.25))
+        positions = np.array([[[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+                              [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+                              [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+                              [[1, 0, 0], [0, 1, 0], [0, 0, 1]]], dtype=np.float64)
+        expected = Scene(camera, [Mesh3D.from_buffer(positions)]).make_render()
+        self.assertEqual(len(expected), 1)
+        for two_sided, count in ((False, 1), (True, 4)):
+            chunks = [Mesh3D.from_buffer(positions[:2]),
+                      Mesh3D.from_buffer(positions[2:])]
+            for chunk in chunks:
+                chunk.two_sided = two_sided
+            with ExternalSort() as sorter:
+                Scene(camera, []).make_render_stream(chunks, sorter)
+                self.assertEqual(len(list(sorter)), count)
+
+    def test_make_render_stream_projects_quantized_chunks(self) -> None:
+        """Test reduced-precision chunks render in the same order and place."""
+        camera = Camera(Vertex(3, 2, 5), Vertex(0, 0, 0))
+        positions = np.random.default_rng(5).uniform(-1, 1, (30, 3, 3))
+        results = []
+        for precision in ("float64", "quantized16"):
+            chunk = Mesh3D.from_buffer(positions.copy(), Shader(10, 20, 30))
+            chunk.set_precision(precision)
+            with ExternalSort() as sorter:
+                Scene(camera, []).make_render_stream([chunk], sorter)
+                results.append([(f.distance, [(p.x, p.y) for p in f.points])
+                                for f in sorter])
+        full, quantized = results
+        self.assertEqual(len(full), len(quantized))
+        for (depth, points), (q_depth, q_points) in zip(full, quantized):
+            self.assertAlmostEqual(depth, q_depth, places=4)
+            np.testing.assert_allclose(points, q_points, atol=1e-3)
+
+    def test_make_render_stream_uses_buffer_face_colors(self) -> None:
+        """Test MeshBuffer chunks keep their per-face colors."""
+        camera = Camera(Vertex(0, 0, 5), Vertex(0, 0, 0))
+        chunk = MeshBuffer(np.zeros((2, 3, 3)), np.array([[1, 2, 3], [4, 5, 6]]))
+        with ExternalSort() as sorter:
+            Scene(camera, []).make_render_stream([chunk], sorter)
+            colors = sorted(f.color.rgb for f in sorter)
+        self.assertEqual(colors, [(1, 2, 3), (4, 5, 6)])
+
+    def test_make_render_stream_applies_variance(self) -> None:
+        """Test color variance stays within range of the base color."""
+        camera = Camera(Vertex(0, 0, 5), Vertex(0, 0, 0))
+        chunk = Mesh3D.from_buffer(np.zeros((50, 3, 3)), Shader(100, 100, 100))
+        with ExternalSort() as sorter:
+            Scene(camera, []).make_render_stream([chunk], sorter, variance=10)
+            colors = [f.color.rgb for f in sorter]
+        self.assertEqual(len(colors), 50)
+        self.assertTrue(all(90 <= c <= 110 for rgb in colors for c in rgb))
+        self.assertGreater(len(set(colors)), 1)
+
+    def test_camera_inside_geometry_clips_instead_of_exploding(self) -> None:
+        """Test a floor passing under the camera is clipped to finite triangles."""
+        camera = Camera(Vertex(0, 0, 1), Vertex(0, 10, 1))
+        floor = [Face3D([Vertex(-50, 50, 0), Vertex(50, 50, 0), Vertex(0, -50, 0)],
+                        Shader(9, 9, 9))]
+        for mesh in (Mesh3D(floor), MeshBuffer.from_faces(floor)):
+            render = Scene(camera, [mesh]).make_render()
+            self.assertEqual(len(render), 2)
+            self.assertTrue(all(abs(p.x) <= 1e3 and abs(p.y) <= 1e3
+                                for face in render for p in face.points))
+
+    def test_changing_meshes_drops_the_bvh(self) -> None:
+        """Test that add and the meshes setter discard a built BVH."""
+        self.assertIsNone(self.scene.bvh)
+        self.scene.build_bvh()
+        self.assertIsNotNone(self.scene.bvh)
+        self.scene.add(Mesh3D([self.face]))
+        self.assertIsNone(self.scene.bvh)
+        self.scene.build_bvh()
+        self.scene.meshes = [self.mesh]
+        self.assertIsNone(self.scene.bvh)
+
+    def test_make_render_with_bvh_matches_make_render(self) -> None:
+        """Test that culling through the BVH draws the same faces for all mesh kinds."""
+        camera = Camera(Vertex(0, -30, 4), Vertex(2, 0, 0), focal_length=2.5,
+                        viewport=AspectRatio(4, 3))
+        rng = np.random.default_rng(3)
+        positions = [rng.uniform(-1, 1, (40, 3, 3)) + rng.uniform(-15, 15, 3)
+                     for _ in range(6)]
+        ones = np.ones((40, 3))
+        meshes: List[Mesh3D] = [
+            Mesh3D.from_buffer(positions[0], Shader(1, 2, 3)),
+            MeshBuffer(positions[1], rng.integers(0, 255, (40, 3))),
+            MeshBuffer.from_faces(MeshBuffer(positions[2], ones).faces),
+            IndexedMesh3D.from_buffer(positions[3], Shader(4, 5, 6)),
+            Mesh3D(MeshBuffer(positions[4], ones).faces),
+            Mesh3D.from_buffer(np.concatenate(positions), Shader(7, 8, 9))]
+        scene = Scene(camera, meshes)
+        expected = sorted(scene.make_render(), reverse=True)
+        scene.build_bvh(leaf_size=2)
+        rendered = sorted(scene.make_render(), reverse=True)
+        self.assertLess(sum(len(faces) for _, faces in scene.bvh.cull(camera)),
+                        sum(mesh.num_faces for mesh in meshes))
+        self.assertEqual([f.color for f in rendered], [f.color for f in expected])
+        np.testing.assert_allclose([f.distance for f in rendered],
+                                   [f.distance for f in expected])
+
+    def test_build_bvh_reuses_saved_trees(self) -> None:
+        """Test that a saved BVH is loaded instead of rebuilt while the faces match."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = self.scene.build_bvh(cache_dir)
+            self.assertEqual(os.listdir(cache_dir), [first.key + BVH.EXTENSION])
+            with patch.object(BVH, "build") as build:
+                scene = Scene(self.mock_camera, [self.mesh])
+                self.assertTrue(scene.build_bvh(cache_dir).is_built)
+                build.assert_not_called()
+
+    def test_translate_refits_the_bvh(self) -> None:
+        """Test that moving a mesh through the scene keeps the BVH current."""
+        self.scene.build_bvh()
+        self.scene.translate(self.mesh, Vector(0, 0, 5))
+        self.assertEqual(self.scene.bvh.nearest(Vertex(0.1, 0.1, 5)).distance, 0.0)
+        self.assertEqual(self.face.points[0], Vertex(0, 0, 5))
+        with self.assertRaises(ValueError):
+            self.scene.translate(Mesh3D([self.face]), Vector(1, 0, 0))
@@ -170,3 +170,15 @@ class TestScreen(unittest.TestCase):
         self.screen.render(faces)
         mock_create_canvas.assert_called_once()
         mock_draw_faces.assert_called_once_with(faces)
+
+    @patch.object(Screen, "_create_canvas")
+    @patch.object(Screen, "_draw_face")
+    def test_render_stream_draws_in_given_order(self, mock_draw_face: MagicMock,
+                                                mock_create_canvas: MagicMock) -> None:
+        """Test render_stream draws faces as produced, without re-sorting."""
+        near = Face2D([Point(0, 0), Point(1, 0), Point(0, 1)], 0.5, Shader(255, 0, 0))
+        far = Face2D([Point(0, 0), Point(1, 0), Point(0, 1)], 5.0, Shader(0, 255, 0))
+        self.screen.render_stream(iter([near, far]))
+        mock_create_canvas.assert_called_once()
+        self.assertEqual([c.args[0] for c in mock_draw_face.call_args_list],
+                         [near, far])
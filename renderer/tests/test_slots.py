@@ -0,0 +1,34 @@
+"""
+Unit tests for the slotted geometry primitives.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import unittest
+from typing import Any, List
+from geometry import Face2D, Face3D, Point, Shader, Vector, Vertex
+
+
+def make_instances() -> List[Any]:
+    """Builds one instance of every primitive that declares __slots__."""
+    shader = Shader(1, 2, 3)
+    corners = [Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 1, 0)]
+    return [Vertex(1, 2, 3), Vector(1, 2, 3), Point(1, 2), shader,
+            Face3D(corners, shader),
+            Face2D([Point(0, 0), Point(1, 0), Point(0, 1)], 1.0, shader)]
+
+
+class TestSlots(unittest.TestCase):
+    """Unit tests shared by every slotted primitive."""
+
+    def test_slots_without_instance_dict(self) -> None:
+        """Test that each primitive stores its fields in slots and has no __dict__."""
+        for instance in make_instances():
+            with self.subTest(type(instance).__name__):
+                self.assertFalse(hasattr(instance, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    setattr(instance, "unknown", 1)
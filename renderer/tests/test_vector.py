@@ -167,14 +167,14 @@ class TestVector(unittest.TestCase):
 
     def test_y_property_set_calls_invalidate_cache(self) -> None:
         """Test that setting y updates _y and calls _invalidate_cache."""
-        with patch.object(self.v1, "_invalidate_cache") as mock_invalidate:
+        with patch.object(Vector, "_invalidate_cache") as mock_invalidate:
             self.v1.y = 10.0
             mock_invalidate.assert_called_once()
             self.assertEqual(self.v1.y, 10.0)
 
     def test_z_property_set_calls_invalidate_cache(self) -> None:
         """Test that setting y updates _y and calls _invalidate_cache."""
-        with patch.object(self.v1, "_invalidate_cache") as mock_invalidate:
+        with patch.object(Vector, "_invalidate_cache") as mock_invalidate:
             self.v1.z = 10.0
             mock_invalidate.assert_called_once()
             self.assertEqual(self.v1.z, 10.0)
@@ -197,3 +197,11 @@ class TestVector(unittest.TestCase):
         v = Vector(x, y, z)
         scaled = v * scalar
         self.assertEqual(scaled, Vector(x * scalar, y * scalar, z * scalar))
+
+    def test_normalize_is_cached_until_change(self) -> None:
+        """Test that normalize reuses its result until a component changes."""
+        unit = self.v1.normalize
+        self.assertIs(self.v1.normalize, unit)
+        self.v1.x = 0.0
+        self.assertIsNot(self.v1.normalize, unit)
+        self.assertEqual(self.v1.normalize, Vector(0.0, 2.0, 3.0) * (1 / math.sqrt(13)))
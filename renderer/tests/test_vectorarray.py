@@ -0,0 +1,168 @@
+"""
+Unit tests for the VectorArray class using unittest and Hypothesis.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import math
+import unittest
+from typing import List, Tuple
+import numpy as np
+from hypothesis import assume, given, strategies as st
+from geometry import Vector, VectorArray, Vertex, VertexArray
+
+Triple = Tuple[float, float, float]
+Pairs = Tuple[List[Triple], List[Triple]]
+
+components = st.floats(min_value=-1e3, max_value=1e3, allow_nan=False,
+                       allow_infinity=False)
+triples = st.tuples(components, components, components)
+
+
+@st.composite
+def paired_rows(draw: st.DrawFn) -> Pairs:
+    """Draws two lists of triples with the same length."""
+    size = draw(st.integers(min_value=1, max_value=8))
+    rows = st.lists(triples, min_size=size, max_size=size)
+    return draw(rows), draw(rows)
+
+
+class TestVectorArray(unittest.TestCase):
+    """Unit tests for the VectorArray class."""
+
+    def setUp(self) -> None:
+        """Set up two small vector arrays."""
+        self.a = VectorArray([[1.0, 2.0, 3.0], [0.0, 0.0, 2.0]])
+        self.b = VectorArray([[4.0, 5.0, 6.0], [1.0, 0.0, 0.0]])
+
+    def assert_rows_close(self, actual: List[float], expected: List[float]) -> None:
+        """Asserts that two lists of floats match within Vector's tolerance."""
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            self.assertTrue(math.isclose(got, want, rel_tol=1e-9, abs_tol=1e-6),
+                            f"{got} != {want}")
+
+    def test_constructor_rejects_bad_shape(self) -> None:
+        """Test that data must have shape (N, 3)."""
+        with self.assertRaises(ValueError):
+            VectorArray([1.0, 2.0, 3.0])
+        with self.assertRaises(ValueError):
+            VectorArray([[1.0, 2.0]])
+
+    def test_rows_and_components(self) -> None:
+        """Test indexing, iteration and component views."""
+        self.assertEqual(len(self.a), 2)
+        self.assertEqual(self.a[0], Vector(1.0, 2.0, 3.0))
+        self.assertEqual(list(self.a), [Vector(1.0, 2.0, 3.0), Vector(0.0, 0.0, 2.0)])
+        self.assertEqual(self.a.z.tolist(), [3.0, 2.0])
+        self.assertEqual(repr(self.a), "VectorArray(n=2)")
+
+    def test_from_vectors_round_trip(self) -> None:
+        """Test packing Vector objects, including an empty list."""
+        vectors = [Vector(1.0, 2.0, 3.0), Vector(-1.0, 0.5, 0.0)]
+        self.assertEqual(list(VectorArray.from_vectors(vectors)), vectors)
+        self.assertEqual(len(VectorArray.from_vectors([])), 0)
+
+    def test_broadcast_against_single_vector(self) -> None:
+        """Test that a single Vector operand applies to every row."""
+        self.assertEqual(self.a.dot(Vector(1.0, 0.0, 0.0)).tolist(), [1.0, 0.0])
+        self.assertEqual(self.a + Vector(1.0, 1.0, 1.0),
+                         VectorArray([[2.0, 3.0, 4.0], [1.0, 1.0, 3.0]]))
+        self.assertEqual(self.a.cross(Vector(0.0, 0.0, 1.0)),
+                         VectorArray([[2.0, -1.0, 0.0], [0.0, 0.0, 0.0]]))
+
+    def test_add_vertex_gives_vertices(self) -> None:
+        """Test that adding vertices yields a VertexArray."""
+        moved = self.a + Vertex(1.0, 1.0, 1.0)
+        self.assertIsInstance(moved, VertexArray)
+        self.assertEqual(moved[1], Vertex(1.0, 1.0, 3.0))
+
+    def test_length_mismatch_raises(self) -> None:
+        """Test that arrays of different lengths cannot be combined."""
+        with self.assertRaises(ValueError):
+            self.a.dot(VectorArray([[1.0, 0.0, 0.0]]))
+
+    def test_invalid_operands_raise_type_error(self) -> None:
+        """Test that operand types are checked like Vector's."""
+        with self.assertRaises(TypeError):
+            self.a.dot(Vertex(1.0, 0.0, 0.0))  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            self.a.cross(VertexArray([[1.0, 0.0, 0.0]] * 2))  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            _ = self.a + "x"
+        with self.assertRaises(TypeError):
+            _ = self.a * "x"  # type: ignore[operator]
+        with self.assertRaises(TypeError):
+            _ = self.a * np.ones(3)
+
+    def test_normalize_zero_vector_raises(self) -> None:
+        """Test that normalizing a zero row raises ValueError."""
+        with self.assertRaises(ValueError):
+            _ = VectorArray([[1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]).normalize
+
+    def test_multiply_per_vector(self) -> None:
+        """Test scaling each row by its own factor."""
+        self.assertEqual(self.a * np.array([2.0, 0.5]),
+                         VectorArray([[2.0, 4.0, 6.0], [0.0, 0.0, 1.0]]))
+        self.assertEqual(2 * self.a, self.a * 2.0)
+
+    def test_equality(self) -> None:
+        """Test tolerant equality and comparison with other types."""
+        self.assertEqual(self.a, VectorArray(self.a.data * (1 + 1e-12)))
+        self.assertNotEqual(self.a, self.b)
+        self.assertNotEqual(self.a, VectorArray(self.a.data[:1]))
+        self.assertNotEqual(self.a, VertexArray(self.a.data))
+
+    @given(paired_rows())
+    def test_dot_and_cross_match_vector(self, rows: Pairs) -> None:
+        """Test dot and cross against the scalar Vector results."""
+        left, right = rows
+        vectors = VectorArray(left)
+        others = VectorArray(right)
+        self.assert_rows_close(vectors.dot(others).tolist(),
+                               [Vector(*u).dot(Vector(*v))
+                                for u, v in zip(left, right)])
+        crosses = vectors.cross(others)
+        for row, (u, v) in enumerate(zip(left, right)):
+            expected = Vector(*u).cross(Vector(*v))
+            self.assert_rows_close(crosses.data[row].tolist(),
+                                   [expected.x, expected.y, expected.z])
+
+    @given(st.lists(triples, min_size=1, max_size=8), triples)
+    def test_broadcast_matches_vector(self, rows: List[Triple], single: Triple) -> None:
+        """Test single-Vector operands against the scalar results."""
+        vectors = VectorArray(rows)
+        other = Vector(*single)
+        self.assert_rows_close(vectors.dot(other).tolist(),
+                               [Vector(*row).dot(other) for row in rows])
+        for row, total in zip(rows, vectors + other):
+            self.assertEqual(total, Vector(*row) + other)
+
+    @given(st.lists(triples, min_size=1, max_size=8), components)
+    def test_magnitude_scale_and_normalize_match_vector(self, rows: List[Triple],
+                                                        scalar: float) -> None:
+        """Test magnitude, normalize and scalar multiply against Vector."""
+        vectors = VectorArray(rows)
+        self.assert_rows_close(vectors.magnitude.tolist(),
+                               [Vector(*row).magnitude for row in rows])
+        for row, scaled in zip(rows, vectors * scalar):
+            self.assertEqual(scaled, Vector(*row) * scalar)
+        assume(all(Vector(*row).magnitude > 1e-6 for row in rows))
+        for row, unit in zip(rows, vectors.normalize):
+            self.assertEqual(unit, Vector(*row).normalize)
+
+    @given(paired_rows())
+    def test_add_and_sub_match_vector(self, rows: Pairs) -> None:
+        """Test elementwise addition and subtraction against Vector."""
+        left, right = rows
+        vectors = VectorArray(left)
+        others = VectorArray(right)
+        for u, v, total, difference in zip(left, right, vectors + others,
+                                           vectors - others):
+            self.assertEqual(total, Vector(*u) + Vector(*v))
+            self.assertEqual(difference,
+                             Vector(u[0] - v[0], u[1] - v[1], u[2] - v[2]))
@@ -0,0 +1,72 @@
+"""
+Unit tests for the VertexArray class using unittest and Hypothesis.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import math
+import unittest
+from typing import List, Tuple
+from hypothesis import given, strategies as st
+from geometry import Vector, VectorArray, Vertex, VertexArray
+
+Triple = Tuple[float, float, float]
+
+components = st.floats(min_value=-1e3, max_value=1e3, allow_nan=False,
+                       allow_infinity=False)
+triples = st.tuples(components, components, components)
+
+
+class TestVertexArray(unittest.TestCase):
+    """Unit tests for the VertexArray class."""
+
+    def setUp(self) -> None:
+        """Set up a small vertex array."""
+        self.vertices = VertexArray([[0.0, 0.0, 0.0], [1.0, 2.0, 2.0]])
+
+    def test_rows_and_round_trip(self) -> None:
+        """Test indexing and packing Vertex objects."""
+        self.assertEqual(self.vertices[1], Vertex(1.0, 2.0, 2.0))
+        self.assertEqual(VertexArray.from_vertices(list(self.vertices)), self.vertices)
+        self.assertNotEqual(self.vertices, VectorArray(self.vertices.data))
+
+    def test_subtracting_vertices_gives_vectors(self) -> None:
+        """Test that vertex differences are a VectorArray."""
+        difference = self.vertices - Vertex(1.0, 0.0, 0.0)
+        self.assertIsInstance(difference, VectorArray)
+        self.assertEqual(difference[1], Vector(0.0, 2.0, 2.0))
+
+    def test_moving_by_vectors_gives_vertices(self) -> None:
+        """Test adding and subtracting vectors keeps vertices."""
+        moved = self.vertices + Vector(1.0, 1.0, 1.0)
+        self.assertEqual(moved[0], Vertex(1.0, 1.0, 1.0))
+        self.assertEqual(moved - Vector(1.0, 1.0, 1.0), self.vertices)
+
+    def test_distance(self) -> None:
+        """Test distances to one vertex."""
+        self.assertEqual(self.vertices.distance(Vertex(0.0, 0.0, 0.0)).tolist(),
+                         [0.0, 3.0])
+
+    def test_invalid_operands_raise_type_error(self) -> None:
+        """Test that vertices cannot be added or compared by distance to vectors."""
+        with self.assertRaises(TypeError):
+            _ = self.vertices + Vertex(1.0, 1.0, 1.0)  # type: ignore[operator]
+        with self.assertRaises(TypeError):
+            _ = self.vertices - 1.0
+        with self.assertRaises(TypeError):
+            self.vertices.distance(Vector(1.0, 1.0, 1.0))  # type: ignore[arg-type]
+
+    @given(st.lists(triples, min_size=1, max_size=8), triples)
+    def test_matches_vertex(self, rows: List[Triple], single: Triple) -> None:
+        """Test subtraction and distance against the scalar Vertex results."""
+        vertices = VertexArray(rows)
+        other = Vertex(*single)
+        for row, difference, distance in zip(rows, vertices - other,
+                                             vertices.distance(other)):
+            self.assertEqual(difference, Vertex(*row) - other)
+            self.assertTrue(math.isclose(distance, Vertex(*row).distance(other),
+                                         rel_tol=1e-9, abs_tol=1e-9))
@@ -0,0 +1,116 @@
+"""
+Unit tests for the WavefrontParser class and FileImport's OBJ support.
+"""
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, mock_open
+from utility import FileImport
+from utility.wavefront import WavefrontParser
+from geometry import IndexedMesh3D, Vertex, Shader
+
+CUBE_SIDES = """# two quads in two groups
+mtllib scene.mtl
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 0 0 1
+o front
+usemtl red
+f 1/1/1 2/2/1 3/3/1 4/4/1
+g top
+usemtl blue
+f -5//1 -4//1 -1//1
+"""
+
+MATERIALS = """newmtl red
+Kd 1.0 0.0 0.0
+newmtl blue
+Kd 0 0 0.5
+"""
+
+
+class TestWavefrontParser(unittest.TestCase):
+    """Unit tests for parsing standard OBJ records."""
+
+    def setUp(self) -> None:
+        """Reset the FileImport singleton."""
+        FileImport._instance = None  # pylint: disable=protected-access
+        self.importer = FileImport()
+
+    def _parse(self, text: str) -> list:
+        """Parses OBJ text the way FileImport feeds the parser."""
+        lines = [line.strip() for line in text.splitlines()
+                 if line.strip() and not line.strip().startswith("#")]
+        return WavefrontParser().parse(lines)
+
+    def test_groups_become_meshes(self) -> None:
+        """Test each group/material pair becomes an IndexedMesh3D."""
+        meshes = self._parse(CUBE_SIDES)
+        self.assertEqual(len(meshes), 2)
+        self.assertTrue(all(isinstance(m, IndexedMesh3D) for m in meshes))
+
+    def test_quads_are_fan_triangulated(self) -> None:
+        """Test an n-gon becomes n - 2 triangles sharing its first vertex."""
+        front = self._parse(CUBE_SIDES)[0]
+        self.assertEqual(front.num_faces, 2)
+        self.assertEqual(front.indices, [(0, 1, 2), (0, 2, 3)])
+        self.assertEqual(front.faces[1].points[2], Vertex(0, 1, 0))
+
+    def test_negative_indices_are_relative(self) -> None:
+        """Test negative references count back from the latest vertex."""
+        top = self._parse(CUBE_SIDES)[1]
+        self.assertEqual(top.faces[0].points,
+                         [Vertex(0, 0, 0), Vertex(1, 0, 0), Vertex(0, 0, 1)])
+
+    def test_unknown_material_uses_default_color(self) -> None:
+        """Test meshes without a material library get the default color."""
+        meshes = self._parse(CUBE_SIDES)
+        self.assertEqual(meshes[0].base_shader, Shader(127, 127, 127))
+
+    def test_material_library_colors(self) -> None:
+        """Test usemtl picks up diffuse colors from the mtllib file."""
+        with tempfile.TemporaryDirectory() as folder:
+            obj_path = os.path.join(folder, "scene.obj")
+            with open(obj_path, "w", encoding="utf-8") as file:
+                file.write(CUBE_SIDES)
+            with open(os.path.join(folder, "scene.mtl"), "w", encoding="utf-8") as file:
+                file.write(MATERIALS)
+            meshes = self.importer.read_wavefront(obj_path)
+        self.assertEqual(meshes[0].faces[0].color, Shader(255, 0, 0))
+        self.assertEqual(meshes[1].base_shader, Shader(0, 0, 128))
+
+    def test_out_of_range_reference_raises(self) -> None:
+        """Test references to missing vertices raise ValueError."""
+        with self.assertRaises(ValueError):
+            self._parse("v 0 0 0\nv 1 0 0\nf 1 2 3\n")
+
+    def test_short_records_raise(self) -> None:
+        """Test truncated 'v' and 'f' records raise ValueError."""
+        with self.assertRaises(ValueError):
+            self._parse("v 0 0\n")
+        with self.assertRaises(ValueError):
+            self._parse("v 0 0 0\nv 1 0 0\nf 1 2\n")
+
+    @patch("builtins.open", new_callable=mock_open, read_data=CUBE_SIDES)
+    def test_read_file_detects_wavefront(self, _mock_file) -> None:
+        """Test read_file routes standard OBJ files to the OBJ importer."""
+        self.assertTrue(self.importer.is_wavefront("mock.obj"))
+        meshes = self.importer.read_file("mock.obj")
+        self.assertEqual([m.num_faces for m in meshes], [2, 1])
+        streamed = self.importer.read_file("mock.obj", stream=True)
+        self.assertEqual(len(list(streamed)), 2)
+
+    def test_bundled_assets_are_not_wavefront(self) -> None:
+        """Test this project's mesh-count format is not mistaken for OBJ."""
+        asset = os.path.join(os.path.dirname(__file__), "..", "assets",
+                             "tetrahedron.obj")
+        self.assertFalse(self.importer.is_wavefront(asset))
@@ -3,17 +3,29 @@ Utility package for supporting modules used in the 3D rendering engine.
 
 This package includes helper classes for input handling and file importing:
 
+- AssetManifest: Persistent index of asset counts, bounds and camera poses
+- BinaryImport: Loads binary STL and PLY scans as buffer-backed meshes
 - FileImport: Singleton class to load and parse .obj-like mesh files
 - Interface: Graphical interface to collect user input for scene configuration
+- MeshCache: Disk cache of compiled binary meshes keyed by source content hash
+- Precompiler: Command-line tool to bake an asset directory into indexed binaries
 
 Example:
     from utility import FileImport, Interface
 """
 
+from .binaryimport import BinaryImport
 from .fileimport import FileImport
 from .interface import Interface
+from .manifest import AssetManifest
+from .meshcache import MeshCache
+from .precompile import Precompiler
 
 __all__ = [
+    "AssetManifest",
+    "BinaryImport",
     "FileImport",
-    "Interface"
+    "Interface",
+    "MeshCache",
+    "Precompiler"
 ]
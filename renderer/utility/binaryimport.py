@@ -0,0 +1,227 @@
+"""BinaryImport class to load binary STL and PLY scans as buffer-backed meshes."""
+
+from __future__ import annotations
+
+__author__ = "Michael Nuttall"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Michael Nuttall"
+
+import mmap
+import struct
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry import Mesh3D, Shader
+
+PlyElement = Tuple[str, int, List[List[str]]]
+
+
+class BinaryImport:
+    """Loads binary triangle formats without per-vertex Python parsing.
+
+    Files are memory-mapped and read with numpy.frombuffer, so STL vertex
+    data stays a zero-copy view and PLY data costs a single gather.
+    """
+
+    DEFAULT_COLOR: Tuple[int, int, int] = (127, 127, 127)
+    STL_HEADER_SIZE: int = 84
+    STL_DTYPE: np.dtype[Any] = np.dtype([
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attribute", "<u2"),
+    ])
+    PLY_TYPES: Dict[str, str] = {
+        "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+        "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+        "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+        "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+    }
+
+    @staticmethod
+    def _map(filepath: str) -> mmap.mmap:
+        """Memory-maps a file read-only.
+
+        Args:
+            filepath (str): Path to the file.
+
+        Raises:
+            ValueError: If the file is empty.
+
+        Returns:
+            mmap.mmap: Read-only mapping of the whole file.
+        """
+        with open(filepath, 'rb') as file:
+            try:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                raise ValueError(f"Cannot map empty file: {filepath}") from error
+
+    @classmethod
+    def read_stl(cls, filepath: str,
+                 color: Shader | None = None) -> List[Mesh3D]:
+        """Reads a binary STL file into one buffer-backed mesh.
+
+        Args:
+            filepath (str): Path to the .stl file.
+            color (Shader | None, optional): Mesh color. STL carries none,
+                so a neutral gray is used by default.
+
+        Raises:
+            ValueError: If the file is not a well-formed binary STL.
+
+        Returns:
+            List[Mesh3D]: A single mesh whose positions view the file.
+        """
+        buffer = cls._map(filepath)
+        if len(buffer) < cls.STL_HEADER_SIZE:
+            raise ValueError("File too short to be a binary STL.")
+        count = int.from_bytes(buffer[80:84], "little")
+        if len(buffer) != cls.STL_HEADER_SIZE + count * cls.STL_DTYPE.itemsize:
+            raise ValueError("Binary STL size does not match its triangle count.")
+        records = np.frombuffer(buffer, dtype=cls.STL_DTYPE, count=count,
+                                offset=cls.STL_HEADER_SIZE)
+        shader = color if color is not None else Shader(*cls.DEFAULT_COLOR)
+        return [Mesh3D.from_buffer(records["vertices"], shader)]
+
+    @classmethod
+    def _read_ply_header(cls, buffer: mmap.mmap) -> Tuple[str, List[PlyElement], int]:
+        """Parses the text header of a PLY file.
+
+        Args:
+            buffer (mmap.mmap): Mapped file.
+
+        Raises:
+            ValueError: If the header is missing or malformed.
+
+        Returns:
+            Tuple[str, List[PlyElement], int]: Byte-order
+                prefix, elements as (name, count, property tokens), and the
+                offset of the binary body.
+        """
+        end = buffer.find(b"end_header")
+        if not buffer[:4].startswith(b"ply") or end < 0:
+            raise ValueError("Not a PLY file.")
+        body = buffer.find(b"\n", end) + 1
+        elements: List[PlyElement] = []
+        order = ""
+        for line in buffer[:end].decode("ascii").splitlines():
+            parts = line.split()
+            if parts[:1] == ["format"]:
+                orders = {"binary_little_endian": "<", "binary_big_endian": ">"}
+                if parts[1] not in orders:
+                    raise ValueError(f"Unsupported PLY format: {parts[1]}")
+                order = orders[parts[1]]
+            elif parts[:1] == ["element"]:
+                elements.append((parts[1], int(parts[2]), []))
+            elif parts[:1] == ["property"] and elements:
+                elements[-1][2].append(parts[1:])
+        if not order:
+            raise ValueError("PLY header has no format line.")
+        return order, elements, body
+
+    @classmethod
+    def _ply_dtype(cls, order: str, properties: List[List[str]]) -> np.dtype[Any]:
+        """Builds a structured dtype for an element with scalar properties.
+
+        Args:
+            order (str): Byte-order prefix.
+            properties (List[List[str]]): Property tokens (type, name).
+
+        Raises:
+            ValueError: If a property type is unknown.
+
+        Returns:
+            np.dtype[Any]: Record dtype of one element.
+        """
+        fields = []
+        for prop in properties:
+            if prop[0] not in cls.PLY_TYPES:
+                raise ValueError(f"Unsupported PLY property type: {prop[0]}")
+            fields.append((prop[1], order + cls.PLY_TYPES[prop[0]]))
+        return np.dtype(fields)
+
+    @classmethod
+    def _ply_faces(cls, buffer: mmap.mmap, offset: int, count: int, order: str,
+                   properties: List[List[str]]) -> NDArray[np.int64]:
+        """Reads face index lists as an (F, 3) array of triangles.
+
+        All-triangle faces are read in one frombuffer call; polygon meshes
+        fall back to fan-triangulating face by face.
+
+        Args:
+            buffer (mmap.mmap): Mapped file.
+            offset (int): Byte offset of the face element.
+            count (int): Number of faces.
+            order (str): Byte-order prefix.
+            properties (List[List[str]]): Face property tokens.
+
+        Raises:
+            ValueError: If the face element is not a single index list.
+
+        Returns:
+            NDArray[np.int64]: Triangle vertex indices.
+        """
+        if len(properties) != 1 or properties[0][0] != "list":
+            raise ValueError("PLY faces must be a single vertex index list.")
+        count_type = order + cls.PLY_TYPES[properties[0][1]]
+        index_type = order + cls.PLY_TYPES[properties[0][2]]
+        triangle = np.dtype([("n", count_type), ("idx", index_type, (3,))])
+        if count * triangle.itemsize <= len(buffer) - offset:
+            fixed = np.frombuffer(buffer, dtype=triangle, count=count, offset=offset)
+            if bool(np.all(fixed["n"] == 3)):
+                return fixed["idx"].astype(np.int64)
+
+        triangles: List[Tuple[int, int, int]] = []
+        count_format = order + np.dtype(count_type).char
+        try:
+            for _ in range(count):
+                (n,) = struct.unpack_from(count_format, buffer, offset)
+                offset += struct.calcsize(count_format)
+                index_format = f"{order}{n}{np.dtype(index_type).char}"
+                idx = struct.unpack_from(index_format, buffer, offset)
+                offset += struct.calcsize(index_format)
+                triangles.extend((idx[0], idx[i], idx[i + 1]) for i in range(1, n - 1))
+        except struct.error as error:
+            raise ValueError("PLY face data is truncated.") from error
+        return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+    @classmethod
+    def read_ply(cls, filepath: str,
+                 color: Shader | None = None) -> List[Mesh3D]:
+        """Reads a binary PLY file into one buffer-backed mesh.
+
+        Args:
+            filepath (str): Path to the .ply file.
+            color (Shader | None, optional): Mesh color. Defaults to the mean
+                vertex color if the file has one, else a neutral gray.
+
+        Raises:
+            ValueError: If the file is not a supported binary PLY.
+
+        Returns:
+            List[Mesh3D]: A single mesh with an (F, 3, 3) position array.
+        """
+        buffer = cls._map(filepath)
+        order, elements, offset = cls._read_ply_header(buffer)
+        if [name for name, _, _ in elements[:2]] != ["vertex", "face"]:
+            raise ValueError("PLY must start with vertex and face elements.")
+        (_, num_vertices, vertex_props), (_, num_faces, face_props) = elements[:2]
+
+        vertex_type = cls._ply_dtype(order, vertex_props)
+        vertices = np.frombuffer(buffer, dtype=vertex_type, count=num_vertices,
+                                 offset=offset)
+        offset += num_vertices * vertex_type.itemsize
+        triangles = cls._ply_faces(buffer, offset, num_faces, order, face_props)
+        if triangles.size and (triangles.min() < 0 or triangles.max() >= num_vertices):
+            raise ValueError("PLY face references a missing vertex.")
+
+        xyz = np.stack([vertices["x"], vertices["y"], vertices["z"]], axis=-1)
+        if color is None:
+            color = Shader(*cls.DEFAULT_COLOR)
+            names = vertex_type.names or ()
+            channels = ("red", "green", "blue")
+            if num_vertices and all(c in names for c in channels):
+                color = Shader(*(int(vertices[c].mean()) for c in channels))
+        return [Mesh3D.from_buffer(xyz[triangles], color)]
@@ -1,16 +1,151 @@
 """Singleton class to open and collect data from files."""
 
 from __future__ import annotations
-from typing import List
-from geometry import Mesh3D, Face3D, Vertex, Shader
+import bz2
+import gzip
+import lzma
+import os
+import warnings
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice, repeat
+from typing import (IO, TYPE_CHECKING, Any, Callable, Dict, Generator, Iterator, List,
+                    Literal, NamedTuple, Tuple, overload)
+import numpy as np
+from numpy.typing import NDArray
+from geometry import Mesh3D, Face3D, IndexedMesh3D, LazyMesh3D, Vertex, Shader
+from utility.binaryimport import BinaryImport
+from utility.meshcache import MeshCache
+from utility.wavefront import WavefrontParser
+
+if TYPE_CHECKING:
+    from utility.manifest import AssetManifest  # pragma: no cover
 
 __author__ = "Arin Hartung"
 __date__ = "2025/04/26"
 __license__ = "MIT"
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 __maintainer__ = "Arin Hartung"
 
 
+class MeshBlock(NamedTuple):
+    """Location of one mesh's vertex lines within a text asset."""
+
+    color: Shader
+    num_faces: int
+    start: int
+    end: int
+
+
+class _LineReader:
+    """Walks the meaningful lines of a binary file one bounded chunk at a time."""
+
+    CHUNK_SIZE: int = 1 << 20
+
+    def __init__(self, file: IO[bytes]) -> None:
+        """Constructor
+
+        Args:
+            file (IO[bytes]): File opened in binary mode at its start.
+        """
+        self._file: IO[bytes] = file
+        self._data: bytes = b""
+        self._tail: bytes = b""
+        self._base: int = 0
+        self._lines: NDArray[np.intp] = np.empty((0, 2), dtype=np.intp)
+        self._row: int = 0
+        self.offset: int = 0
+
+    @staticmethod
+    def _line_table(data: bytes) -> NDArray[np.intp]:
+        """
+        Finds the byte range of every meaningful line of raw file data.
+
+        Lines are classified by their first byte with array operations;
+        only lines starting with whitespace are stripped in Python.
+
+        Args:
+            data (bytes): Complete lines of one chunk of the file.
+
+        Returns:
+            NDArray[np.intp]: (M, 2) [start, end) offsets of each meaningful
+                line, where end includes the line's newline.
+        """
+        raw = np.frombuffer(data, dtype=np.uint8)
+        newlines = np.flatnonzero(raw == ord("\n"))
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines + 1, [len(raw)]))
+        nonempty = starts < ends
+        starts, ends = starts[nonempty], ends[nonempty]
+        first = raw[starts]
+        space = (first == ord(" ")) | ((first >= ord("\t")) & (first <= ord("\r")))
+        keep = ~space & (first != ord("#"))
+        for row in np.flatnonzero(space & (ends - starts > 2)).tolist():
+            stripped = data[starts[row]:ends[row]].strip()
+            keep[row] = bool(stripped) and not stripped.startswith(b"#")
+        return np.stack((starts[keep], ends[keep]), axis=-1)
+
+    def _fill(self) -> bool:
+        """
+        Loads the complete lines of the next chunk of the file.
+
+        Returns:
+            bool: False once the file is exhausted.
+        """
+        while True:
+            chunk = self._file.read(self.CHUNK_SIZE)
+            data = self._tail + chunk
+            if not data:
+                return False
+            cut = data.rfind(b"\n") + 1 if chunk else len(data)
+            if cut:
+                break
+            self._tail = data
+        self._base += len(self._data)
+        self._data, self._tail = data[:cut], data[cut:]
+        self._lines = self._line_table(self._data)
+        self._row = 0
+        return True
+
+    def next_line(self) -> bytes:
+        """
+        Gets the next meaningful line and moves offset past it.
+
+        Raises:
+            ValueError: If the file ends early.
+
+        Returns:
+            bytes: The line, still holding its surrounding whitespace.
+        """
+        while self._row >= len(self._lines):
+            if not self._fill():
+                raise ValueError("Unexpected end of data.")
+        start, end = self._lines[self._row]
+        self._row += 1
+        self.offset = self._base + int(end)
+        return self._data[start:end]
+
+    def skip(self, count: int) -> None:
+        """
+        Passes over meaningful lines without decoding them.
+
+        Stops early at the end of the file, leaving the short block for the
+        parser to report.
+
+        Args:
+            count (int): Number of lines to pass over.
+        """
+        while count > 0:
+            if self._row >= len(self._lines) and not self._fill():
+                return
+            taken = min(count, len(self._lines) - self._row)
+            if taken:
+                self._row += taken
+                count -= taken
+                self.offset = self._base + int(self._lines[self._row - 1, 1])
+
+
 class FileImport:
     """
     A Singleton class for importing 3D geometry from files.
@@ -20,6 +155,13 @@ class FileImport:
     """
 
     _instance: FileImport | None = None
+    DEFAULT_CHUNK_SIZE: int = 4096
+    MAX_IO_THREADS: int = 8
+    COMPRESSION_MAGIC: Dict[str, bytes] = {
+        "gzip": b"\x1f\x8b",
+        "bz2": b"BZh",
+        "xz": b"\xfd7zXZ\x00",
+    }
 
     def __new__(cls) -> FileImport:
         """Creates a new instance if one doesn't already exist.
@@ -36,6 +178,177 @@ class FileImport:
     def __init__(self) -> None:
         """Constructor. Enforces singleton."""
         self._data: List[str] = []
+        self._cache: MeshCache | None = None
+        self._manifest: AssetManifest | None = None
+        self._workers: int = 1
+        self._precision: str = "float64"
+
+    @property
+    def cache(self) -> MeshCache | None:
+        """
+        Gets the compiled mesh cache used by read_file.
+
+        Returns:
+            MeshCache | None: Active cache, or None if caching is off.
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: MeshCache | None) -> None:
+        """
+        Sets the compiled mesh cache used by read_file.
+
+        Args:
+            value (MeshCache | None): Cache to use, or None to disable.
+        """
+        self._cache = value
+
+    @property
+    def manifest(self) -> AssetManifest | None:
+        """
+        Gets the asset manifest used to find precompiled files and
+        whether streamed meshes are two-sided.
+
+        Returns:
+            AssetManifest | None: Active manifest, or None to ignore
+                precompiled files.
+        """
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, value: AssetManifest | None) -> None:
+        """
+        Sets the asset manifest used to find precompiled files and
+        whether streamed meshes are two-sided.
+
+        Args:
+            value (AssetManifest | None): Manifest to use, or None.
+        """
+        self._manifest = value
+
+    @property
+    def workers(self) -> int:
+        """
+        Gets the number of processes used to parse text assets.
+
+        Returns:
+            int: Worker process count; 1 parses in this process.
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+        """
+        Sets the number of processes used to parse text assets.
+
+        Args:
+            value (int): Worker process count; 1 parses in this process.
+
+        Raises:
+            ValueError: If value is less than 1.
+        """
+        if value < 1:
+            raise ValueError("Worker count must be at least 1.")
+        self._workers = value
+
+    @property
+    def precision(self) -> str:
+        """
+        Gets the storage precision of buffer-backed meshes.
+
+        Returns:
+            str: One of Mesh3D.PRECISIONS.
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, value: str) -> None:
+        """
+        Sets the storage precision of buffer-backed meshes.
+
+        Applies to streamed chunks, to meshes read without welding and to
+        the vertex pools of welded ones; cached copies are always compiled
+        at full precision.
+
+        Args:
+            value (str): "float64", "float32" or "quantized16".
+
+        Raises:
+            ValueError: If value is not one of Mesh3D.PRECISIONS.
+        """
+        if value not in Mesh3D.PRECISIONS:
+            raise ValueError(f"Unknown precision {value!r}; "
+                             f"expected one of {', '.join(Mesh3D.PRECISIONS)}.")
+        self._precision = value
+
+    def _apply_precision(self, mesh: Mesh3D) -> Mesh3D:
+        """
+        Converts a mesh's vertex buffer to the configured precision.
+
+        Args:
+            mesh (Mesh3D): Mesh to convert in place.
+
+        Returns:
+            Mesh3D: The same mesh.
+        """
+        mesh.set_precision(self._precision)
+        return mesh
+
+    @classmethod
+    def compression(cls, filepath: str) -> str | None:
+        """
+        Detects a compressed file by its magic bytes.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Returns:
+            str | None: 'gzip', 'bz2' or 'xz', or None for a plain file.
+        """
+        with open(filepath, 'rb') as file:
+            head = file.read(max(map(len, cls.COMPRESSION_MAGIC.values())))
+        for name, magic in cls.COMPRESSION_MAGIC.items():
+            if head[:len(magic)] == magic:
+                return name
+        return None
+
+    @classmethod
+    def _opener(cls, filepath: str) -> Callable[..., IO[Any]]:
+        """
+        Picks the open function matching a file's compression.
+
+        The decompressing openers decode in chunks as the stream is read,
+        so a compressed file is never inflated in memory all at once.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Returns:
+            Callable[..., IO[Any]]: gzip.open, bz2.open, lzma.open or open.
+        """
+        openers: Dict[str | None, Callable[..., IO[Any]]] = {
+            "gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open,
+        }
+        return openers.get(cls.compression(filepath), open)
+
+    @classmethod
+    def _iter_lines(cls, filepath: str) -> Generator[str, None, None]:
+        """
+        Lazily yields stripped lines from a file, skipping blanks and comments (#).
+
+        Compressed files are decoded in chunks as the lines are consumed.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Yields:
+            str: The next meaningful line of the file.
+        """
+        with cls._opener(filepath)(filepath, 'rt', encoding='utf-8') as file:
+            for line in file:
+                stripped = line.strip()
+                if stripped and not stripped.startswith("#"):
+                    yield stripped
 
     def read_data(self, filepath: str) -> None:
         """
@@ -44,11 +357,192 @@ class FileImport:
         Args:
             filepath (str): Path to the input file.
         """
-        with open(filepath, 'r', encoding='utf-8') as file:
-            self._data = [
-                line.strip() for line in file
-                if line.strip() and not line.strip().startswith("#")
-            ]
+        self._data = list(self._iter_lines(filepath))
+
+    @staticmethod
+    def _next_line(lines: Iterator[str]) -> str:
+        """
+        Gets the next line of a mesh stream.
+
+        Args:
+            lines (Iterator[str]): Remaining lines.
+
+        Raises:
+            ValueError: If the stream ends early.
+
+        Returns:
+            str: The next line.
+        """
+        line = next(lines, None)
+        if line is None:
+            raise ValueError("Unexpected end of data.")
+        return line
+
+    @staticmethod
+    def _parse_corners(lines: Iterator[str]) -> List[Tuple[float, float, float]]:
+        """
+        Parses the three vertex lines of a single face into coordinates.
+
+        Args:
+            lines (Iterator[str]): Remaining lines.
+
+        Raises:
+            ValueError: If a vertex line is malformed or missing.
+
+        Returns:
+            List[Tuple[float, float, float]]: The face's corner coordinates.
+        """
+        corners: List[Tuple[float, float, float]] = []
+        for _ in range(3):
+            line = next(lines, None)
+            if line is None:
+                break
+            parts = line.split()
+            if parts[0] != "v":
+                raise ValueError(
+                    f"Expected line starting with 'v', got: {parts}")
+            corners.append((float(parts[1]), float(parts[2]), float(parts[3])))
+
+        if len(corners) != 3:
+            raise ValueError(f"Expected 3 vertices, got: {len(corners)}")
+
+        return corners
+
+    @staticmethod
+    def _has_vertex_layout(body: str, count: int) -> bool:
+        """
+        Checks that every line of a vertex block has exactly three spaces.
+
+        The spaces and newlines of the block must run space, space, space,
+        newline for each line, so no line can lend a coordinate to another.
+
+        Args:
+            body (str): The block's lines joined by newlines.
+            count (int): Number of lines in the block.
+
+        Returns:
+            bool: True if each line splits into exactly four tokens.
+        """
+        data = np.frombuffer(body.encode(), dtype=np.uint8)
+        separators = data[(data == ord(" ")) | (data == ord("\n"))]
+        return bool(separators.size == 4 * count - 1
+                    and np.all(separators[3::4] == ord("\n")))
+
+    @classmethod
+    def _parse_vertices(cls, block: List[str],
+                        num_faces: int) -> NDArray[np.float64]:
+        """
+        Parses the vertex lines of one mesh into an (F, 3, 3) array.
+
+        Blocks written as 'v x y z' with single spaces are converted in one
+        numpy call. Anything else, including every malformed block, goes
+        through the line parser so the error messages stay the same.
+
+        Args:
+            block (List[str]): The mesh's 3 * num_faces vertex lines.
+            num_faces (int): Number of faces in the mesh.
+
+        Raises:
+            ValueError: If a vertex line is malformed or missing.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (num_faces, 3, 3).
+        """
+        body = "\n".join(block)
+        count = len(block)
+        if (count == 3 * num_faces and body.startswith("v ")
+                and body.count("\nv ") == count - 1 and body.count("v") == count
+                and "\t" not in body and cls._has_vertex_layout(body, count)):
+            with warnings.catch_warnings():
+                # older numpy warns instead of raising on unparsable text
+                warnings.simplefilter("error", DeprecationWarning)
+                try:
+                    coords = np.fromstring(body.replace("v", " "), sep=" ")
+                except (ValueError, DeprecationWarning):
+                    coords = np.empty(0)
+            if coords.size == 9 * num_faces:
+                return coords.reshape(num_faces, 3, 3)
+
+        lines = iter(block)
+        corners = array('d')
+        for _ in range(num_faces):
+            for corner in cls._parse_corners(lines):
+                corners.extend(corner)
+        return np.frombuffer(corners, dtype=np.float64).reshape(num_faces, 3, 3)
+
+    @classmethod
+    def _parse_face(cls, lines: Iterator[str]) -> Face3D:
+        """
+        Parses the three vertex lines of a single face.
+
+        Args:
+            lines (Iterator[str]): Remaining lines.
+
+        Raises:
+            ValueError: If a vertex line is malformed or missing.
+
+        Returns:
+            Face3D: The parsed face.
+        """
+        return Face3D([Vertex(*corner) for corner in cls._parse_corners(lines)])
+
+    def _parse_header(self, lines: Iterator[str]) -> Tuple[Shader, int]:
+        """
+        Parses the RGB and face count lines that open a mesh block.
+
+        Args:
+            lines (Iterator[str]): Remaining lines.
+
+        Raises:
+            ValueError: If either line is malformed or missing.
+
+        Returns:
+            Tuple[Shader, int]: Mesh color and face count.
+        """
+        # Read RGB color
+        color_parts = list(map(int, self._next_line(lines).split()))
+        if len(color_parts) != 3:
+            raise ValueError(f"Expected 3 ints for RGB, got: {color_parts}")
+
+        # Read number of faces
+        return Shader(*color_parts), max(int(self._next_line(lines)), 0)
+
+    def _parse_mesh(self, lines: Iterator[str]) -> Mesh3D:
+        """
+        Parses one mesh block: RGB line, face count, then the face vertices.
+
+        The face count fixes how many vertex lines follow, so they are
+        taken as one block and converted together.
+
+        Args:
+            lines (Iterator[str]): Remaining lines.
+
+        Raises:
+            ValueError: If the block is malformed.
+
+        Returns:
+            Mesh3D: The parsed mesh, backed by its vertex array.
+        """
+        shader, num_faces = self._parse_header(lines)
+        block = list(islice(lines, 3 * num_faces))
+        return Mesh3D.from_buffer(self._parse_vertices(block, num_faces), shader)
+
+    def _parse_meshes(self, lines: Iterator[str]) -> Iterator[Mesh3D]:
+        """
+        Yields each mesh as soon as its faces have been parsed.
+
+        Args:
+            lines (Iterator[str]): Meaningful lines, starting at the mesh count.
+
+        Raises:
+            ValueError: If format errors exist.
+
+        Yields:
+            Mesh3D: The next parsed mesh.
+        """
+        num_meshes = int(self._next_line(lines))
+        for _ in range(num_meshes):
+            yield self._parse_mesh(lines)
 
     def make_list(self) -> List[Mesh3D]:
         """
@@ -63,62 +557,509 @@ class FileImport:
         if not self._data:
             raise ValueError("No data loaded.")
 
-        iterator = 0
-        num_meshes = int(self._data[iterator])
-        iterator += 1
+        return list(self._parse_meshes(iter(self._data)))
 
-        list_meshes: List[Mesh3D] = []
+    def index_file(self, filepath: str) -> List[MeshBlock]:
+        """
+        Finds the color, face count and vertex byte range of every mesh.
 
-        for _ in range(num_meshes):
-            # def the mesh
-            mesh: Mesh3D = Mesh3D([])
-            # Read RGB color
-            color_parts = list(map(int, self._data[iterator].split()))
-            if len(color_parts) != 3:
-                raise ValueError(f"Expected 3 ints for RGB, got: {color_parts}")
-            shader = Shader(*color_parts)
-            iterator += 1
-
-            # Read number of faces
-            num_faces = int(self._data[iterator])
-            iterator += 1
-
-            for _ in range(num_faces):
-                vertices: List[Vertex] = []
-                for _ in range(3):
-                    if iterator >= len(self._data):
-                        break
-                    parts = self._data[iterator].split()
-                    if parts[0] != "v":
-                        raise ValueError(
-                            f"Expected line starting with 'v', got: {parts}")
-                    vertices.append(Vertex(
-                        float(parts[1]), float(parts[2]), float(parts[3])
-                    ))
-                    iterator += 1
-
-                if len(vertices) != 3:
-                    raise ValueError(f"Expected 3 vertices, got: {len(vertices)}")
-
-                mesh.add(Face3D(vertices))
-
-            mesh.set_color(shader)
-            list_meshes.append(mesh)
-
-        return list_meshes
-
-    def read_file(self, filepath: str) -> List[Mesh3D]:
+        Only the count and RGB lines are parsed. The file is read in bounded
+        chunks and each vertex block is skipped by counting its 3 * N lines,
+        so the whole file is never held in memory.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Raises:
+            ValueError: If a count or RGB line is malformed or missing.
+
+        Returns:
+            List[MeshBlock]: One entry per mesh, in file order.
         """
-        Reads a file and creates a list of Mesh3D objects.
+        blocks: List[MeshBlock] = []
+        with self._opener(filepath)(filepath, 'rb') as file:
+            lines = _LineReader(file)
+            for _ in range(int(lines.next_line())):
+                color_parts = list(map(int, lines.next_line().split()))
+                if len(color_parts) != 3:
+                    raise ValueError(f"Expected 3 ints for RGB, got: {color_parts}")
+                num_faces = max(int(lines.next_line()), 0)
+                start = lines.offset
+                lines.skip(3 * num_faces)
+                blocks.append(MeshBlock(Shader(*color_parts), num_faces, start,
+                                        lines.offset))
+        return blocks
+
+    @classmethod
+    def _parse_block(cls, filepath: str, start: int, end: int,
+                     num_faces: int) -> NDArray[np.float64]:
+        """
+        Parses the vertex lines of one mesh into a compact array.
+
+        Runs in pool workers, so it reopens the file and returns plain
+        coordinates, which pickle far smaller than Vertex objects.
+
+        Args:
+            filepath (str): Path to the input file.
+            start (int): Byte offset of the mesh's first vertex line.
+            end (int): Byte offset just past its last vertex line.
+            num_faces (int): Number of faces in the mesh.
+
+        Raises:
+            ValueError: If a vertex line is malformed or missing.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (num_faces, 3, 3).
+        """
+        with cls._opener(filepath)(filepath, 'rb') as file:
+            file.seek(start)
+            text = file.read(end - start).decode('utf-8')
+        block = [stripped for stripped in map(str.strip, text.splitlines())
+                 if stripped and not stripped.startswith("#")]
+        return cls._parse_vertices(block, num_faces)
+
+    def read_parallel(self, filepath: str,
+                      workers: int | None = None) -> List[Mesh3D]:
+        """
+        Parses the meshes of a text asset in a pool of worker processes.
+
+        A first pass indexes each mesh's vertex lines by byte range; each
+        range is then parsed by a worker and the results are wrapped as
+        buffer-backed meshes in file order.
 
         Args:
             filepath (str): Path to the input file.
+            workers (int | None, optional): Process count. Defaults to the
+                workers property.
+
+        Raises:
+            ValueError: If format errors exist.
 
         Returns:
             List[Mesh3D]: List of parsed meshes.
         """
-        self.read_data(filepath)
-        return self.make_list()
+        with ProcessPoolExecutor(max_workers=workers or self._workers) as pool:
+            return self._parse_indexed(filepath, pool)
+
+    def _parse_indexed(self, filepath: str, pool: Executor | None) -> List[Mesh3D]:
+        """
+        Indexes a text asset and parses its mesh blocks.
+
+        Args:
+            filepath (str): Path to the input file.
+            pool (Executor | None): Pool to parse blocks in, or None to
+                parse them in the calling thread.
+
+        Raises:
+            ValueError: If format errors exist.
+
+        Returns:
+            List[Mesh3D]: List of parsed meshes, in file order.
+        """
+        blocks = self.index_file(filepath)
+        columns = (repeat(filepath), [block.start for block in blocks],
+                   [block.end for block in blocks],
+                   [block.num_faces for block in blocks])
+        arrays = pool.map(self._parse_block, *columns) if pool is not None \
+            else map(self._parse_block, *columns)
+        return [Mesh3D.from_buffer(positions, block.color)
+                for positions, block in zip(arrays, blocks)]
+
+    def read_files(self, filepaths: List[str], weld: bool = False) -> List[Mesh3D]:
+        """
+        Loads several files concurrently and merges their meshes.
+
+        Each file is read in its own thread, so disk reads and
+        decompression overlap. With more than one worker, the CPU-bound
+        block parsing of text assets is sent to one shared process pool.
+
+        Args:
+            filepaths (List[str]): Paths to the input files.
+            weld (bool, optional): If True, identical vertices are merged and
+                each mesh is returned as an IndexedMesh3D. Defaults to False.
+
+        Raises:
+            ValueError: If format errors exist in any file.
+
+        Returns:
+            List[Mesh3D]: Meshes of every file, in the order of filepaths.
+        """
+        if not filepaths:
+            return []
+        pool = ProcessPoolExecutor(self._workers) if self._workers > 1 else None
+        try:
+            threads = min(len(filepaths), self.MAX_IO_THREADS)
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                loaded = list(executor.map(
+                    lambda path: list(self._load(path, False, pool)), filepaths))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        meshes = [mesh for file_meshes in loaded for mesh in file_meshes]
+        if weld:
+            meshes = [IndexedMesh3D.weld(mesh) for mesh in meshes]
+        return [self._apply_precision(mesh) for mesh in meshes]
+
+    def read_lazy(self, filepath: str,
+                  bounds: List[List[List[float]] | None] | None = None
+                  ) -> List[Mesh3D]:
+        """
+        Opens a text asset as proxies that parse their vertices on demand.
+
+        Only the header index is read up front. Each LazyMesh3D knows its
+        color and face count, and parses its own byte range on first
+        access to positions or faces. Given each mesh's bounds, as listed
+        in the asset manifest, proxies outside the view are culled unloaded.
+
+        Args:
+            filepath (str): Path to the input file.
+            bounds (List[List[List[float]] | None] | None, optional): Per
+                mesh [[min x, y, z], [max x, y, z]] boxes, in file order.
+
+        Raises:
+            ValueError: If a count or RGB line is malformed, or bounds are
+                not given for every mesh.
+
+        Returns:
+            List[Mesh3D]: One unloaded proxy per mesh, in file order.
+        """
+        blocks = self.index_file(filepath)
+        if bounds is not None and len(bounds) != len(blocks):
+            raise ValueError(f"Expected bounds for {len(blocks)} meshes, "
+                             f"got {len(bounds)}.")
+        boxes = bounds if bounds is not None else [None] * len(blocks)
+        return [LazyMesh3D(partial(self._parse_block, filepath, block.start,
+                                   block.end, block.num_faces),
+                           block.num_faces, block.color, box)
+                for block, box in zip(blocks, boxes)]
+
+    def make_wavefront(self, lines: Iterator[str],
+                       base_dir: str = ".") -> List[Mesh3D]:
+        """
+        Creates meshes from standard Wavefront OBJ records.
+
+        Each 'o'/'g' group and 'usemtl' material becomes one IndexedMesh3D,
+        and polygons are fan-triangulated.
+
+        Args:
+            lines (Iterator[str]): Stripped, non-comment OBJ lines.
+            base_dir (str, optional): Directory 'mtllib' paths are relative to.
+
+        Raises:
+            ValueError: If a record is malformed.
+
+        Returns:
+            List[Mesh3D]: List of parsed meshes.
+        """
+        return list(WavefrontParser(base_dir).parse(lines))
+
+    def read_wavefront(self, filepath: str) -> List[Mesh3D]:
+        """
+        Reads a standard Wavefront OBJ file in a single streamed pass.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Raises:
+            ValueError: If a record is malformed.
+
+        Returns:
+            List[Mesh3D]: List of parsed meshes.
+        """
+        return self.make_wavefront(self._iter_lines(filepath),
+                                   os.path.dirname(filepath))
+
+    def is_wavefront(self, filepath: str) -> bool:
+        """
+        Checks whether a text file holds standard OBJ records rather than
+        this project's mesh-count format, which always starts with a number.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Returns:
+            bool: True if the first meaningful line is not a mesh count.
+        """
+        lines = self._iter_lines(filepath)
+        first = next(lines, "")
+        lines.close()
+        return bool(first) and not first.split()[0].isdigit()
+
+    def iter_file(self, filepath: str) -> Iterator[Mesh3D]:
+        """
+        Streams meshes from a file without buffering its lines.
+
+        Each Mesh3D is yielded as soon as its faces are read, and only
+        the current line is held in memory.
+
+        Args:
+            filepath (str): Path to the input file.
+
+        Raises:
+            ValueError: If format errors exist.
+
+        Yields:
+            Mesh3D: The next parsed mesh.
+        """
+        yield from self._parse_meshes(self._iter_lines(filepath))
+
+    def iter_chunks(self, filepath: str,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Mesh3D]:
+        """
+        Streams a file as buffer-backed meshes of at most chunk_size faces.
+
+        Text assets in this project's format are read line by line and
+        converted a chunk at a time, so only one chunk's lines and
+        coordinates are held at once. Compiled files and binary scans are
+        mapped and sliced without copying. Wavefront OBJ files are parsed
+        whole and yielded one mesh at a time.
+
+        Args:
+            filepath (str): Path to the input file.
+            chunk_size (int, optional): Largest face count per chunk.
+
+        Raises:
+            ValueError: If chunk_size is not positive or format errors exist.
+
+        Yields:
+            Mesh3D: The next chunk, colored with its source mesh's shader,
+                two-sided as its whole source mesh is and stored at the
+                configured precision.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        sides = self._manifest.part_sides(filepath) if self._manifest is not None \
+            else None
+        return map(self._apply_precision,
+                   self._iter_source_chunks(filepath, chunk_size, sides))
+
+    def _iter_source_chunks(self, filepath: str, chunk_size: int,
+                            sides: List[bool] | None = None) -> Iterator[Mesh3D]:
+        """
+        Streams a file as full-precision chunks with the reader for its format.
+
+        A chunk is rarely closed on its own, so whether back faces are
+        culled is decided once per source mesh: from sides when given,
+        else from the whole mesh when it is mapped or parsed at once.
+        Text chunks with no recorded side are drawn two-sided.
+
+        Args:
+            filepath (str): Path to the input file.
+            chunk_size (int): Largest face count per chunk.
+            sides (List[bool] | None, optional): two_sided of each source
+                mesh in file order, as recorded by an AssetManifest.
+
+        Raises:
+            ValueError: If format errors exist.
+
+        Yields:
+            Mesh3D: The next chunk, colored with its source mesh's shader.
+        """
+        extension = os.path.splitext(filepath)[1].lower()
+        mapped: List[Mesh3D] | Iterator[Mesh3D] | None = None
+        if extension in (".stl", ".ply"):
+            mapped = self._read_source(filepath, False)
+        elif MeshCache.is_compiled(filepath):
+            mapped = MeshCache.map_compiled(filepath)
+        elif self.is_wavefront(filepath):
+            mapped = self.read_wavefront(filepath)
+        else:
+            yield from self._iter_text_chunks(filepath, chunk_size, sides)
+        for index, mesh in enumerate(mapped or []):
+            two_sided = sides[index] if sides is not None and index < len(sides) \
+                else mesh.two_sided
+            yield from self._split_mesh(mesh, chunk_size, two_sided)
+
+    def _iter_text_chunks(self, filepath: str, chunk_size: int,
+                          sides: List[bool] | None = None) -> Iterator[Mesh3D]:
+        """
+        Streams a text asset in this project's format chunk by chunk.
+
+        Args:
+            filepath (str): Path to the input file.
+            chunk_size (int): Largest face count per chunk.
+            sides (List[bool] | None, optional): two_sided of each mesh in
+                file order; meshes without one are drawn two-sided.
+
+        Raises:
+            ValueError: If format errors exist.
+
+        Yields:
+            Mesh3D: The next chunk, colored with its source mesh's shader.
+        """
+        lines = self._iter_lines(filepath)
+        for index in range(int(self._next_line(lines))):
+            shader, num_faces = self._parse_header(lines)
+            two_sided = sides[index] if sides is not None and index < len(sides) \
+                else True
+            for first in range(0, num_faces, chunk_size):
+                count = min(chunk_size, num_faces - first)
+                block = list(islice(lines, 3 * count))
+                chunk = Mesh3D.from_buffer(self._parse_vertices(block, count), shader)
+                chunk.two_sided = two_sided
+                yield chunk
+
+    @staticmethod
+    def _split_mesh(mesh: Mesh3D, chunk_size: int,
+                    two_sided: bool | None = None) -> Iterator[Mesh3D]:
+        """
+        Slices a buffer-backed mesh into views of at most chunk_size faces.
+
+        Args:
+            mesh (Mesh3D): Mesh to split.
+            chunk_size (int): Largest face count per chunk.
+            two_sided (bool | None, optional): two_sided of every chunk;
+                None leaves each chunk to decide for itself.
+
+        Yields:
+            Mesh3D: The next chunk; meshes without a buffer are yielded whole.
+        """
+        positions = mesh.positions
+        if positions is None:
+            mesh.two_sided = two_sided
+            yield mesh
+            return
+        for first in range(0, len(positions), chunk_size):
+            chunk = Mesh3D.from_buffer(positions[first:first + chunk_size],
+                                       mesh.base_shader)
+            chunk.two_sided = two_sided
+            yield chunk
+
+    def map_file(self, filepath: str) -> List[Mesh3D]:
+        """
+        Opens meshes as zero-copy views over a memory-mapped compiled file.
+
+        A text asset is first compiled through the cache (a default
+        MeshCache if none is set), so later calls map it straight away.
+
+        Args:
+            filepath (str): Path to a compiled file or a text asset.
+
+        Raises:
+            ValueError: If format errors exist.
+
+        Returns:
+            List[Mesh3D]: Meshes whose positions are read-only mapped views.
+        """
+        if MeshCache.is_compiled(filepath):
+            return MeshCache.map_compiled(filepath)
+        cache = self._cache if self._cache is not None else MeshCache()
+        compiled = cache.lookup(filepath)
+        if compiled is None:
+            compiled = cache.store(filepath, list(self.iter_file(filepath)))
+        return MeshCache.map_compiled(compiled)
+
+    @overload
+    def read_file(self, filepath: str, stream: Literal[False] = False,
+                  weld: bool = False) -> List[Mesh3D]: ...
+
+    @overload
+    def read_file(self, filepath: str, stream: Literal[True],
+                  weld: bool = False) -> Iterator[Mesh3D]: ...
+
+    def read_file(self, filepath: str, stream: bool = False,
+                  weld: bool = False) -> List[Mesh3D] | Iterator[Mesh3D]:
+        """
+        Reads a file and creates a list of Mesh3D objects.
+
+        Standard Wavefront OBJ files are detected and read with
+        read_wavefront, and binary '.stl'/'.ply' scans are mapped with
+        BinaryImport. With more than one worker, mesh blocks are parsed
+        in parallel by read_parallel. The raw lines are released once the
+        meshes are built. When a cache is set, a compiled copy is loaded
+        instead of parsing the text, and a fresh parse is compiled for the
+        next load.
+
+        Args:
+            filepath (str): Path to the input file.
+            stream (bool, optional): If True, returns a lazy iterator that
+                parses the file line by line instead. Defaults to False.
+            weld (bool, optional): If True, identical vertices are merged and
+                each mesh is returned as an IndexedMesh3D. Defaults to False.
+
+        Returns:
+            List[Mesh3D] | Iterator[Mesh3D]: Parsed meshes.
+        """
+        meshes = self._load(filepath, stream)
+        if weld:
+            meshes = map(IndexedMesh3D.weld, meshes)
+        elif self._precision == "float64":
+            return meshes
+        converted = map(self._apply_precision, meshes)
+        return converted if stream else list(converted)
+
+    def _load(self, filepath: str, stream: bool,
+              pool: Executor | None = None) -> List[Mesh3D] | Iterator[Mesh3D]:
+        """
+        Loads meshes from a precompiled file, the cache, or by parsing the text file.
+
+        A source's precompiled file is used while the manifest says the
+        source is unchanged since it was compiled.
+
+        Args:
+            filepath (str): Path to the input file.
+            stream (bool): If True, returns a lazy iterator.
+            pool (Executor | None, optional): Shared pool for parsing text
+                mesh blocks, as used by read_files.
+
+        Returns:
+            List[Mesh3D] | Iterator[Mesh3D]: Parsed meshes.
+        """
+        compiled = self._manifest.compiled_file(filepath) \
+            if self._manifest is not None else None
+        if compiled is None and self._cache is not None:
+            compiled = self._cache.lookup(filepath)
+        if compiled is not None:
+            cached = MeshCache.iter_compiled(compiled)
+            return cached if stream else list(cached)
+        meshes = self._read_source(filepath, stream, pool)
+        if not isinstance(meshes, list):
+            return meshes
+        if self._cache is not None:
+            try:
+                self._cache.store(filepath, meshes)
+            except OSError:
+                pass  # an unwritable cache only costs the next load a re-parse
+        return iter(meshes) if stream else meshes
+
+    def _read_source(self, filepath: str, stream: bool,
+                     pool: Executor | None = None) -> List[Mesh3D] | Iterator[Mesh3D]:
+        """
+        Parses a source asset with the reader matching its format.
+
+        Holds no state on the singleton, so several files may be parsed
+        from different threads at once.
+
+        Args:
+            filepath (str): Path to the input file.
+            stream (bool): If True, this project's text format is parsed
+                lazily and an iterator is returned.
+            pool (Executor | None, optional): Shared pool for parsing text
+                mesh blocks.
+
+        Returns:
+            List[Mesh3D] | Iterator[Mesh3D]: Parsed meshes.
+        """
+        extension = os.path.splitext(filepath)[1].lower()
+        if extension in (".stl", ".ply"):
+            reader = BinaryImport.read_stl if extension == ".stl" \
+                else BinaryImport.read_ply
+            return reader(filepath, None)
+        if extension == MeshCache.EXTENSION and MeshCache.is_compiled(filepath):
+            # pre-baked by Precompiler or copied out of a cache directory
+            return MeshCache.iter_compiled(filepath) if stream \
+                else MeshCache.map_compiled(filepath)
+        if self.is_wavefront(filepath):
+            return self.read_wavefront(filepath)
+        if stream:
+            return self.iter_file(filepath)
+        if self.compression(filepath) is None:
+            # block offsets only index plain files; compressed ones stream
+            if pool is not None:
+                return self._parse_indexed(filepath, pool)
+            if self._workers > 1:
+                return self.read_parallel(filepath)
+        return list(self._parse_meshes(self._iter_lines(filepath)))
 
     def get_data(self) -> List[str]:
         """
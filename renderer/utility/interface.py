@@ -14,6 +14,7 @@ import tkinter as tk
 from tkinter import messagebox
 import os
 from typing import Any
+from utility.manifest import AssetManifest
 
 
 class Interface:
@@ -25,8 +26,9 @@ class Interface:
         self._root.title("3D Engine - Load Scene")
         self._root.configure(bg="#f0f0f0")
         self._result: dict[str, Any] = {}
+        self._asset_names: list[str] = []
         self._setup_widgets()
-        self._center_window(400, 580)
+        self._center_window(400, 720)
 
     def _on_enter(self, event: tk.Event[Any]) -> None:
         """Handles mouse hover event on the Render button.
@@ -48,16 +50,37 @@ class Interface:
         """
         event.widget.config(bg="#1E90FF")
 
+    def _on_asset_select(self, event: tk.Event[Any]) -> None:
+        """Copies the asset chosen in the list into the file path field.
+
+        Args:
+            event (tk.Event[Any]): Tkinter selection event of the asset list.
+        """
+        selection = event.widget.curselection()
+        if selection:
+            self._entry_filepath.delete(0, tk.END)
+            self._entry_filepath.insert(0, self._asset_names[selection[0]])
+            self._entry_filepath.config(fg="black")
+
     def _setup_widgets(self) -> None:
         """Sets up all entry fields, labels, and the render button."""
         padding: dict[str, Any] = {'padx': 10, 'pady': 5}
 
-        tk.Label(self._root, text="Enter file path:",
+        tk.Label(self._root, text="Enter file path(s), separated by ';':",
                  bg="#f0f0f0").pack(**padding)
         self._entry_filepath = tk.Entry(self._root, width=50)
         self._add_placeholder(self._entry_filepath, "demo.obj")
         self._entry_filepath.pack(**padding)
 
+        tk.Label(self._root, text="Available assets:",
+                 bg="#f0f0f0").pack(**padding)
+        self._asset_list = tk.Listbox(self._root, width=50, height=6)
+        for name, summary in AssetManifest("assets").listing():
+            self._asset_names.append(name)
+            self._asset_list.insert(tk.END, f"{name} ({summary})")
+        self._asset_list.bind("<<ListboxSelect>>", self._on_asset_select)
+        self._asset_list.pack(**padding)
+
         tk.Label(self._root, text="Camera origin (x y z):",
                  bg="#f0f0f0").pack(**padding)
         self._entry_cam_origin = tk.Entry(self._root, width=50)
@@ -192,7 +215,9 @@ class Interface:
     def _collect_input(self) -> None:
         """Collects input from user, validates it, and stores in _result."""
         try:
-            filepath = self._resolve_filepath(self._entry_filepath.get())
+            filepaths = [self._resolve_filepath(path.strip())
+                         for path in self._entry_filepath.get().split(";")]
+            filepath = filepaths[0] if len(filepaths) == 1 else filepaths
             cam_origin = self._parse_vector(self._entry_cam_origin.get(),
                                             3, "Camera origin")
             look_at = self._parse_vector(self._entry_look_at.get(),
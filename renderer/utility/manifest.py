@@ -0,0 +1,497 @@
+"""AssetManifest class to index an asset directory without loading its meshes."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import json
+import math
+import os
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from geometry import IndexedMesh3D, Mesh3D
+from utility.fileimport import FileImport
+from utility.meshcache import MeshCache
+
+Bounds = List[List[float]]
+
+
+class AssetManifest:
+    """A persistent JSON index of the mesh assets in a directory.
+
+    Each entry is keyed by the asset's path relative to the directory and
+    records the file fingerprint (size and modification time), the mesh
+    and face counts, the bounding box and a suggested camera pose. An
+    entry is only trusted while the fingerprint still matches, and update
+    re-parses just the files whose fingerprint changed.
+    """
+
+    MANIFEST_VERSION: int = 2
+    DEFAULT_DIR: str = ".compiled"
+    MANIFEST_NAME: str = "manifest.json"
+    SOURCE_EXTENSIONS: Tuple[str, ...] = (".obj", ".stl", ".ply")
+    COMPRESSED_EXTENSIONS: Tuple[str, ...] = (".gz", ".bz2", ".xz")
+    VIEW_DIRECTION: Tuple[float, float, float] = (-0.7, -1.0, 1.0)
+    FRAMING_SLOPE: float = 1.5
+
+    def __init__(self, asset_dir: str, path: str | None = None) -> None:
+        """Constructor
+
+        Loads the stored manifest if it exists and has the current version.
+
+        Args:
+            asset_dir (str): Directory holding the assets.
+            path (str | None, optional): Manifest file. Defaults to
+                '.compiled/manifest.json' inside asset_dir.
+        """
+        self._asset_dir: str = asset_dir
+        self._path: str = path if path is not None \
+            else os.path.join(asset_dir, self.DEFAULT_DIR, self.MANIFEST_NAME)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    @property
+    def asset_dir(self) -> str:
+        """Gets the indexed directory.
+
+        Returns:
+            str: Asset directory.
+        """
+        return self._asset_dir
+
+    @property
+    def path(self) -> str:
+        """Gets the manifest file path.
+
+        Returns:
+            str: Path of the JSON file.
+        """
+        return self._path
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Gets the stored entries, including stale ones.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Entries keyed by relative path.
+        """
+        return self._entries
+
+    @classmethod
+    def is_source(cls, filename: str) -> bool:
+        """Checks whether a file name looks like a loadable mesh asset.
+
+        Args:
+            filename (str): File name or path.
+
+        Returns:
+            bool: True for .obj, .stl and .ply files, optionally compressed.
+        """
+        root, extension = os.path.splitext(filename.lower())
+        if extension in cls.COMPRESSED_EXTENSIONS:
+            extension = os.path.splitext(root)[1]
+        return extension in cls.SOURCE_EXTENSIONS
+
+    def find_sources(self) -> List[str]:
+        """Lists the assets under the asset directory.
+
+        Hidden directories, including the default output directory, are
+        skipped.
+
+        Returns:
+            List[str]: Sorted '/'-separated paths relative to the directory.
+        """
+        sources: List[str] = []
+        for root, dirs, files in os.walk(self._asset_dir):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            sources.extend(self.name_for(os.path.join(root, name))
+                           for name in files if self.is_source(name))
+        return sorted(sources)
+
+    def is_listed(self, name: str) -> bool:
+        """Checks whether a key names an asset find_sources would list.
+
+        Only the named file is looked at, so the directory is not walked.
+
+        Args:
+            name (str): Manifest key.
+
+        Returns:
+            bool: True for an existing asset file inside the directory
+                and outside hidden subdirectories.
+        """
+        folders, filename = name.split("/")[:-1], name.split("/")[-1]
+        return not any(folder.startswith(".") for folder in folders) \
+            and self.is_source(filename) and os.path.isfile(self.source_path(name))
+
+    def name_for(self, filepath: str) -> str:
+        """Gets the manifest key of an asset path.
+
+        Args:
+            filepath (str): Path to the asset.
+
+        Returns:
+            str: '/'-separated path relative to the asset directory.
+        """
+        return os.path.relpath(filepath, self._asset_dir).replace(os.sep, "/")
+
+    def source_path(self, name: str) -> str:
+        """Gets the file path of a manifest key.
+
+        Args:
+            name (str): Manifest key.
+
+        Returns:
+            str: Path to the asset.
+        """
+        return os.path.join(self._asset_dir, *name.split("/"))
+
+    @staticmethod
+    def fingerprint(filepath: str) -> List[int]:
+        """Gets the size and modification time of a file.
+
+        Args:
+            filepath (str): Path to the file.
+
+        Returns:
+            List[int]: [size in bytes, mtime in nanoseconds].
+        """
+        stat = os.stat(filepath)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def is_fresh(self, name: str, compiled: bool = False) -> bool:
+        """Checks whether an entry still describes its file.
+
+        Args:
+            name (str): Manifest key.
+            compiled (bool, optional): If True, the entry must also have
+                its compiled file on disk, or record why the asset failed.
+
+        Returns:
+            bool: True if the entry exists and the file is unchanged.
+        """
+        path = self.source_path(name)
+        if name not in self._entries or not os.path.isfile(path) \
+                or self._entries[name].get("fingerprint") != self.fingerprint(path):
+            return False
+        entry = self._entries[name]
+        return not compiled or "error" in entry \
+            or self._compiled_path(entry) is not None
+
+    def _compiled_path(self, entry: Dict[str, Any]) -> str | None:
+        """Gets the compiled file an entry records, if it exists.
+
+        Args:
+            entry (Dict[str, Any]): Manifest entry.
+
+        Returns:
+            str | None: Path of the .rmc file next to the manifest, or None.
+        """
+        if "compiled" not in entry:
+            return None
+        compiled = os.path.join(os.path.dirname(self._path),
+                                *entry["compiled"].split("/"))
+        return compiled if os.path.isfile(compiled) else None
+
+    def get(self, filepath: str) -> Dict[str, Any] | None:
+        """Gets the entry of an asset if it is up to date.
+
+        Args:
+            filepath (str): Path to the asset.
+
+        Returns:
+            Dict[str, Any] | None: The entry, or None if the asset is
+                unindexed, changed, outside the directory or failed to parse.
+        """
+        name = self.name_for(filepath)
+        if name.startswith("../") or not self.is_fresh(name):
+            return None
+        entry = self._entries[name]
+        return None if "error" in entry else entry
+
+    def compiled_file(self, filepath: str) -> str | None:
+        """Finds the precompiled binary of an asset if it is up to date.
+
+        Args:
+            filepath (str): Path to the asset.
+
+        Returns:
+            str | None: Path of the asset's .rmc file next to the manifest,
+                or None if the asset changed, was never compiled or its
+                compiled file is missing.
+        """
+        entry = self.get(filepath)
+        return None if entry is None else self._compiled_path(entry)
+
+    def part_bounds(self, filepath: str) -> List[Bounds | None] | None:
+        """Gets the bounds of each mesh of an asset without parsing it.
+
+        Args:
+            filepath (str): Path to the asset.
+
+        Returns:
+            List[Bounds | None] | None: Per-mesh boxes in file order, or
+                None if the asset has no up-to-date entry.
+        """
+        entry = self.get(filepath)
+        return None if entry is None else [part["bounds"] for part in entry["parts"]]
+
+    def part_sides(self, filepath: str) -> List[bool] | None:
+        """Gets whether each mesh of an asset is two-sided, without parsing it.
+
+        The answer is decided over each whole mesh when it is indexed, so
+        chunks streamed from it can be back-face culled consistently.
+
+        Args:
+            filepath (str): Path to the asset.
+
+        Returns:
+            List[bool] | None: Per-mesh two_sided in file order, or None if
+                the asset has no up-to-date entry.
+        """
+        entry = self.get(filepath)
+        if entry is None:
+            return None
+        return [not part["closed"] for part in entry["parts"]]
+
+    def combined(self, filepaths: List[str]) -> Dict[str, Any] | None:
+        """Merges the entries of several assets loaded as one scene.
+
+        Args:
+            filepaths (List[str]): Paths to the assets.
+
+        Returns:
+            Dict[str, Any] | None: Total mesh and face counts, the union of
+                the bounds and a camera framing it, or None if any asset
+                has no up-to-date entry.
+        """
+        entries = [self.get(path) for path in filepaths]
+        known = [entry for entry in entries if entry is not None]
+        if len(known) != len(entries):
+            return None
+        bounds = self.union([entry["bounds"] for entry in known])
+        return {"meshes": sum(entry["meshes"] for entry in known),
+                "faces": sum(entry["faces"] for entry in known),
+                "bounds": bounds, "camera": self.suggest_camera(bounds)}
+
+    @staticmethod
+    def union(boxes: List[Bounds | None]) -> Bounds | None:
+        """Gets the box enclosing several bounding boxes.
+
+        Args:
+            boxes (List[Bounds | None]): Boxes as [[min x, y, z], [max x, y, z]];
+                None entries (empty meshes) are ignored.
+
+        Returns:
+            Bounds | None: Enclosing box, or None if no box is given.
+        """
+        known = [box for box in boxes if box is not None]
+        if not known:
+            return None
+        return [[min(box[0][i] for box in known) for i in range(3)],
+                [max(box[1][i] for box in known) for i in range(3)]]
+
+    @staticmethod
+    def mesh_stats(mesh: IndexedMesh3D) -> Dict[str, Any]:
+        """Summarizes one welded mesh.
+
+        Args:
+            mesh (IndexedMesh3D): Mesh to describe.
+
+        Returns:
+            Dict[str, Any]: Color, vertex and face counts, whether the
+                mesh is closed, and bounds as [[min x, y, z], [max x, y, z]],
+                or None for an empty mesh.
+        """
+        vertices, indices = MeshCache.indexed_arrays(mesh)
+        bounds = [vertices.min(axis=0).tolist(), vertices.max(axis=0).tolist()] \
+            if len(vertices) else None
+        color = mesh.base_shader.rgb if mesh.base_shader is not None else (0, 0, 0)
+        return {"color": list(color), "vertices": len(vertices),
+                "faces": len(indices), "closed": mesh.is_closed, "bounds": bounds}
+
+    @classmethod
+    def suggest_camera(cls, bounds: Bounds | None) -> Dict[str, List[float]] | None:
+        """Suggests a camera pose that frames a bounding box.
+
+        The camera looks at the box center along VIEW_DIRECTION (the
+        interface's default view), far enough back that the bounding
+        sphere fits the default 4:3 view at focal length 1.
+
+        Args:
+            bounds (Bounds | None): [[min x, y, z], [max x, y, z]].
+
+        Returns:
+            Dict[str, List[float]] | None: 'origin' and 'look_at'
+                coordinates, or None without bounds.
+        """
+        if bounds is None:
+            return None
+        center = [(low + high) / 2 for low, high in zip(*bounds)]
+        radius = math.dist(bounds[0], bounds[1]) / 2
+        distance = radius * math.sqrt(1 + 1 / cls.FRAMING_SLOPE ** 2) if radius else 1.0
+        length = math.hypot(*cls.VIEW_DIRECTION)
+        origin = [c + d / length * distance for c, d in zip(center, cls.VIEW_DIRECTION)]
+        return {"origin": [round(v, 6) for v in origin],
+                "look_at": [round(v, 6) for v in center]}
+
+    @classmethod
+    def describe(cls, meshes: List[Mesh3D]) -> Dict[str, Any]:
+        """Builds the manifest fields for the meshes of one asset.
+
+        Args:
+            meshes (List[Mesh3D]): Meshes parsed from the asset.
+
+        Returns:
+            Dict[str, Any]: Mesh and face counts, overall bounds, a
+                suggested camera and per-mesh stats under 'parts'.
+        """
+        parts = [cls.mesh_stats(IndexedMesh3D.weld(mesh)) for mesh in meshes]
+        bounds = cls.union([part["bounds"] for part in parts])
+        return {"meshes": len(parts), "faces": sum(part["faces"] for part in parts),
+                "bounds": bounds, "camera": cls.suggest_camera(bounds), "parts": parts}
+
+    @classmethod
+    def survey(cls, chunks: Iterable[Mesh3D]) -> Dict[str, Any]:
+        """Counts and bounds streamed chunks without keeping them.
+
+        Only one chunk is held at a time, so a scene too large to load can
+        be measured before deciding how to draw it. Nothing is stored: the
+        source meshes are never welded, so per-mesh stats are unknown.
+
+        Args:
+            chunks (Iterable[Mesh3D]): Chunks, as from FileImport.iter_chunks.
+
+        Returns:
+            Dict[str, Any]: Face count, bounds and a suggested camera, as
+                in combined.
+        """
+        faces = 0
+        bounds: Bounds | None = None
+        for chunk in chunks:
+            if chunk.num_faces:
+                lower, upper = chunk.bounds
+                faces += chunk.num_faces
+                bounds = cls.union([bounds, [lower.tolist(), upper.tolist()]])
+        return {"faces": faces, "bounds": bounds, "camera": cls.suggest_camera(bounds)}
+
+    def set_entry(self, name: str, entry: Dict[str, Any]) -> None:
+        """Stores an entry, stamping it with the file's current fingerprint.
+
+        Args:
+            name (str): Manifest key.
+            entry (Dict[str, Any]): Fields describing the asset.
+        """
+        entry["fingerprint"] = self.fingerprint(self.source_path(name))
+        self._entries[name] = entry
+
+    def refresh(self, name: str, importer: FileImport | None = None) -> Dict[str, Any]:
+        """Parses one asset and stores its entry.
+
+        Args:
+            name (str): Manifest key.
+            importer (FileImport | None, optional): Configured importer to
+                parse with, so its cache keeps the parsed meshes.
+
+        Returns:
+            Dict[str, Any]: The new entry, with an 'error' message if the
+                asset could not be parsed.
+        """
+        reader = importer if importer is not None else FileImport()
+        try:
+            entry = self.describe(reader.read_file(self.source_path(name)))
+        except ValueError as error:
+            entry = {"error": str(error)}
+        self.set_entry(name, entry)
+        return entry
+
+    def forget(self, name: str) -> None:
+        """Drops an entry and deletes its compiled file, if any.
+
+        Args:
+            name (str): Manifest key.
+        """
+        compiled = self._compiled_path(self._entries.pop(name))
+        if compiled is not None:
+            os.remove(compiled)
+
+    def update(self, names: List[str] | None = None, force: bool = False,
+               compiler: Callable[[List[str]], List[Dict[str, Any]]] | None = None,
+               importer: FileImport | None = None) -> List[str]:
+        """Re-indexes changed and new assets and forgets deleted ones.
+
+        Unchanged files are not opened, and named updates do not walk the
+        directory. Stale assets are parsed one at a time by refresh, or all
+        handed to compiler, which returns their entries; with a compiler,
+        an asset also stays stale until its compiled file exists. The
+        manifest is saved if anything changed.
+
+        Args:
+            names (List[str] | None, optional): Keys to check. Defaults to
+                every asset in the directory, in which case deleted assets
+                are forgotten as well.
+            force (bool, optional): If True, every checked asset is re-indexed.
+            compiler (Callable[[List[str]], List[Dict[str, Any]]] | None,
+                optional): Builds the entries of the stale keys.
+            importer (FileImport | None, optional): Importer refresh parses with.
+
+        Returns:
+            List[str]: Keys of the assets that were re-indexed.
+        """
+        if names is None:
+            checked = self.find_sources()
+            removed = set(self._entries) - set(checked)
+        else:
+            checked = [name for name in names if self.is_listed(name)]
+            removed = set()
+        stale = [name for name in checked
+                 if force or not self.is_fresh(name, compiled=compiler is not None)]
+        for name in removed:
+            self.forget(name)
+        if compiler is not None:
+            for name, entry in zip(stale, compiler(stale)):
+                self.set_entry(name, entry)
+        else:
+            for name in stale:
+                self.refresh(name, importer)
+        if stale or removed:
+            self.save()
+        return stale
+
+    def listing(self) -> List[Tuple[str, str]]:
+        """Describes every asset in the directory without parsing any.
+
+        Returns:
+            List[Tuple[str, str]]: Each asset's key and a summary of its
+                counts, or a note that it is not indexed yet.
+        """
+        rows = []
+        for name in self.find_sources():
+            entry = self.get(self.source_path(name))
+            summary = "not indexed" if entry is None \
+                else f"{entry['faces']} faces, {entry['meshes']} meshes"
+            rows.append((name, summary))
+        return rows
+
+    def load(self) -> None:
+        """Reads the stored manifest, starting empty if it is missing or outdated."""
+        self._entries = {}
+        try:
+            with open(self._path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.MANIFEST_VERSION:
+            self._entries = data.get("assets", {})
+
+    def save(self) -> None:
+        """Writes the manifest atomically."""
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        partial = f"{self._path}.{os.getpid()}.tmp"
+        with open(partial, 'w', encoding='utf-8') as file:
+            json.dump({"version": self.MANIFEST_VERSION, "assets": self._entries},
+                      file, indent=2)
+        os.replace(partial, self._path)
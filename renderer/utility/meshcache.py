@@ -0,0 +1,512 @@
+"""MeshCache class to store parsed meshes in a compact binary form."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from geometry import IndexedMesh3D, Mesh3D, MeshBuffer, Shader
+
+
+class MeshCache:
+    """A disk cache of compiled meshes keyed by the source file's content hash.
+
+    Each compiled file starts with a fixed header, then one table entry
+    (RGB and face count) per mesh, then every vertex coordinate as a flat
+    little-endian float64 array, nine values per face, in file order.
+    The header and table entries are 16 bytes each, so the coordinate
+    block is 8-byte aligned and can be mapped straight into arrays.
+
+    Indexed files (version 2) store welded meshes instead: each table entry
+    holds RGB, vertex count and face count, and each mesh's block is its
+    float64 vertex pool, its uint32 index triples (padded to 8 bytes), and
+    one float64 unit normal per face, which mapped meshes use for their face
+    planes.
+    """
+
+    MAGIC: bytes = b"RMSH"
+    FORMAT_VERSION: int = 1
+    EXTENSION: str = ".rmc"
+    COORD_DTYPE: np.dtype[np.float64] = np.dtype("<f8")
+    HEADER: struct.Struct = struct.Struct("<4sII4x")
+    MESH_ENTRY: struct.Struct = struct.Struct("<3B5xQ")
+    INDEXED_VERSION: int = 2
+    INDEXED_ENTRY: struct.Struct = struct.Struct("<3BxII4x")
+    INDEX_DTYPE: np.dtype[np.uint32] = np.dtype("<u4")
+    DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir: str | None = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 sidecars: Iterable[str] = ()) -> None:
+        """Constructor
+
+        Args:
+            cache_dir (str | None, optional): Directory for compiled files.
+                If None, a '.meshcache' folder next to each source is used.
+            max_bytes (int, optional): Total size the cache directory may
+                reach before the least recently used files are evicted.
+            sidecars (Iterable[str], optional): Extensions of other files
+                kept in the cache directory that count towards max_bytes
+                and may be evicted, such as saved scene BVHs.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache size limit must be positive.")
+        self._cache_dir: str | None = cache_dir
+        self._max_bytes: int = max_bytes
+        self._sidecars: Tuple[str, ...] = tuple(sidecars)
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    @property
+    def sidecars(self) -> Tuple[str, ...]:
+        """Gets the extensions of other files the cache evicts.
+
+        Returns:
+            Tuple[str, ...]: File extensions besides EXTENSION.
+        """
+        return self._sidecars
+
+    @property
+    def max_bytes(self) -> int:
+        """Gets the total size limit of the cache directory.
+
+        Returns:
+            int: Size limit in bytes.
+        """
+        return self._max_bytes
+
+    def directory_for(self, filepath: str) -> str:
+        """Gets the cache directory used for a source file.
+
+        Args:
+            filepath (str): Path to the source asset.
+
+        Returns:
+            str: Cache directory path.
+        """
+        if self._cache_dir is not None:
+            return self._cache_dir
+        return os.path.join(os.path.dirname(os.path.abspath(filepath)), ".meshcache")
+
+    def digest(self, filepath: str) -> str:
+        """Hashes a source file's contents.
+
+        The digest is remembered per (path, mtime, size) so an unchanged
+        file is only hashed once per cache instance.
+
+        Args:
+            filepath (str): Path to the source asset.
+
+        Returns:
+            str: Hex SHA-256 digest of the file contents.
+        """
+        stat = os.stat(filepath)
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        if key not in self._digests:
+            hasher = hashlib.sha256()
+            with open(filepath, 'rb') as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    hasher.update(block)
+            self._digests[key] = hasher.hexdigest()
+        return self._digests[key]
+
+    def path_for(self, filepath: str) -> str:
+        """Gets the compiled file path for a source file.
+
+        Args:
+            filepath (str): Path to the source asset.
+
+        Returns:
+            str: Path of the compiled file.
+        """
+        return os.path.join(self.directory_for(filepath),
+                            self.digest(filepath) + self.EXTENSION)
+
+    def lookup(self, filepath: str) -> str | None:
+        """Finds the compiled file for a source file and marks it as used.
+
+        Args:
+            filepath (str): Path to the source asset.
+
+        Returns:
+            str | None: Compiled file path, or None on a cache miss.
+        """
+        compiled = self.path_for(filepath)
+        if not os.path.isfile(compiled):
+            return None
+        os.utime(compiled)  # mark as recently used
+        return compiled
+
+    def load(self, filepath: str) -> List[Mesh3D] | None:
+        """Loads the compiled meshes for a source file if they are cached.
+
+        Args:
+            filepath (str): Path to the source asset.
+
+        Returns:
+            List[Mesh3D] | None: Cached meshes, or None on a cache miss.
+        """
+        compiled = self.lookup(filepath)
+        if compiled is None:
+            return None
+        return list(self.iter_compiled(compiled))
+
+    def store(self, filepath: str, meshes: List[Mesh3D]) -> str:
+        """Compiles meshes for a source file and evicts old entries.
+
+        The new compiled file is never evicted itself, even when it alone
+        is larger than max_bytes, so its path can be mapped straight away.
+
+        Args:
+            filepath (str): Path to the source asset.
+            meshes (List[Mesh3D]): Meshes parsed from the source.
+
+        Returns:
+            str: Path of the compiled file.
+        """
+        compiled = self.path_for(filepath)
+        os.makedirs(os.path.dirname(compiled), exist_ok=True)
+        partial = f"{compiled}.{os.getpid()}.tmp"
+        self.write_compiled(partial, meshes)
+        os.replace(partial, compiled)
+        self.evict(os.path.dirname(compiled), keep=compiled)
+        return compiled
+
+    def evict(self, directory: str, keep: str | None = None) -> None:
+        """Deletes least recently used compiled files over the size limit.
+
+        Sidecar files kept in the directory count towards the limit too.
+
+        Args:
+            directory (str): Cache directory to trim.
+            keep (str | None, optional): Path of a file in the directory
+                that counts towards the limit but is never deleted, such
+                as the one just stored.
+        """
+        kept = os.path.basename(keep) if keep is not None else None
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith((self.EXTENSION, *self._sidecars)):
+                stat = os.stat(os.path.join(directory, name))
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            if name == kept:
+                continue
+            os.remove(os.path.join(directory, name))
+            total -= size
+
+    @staticmethod
+    def _mesh_rgb(mesh: Mesh3D) -> Tuple[int, int, int]:
+        """Gets the RGB stored for a mesh.
+
+        Args:
+            mesh (Mesh3D): Mesh to inspect.
+
+        Returns:
+            Tuple[int, int, int]: Base color of the mesh.
+        """
+        if mesh.base_shader is not None:
+            return mesh.base_shader.rgb
+        if isinstance(mesh, MeshBuffer) and mesh.num_faces:
+            red, green, blue = (int(c) for c in mesh.colors[0])
+            return (red, green, blue)
+        if mesh.faces:
+            return mesh.faces[0].color.rgb
+        return (0, 0, 0)
+
+    @classmethod
+    def _mesh_coords(cls, mesh: Mesh3D) -> NDArray[np.float64]:
+        """Gets the vertex coordinates of a mesh as a little-endian array.
+
+        Args:
+            mesh (Mesh3D): Mesh to flatten.
+
+        Returns:
+            NDArray[np.float64]: Array of shape (F, 3, 3).
+        """
+        if mesh.positions is not None:
+            return np.ascontiguousarray(mesh.positions, dtype=cls.COORD_DTYPE)
+        coords = [[(vertex.x, vertex.y, vertex.z) for vertex in face.points]
+                  for face in mesh.faces]
+        return np.array(coords, dtype=cls.COORD_DTYPE).reshape(-1, 3, 3)
+
+    @classmethod
+    def write_compiled(cls, path: str, meshes: List[Mesh3D]) -> None:
+        """Writes meshes to a compiled binary file.
+
+        Args:
+            path (str): Destination path.
+            meshes (List[Mesh3D]): Meshes to write.
+        """
+        with open(path, 'wb') as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.FORMAT_VERSION, len(meshes)))
+            for mesh in meshes:
+                file.write(cls.MESH_ENTRY.pack(*cls._mesh_rgb(mesh), mesh.num_faces))
+            for mesh in meshes:
+                file.write(cls._mesh_coords(mesh).tobytes())
+
+    @staticmethod
+    def face_normals(vertices: NDArray[np.floating[Any]],
+                     indices: NDArray[np.integer[Any]]) -> NDArray[np.float64]:
+        """Computes the unit normal of every face of an indexed mesh.
+
+        Args:
+            vertices (NDArray[np.floating[Any]]): Vertex pool of shape (V, 3).
+            indices (NDArray[np.integer[Any]]): Index triples of shape (F, 3).
+
+        Returns:
+            NDArray[np.float64]: Normals of shape (F, 3); zero for
+                degenerate faces.
+        """
+        return Mesh3D.face_normals(np.asarray(vertices, dtype=np.float64)[indices])
+
+    @classmethod
+    def indexed_arrays(cls, mesh: IndexedMesh3D
+                       ) -> Tuple[NDArray[np.float64], NDArray[np.uint32]]:
+        """Gets the vertex pool and index triples of a welded mesh as arrays.
+
+        Args:
+            mesh (IndexedMesh3D): Mesh to flatten.
+
+        Returns:
+            Tuple[NDArray[np.float64], NDArray[np.uint32]]: Vertices of
+                shape (V, 3) and indices of shape (F, 3).
+        """
+        vertices = np.asarray(mesh.pool, dtype=cls.COORD_DTYPE)
+        indices = np.asarray(mesh.index_array, dtype=cls.INDEX_DTYPE)
+        return vertices, indices
+
+    @classmethod
+    def write_indexed(cls, path: str, meshes: List[IndexedMesh3D]) -> None:
+        """Writes welded meshes and their face normals to an indexed file.
+
+        Args:
+            path (str): Destination path.
+            meshes (List[IndexedMesh3D]): Meshes to write.
+        """
+        arrays = [cls.indexed_arrays(mesh) for mesh in meshes]
+        with open(path, 'wb') as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.INDEXED_VERSION, len(meshes)))
+            for mesh, (vertices, indices) in zip(meshes, arrays):
+                file.write(cls.INDEXED_ENTRY.pack(*cls._mesh_rgb(mesh),
+                                                  len(vertices), len(indices)))
+            for vertices, indices in arrays:
+                file.write(vertices.tobytes())
+                file.write(indices.tobytes())
+                file.write(bytes(-indices.nbytes % 8))
+                normals = cls.face_normals(vertices, indices)
+                file.write(normals.astype(cls.COORD_DTYPE).tobytes())
+
+    @classmethod
+    def is_compiled(cls, path: str) -> bool:
+        """Checks whether a file starts with the compiled mesh magic bytes.
+
+        Args:
+            path (str): File to check.
+
+        Returns:
+            bool: True if the file is a compiled mesh file.
+        """
+        with open(path, 'rb') as file:
+            return file.read(len(cls.MAGIC)) == cls.MAGIC
+
+    @classmethod
+    def read_header(cls, file: BinaryIO) -> Tuple[int, int]:
+        """Reads the header of a compiled file.
+
+        Args:
+            file (BinaryIO): File positioned at the start.
+
+        Raises:
+            ValueError: If the file is not a compiled mesh file.
+
+        Returns:
+            Tuple[int, int]: Format version and mesh count.
+        """
+        header = file.read(cls.HEADER.size)
+        if len(header) != cls.HEADER.size:
+            raise ValueError("Not a compiled mesh file.")
+        magic, version, num_meshes = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC \
+                or version not in (cls.FORMAT_VERSION, cls.INDEXED_VERSION):
+            raise ValueError("Not a compiled mesh file.")
+        return version, num_meshes
+
+    @classmethod
+    def read_table(cls, file: BinaryIO) -> List[Tuple[Shader, int]]:
+        """Reads the header and mesh table of a compiled file.
+
+        Args:
+            file (BinaryIO): File positioned at the start.
+
+        Raises:
+            ValueError: If the file is not a compiled (version 1) mesh file.
+
+        Returns:
+            List[Tuple[Shader, int]]: Color and face count of each mesh.
+        """
+        version, num_meshes = cls.read_header(file)
+        if version != cls.FORMAT_VERSION:
+            raise ValueError("Not a compiled mesh file.")
+        table = []
+        for _ in range(num_meshes):
+            r, g, b, num_faces = cls.MESH_ENTRY.unpack(file.read(cls.MESH_ENTRY.size))
+            table.append((Shader(r, g, b), num_faces))
+        return table
+
+    @classmethod
+    def iter_compiled(cls, path: str) -> Iterator[Mesh3D]:
+        """Reads meshes back from a compiled binary file one at a time.
+
+        Each mesh owns a private copy of its coordinates; Face3D objects
+        are only built when its faces are accessed.
+
+        Args:
+            path (str): Compiled file path.
+
+        Raises:
+            ValueError: If the file is not a compiled mesh file or is truncated.
+
+        Yields:
+            Mesh3D: The next mesh in file order.
+        """
+        if cls.is_indexed(path):
+            yield from cls.map_indexed(path)
+            return
+        with open(path, 'rb') as file:
+            for shader, num_faces in cls.read_table(file):
+                count = 9 * num_faces
+                coords = np.fromfile(file, dtype=cls.COORD_DTYPE, count=count)
+                if coords.size != count:
+                    raise ValueError("Compiled mesh file is truncated.")
+                yield Mesh3D.from_buffer(coords.reshape(num_faces, 3, 3), shader)
+
+    @classmethod
+    def map_compiled(cls, path: str) -> List[Mesh3D]:
+        """Memory-maps a compiled file and wraps it in zero-copy meshes.
+
+        Each mesh's positions are a read-only view into the mapping, so
+        processes mapping the same file share one copy in the page cache.
+
+        Args:
+            path (str): Compiled file path.
+
+        Raises:
+            ValueError: If the file is not a compiled mesh file or is truncated.
+
+        Returns:
+            List[Mesh3D]: Buffer-backed meshes in file order.
+        """
+        if cls.is_indexed(path):
+            return cls.map_indexed(path)
+        with open(path, 'rb') as file:
+            table = cls.read_table(file)
+            offset = file.tell()
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        meshes: List[Mesh3D] = []
+        for shader, num_faces in table:
+            size = 9 * num_faces * cls.COORD_DTYPE.itemsize
+            if offset + size > len(buffer):
+                raise ValueError("Compiled mesh file is truncated.")
+            view: NDArray[Any] = np.frombuffer(buffer, dtype=cls.COORD_DTYPE,
+                                               count=9 * num_faces, offset=offset)
+            meshes.append(Mesh3D.from_buffer(view.reshape(num_faces, 3, 3), shader))
+            offset += size
+        return meshes
+
+    @classmethod
+    def is_indexed(cls, path: str) -> bool:
+        """Checks whether a compiled file holds welded (version 2) meshes.
+
+        Args:
+            path (str): Compiled file path.
+
+        Raises:
+            ValueError: If the file is not a compiled mesh file.
+
+        Returns:
+            bool: True for an indexed file.
+        """
+        with open(path, 'rb') as file:
+            return cls.read_header(file)[0] == cls.INDEXED_VERSION
+
+    @classmethod
+    def _indexed_views(cls, buffer: mmap.mmap, offset: int, num_vertices: int,
+                       num_faces: int) -> Tuple[List[NDArray[Any]], int]:
+        """Views one mesh block of an indexed file.
+
+        Args:
+            buffer (mmap.mmap): Mapped file.
+            offset (int): Byte offset of the block.
+            num_vertices (int): Vertex count.
+            num_faces (int): Face count.
+
+        Raises:
+            ValueError: If the block runs past the end of the file.
+
+        Returns:
+            Tuple[List[NDArray[Any]], int]: Vertices (V, 3), indices (F, 3)
+                and normals (F, 3), then the offset of the next block.
+        """
+        sizes = (24 * num_vertices, 12 * num_faces + (-12 * num_faces % 8),
+                 24 * num_faces)
+        if offset + sum(sizes) > len(buffer):
+            raise ValueError("Compiled mesh file is truncated.")
+        views: List[NDArray[Any]] = []
+        dtypes: Tuple[np.dtype[Any], ...] = (cls.COORD_DTYPE, cls.INDEX_DTYPE,
+                                             cls.COORD_DTYPE)
+        counts = (num_vertices, num_faces, num_faces)
+        for dtype, rows, size in zip(dtypes, counts, sizes):
+            views.append(np.frombuffer(buffer, dtype=dtype, count=3 * rows,
+                                       offset=offset).reshape(rows, 3))
+            offset += size
+        return views, offset
+
+    @classmethod
+    def map_indexed(cls, path: str) -> List[Mesh3D]:
+        """Memory-maps an indexed file and rebuilds its welded meshes.
+
+        Args:
+            path (str): Indexed file path.
+
+        Raises:
+            ValueError: If the file is not an indexed mesh file, is
+                truncated, or references a missing vertex.
+
+        Returns:
+            List[Mesh3D]: IndexedMesh3D meshes in file order, carrying their
+                stored face normals.
+        """
+        with open(path, 'rb') as file:
+            version, num_meshes = cls.read_header(file)
+            if version != cls.INDEXED_VERSION:
+                raise ValueError("Not an indexed mesh file.")
+            table = [cls.INDEXED_ENTRY.unpack(file.read(cls.INDEXED_ENTRY.size))
+                     for _ in range(num_meshes)]
+            offset = file.tell()
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        meshes: List[Mesh3D] = []
+        for r, g, b, num_vertices, num_faces in table:
+            (vertices, indices, normals), offset = cls._indexed_views(
+                buffer, offset, num_vertices, num_faces)
+            meshes.append(IndexedMesh3D.from_arrays(vertices, indices, Shader(r, g, b),
+                                                    normals))
+        return meshes
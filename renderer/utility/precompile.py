@@ -0,0 +1,221 @@
+"""Precompiler class to bake a directory of mesh assets into indexed binaries."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+from geometry import IndexedMesh3D
+from utility.fileimport import FileImport
+from utility.manifest import AssetManifest
+from utility.meshcache import MeshCache
+
+
+class Precompiler:
+    """Compiles every mesh asset under a directory ahead of time.
+
+    Each source is parsed with FileImport, welded, and written as an
+    indexed MeshCache file (vertex pool, index triples and face normals,
+    which the mapped meshes reuse for back-face culling) mirroring its path
+    under the output directory. The output directory's
+    AssetManifest records each source's digest, counts, bounds and
+    suggested camera; run goes through AssetManifest.update, so a later
+    run only recompiles changed files. Files are converted in parallel,
+    one per worker process.
+    """
+
+    DEFAULT_OUTPUT: str = AssetManifest.DEFAULT_DIR
+
+    def __init__(self, source_dir: str, output_dir: str | None = None,
+                 workers: int = 1) -> None:
+        """Constructor
+
+        Args:
+            source_dir (str): Directory to search for assets.
+            output_dir (str | None, optional): Directory for compiled files
+                and the manifest. Defaults to '.compiled' in source_dir.
+            workers (int, optional): Number of processes converting files.
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        self._source_dir: str = source_dir
+        self._output_dir: str = output_dir if output_dir is not None \
+            else os.path.join(source_dir, self.DEFAULT_OUTPUT)
+        self._manifest: AssetManifest = AssetManifest(
+            source_dir, os.path.join(self._output_dir, AssetManifest.MANIFEST_NAME))
+        self._workers: int = 1
+        self.workers = workers
+
+    @property
+    def source_dir(self) -> str:
+        """Gets the directory searched for assets.
+
+        Returns:
+            str: Source directory.
+        """
+        return self._source_dir
+
+    @property
+    def output_dir(self) -> str:
+        """Gets the directory receiving compiled files.
+
+        Returns:
+            str: Output directory.
+        """
+        return self._output_dir
+
+    @property
+    def manifest(self) -> AssetManifest:
+        """Gets the manifest of the compiled assets.
+
+        Returns:
+            AssetManifest: Manifest stored in the output directory.
+        """
+        return self._manifest
+
+    @property
+    def workers(self) -> int:
+        """Gets the number of conversion processes.
+
+        Returns:
+            int: Worker count.
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+        """Sets the number of conversion processes.
+
+        Args:
+            value (int): Worker count; 1 converts in this process.
+
+        Raises:
+            ValueError: If value is less than 1.
+        """
+        if value < 1:
+            raise ValueError("Worker count must be at least 1.")
+        self._workers = value
+
+    def target_for(self, name: str) -> str:
+        """Gets the compiled file path of an asset.
+
+        Args:
+            name (str): Manifest key of the asset.
+
+        Returns:
+            str: Path of its .rmc file under the output directory.
+        """
+        return os.path.join(self._output_dir, *name.split("/")) + MeshCache.EXTENSION
+
+    @classmethod
+    def compile_file(cls, source: str, target: str) -> Dict[str, Any]:
+        """Compiles one asset into an indexed binary file.
+
+        Runs in worker processes, so it only uses its arguments.
+
+        Args:
+            source (str): Path to the source asset.
+            target (str): Path of the compiled file to write.
+
+        Returns:
+            Dict[str, Any]: Manifest fields with the source digest, or an
+                'error' message if the asset is invalid.
+        """
+        try:
+            meshes = [IndexedMesh3D.weld(mesh)
+                      for mesh in FileImport().read_file(source)]
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            partial = f"{target}.{os.getpid()}.tmp"
+            MeshCache.write_indexed(partial, meshes)
+            os.replace(partial, target)
+        except (OSError, ValueError) as error:
+            return {"error": str(error)}
+        entry = AssetManifest.describe(list(meshes))
+        entry["digest"] = MeshCache().digest(source)
+        return entry
+
+    def run(self, force: bool = False) -> List[str]:
+        """Compiles new and changed assets and saves the manifest.
+
+        The manifest decides which assets are stale; compiled files of
+        deleted sources are removed with their entries.
+
+        Args:
+            force (bool, optional): If True, every asset is recompiled.
+
+        Returns:
+            List[str]: Manifest keys of the assets that were compiled.
+        """
+        return self._manifest.update(force=force, compiler=self._compile)
+
+    def _compile(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Compiles assets, in parallel if there are workers to spare.
+
+        Args:
+            names (List[str]): Manifest keys of the assets to compile.
+
+        Returns:
+            List[Dict[str, Any]]: Manifest entry of each asset, in order.
+        """
+        paths = [self._manifest.source_path(name) for name in names]
+        targets = [self.target_for(name) for name in names]
+        if self._workers > 1 and len(names) > 1:
+            with ProcessPoolExecutor(min(self._workers, len(names))) as pool:
+                entries = list(pool.map(self.compile_file, paths, targets))
+        else:
+            entries = list(map(self.compile_file, paths, targets))
+        for name, entry in zip(names, entries):
+            if "error" not in entry:
+                entry["compiled"] = name + MeshCache.EXTENSION
+        return entries
+
+    @classmethod
+    def main(cls, argv: List[str] | None = None) -> int:
+        """Command-line entry point.
+
+        Args:
+            argv (List[str] | None, optional): Arguments; defaults to
+                sys.argv.
+
+        Returns:
+            int: Exit status, 1 if any asset failed to compile.
+        """
+        parser = argparse.ArgumentParser(
+            description="Compile mesh assets into indexed binary files.")
+        parser.add_argument("source", nargs="?", default="assets",
+                            help="directory to search for assets (default: assets)")
+        parser.add_argument("-o", "--output", default=None,
+                            help="output directory "
+                                 f"(default: SOURCE/{cls.DEFAULT_OUTPUT})")
+        parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                            help="number of worker processes (default: CPU count)")
+        parser.add_argument("-f", "--force", action="store_true",
+                            help="recompile assets that have not changed")
+        args = parser.parse_args(argv)
+        if args.workers < 1:
+            parser.error("--workers must be at least 1")
+
+        compiler = cls(args.source, args.output, args.workers)
+        compiled = set(compiler.run(args.force))
+        failed = 0
+        for name, entry in sorted(compiler.manifest.entries.items()):
+            status = "compiled" if name in compiled else "up to date"
+            if "error" in entry:
+                failed += 1
+                print(f"{name}: {entry['error']}")
+            else:
+                print(f"{name}: {entry['meshes']} meshes, "
+                      f"{entry['faces']} faces ({status})")
+        return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(Precompiler.main())  # pragma: no cover
@@ -0,0 +1,187 @@
+"""WavefrontParser class to build meshes from standard Wavefront OBJ records."""
+
+from __future__ import annotations
+
+__author__ = "Arin Hartung"
+__date__ = "2026/10/17"
+__license__ = "MIT"
+__version__ = "0.1.0"
+__maintainer__ = "Arin Hartung"
+
+import os
+from array import array
+from typing import Dict, Iterable, List, Tuple
+from geometry import IndexedMesh3D, Vertex, Shader
+
+
+class _MeshBuilder:
+    """Collects the faces of one group/material pair over a local vertex pool."""
+
+    def __init__(self, color: Shader) -> None:
+        """Constructor
+
+        Args:
+            color (Shader): Base color of the mesh.
+        """
+        self.color: Shader = color
+        self.vertices: List[Vertex] = []
+        self.indices: List[Tuple[int, int, int]] = []
+        self.local: Dict[int, int] = {}
+
+    def local_index(self, index: int, coords: array[float]) -> int:
+        """Maps a global OBJ vertex index to this mesh's pool.
+
+        Args:
+            index (int): Zero-based global vertex index.
+            coords (array[float]): Flat x, y, z coordinates of all vertices.
+
+        Returns:
+            int: Index into this mesh's vertex pool.
+        """
+        if index not in self.local:
+            self.local[index] = len(self.vertices)
+            start = 3 * index
+            self.vertices.append(Vertex(coords[start], coords[start + 1],
+                                        coords[start + 2]))
+        return self.local[index]
+
+    def build(self) -> IndexedMesh3D:
+        """Creates the finished mesh.
+
+        Returns:
+            IndexedMesh3D: Mesh over the collected pool.
+        """
+        return IndexedMesh3D(self.vertices, self.indices, self.color)
+
+
+class WavefrontParser:
+    """Single-pass parser for standard OBJ 'v' and 'f' records.
+
+    Each group ('o'/'g') and material ('usemtl') pair becomes one indexed
+    mesh. Polygons are triangulated as fans, and material colors come from
+    the diffuse ('Kd') entries of any 'mtllib' files.
+    """
+
+    DEFAULT_COLOR: Tuple[int, int, int] = (127, 127, 127)
+
+    def __init__(self, base_dir: str = ".") -> None:
+        """Constructor
+
+        Args:
+            base_dir (str, optional): Directory that 'mtllib' paths are
+                relative to. Defaults to the working directory.
+        """
+        self._base_dir: str = base_dir
+        self._coords: array[float] = array('d')
+        self._materials: Dict[str, Shader] = {}
+        self._builders: Dict[Tuple[str, str], _MeshBuilder] = {}
+        self._group: str = ""
+        self._material: str = ""
+
+    def parse(self, lines: Iterable[str]) -> List[IndexedMesh3D]:
+        """Parses OBJ records into meshes, one line at a time.
+
+        Args:
+            lines (Iterable[str]): Stripped, non-comment lines.
+
+        Raises:
+            ValueError: If a record is malformed.
+
+        Returns:
+            List[IndexedMesh3D]: One mesh per group/material, in order of
+                first appearance.
+        """
+        for line in lines:
+            keyword, _, rest = line.replace("\t", " ").partition(" ")
+            if keyword == "v":
+                self._add_vertex(rest.split())
+            elif keyword == "f":
+                self._add_polygon(rest.split())
+            elif keyword in ("o", "g"):
+                self._group = rest.strip()
+            elif keyword == "usemtl":
+                self._material = rest.strip()
+            elif keyword == "mtllib":
+                for name in rest.split():
+                    self._load_materials(os.path.join(self._base_dir, name))
+        return [builder.build() for builder in self._builders.values()
+                if builder.indices]
+
+    def _add_vertex(self, parts: List[str]) -> None:
+        """Stores a 'v' record.
+
+        Args:
+            parts (List[str]): Tokens after the keyword.
+
+        Raises:
+            ValueError: If fewer than three coordinates are given.
+        """
+        if len(parts) < 3:
+            raise ValueError(f"Expected 3 coordinates for 'v', got: {parts}")
+        self._coords.extend((float(parts[0]), float(parts[1]), float(parts[2])))
+
+    def _resolve(self, token: str) -> int:
+        """Converts an OBJ vertex reference ('7', '7/1/2', '-1//3') to an index.
+
+        Args:
+            token (str): Face vertex token.
+
+        Raises:
+            ValueError: If the reference is out of range.
+
+        Returns:
+            int: Zero-based global vertex index.
+        """
+        count = len(self._coords) // 3
+        index = int(token.split("/", 1)[0])
+        resolved = index - 1 if index > 0 else count + index
+        if not 0 <= resolved < count:
+            raise ValueError(f"Vertex reference {token} out of range.")
+        return resolved
+
+    def _add_polygon(self, tokens: List[str]) -> None:
+        """Stores an 'f' record, fan-triangulating polygons.
+
+        Args:
+            tokens (List[str]): Face vertex tokens.
+
+        Raises:
+            ValueError: If the face has fewer than three vertices.
+        """
+        if len(tokens) < 3:
+            raise ValueError(f"Expected at least 3 vertices for 'f', got: {tokens}")
+        builder = self._current_builder()
+        corners = [builder.local_index(self._resolve(token), self._coords)
+                   for token in tokens]
+        for i in range(1, len(corners) - 1):
+            builder.indices.append((corners[0], corners[i], corners[i + 1]))
+
+    def _current_builder(self) -> _MeshBuilder:
+        """Gets the builder for the active group and material.
+
+        Returns:
+            _MeshBuilder: Builder receiving new faces.
+        """
+        key = (self._group, self._material)
+        if key not in self._builders:
+            color = self._materials.get(self._material, Shader(*self.DEFAULT_COLOR))
+            self._builders[key] = _MeshBuilder(color)
+        return self._builders[key]
+
+    def _load_materials(self, path: str) -> None:
+        """Reads diffuse colors from a material library, if it exists.
+
+        Args:
+            path (str): Path to the .mtl file.
+        """
+        if not os.path.isfile(path):
+            return
+        name = ""
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == "newmtl":
+                    name = parts[1]
+                elif len(parts) >= 4 and parts[0] == "Kd":
+                    rgb = (max(0, min(round(float(c) * 255), 255)) for c in parts[1:4])
+                    self._materials[name] = Shader(*rgb)